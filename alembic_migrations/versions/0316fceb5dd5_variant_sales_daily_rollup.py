@@ -0,0 +1,62 @@
+"""Daily variant sales rollup
+
+Revision ID: 0316fceb5dd5
+Revises: 62f8ecaeb262
+Create Date: 2026-10-16 19:40:12.318204
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0316fceb5dd5'
+down_revision: Union[str, Sequence[str], None] = '62f8ecaeb262'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('variant_sales_daily',
+    sa.Column('variant_id', sa.UUID(), nullable=False),
+    sa.Column('sale_date', sa.Date(), nullable=False),
+    sa.Column('sku', sa.String(length=100), nullable=True),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['variant_id'], ['product_variants.id'], ),
+    sa.PrimaryKeyConstraint('variant_id', 'sale_date')
+    )
+    op.create_index('ix_variant_sales_daily_sale_date', 'variant_sales_daily', ['sale_date'], unique=False)
+    op.create_table('sales_rollup_coverage',
+    sa.Column('rollup', sa.String(length=100), nullable=False),
+    sa.Column('covered_since', sa.Date(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('rollup')
+    )
+
+    # Backfill from all existing orders; the rollup is then complete for any window
+    op.execute("""
+        INSERT INTO variant_sales_daily (variant_id, sale_date, sku, quantity, revenue, order_count, updated_at)
+        SELECT li.variant_id, date(o.created_at), max(li.sku), sum(li.quantity),
+               sum(li.price * li.quantity), count(DISTINCT li.order_id), now()
+        FROM order_line_items li
+        JOIN orders o ON li.order_id = o.id
+        WHERE li.variant_id IS NOT NULL
+          AND o.financial_status IN ('paid', 'partially_paid', 'authorized')
+        GROUP BY li.variant_id, date(o.created_at)
+    """)
+    op.execute("""
+        INSERT INTO sales_rollup_coverage (rollup, covered_since, updated_at)
+        VALUES ('variant_sales_daily', DATE '1970-01-01', now())
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('sales_rollup_coverage')
+    op.drop_index('ix_variant_sales_daily_sale_date', table_name='variant_sales_daily')
+    op.drop_table('variant_sales_daily')
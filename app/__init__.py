@@ -92,6 +92,9 @@ def create_app(config: Optional[str] = None) -> Flask:
     # Register error handlers
     register_error_handlers(app)
 
+    # Drain webhooks left in the durable queue by a previous run
+    init_webhook_dispatcher(app)
+
     # Initialize autonomous empire (after everything else is set up)
     init_autonomous_empire(app)
 
@@ -276,6 +279,18 @@ def register_error_handlers(app: Flask) -> None:
     reg_errors(app)
 
 
+def init_webhook_dispatcher(app: Flask) -> None:
+    """Start the webhook queue dispatcher so queued entries resume at startup."""
+    if app.config.get('TESTING'):
+        return
+    try:
+        from app.services.webhook_processor import get_webhook_processor
+
+        get_webhook_processor().start_dispatcher()
+    except Exception as e:
+        app.logger.error(f"❌ Failed to start webhook dispatcher: {e}")
+
+
 def init_autonomous_empire(app: Flask) -> None:
     """Initialize the autonomous empire management system.
     
@@ -11,13 +11,13 @@ Provides API endpoints for:
 - Assistant configuration and conversation management
 """
 
-import asyncio
 import logging
 from datetime import datetime, timezone
 
-from flask import Blueprint, Response, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 
 from app.services.ai_assistant import control_center_assistant
+from app.services.async_bridge import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -106,15 +106,9 @@ def chat_with_assistant():
         include_status = data.get('include_system_status', True)
 
         # Get response asynchronously
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            response = loop.run_until_complete(
-                control_center_assistant.get_response(user_message, include_status)
-            )
-        finally:
-            loop.close()
+        response = run_async(
+            control_center_assistant.get_response(user_message, include_status)
+        )
 
         if response['success']:
             return jsonify({
@@ -193,30 +187,35 @@ def stream_chat():
 
         def generate():
             """Generate streaming response."""
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
             try:
                 async def stream():
-                    async for chunk in control_center_assistant.get_streaming_response(user_message, include_status):
-                        yield f"data: {jsonify(chunk).get_data(as_text=True)}\n\n"
+                    upstream = control_center_assistant.get_streaming_response(user_message, include_status)
+                    try:
+                        async for chunk in upstream:
+                            yield f"data: {jsonify(chunk).get_data(as_text=True)}\n\n"
+                    finally:
+                        # async for leaves an abandoned generator to the garbage collector
+                        await upstream.aclose()
 
                 # Run the async generator
                 async_gen = stream()
-                while True:
-                    try:
-                        chunk = loop.run_until_complete(async_gen.__anext__())
-                        yield chunk
-                    except StopAsyncIteration:
-                        break
+                try:
+                    while True:
+                        try:
+                            chunk = run_async(async_gen.__anext__())
+                            yield chunk
+                        except StopAsyncIteration:
+                            break
+                finally:
+                    # Close the upstream stream too when the client disconnects early
+                    run_async(async_gen.aclose())
 
             except Exception as e:
                 logger.error(f"Streaming error: {e}")
                 yield f"data: {jsonify({'type': 'error', 'data': str(e)}).get_data(as_text=True)}\n\n"
-            finally:
-                loop.close()
 
-        return Response(generate(), mimetype='text/event-stream')
+        # Chunks are serialized with jsonify, which needs the request context
+        return Response(stream_with_context(generate()), mimetype='text/event-stream')
 
     except Exception as e:
         logger.error(f"Error setting up streaming chat: {e}")
@@ -246,15 +245,9 @@ def get_executive_summary():
 
     try:
         # Get executive summary asynchronously
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            summary_data = loop.run_until_complete(
-                control_center_assistant.get_executive_summary()
-            )
-        finally:
-            loop.close()
+        summary_data = run_async(
+            control_center_assistant.get_executive_summary()
+        )
 
         if summary_data['success']:
             return jsonify({
@@ -361,15 +354,9 @@ def get_quick_insights():
         Format as bullet points, keep each insight under 100 characters."""
 
         # Get response asynchronously
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            response = loop.run_until_complete(
-                control_center_assistant.get_response(quick_prompt, include_system_status=True)
-            )
-        finally:
-            loop.close()
+        response = run_async(
+            control_center_assistant.get_response(quick_prompt, include_system_status=True)
+        )
 
         if response['success']:
             # Parse insights from response
@@ -459,15 +446,9 @@ def process_voice_command():
         audio_data = audio_file.read()
 
         # Process voice command asynchronously
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            result = loop.run_until_complete(
-                control_center_assistant.process_voice_command(audio_data)
-            )
-        finally:
-            loop.close()
+        result = run_async(
+            control_center_assistant.process_voice_command(audio_data)
+        )
 
         if result['success']:
             return jsonify({
@@ -560,15 +541,9 @@ def synthesize_speech():
             }), 400
 
         # Generate voice response asynchronously
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            result = loop.run_until_complete(
-                control_center_assistant.generate_voice_response(text)
-            )
-        finally:
-            loop.close()
+        result = run_async(
+            control_center_assistant.generate_voice_response(text)
+        )
 
         if result['success']:
             return jsonify({
@@ -641,15 +616,9 @@ def execute_empire_command():
         parameters = data.get('parameters', {})
 
         # Execute empire command asynchronously
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            result = loop.run_until_complete(
-                control_center_assistant.execute_empire_command(command, parameters)
-            )
-        finally:
-            loop.close()
+        result = run_async(
+            control_center_assistant.execute_empire_command(command, parameters)
+        )
 
         if result['success']:
             return jsonify(result)
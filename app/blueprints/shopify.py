@@ -12,7 +12,6 @@ import logging
 from datetime import datetime, timezone
 
 from flask import Blueprint, jsonify, request
-from werkzeug.exceptions import BadRequest
 
 from app.jobs.shopify_jobs import (
     bulk_operation_job,
@@ -997,8 +996,8 @@ def handle_webhook(topic: str):
         type: string
         description: Shop domain
     responses:
-      202:
-        description: Webhook received and verified
+      200:
+        description: Webhook verified and queued (or a duplicate delivery)
       401:
         description: Invalid HMAC signature
       400:
@@ -1042,71 +1041,41 @@ def handle_webhook(topic: str):
                 "message": "Webhook verification failed"
             }), 401
 
-        # Parse JSON payload
-        try:
-            webhook_data = request.get_json()
-        except BadRequest:
-            webhook_data = {}
-
-        # Process webhook - Store and route to agents for real-time business logic
-        webhook_info = {
-            'topic': topic,
-            'shop_domain': shop_domain,
-            'data': webhook_data,
-            'headers': dict(request.headers),
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'verified': True
-        }
-
-        # Route webhook to appropriate agents for processing
-        processing_result = None
-        try:
-            from app.services.webhook_processor import get_webhook_processor
-            import asyncio
-            
-            processor = get_webhook_processor()
-            
-            # Process webhook asynchronously - routes to agents
-            processing_result = asyncio.run(
-                processor.process_shopify_webhook(topic, webhook_data, shop_domain)
-            )
-            logger.info(f"Webhook routed to {processing_result.get('agents_notified', 0)} agents")
-        except Exception as e:
-            logger.error(f"Failed to route webhook to agents: {e}")
-            processing_result = {"error": str(e), "agents_notified": 0}
+        # Persist the raw payload and acknowledge; agents are notified by the queue dispatcher
+        from app.services.webhook_processor import get_webhook_processor
+
+        webhook_id = request.headers.get('X-Shopify-Webhook-Id')
+        queue_result = get_webhook_processor().enqueue_shopify_webhook(
+            topic, payload, shop_domain, webhook_id
+        )
 
         # Emit webhook event via WebSocket for real-time command center updates
-        try:
-            from app.sockets import socketio
-            if socketio:
-                socketio.emit('webhook', {
-                    'topic': topic,
-                    'shop_domain': shop_domain,
-                    'id': webhook_data.get('id') if webhook_data else None,
-                    'timestamp': datetime.now(timezone.utc).isoformat(),
-                    'agents_notified': processing_result.get('agents_notified', 0) if processing_result else 0
-                }, namespace='/ws/shopify')
-        except:
-            pass
+        if queue_result["queued"]:
+            try:
+                from app.sockets import socketio
+                if socketio:
+                    socketio.emit('webhook', {
+                        'topic': topic,
+                        'shop_domain': shop_domain,
+                        'webhook_id': queue_result["webhook_id"],
+                        'timestamp': datetime.now(timezone.utc).isoformat(),
+                        'status': 'queued'
+                    }, namespace='/ws/shopify')
+            except Exception:
+                pass
 
         safe_topic = topic.replace('\n', '').replace('\r', '')[:50]
-        safe_shop_domain = shop_domain.replace('\n', '').replace('\r', '')[:100]
-        logger.info(f"Processed webhook {safe_topic} from {safe_shop_domain} - routed to agents")
+        safe_shop_domain = (shop_domain or '').replace('\n', '').replace('\r', '')[:100]
+        logger.info(f"Queued webhook {safe_topic} from {safe_shop_domain}")
 
-        response_data = {
-            "status": "received",
+        return jsonify({
+            "status": "duplicate" if queue_result["duplicate"] else "queued",
             "topic": topic,
             "shop_domain": shop_domain,
             "verified": True,
+            "webhook_id": queue_result["webhook_id"],
             "timestamp": datetime.now(timezone.utc).isoformat()
-        }
-        
-        # Include agent routing info if available
-        if processing_result:
-            response_data["agents_notified"] = processing_result.get("agents_notified", 0)
-            response_data["webhook_id"] = processing_result.get("webhook_id")
-
-        return jsonify(response_data), 202
+        }), 200
 
     except Exception as e:
         safe_topic = topic.replace('\n', '').replace('\r', '')[:50]
@@ -8,7 +8,7 @@ secrets from Cloudflare/deployment variables when available.
 
 import asyncio
 import os
-from typing import Optional, Type
+from typing import Dict, Iterable, Optional, Type
 
 # Import secret resolver for secure credential management
 try:
@@ -17,6 +17,33 @@ try:
 except ImportError:
     _secret_resolver = None
 
+# Secrets read by the configuration classes below, resolved together at import
+_CONFIG_SECRET_KEYS = (
+    "SECRET_KEY",
+    "SHOPIFY_API_KEY",
+    "SHOPIFY_API_SECRET",
+    "OPENAI_API_KEY",
+    "AUTO_DS_API_KEY",
+    "AUTODS_API_KEY",
+    "SPOCKET_API_KEY",
+    "GITHUB_TOKEN",
+    "API_KEY_ROYALGPT",
+)
+
+
+def _prefetch_secrets(keys: Iterable[str]) -> Dict[str, str]:
+    """Resolve the configuration secrets concurrently on one event loop."""
+    if not _secret_resolver:
+        return {}
+    try:
+        return asyncio.run(_secret_resolver.prefetch(keys))
+    except Exception:
+        # e.g. imported from inside a running event loop
+        return {}
+
+
+_prefetched_secrets = _prefetch_secrets(_CONFIG_SECRET_KEYS)
+
 
 def _get_secret(key: str, default: Optional[str] = None) -> Optional[str]:
     """
@@ -25,7 +52,11 @@ def _get_secret(key: str, default: Optional[str] = None) -> Optional[str]:
     This ensures secrets are fetched from Cloudflare/deployment variables when available,
     with graceful fallback to local environment variables for development.
     """
-    if _secret_resolver:
+    value = _prefetched_secrets.get(key)
+    if value:
+        return value
+
+    if _secret_resolver and key not in _CONFIG_SECRET_KEYS:
         try:
             value = asyncio.run(_secret_resolver.get_secret_with_fallback(key, None))
             if value:
@@ -83,6 +114,11 @@ class Config:
         os.getenv("CIRCUIT_BREAKER_RECOVERY_TIMEOUT", "60")
     )
 
+    # Background dependency probes for readiness checks
+    HEALTH_PROBE_INTERVAL = float(os.getenv("HEALTH_PROBE_INTERVAL", "30"))
+    HEALTH_PROBE_JITTER = float(os.getenv("HEALTH_PROBE_JITTER", "0.2"))
+    HEALTH_PROBE_TIMEOUT = float(os.getenv("HEALTH_PROBE_TIMEOUT", "5"))
+
     # FASE 2: RoyalGPT Orchestration Settings (use secret resolver for API key)
     ROYALGPT_ENABLED = os.getenv("ENABLE_ROYALGPT_ORCHESTRATION", "true").lower() == "true"
     API_KEY_ROYALGPT = _get_secret("API_KEY_ROYALGPT", "")
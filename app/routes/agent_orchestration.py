@@ -10,6 +10,7 @@ from datetime import datetime
 
 from flask import Blueprint, jsonify, request
 
+from app.services.async_bridge import run_async
 from orchestrator.core.agent_registry import (
     AgentCapability,
     get_agent_registry,
@@ -174,11 +175,8 @@ def submit_task():
         # Submit task
         integration = get_aira_integration()
 
-        # Run async function in sync context
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        task = loop.run_until_complete(
+        # Run async function on the shared event loop
+        task = run_async(
             integration.submit_task(
                 task_id=data['task_id'],
                 capability=capability,
@@ -186,7 +184,6 @@ def submit_task():
                 priority=priority
             )
         )
-        loop.close()
 
         return jsonify({
             'message': 'Task submitted successfully',
@@ -221,12 +218,8 @@ def cancel_task(task_id: str):
     try:
         integration = get_aira_integration()
 
-        # Run async function in sync context
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        success = loop.run_until_complete(integration.cancel_task(task_id))
-        loop.close()
+        # Run async function on the shared event loop
+        success = run_async(integration.cancel_task(task_id))
 
         if not success:
             return jsonify({'error': f'Task {task_id} not found or cannot be cancelled'}), 404
@@ -6,7 +6,6 @@ Provides endpoints for consciousness status, digital twin management,
 intelligent decision making, and business optimization.
 """
 
-import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
@@ -14,6 +13,7 @@ from typing import Optional
 from flask import Blueprint, jsonify, request
 
 from app.orchestrator_bridge import get_orchestrator
+from app.services.async_bridge import run_async
 from orchestrator.intelligence.enhanced_aira import (
     AIRAIntelligenceConfig,
     EnhancedAIRAAgent,
@@ -74,18 +74,12 @@ def get_intelligence_status():
             return jsonify({'error': 'AIRA intelligence not available'}), 500
 
         # Run async status check
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            status = loop.run_until_complete(aira.get_intelligence_status())
-            return jsonify({
-                'status': 'success',
-                'data': status,
-                'timestamp': datetime.now().isoformat()
-            })
-        finally:
-            loop.close()
+        status = run_async(aira.get_intelligence_status())
+        return jsonify({
+            'status': 'success',
+            'data': status,
+            'timestamp': datetime.now().isoformat()
+        })
 
     except Exception as e:
         logger.error(f"Intelligence status error: {e}")
@@ -100,18 +94,12 @@ def get_consciousness_status():
         if not aira or not aira.consciousness:
             return jsonify({'error': 'Consciousness engine not available'}), 500
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            status = loop.run_until_complete(aira.consciousness.get_consciousness_status())
-            return jsonify({
-                'status': 'success',
-                'consciousness': status,
-                'timestamp': datetime.now().isoformat()
-            })
-        finally:
-            loop.close()
+        status = run_async(aira.consciousness.get_consciousness_status())
+        return jsonify({
+            'status': 'success',
+            'consciousness': status,
+            'timestamp': datetime.now().isoformat()
+        })
 
     except Exception as e:
         logger.error(f"Consciousness status error: {e}")
@@ -126,18 +114,12 @@ def get_digital_twin_status():
         if not aira or not aira.digital_twin:
             return jsonify({'error': 'Digital twin engine not available'}), 500
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            status = loop.run_until_complete(aira.digital_twin.get_engine_status())
-            return jsonify({
-                'status': 'success',
-                'digital_twin': status,
-                'timestamp': datetime.now().isoformat()
-            })
-        finally:
-            loop.close()
+        status = run_async(aira.digital_twin.get_engine_status())
+        return jsonify({
+            'status': 'success',
+            'digital_twin': status,
+            'timestamp': datetime.now().isoformat()
+        })
 
     except Exception as e:
         logger.error(f"Digital twin status error: {e}")
@@ -170,35 +152,28 @@ def make_intelligent_decision():
         constraints = data.get('constraints', [])
         confidence_threshold = data.get('confidence_threshold', 0.75)
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            decision = loop.run_until_complete(
-                aira.make_business_decision(
-                    situation=situation,
-                    available_actions=available_actions,
-                    objectives=objectives,
-                    constraints=constraints,
-                    require_confidence=confidence_threshold
-                )
+        decision = run_async(
+            aira.make_business_decision(
+                situation=situation,
+                available_actions=available_actions,
+                objectives=objectives,
+                constraints=constraints,
+                require_confidence=confidence_threshold
             )
+        )
 
-            if decision:
-                return jsonify({
-                    'status': 'success',
-                    'decision': decision,
-                    'timestamp': datetime.now().isoformat()
-                })
-            else:
-                return jsonify({
-                    'status': 'no_decision',
-                    'message': 'No decision could be made with required confidence',
-                    'timestamp': datetime.now().isoformat()
-                })
-
-        finally:
-            loop.close()
+        if decision:
+            return jsonify({
+                'status': 'success',
+                'decision': decision,
+                'timestamp': datetime.now().isoformat()
+            })
+        else:
+            return jsonify({
+                'status': 'no_decision',
+                'message': 'No decision could be made with required confidence',
+                'timestamp': datetime.now().isoformat()
+            })
 
     except Exception as e:
         logger.error(f"Decision making error: {e}")
@@ -213,18 +188,12 @@ def get_market_intelligence():
         if not aira:
             return jsonify({'error': 'AIRA intelligence not available'}), 500
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            intelligence = loop.run_until_complete(aira.get_market_intelligence())
-            return jsonify({
-                'status': 'success',
-                'market_intelligence': intelligence,
-                'timestamp': datetime.now().isoformat()
-            })
-        finally:
-            loop.close()
+        intelligence = run_async(aira.get_market_intelligence())
+        return jsonify({
+            'status': 'success',
+            'market_intelligence': intelligence,
+            'timestamp': datetime.now().isoformat()
+        })
 
     except Exception as e:
         logger.error(f"Market intelligence error: {e}")
@@ -242,21 +211,15 @@ def optimize_business_operations():
         if not aira:
             return jsonify({'error': 'AIRA intelligence not available'}), 500
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            optimization = loop.run_until_complete(
-                aira.optimize_business_operations(focus_areas)
-            )
+        optimization = run_async(
+            aira.optimize_business_operations(focus_areas)
+        )
 
-            return jsonify({
-                'status': 'success',
-                'optimization': optimization,
-                'timestamp': datetime.now().isoformat()
-            })
-        finally:
-            loop.close()
+        return jsonify({
+            'status': 'success',
+            'optimization': optimization,
+            'timestamp': datetime.now().isoformat()
+        })
 
     except Exception as e:
         logger.error(f"Business optimization error: {e}")
@@ -282,26 +245,20 @@ def learn_from_outcome():
         if not aira:
             return jsonify({'error': 'AIRA intelligence not available'}), 500
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            await_result = loop.run_until_complete(
-                aira.learn_from_business_outcome(
-                    action_taken=data['action_taken'],
-                    expected_outcome=data['expected_outcome'],
-                    actual_outcome=data['actual_outcome'],
-                    context=data.get('context', {})
-                )
+        await_result = run_async(
+            aira.learn_from_business_outcome(
+                action_taken=data['action_taken'],
+                expected_outcome=data['expected_outcome'],
+                actual_outcome=data['actual_outcome'],
+                context=data.get('context', {})
             )
+        )
 
-            return jsonify({
-                'status': 'success',
-                'message': 'Learning completed successfully',
-                'timestamp': datetime.now().isoformat()
-            })
-        finally:
-            loop.close()
+        return jsonify({
+            'status': 'success',
+            'message': 'Learning completed successfully',
+            'timestamp': datetime.now().isoformat()
+        })
 
     except Exception as e:
         logger.error(f"Learning from outcome error: {e}")
@@ -342,32 +299,25 @@ def create_digital_twin():
         if twin_type_str not in twin_type_map:
             return jsonify({'error': f'Invalid twin_type: {twin_type_str}'}), 400
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            success = loop.run_until_complete(
-                aira.digital_twin.create_business_twin(
-                    twin_id=data['twin_id'],
-                    twin_type=twin_type_map[twin_type_str],
-                    name=data['name'],
-                    description=data['description'],
-                    data_sources=data['data_sources'],
-                    key_metrics=data['key_metrics']
-                )
+        success = run_async(
+            aira.digital_twin.create_business_twin(
+                twin_id=data['twin_id'],
+                twin_type=twin_type_map[twin_type_str],
+                name=data['name'],
+                description=data['description'],
+                data_sources=data['data_sources'],
+                key_metrics=data['key_metrics']
             )
+        )
 
-            if success:
-                return jsonify({
-                    'status': 'success',
-                    'message': f'Digital twin {data["twin_id"]} created successfully',
-                    'timestamp': datetime.now().isoformat()
-                })
-            else:
-                return jsonify({'error': 'Failed to create digital twin'}), 500
-
-        finally:
-            loop.close()
+        if success:
+            return jsonify({
+                'status': 'success',
+                'message': f'Digital twin {data["twin_id"]} created successfully',
+                'timestamp': datetime.now().isoformat()
+            })
+        else:
+            return jsonify({'error': 'Failed to create digital twin'}), 500
 
     except Exception as e:
         logger.error(f"Digital twin creation error: {e}")
@@ -386,25 +336,18 @@ def get_twin_prediction(twin_id: str, metric: str):
         if not aira or not aira.digital_twin:
             return jsonify({'error': 'Digital twin engine not available'}), 500
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            prediction = loop.run_until_complete(
-                aira.digital_twin.get_twin_prediction(twin_id, metric, time_horizon)
-            )
-
-            if prediction:
-                return jsonify({
-                    'status': 'success',
-                    'prediction': prediction,
-                    'timestamp': datetime.now().isoformat()
-                })
-            else:
-                return jsonify({'error': f'No prediction available for {twin_id}.{metric}'}), 404
+        prediction = run_async(
+            aira.digital_twin.get_twin_prediction(twin_id, metric, time_horizon)
+        )
 
-        finally:
-            loop.close()
+        if prediction:
+            return jsonify({
+                'status': 'success',
+                'prediction': prediction,
+                'timestamp': datetime.now().isoformat()
+            })
+        else:
+            return jsonify({'error': f'No prediction available for {twin_id}.{metric}'}), 404
 
     except Exception as e:
         logger.error(f"Twin prediction error: {e}")
@@ -434,32 +377,25 @@ def run_scenario_test():
         duration_hours = data.get('duration_hours', 1)
         duration = timedelta(hours=duration_hours)
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            results = loop.run_until_complete(
-                aira.digital_twin.run_scenario_test(
-                    scenario_id=data['scenario_id'],
-                    name=data['name'],
-                    description=data['description'],
-                    parameters=data['parameters'],
-                    twin_ids=data['twin_ids'],
-                    duration=duration
-                )
+        results = run_async(
+            aira.digital_twin.run_scenario_test(
+                scenario_id=data['scenario_id'],
+                name=data['name'],
+                description=data['description'],
+                parameters=data['parameters'],
+                twin_ids=data['twin_ids'],
+                duration=duration
             )
+        )
 
-            if results:
-                return jsonify({
-                    'status': 'success',
-                    'scenario_results': results,
-                    'timestamp': datetime.now().isoformat()
-                })
-            else:
-                return jsonify({'error': 'Scenario test failed'}), 500
-
-        finally:
-            loop.close()
+        if results:
+            return jsonify({
+                'status': 'success',
+                'scenario_results': results,
+                'timestamp': datetime.now().isoformat()
+            })
+        else:
+            return jsonify({'error': 'Scenario test failed'}), 500
 
     except Exception as e:
         logger.error(f"Scenario test error: {e}")
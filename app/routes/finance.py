@@ -4,15 +4,14 @@ Real-time financial operations, payment processing, and business intelligence
 Complete production implementation with Stripe, PayPal, QuickBooks integration
 """
 
-import asyncio
 import logging
 from datetime import datetime
 from decimal import Decimal
-from functools import wraps
 from typing import Optional
 
 from flask import Blueprint, jsonify, request
 
+from app.services.async_bridge import async_route
 from orchestrator.agents.production_finance import (
     PaymentStatus,
     ProductionFinanceAgent,
@@ -29,20 +28,6 @@ finance_bp = Blueprint('finance', __name__, url_prefix='/api/finance')
 _finance_agent: Optional[ProductionFinanceAgent] = None
 
 
-def async_route(f):
-    """Decorator to handle async routes in Flask."""
-    @wraps(f)
-    def wrapper(*args, **kwargs):
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        return loop.run_until_complete(f(*args, **kwargs))
-    return wrapper
-
-
 async def get_finance_agent() -> ProductionFinanceAgent:
     """Get or create finance agent instance."""
     global _finance_agent
@@ -1,6 +1,5 @@
 """Health and readiness endpoints for the orchestrator."""
 
-import asyncio
 import logging
 import os
 from datetime import datetime, timezone
@@ -8,6 +7,7 @@ from typing import Any, Dict, Optional
 
 from flask import Blueprint, current_app, jsonify
 
+from app.services.async_bridge import run_async
 from app.services.empire_service import get_empire_service
 from app.services.health_service import get_health_service
 
@@ -33,16 +33,9 @@ async def _fetch_agent_snapshot() -> Optional[Dict[str, Any]]:
 
 
 def _run_async(coro):
-    """Execute a coroutine safely from synchronous context."""
+    """Execute a coroutine on the shared event loop from synchronous context."""
 
-    try:
-        return asyncio.run(coro)
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
+    return run_async(coro)
 
 
 @health_bp.route("/healthz")
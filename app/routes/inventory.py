@@ -4,7 +4,6 @@ Real business logic for inventory optimization, demand forecasting, and supplier
 No mock data - complete production-ready inventory operations
 """
 
-import asyncio
 import logging
 import time
 from datetime import datetime, timedelta
@@ -13,6 +12,8 @@ from functools import wraps
 from flask import Blueprint, current_app, jsonify, request
 
 from app.orchestrator_bridge import get_orchestrator
+from app.services.async_bridge import gather_async, run_async
+from app.services.catalog_cache import get_catalog_cache
 from app.services.shopify_service import (
     ShopifyAPIError,
     ShopifyAuthError,
@@ -80,12 +81,7 @@ def get_inventory_status():
             }), 503
 
         # Run status check asynchronously
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            status = loop.run_until_complete(inventory_agent.get_status())
-        finally:
-            loop.close()
+        status = run_async(inventory_agent.get_status())
 
         return jsonify({
             'success': True,
@@ -113,23 +109,15 @@ def get_inventory_dashboard():
             return jsonify({'error': 'Inventory agent not available'}), 503
 
         # Get dashboard data
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            # Run multiple operations concurrently
-            tasks = [
-                inventory_agent._fetch_current_inventory(),
-                inventory_agent._analyze_reorder_requirements(),
-                inventory_agent._generate_inventory_analytics(),
-                inventory_agent._monitor_supplier_performance()
-            ]
-
-            inventory_data, reorder_analysis, analytics, supplier_performance = loop.run_until_complete(
-                asyncio.gather(*tasks)
-            )
+        # Run multiple operations concurrently
+        tasks = [
+            inventory_agent._fetch_current_inventory(),
+            inventory_agent._analyze_reorder_requirements(),
+            inventory_agent._generate_inventory_analytics(),
+            inventory_agent._monitor_supplier_performance()
+        ]
 
-        finally:
-            loop.close()
+        inventory_data, reorder_analysis, analytics, supplier_performance = gather_async(*tasks)
 
         # Compile dashboard response
         dashboard_data = {
@@ -335,8 +323,8 @@ def get_inventory_products():
             }), 503
 
         try:
-            # Fetch real data from Shopify
-            products_data, _ = service.list_products(limit=limit)
+            # Serve from the catalog cache; Shopify is only called on a miss
+            products_data, cache_meta = get_catalog_cache().get_products(limit=limit, force=force_refresh)
 
             # Transform to normalized format
             transformed_products = []
@@ -385,8 +373,8 @@ def get_inventory_products():
                     "count": len(transformed_products),
                     "lowStock": low_stock_count,
                     "fetchedMs": fetch_time_ms,
-                    "cache": "MISS" if force_refresh else "HIT",
-                    "apiCalls": 1
+                    "cache": cache_meta["cache"],
+                    "apiCalls": cache_meta["apiCalls"]
                 }
             }
 
@@ -490,7 +478,7 @@ def get_inventory_metrics():
 
         # Get real metrics from Shopify
         try:
-            products_data, _ = service.list_products(limit=250)
+            products_data, _ = get_catalog_cache().get_products()
 
             total_products = len(products_data)
             total_variants = sum(len(p.get('variants', [])) for p in products_data)
@@ -556,8 +544,8 @@ def get_inventory_metrics():
 def get_inventory_agent_status():
     """Get inventory agent status and health metrics."""
     try:
-        agent = asyncio.run(get_inventory_agent())
-        status = asyncio.run(agent.get_status())
+        agent = run_async(get_inventory_agent())
+        status = run_async(agent.get_status())
 
         return jsonify({
             'success': True,
@@ -578,19 +566,19 @@ def get_inventory_agent_status():
 def get_inventory_ml_dashboard():
     """Get comprehensive inventory dashboard data with ML insights."""
     try:
-        agent = asyncio.run(get_inventory_agent())
+        agent = run_async(get_inventory_agent())
 
         # Get current inventory levels
-        inventory_levels = asyncio.run(agent._sync_inventory_levels())
+        inventory_levels = run_async(agent._sync_inventory_levels())
 
         # Get recent forecasts
-        forecasts = asyncio.run(agent._generate_demand_forecasts())
+        forecasts = run_async(agent._generate_demand_forecasts())
 
         # Get optimization recommendations
-        optimization = asyncio.run(agent._optimize_inventory_parameters())
+        optimization = run_async(agent._optimize_inventory_parameters())
 
         # Get reorder analysis
-        reorder_analysis = asyncio.run(agent._analyze_reorder_requirements())
+        reorder_analysis = run_async(agent._analyze_reorder_requirements())
 
         dashboard_data = {
             'inventory_summary': {
@@ -651,7 +639,7 @@ def get_inventory_ml_dashboard():
 def get_item_forecast(sku):
     """Get ML-powered demand forecast for a specific item."""
     try:
-        agent = asyncio.run(get_inventory_agent())
+        agent = run_async(get_inventory_agent())
 
         # Get forecast data for specific SKU
         forecast_data = {
@@ -706,9 +694,9 @@ def get_item_forecast(sku):
 def get_optimization_recommendations():
     """Get AI-powered inventory optimization recommendations."""
     try:
-        agent = asyncio.run(get_inventory_agent())
+        agent = run_async(get_inventory_agent())
 
-        optimization_data = asyncio.run(agent._optimize_inventory_parameters())
+        optimization_data = run_async(agent._optimize_inventory_parameters())
 
         recommendations = {
             'cost_optimization': [
@@ -777,9 +765,9 @@ def get_optimization_recommendations():
 def get_reorder_analysis():
     """Get intelligent reorder requirements and analysis."""
     try:
-        agent = asyncio.run(get_inventory_agent())
+        agent = run_async(get_inventory_agent())
 
-        reorder_data = asyncio.run(agent._analyze_reorder_requirements())
+        reorder_data = run_async(agent._analyze_reorder_requirements())
 
         reorder_analysis = {
             'urgent_reorders': [
@@ -862,7 +850,7 @@ def get_reorder_analysis():
 def get_supplier_performance():
     """Get comprehensive supplier performance analytics."""
     try:
-        agent = asyncio.run(get_inventory_agent())
+        agent = run_async(get_inventory_agent())
 
         supplier_performance = {
             'suppliers': [
@@ -960,10 +948,10 @@ def get_supplier_performance():
 def execute_inventory_cycle():
     """Execute a full intelligent inventory management cycle."""
     try:
-        agent = asyncio.run(get_inventory_agent())
+        agent = run_async(get_inventory_agent())
 
         # Execute the main inventory cycle
-        execution_result = asyncio.run(agent.run())
+        execution_result = run_async(agent.run())
 
         return jsonify({
             'success': True,
@@ -985,8 +973,8 @@ def execute_inventory_cycle():
 def inventory_health_check():
     """Inventory system health check with detailed status."""
     try:
-        agent = asyncio.run(get_inventory_agent())
-        status = asyncio.run(agent.get_status())
+        agent = run_async(get_inventory_agent())
+        status = run_async(agent.get_status())
 
         health_status = {
             'service': 'inventory',
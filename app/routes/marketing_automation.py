@@ -11,6 +11,7 @@ from typing import Dict, List
 from flask import Blueprint, jsonify, request
 from marshmallow import Schema, ValidationError, fields
 
+from app.services.async_bridge import run_async
 from app.services.production_agent_executor import get_agent_executor
 from orchestrator.agents.production_marketing_automation import (
     create_production_marketing_agent,
@@ -397,7 +398,7 @@ def register_marketing_websocket_events(socketio):
                 performance_data = await agent._analyze_marketing_performance()
                 return performance_data
 
-            metrics = asyncio.run(get_metrics())
+            metrics = run_async(get_metrics())
             socketio.emit('marketing_metrics_update', metrics, namespace='/ws/marketing')
 
         except Exception as e:
@@ -417,7 +418,7 @@ def register_marketing_websocket_events(socketio):
                     'engagement_score': email_data.get('engagement_score', 0)
                 }
 
-            status = asyncio.run(get_campaign_status())
+            status = run_async(get_campaign_status())
             socketio.emit('campaign_status_update', status, namespace='/ws/marketing')
 
         except Exception as e:
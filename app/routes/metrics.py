@@ -51,6 +51,13 @@ def get_metrics():
             },
         }
 
+        try:
+            from app.services.webhook_processor import get_webhook_processor
+
+            metrics["webhooks"] = get_webhook_processor().get_queue_metrics()
+        except Exception as e:
+            logger.warning(f"Webhook metrics unavailable: {e}")
+
         return jsonify(metrics)
 
     except Exception as e:
@@ -202,10 +209,8 @@ def get_dashboard_metrics():
             
             # Orders metrics
             try:
-                recent_orders = await shopify.get_orders(limit=100, status='any')
-                if recent_orders and 'orders' in recent_orders:
-                    orders = recent_orders['orders']
-                    
+                orders, pagination = shopify.list_orders(limit=100, status='any')
+                if orders:
                     metrics['orders'] = {
                         'total': len(orders),
                         'pending': len([o for o in orders if o.get('fulfillment_status') is None]),
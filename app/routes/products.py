@@ -15,6 +15,7 @@ from typing import Optional
 
 from flask import Blueprint, jsonify, request
 
+from app.services.catalog_cache import get_catalog_cache
 from app.services.shopify_service import ShopifyService, ShopifyAPIError
 
 logger = logging.getLogger(__name__)
@@ -81,9 +82,8 @@ def get_products():
         if collection_id:
             params['collection_id'] = collection_id
         
-        # Get products from Shopify
-        products, pagination = service.list_products(limit=limit, fields=None)
-        products_response = {'products': products}
+        # Get products from the catalog cache
+        products, _ = get_catalog_cache().get_products(limit=limit)
         
         # Apply search filter if provided (Shopify API doesn't support search param directly)
         if search:
@@ -164,9 +164,8 @@ def get_product(product_id: str):
                 'error': 'Shopify not configured'
             }), 503
         
-        # Get product from Shopify - fetch all and filter by ID
-        products, pagination = service.list_products(limit=250, fields=None)
-        product = next((p for p in products if str(p.get('id')) == str(product_id)), None)
+        # Get product from the catalog cache
+        product = get_catalog_cache().get_product(product_id)
         
         if not product:
             return jsonify({
@@ -267,8 +266,8 @@ def get_product_stats():
                 'error': 'Shopify not configured'
             }), 503
         
-        # Get all products (this might need pagination for large catalogs)
-        products, pagination = service.list_products(limit=250, fields=None)
+        # Get all products
+        products, _ = get_catalog_cache().get_products()
         
         # Calculate statistics
         total_products = len(products)
@@ -361,7 +360,7 @@ def search_products():
             }), 503
         
         # Get products and filter by search query
-        products, pagination = service.list_products(limit=250, fields=None)
+        products, _ = get_catalog_cache().get_products()
         
         query_lower = query.lower()
         matching_products = [
@@ -12,6 +12,8 @@ from flask import Blueprint, jsonify, request
 
 from app.blueprints.shopify import get_shopify_service
 from app.orchestrator_bridge import get_orchestrator as get_bridge_orchestrator
+from app.services.async_bridge import run_async
+from app.services.catalog_cache import get_catalog_cache
 from app.services.shopify_service import (
     ShopifyAPIError,
     ShopifyAuthError,
@@ -414,7 +416,7 @@ def list_products_v2():
     raw_products: list[dict[str, Any]] = []
 
     try:
-        raw_products, _ = service.list_products(limit=limit)
+        raw_products, _ = get_catalog_cache().get_products(limit=limit)
     except (ShopifyAuthError, ShopifyAPIError, ShopifyRateLimitError) as exc:
         # Replace error response with graceful empty fallback (no mock data) to satisfy contract
         logger.warning("Shopify product fetch failed (%s) - returning empty fallback response", exc)
@@ -540,7 +542,7 @@ def analyse_product_v2():
     raw_products: list[dict[str, Any]] = []
 
     try:
-        raw_products, _ = service.list_products(limit=250)
+        raw_products, _ = get_catalog_cache().get_products()
     except (ShopifyAuthError, ShopifyAPIError, ShopifyRateLimitError) as exc:
         # Return graceful empty analysis instead of 503
         logger.warning("Shopify product analysis fetch failed: %s - returning empty analysis", exc)
@@ -791,7 +793,6 @@ def execute_agent(agent_id: str):
             agent.execution_params = execution_params
 
         # Trigger execution asynchronously
-        import asyncio
         import threading
         import uuid
 
@@ -812,9 +813,9 @@ def execute_agent(agent_id: str):
         def run_agent() -> None:
             try:
                 if hasattr(agent, "execute"):
-                    result = asyncio.run(agent.execute())
+                    result = run_async(agent.execute())
                 else:
-                    result = asyncio.run(agent._execute_task())
+                    result = run_async(agent._execute_task())
 
                 # Update execution record with result
                 active_executions[execution_id]['status'] = 'completed'
@@ -929,7 +930,7 @@ def get_inventory_status():
         })
 
     try:
-        products, _ = service.list_products(limit=250)
+        products, _ = get_catalog_cache().get_products()
 
         total_inventory = 0
         low_stock_count = 0
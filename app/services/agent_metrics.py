@@ -0,0 +1,328 @@
+"""
+Incremental agent execution metrics.
+
+The production agent executor reports every finished execution here, so
+agent health is maintained as streaming state instead of being recomputed
+from execution history on each monitoring cycle:
+
+- cumulative counters per agent type
+- an EWMA of execution latency
+- hourly buckets over a sliding window (24h by default), each holding
+  counts and a t-digest of durations, for error rate, throughput and
+  p50/p95/p99 latency over the window
+
+Recording an execution is O(1) amortised and a snapshot costs O(buckets),
+independent of how many executions the fleet has run.
+"""
+
+import bisect
+import logging
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SUCCESS_STATUS = "completed"
+FAILURE_STATUS = "failed"
+
+
+class TDigest:
+    """Merging t-digest for streaming quantile estimates.
+
+    Values are buffered and periodically merged into at most roughly
+    ``compression`` centroids, sized so that the tails stay accurate.
+    """
+
+    __slots__ = ("compression", "count", "min", "max", "_means", "_weights", "_buffer")
+
+    def __init__(self, compression: int = 100):
+        self.compression = compression
+        self.count = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._means: List[float] = []
+        self._weights: List[float] = []
+        self._buffer: List[Tuple[float, float]] = []
+
+    def __len__(self) -> int:
+        return int(self.count)
+
+    def add(self, value: float, weight: float = 1.0):
+        self._buffer.append((value, weight))
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= self.compression * 5:
+            self._compress()
+
+    def merge(self, other: "TDigest"):
+        """Fold another digest into this one."""
+        if not other.count:
+            return
+        self._buffer.extend(zip(other._means, other._weights))
+        self._buffer.extend(other._buffer)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the ``q`` quantile (0-1), or None when empty."""
+        if not self.count:
+            return None
+        self._compress()
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        means, weights = self._means, self._weights
+        if len(means) == 1:
+            return means[0]
+
+        target = q * self.count
+        cumulative = 0.0
+        for i, weight in enumerate(weights):
+            center = cumulative + weight / 2
+            if target < center:
+                if i == 0:
+                    # Between the minimum and the first centroid
+                    return self.min + (means[0] - self.min) * target / center
+                prev_center = cumulative - weights[i - 1] / 2
+                fraction = (target - prev_center) / (center - prev_center)
+                return means[i - 1] + (means[i] - means[i - 1]) * fraction
+            cumulative += weight
+
+        # Between the last centroid and the maximum
+        last_center = self.count - weights[-1] / 2
+        fraction = (target - last_center) / (self.count - last_center)
+        return means[-1] + (self.max - means[-1]) * fraction
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        points = sorted(list(zip(self._means, self._weights)) + self._buffer)
+        self._buffer = []
+
+        means: List[float] = []
+        weights: List[float] = []
+        total = self.count
+        k_limit = self._k(0.0) + 1
+        cumulative = 0.0
+        for mean, weight in points:
+            q = (cumulative + weight) / total
+            if means and self._k(q) <= k_limit:
+                merged = weights[-1] + weight
+                means[-1] += (mean - means[-1]) * weight / merged
+                weights[-1] = merged
+            else:
+                if means:
+                    k_limit = self._k(cumulative / total) + 1
+                means.append(mean)
+                weights.append(weight)
+            cumulative += weight
+
+        self._means, self._weights = means, weights
+
+    def _k(self, q: float) -> float:
+        # k1 scale function: small centroids near the tails, large in the middle
+        return self.compression / (2 * math.pi) * math.asin(2 * min(1.0, max(0.0, q)) - 1)
+
+
+@dataclass(slots=True)
+class _Bucket:
+    hour: int
+    total: int = 0
+    failed: int = 0
+    duration_total: float = 0.0
+    durations: TDigest = field(default_factory=TDigest)
+
+
+class AgentStats:
+    """Streaming execution statistics for one agent type."""
+
+    def __init__(self, window_hours: int = 24, ewma_alpha: float = 0.2):
+        self.window_hours = window_hours
+        self.ewma_alpha = ewma_alpha
+        self.total = 0
+        self.successful = 0
+        self.failed = 0
+        self.ewma_duration: Optional[float] = None
+        self.last_execution_time: Optional[datetime] = None
+        self._buckets: Deque[_Bucket] = deque()
+
+    def record(self, status: str, duration: Optional[float], finished_at: datetime):
+        self.total += 1
+        if status == SUCCESS_STATUS:
+            self.successful += 1
+        elif status == FAILURE_STATUS:
+            self.failed += 1
+        if self.last_execution_time is None or finished_at > self.last_execution_time:
+            self.last_execution_time = finished_at
+
+        bucket = self._bucket_for(finished_at)
+        if bucket is None:
+            return
+        bucket.total += 1
+        if status == FAILURE_STATUS:
+            bucket.failed += 1
+        if status == SUCCESS_STATUS and duration:
+            bucket.duration_total += duration
+            bucket.durations.add(duration)
+            self.ewma_duration = duration if self.ewma_duration is None else (
+                self.ewma_alpha * duration + (1 - self.ewma_alpha) * self.ewma_duration
+            )
+
+    def snapshot(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Current statistics, with rates and percentiles over the window."""
+        self._expire(self._hour(now or datetime.now(timezone.utc)))
+
+        window_total = sum(b.total for b in self._buckets)
+        window_failed = sum(b.failed for b in self._buckets)
+        durations = TDigest()
+        duration_total = 0.0
+        for bucket in self._buckets:
+            durations.merge(bucket.durations)
+            duration_total += bucket.duration_total
+
+        return {
+            "total_executions": self.total,
+            "successful_executions": self.successful,
+            "failed_executions": self.failed,
+            "window_executions": window_total,
+            "error_rate_percent": window_failed / window_total * 100 if window_total else 0.0,
+            "throughput_per_hour": window_total / self.window_hours,
+            "avg_execution_time_seconds": duration_total / len(durations) if durations.count else 0.0,
+            "ewma_execution_time_seconds": self.ewma_duration or 0.0,
+            "p50_execution_time_seconds": durations.quantile(0.50) or 0.0,
+            "p95_execution_time_seconds": durations.quantile(0.95) or 0.0,
+            "p99_execution_time_seconds": durations.quantile(0.99) or 0.0,
+            "last_execution_time": self.last_execution_time,
+        }
+
+    def _bucket_for(self, finished_at: datetime) -> Optional[_Bucket]:
+        hour = self._hour(finished_at)
+        if not self._buckets or hour > self._buckets[-1].hour:
+            self._buckets.append(_Bucket(hour))
+            self._expire(hour)
+            return self._buckets[-1]
+        if hour < self._buckets[-1].hour - self.window_hours + 1:
+            return None  # Already outside the window
+
+        # Late arrival: find or insert its bucket, keeping hours ordered
+        hours = [b.hour for b in self._buckets]
+        index = bisect.bisect_left(hours, hour)
+        if index < len(hours) and hours[index] == hour:
+            return self._buckets[index]
+        self._buckets.insert(index, _Bucket(hour))
+        return self._buckets[index]
+
+    def _expire(self, current_hour: int):
+        while self._buckets and self._buckets[0].hour <= current_hour - self.window_hours:
+            self._buckets.popleft()
+
+    @staticmethod
+    def _hour(moment: datetime) -> int:
+        return int(moment.timestamp() // 3600)
+
+
+class AgentMetricsAggregator:
+    """Per-agent-type streaming metrics fed by execution completion events."""
+
+    def __init__(self, window_hours: int = 24, ewma_alpha: float = 0.2):
+        self.window_hours = window_hours
+        self.ewma_alpha = ewma_alpha
+        self.created_at = datetime.now(timezone.utc)
+        self.seeded = False
+        self._stats: Dict[str, AgentStats] = {}
+        self._lock = threading.Lock()
+
+    def record_execution(
+        self,
+        agent_type: str,
+        status: str,
+        duration_seconds: Optional[float] = None,
+        finished_at: Optional[datetime] = None,
+    ):
+        """
+        Record a finished execution.
+
+        Args:
+            agent_type: Agent type the execution ran
+            status: Final execution status ("completed", "failed", ...)
+            duration_seconds: Execution duration, if known
+            finished_at: Completion time, defaults to now
+        """
+        finished_at = finished_at or datetime.now(timezone.utc)
+        with self._lock:
+            stats = self._stats.get(agent_type)
+            if stats is None:
+                stats = self._stats[agent_type] = AgentStats(self.window_hours, self.ewma_alpha)
+            stats.record(status, duration_seconds, finished_at)
+
+    def seed(self, executions: Iterable[Dict[str, Any]]) -> int:
+        """
+        Load execution history that finished before this aggregator existed.
+
+        Executions finished after creation were already reported live and
+        are skipped, so seeding never double-counts.
+
+        Args:
+            executions: Execution dicts as returned by the agent executor
+
+        Returns:
+            Number of executions loaded
+        """
+        loaded = []
+        for execution in executions:
+            if execution.get('status') not in (SUCCESS_STATUS, FAILURE_STATUS):
+                continue
+            finished = execution.get('completed_at') or execution.get('queued_at')
+            if not finished:
+                continue
+            finished_at = datetime.fromisoformat(finished.replace('Z', '+00:00'))
+            if finished_at.tzinfo is None:
+                finished_at = finished_at.replace(tzinfo=timezone.utc)
+            if finished_at >= self.created_at:
+                continue
+            loaded.append((finished_at, execution))
+
+        loaded.sort(key=lambda item: item[0])
+        for finished_at, execution in loaded:
+            self.record_execution(
+                execution['agent_type'], execution['status'], execution.get('duration_seconds'), finished_at
+            )
+        self.seeded = True
+        return len(loaded)
+
+    def agent_types(self) -> List[str]:
+        with self._lock:
+            return list(self._stats)
+
+    def snapshot(self, agent_type: str, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            stats = self._stats.get(agent_type)
+            return stats.snapshot(now) if stats else None
+
+    def snapshot_all(self, now: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {agent_type: stats.snapshot(now) for agent_type, stats in self._stats.items()}
+
+
+# Singleton instance
+_agent_metrics: Optional[AgentMetricsAggregator] = None
+_agent_metrics_lock = threading.Lock()
+
+
+def get_agent_metrics() -> AgentMetricsAggregator:
+    """Get the process-wide agent metrics aggregator."""
+    global _agent_metrics
+    if _agent_metrics is None:
+        with _agent_metrics_lock:
+            if _agent_metrics is None:
+                _agent_metrics = AgentMetricsAggregator()
+    return _agent_metrics
@@ -0,0 +1,321 @@
+"""
+Async Bridge - Persistent Event Loop for Synchronous Callers
+
+Flask views and Socket.IO handlers run on worker threads that have no event
+loop of their own. Historically each handler called ``asyncio.run()`` or built
+a throwaway ``asyncio.new_event_loop()``, which discarded every connection
+pool, httpx client and Redis connection that the agents had opened as soon as
+the request finished.
+
+This module owns a single long-lived event loop running on a daemon thread.
+Synchronous code hands coroutines to it through :func:`run_async` (or
+``get_async_bridge().submit(...)``) and blocks until the result is ready, so
+agent objects and their async clients stay bound to one loop and are reused
+across requests.
+
+Cancellation is request scoped: if the caller's timeout expires, or the
+calling thread is interrupted, the underlying task is cancelled on the loop
+instead of being left to run detached.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import inspect
+import logging
+import threading
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncBridgeError(RuntimeError):
+    """Raised when a coroutine cannot be scheduled on the bridge loop."""
+
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+class AsyncLoopBridge:
+    """
+    Long-lived background event loop shared by all synchronous callers.
+
+    The loop thread is started lazily on first use and restarted if it ever
+    dies, so importing this module has no side effects.
+    """
+
+    def __init__(self, name: str = "async-bridge-loop", default_timeout: Optional[float] = None):
+        self.name = name
+        self.default_timeout = default_timeout
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._started = threading.Event()
+
+        self._metrics_lock = threading.Lock()
+        self.metrics = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'timed_out': 0,
+            'cancelled': 0,
+            'in_flight': 0,
+            'total_wait_seconds': 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background loop thread is alive and serving work."""
+        return (
+            self._thread is not None
+            and self._thread.is_alive()
+            and self._loop is not None
+            and self._loop.is_running()
+        )
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The shared event loop, starting it if necessary."""
+        self.start()
+        assert self._loop is not None
+        return self._loop
+
+    def start(self) -> None:
+        """Start the background loop thread if it is not already running."""
+        if self.is_running:
+            return
+
+        with self._lock:
+            if self.is_running:
+                return
+
+            self._started.clear()
+            loop = asyncio.new_event_loop()
+            self._loop = loop
+            self._thread = threading.Thread(
+                target=self._run_loop, args=(loop,), name=self.name, daemon=True
+            )
+            self._thread.start()
+
+            if not self._started.wait(timeout=5.0):
+                raise AsyncBridgeError("Background event loop failed to start")
+
+            logger.info(f"Async bridge event loop started ({self.name})")
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(self._started.set)
+        try:
+            loop.run_forever()
+        except Exception as e:
+            logger.error(f"Async bridge event loop crashed: {e}", exc_info=True)
+        finally:
+            try:
+                pending = asyncio.all_tasks(loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            except Exception as e:
+                logger.debug(f"Async bridge cleanup error: {e}")
+            finally:
+                loop.close()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the loop, cancelling outstanding tasks."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None:
+                return
+
+            if loop.is_running():
+                loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=timeout)
+
+            self._loop = None
+            self._thread = None
+            logger.info(f"Async bridge event loop stopped ({self.name})")
+
+    # ------------------------------------------------------------------
+    # Submission API
+    # ------------------------------------------------------------------
+
+    def submit_nowait(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the shared loop and return its future."""
+        if not asyncio.iscoroutine(coro):
+            if not inspect.isawaitable(coro):
+                raise TypeError(f"Expected a coroutine, got {type(coro).__name__}")
+            coro = _await(coro)
+
+        if self._in_loop_thread():
+            coro.close()
+            raise AsyncBridgeError(
+                "submit() called from the bridge loop thread; await the coroutine instead"
+            )
+
+        try:
+            loop = self.loop
+        except Exception:
+            coro.close()
+            raise
+
+        # Run the task inside a copy of the caller's context so Flask's
+        # request/app context (held in contextvars) is visible to the coroutine.
+        context = contextvars.copy_context()
+        future: concurrent.futures.Future = concurrent.futures.Future()
+
+        def _schedule() -> None:
+            if future.cancelled():
+                coro.close()
+                return
+            try:
+                task = context.run(loop.create_task, coro)
+            except BaseException as exc:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(exc)
+                return
+            task.add_done_callback(lambda t: self._copy_task_state(t, future))
+            future.add_done_callback(
+                lambda f: f.cancelled() and loop.call_soon_threadsafe(task.cancel)
+            )
+
+        loop.call_soon_threadsafe(_schedule)
+
+        with self._metrics_lock:
+            self.metrics['submitted'] += 1
+            self.metrics['in_flight'] += 1
+        future.add_done_callback(self._record_completion)
+        return future
+
+    def submit(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the shared loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to execute
+            timeout: Seconds to wait before cancelling the task. Falls back to
+                the bridge's ``default_timeout``; ``None`` waits indefinitely.
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            TimeoutError: If the timeout elapsed; the task is cancelled.
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+
+        future = self.submit_nowait(coro)
+        started = time.monotonic()
+
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            with self._metrics_lock:
+                self.metrics['timed_out'] += 1
+            raise TimeoutError(f"Coroutine did not complete within {timeout}s") from None
+        except BaseException:
+            # Caller went away (KeyboardInterrupt, worker shutdown, ...):
+            # don't leave the task running detached on the loop.
+            future.cancel()
+            raise
+        finally:
+            with self._metrics_lock:
+                self.metrics['total_wait_seconds'] += time.monotonic() - started
+
+    @staticmethod
+    def _copy_task_state(task: asyncio.Task, future: concurrent.futures.Future) -> None:
+        if task.cancelled():
+            future.cancel()
+        if not future.set_running_or_notify_cancel():
+            return
+        exception = task.exception()
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(task.result())
+
+    def _record_completion(self, future: concurrent.futures.Future) -> None:
+        with self._metrics_lock:
+            self.metrics['in_flight'] -= 1
+            if future.cancelled():
+                self.metrics['cancelled'] += 1
+            elif future.exception() is not None:
+                self.metrics['failed'] += 1
+            else:
+                self.metrics['completed'] += 1
+
+    def _in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bridge health and throughput statistics."""
+        with self._metrics_lock:
+            stats = dict(self.metrics)
+
+        finished = stats['submitted'] - stats['in_flight']
+        stats['avg_wait_seconds'] = stats['total_wait_seconds'] / finished if finished else 0.0
+        stats['running'] = self.is_running
+        stats['thread_name'] = self.name
+        return stats
+
+
+# Global bridge instance
+_async_bridge: Optional[AsyncLoopBridge] = None
+_async_bridge_lock = threading.Lock()
+
+
+def get_async_bridge() -> AsyncLoopBridge:
+    """Get or create the global async bridge instance."""
+    global _async_bridge
+    if _async_bridge is None:
+        with _async_bridge_lock:
+            if _async_bridge is None:
+                _async_bridge = AsyncLoopBridge()
+    return _async_bridge
+
+
+def run_async(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """Execute a coroutine on the shared event loop from synchronous code."""
+    return get_async_bridge().submit(coro, timeout=timeout)
+
+
+def gather_async(*coros: Awaitable[Any], timeout: Optional[float] = None,
+                 return_exceptions: bool = False) -> list:
+    """Run several coroutines concurrently on the shared loop and return their results."""
+    async def _gather() -> list:
+        return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+    return run_async(_gather(), timeout=timeout)
+
+
+def async_route(f: Optional[Callable] = None, *, timeout: Optional[float] = None) -> Callable:
+    """
+    Decorator that lets a Flask view be written as ``async def``.
+
+    The view coroutine runs on the shared bridge loop rather than a per-request
+    loop. Usable bare (``@async_route``) or with a timeout
+    (``@async_route(timeout=30)``).
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return run_async(func(*args, **kwargs), timeout=timeout)
+        return wrapper
+
+    if f is not None:
+        return decorator(f)
+    return decorator
+
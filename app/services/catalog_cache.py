@@ -0,0 +1,459 @@
+"""
+Catalog Cache - shared in-process read-through cache of the Shopify catalog.
+
+Product records (Shopify REST shape, variants included) are kept keyed by
+product ID, with indexes from variant and inventory item IDs back to their
+product. The cache is:
+
+- populated by a full sync on first use and by a background sync thread
+- updated in place by ``products/create`` and ``products/update`` webhooks
+  (their payload is the full product), and pruned by ``products/delete``
+- invalidated per product by ``inventory_levels/update`` webhooks; the
+  affected products are re-fetched in one request on the next read
+
+Every change bumps a catalog-wide version, and each product carries the
+version at which it last changed, so clients can detect updates cheaply.
+
+Each worker process has its own cache, but a webhook is processed by only one
+of them. With a ``CatalogBus`` the worker that applies a webhook relays it to
+the others over Redis pub/sub, so every worker's cache stays current.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from app.services.shopify_service import ShopifyService
+
+logger = logging.getLogger(__name__)
+
+# Shopify's maximum page size, also the maximum number of IDs per request
+SHOPIFY_PAGE_SIZE = 250
+
+CATALOG_TOPICS = ("products/create", "products/update", "products/delete")
+
+# Longest sync interval for a cache whose worker does not receive every webhook
+UNSHARED_SYNC_INTERVAL = 60.0
+
+
+def _is_catalog_topic(topic: str) -> bool:
+    return topic in CATALOG_TOPICS or topic.startswith("inventory_levels/")
+
+
+class CatalogBus:
+    """Relays catalog webhooks between worker processes over Redis pub/sub."""
+
+    def __init__(self, client, channel: str = "catalog:webhooks", retry_interval: float = 5.0):
+        """
+        Args:
+            client: Redis client
+            channel: Pub/sub channel shared by the workers
+            retry_interval: Seconds to wait before resubscribing after an error
+        """
+        self.client = client
+        self.channel = channel
+        self.retry_interval = retry_interval
+        self.origin = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    def publish(self, topic: str, data: Dict[str, Any]):
+        """Send a webhook to the other workers; failures are logged, not raised."""
+        try:
+            self.client.publish(self.channel, json.dumps({"origin": self.origin, "topic": topic, "data": data}))
+        except Exception as e:
+            logger.warning(f"Failed to relay {topic} webhook to other workers: {e}")
+
+    def listen(self, on_webhook: Callable[[str, Dict[str, Any]], Any],
+               on_resubscribe: Callable[[], Any], stop: threading.Event):
+        """
+        Deliver webhooks published by other workers until ``stop`` is set.
+
+        Pub/sub does not buffer messages for disconnected subscribers, so
+        ``on_resubscribe`` is called after a lost subscription is restored.
+        """
+        subscribed_before = False
+        while not stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                if subscribed_before:
+                    on_resubscribe()
+                subscribed_before = True
+                while not stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if not message or message.get("type") != "message":
+                        continue
+                    payload = json.loads(message["data"])
+                    if payload.get("origin") == self.origin:
+                        continue
+                    on_webhook(payload["topic"], payload["data"])
+            except Exception as e:
+                logger.warning(f"Catalog webhook subscription failed, retrying: {e}")
+                stop.wait(self.retry_interval)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+
+class CatalogCache:
+    """Product catalog cache with webhook-driven invalidation."""
+
+    def __init__(self, service: Optional[ShopifyService] = None, sync_interval: float = 300.0,
+                 bus: Optional[CatalogBus] = None):
+        """
+        Args:
+            service: Shopify service used to load products
+            sync_interval: Seconds between background full syncs; reads
+                re-sync synchronously once the catalog is twice this old
+            bus: Relays webhooks to and from the caches of other workers
+        """
+        self.service = service or ShopifyService()
+        self.sync_interval = sync_interval
+        self.bus = bus
+
+        self.version = 0
+        self.synced_at: Optional[float] = None
+        self.metrics = {"hits": 0, "misses": 0, "api_calls": 0, "webhooks": 0, "invalidations": 0}
+
+        self._products: Dict[int, Dict[str, Any]] = {}
+        self._versions: Dict[int, int] = {}
+        self._by_variant: Dict[int, int] = {}
+        self._by_inventory_item: Dict[int, int] = {}
+        self._dirty: Set[int] = set()
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._syncs = 0
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._bus_thread: Optional[threading.Thread] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.synced_at is not None
+
+    def start(self):
+        """Start the background sync thread and the bus listener."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sync_loop, name="catalog-sync", daemon=True)
+        self._thread.start()
+        if self.bus is not None:
+            self._bus_thread = threading.Thread(
+                target=self.bus.listen,
+                args=(self._apply_relayed, self._resync, self._stop),
+                name="catalog-bus",
+                daemon=True,
+            )
+            self._bus_thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def get_products(self, limit: Optional[int] = None, force: bool = False) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Get products ordered by ID, loading or refreshing them if needed.
+
+        Returned records are shared with the cache and must not be mutated.
+
+        Args:
+            limit: Maximum number of products to return
+            force: Re-sync the whole catalog from Shopify first
+
+        Returns:
+            Tuple of (products, meta) where meta has the cache status
+            ("HIT", "REFRESH" or "MISS"), Shopify API calls made and the
+            catalog version
+
+        Raises:
+            ShopifyAuthError, ShopifyAPIError: When Shopify is needed but fails
+        """
+        status, api_calls = self._ensure_fresh(force)
+        with self._lock:
+            ids = sorted(self._products)
+            if limit is not None:
+                ids = ids[:limit]
+            products = [self._products[product_id] for product_id in ids]
+            return products, {"cache": status, "apiCalls": api_calls, "version": self.version}
+
+    def get_product(self, product_id: Any) -> Optional[Dict[str, Any]]:
+        """Get one product by ID, or None if it is not in the catalog."""
+        self._ensure_fresh(False)
+        with self._lock:
+            return self._products.get(_as_id(product_id))
+
+    def product_version(self, product_id: Any) -> Optional[int]:
+        with self._lock:
+            return self._versions.get(_as_id(product_id))
+
+    def sync(self) -> int:
+        """Replace the catalog with a full load from Shopify and return its size."""
+        return self._sync()[0]
+
+    def _sync(self) -> Tuple[int, int]:
+        # Webhooks keep arriving during the fetch: remember what was pending
+        # before it so later invalidations and newer updates survive the sync
+        with self._lock:
+            dirty_before = set(self._dirty)
+            version_before = self.version
+
+        products, calls = self._fetch_all()
+        with self._lock:
+            self.metrics["api_calls"] += calls
+            fresh = {_as_id(p.get("id")) for p in products}
+            for product_id in list(self._products):
+                if product_id not in fresh and self._versions.get(product_id, 0) <= version_before:
+                    self._remove(product_id)
+            for product in products:
+                self._upsert(product, check_order=True)
+            self._dirty -= dirty_before
+            self.synced_at = time.monotonic()
+            self._syncs += 1
+            logger.info(f"Catalog synced: {len(self._products)} products (version {self.version})")
+            return len(self._products), calls
+
+    def _fetch_all(self) -> Tuple[List[Dict[str, Any]], int]:
+        """Read every product page by page, following pagination cursors."""
+        products: List[Dict[str, Any]] = []
+        page_info = None
+        calls = 0
+        while True:
+            page, pagination = self.service.list_products(limit=SHOPIFY_PAGE_SIZE, page_info=page_info)
+            calls += 1
+            products.extend(page)
+            page_info = (pagination or {}).get("next_page_info")
+            if not page_info:
+                return products, calls
+
+    def apply_webhook(self, topic: str, data: Dict[str, Any]) -> bool:
+        """
+        Apply a product or inventory webhook to the cached catalog and relay
+        it to the other workers.
+
+        Args:
+            topic: Webhook topic
+            data: Webhook payload
+
+        Returns:
+            True if the catalog changed or was invalidated
+        """
+        changed = self._apply(topic, data)
+        # Relay even when nothing changed here: another worker's copy may differ
+        if self.bus is not None and _is_catalog_topic(topic):
+            self.bus.publish(topic, data)
+        return changed
+
+    def _apply_relayed(self, topic: str, data: Dict[str, Any]):
+        self._apply(topic, data)
+
+    def _resync(self):
+        # Webhooks relayed while the subscription was down are lost
+        if not self.loaded:
+            return
+        try:
+            self._sync_once(self._syncs)
+        except Exception as e:
+            logger.warning(f"Catalog re-sync after relay reconnect failed, serving cached catalog: {e}")
+
+    def _apply(self, topic: str, data: Dict[str, Any]) -> bool:
+        with self._lock:
+            self.metrics["webhooks"] += 1
+            if topic in ("products/create", "products/update"):
+                return self._upsert(data, check_order=True)
+            if topic == "products/delete":
+                return self._remove(_as_id(data.get("id")))
+            if topic.startswith("inventory_levels/"):
+                product_id = self._by_inventory_item.get(_as_id(data.get("inventory_item_id")))
+                if product_id is None:
+                    return False
+                self._dirty.add(product_id)
+                self.metrics["invalidations"] += 1
+                return True
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.metrics,
+                "products": len(self._products),
+                "variants": len(self._by_variant),
+                "dirty": len(self._dirty),
+                "version": self.version,
+                "age_seconds": round(time.monotonic() - self.synced_at, 1) if self.loaded else None,
+            }
+
+    def _ensure_fresh(self, force: bool) -> Tuple[str, int]:
+        stale = self.loaded and time.monotonic() - self.synced_at > self.sync_interval * 2
+        if force or not self.loaded or stale:
+            calls = self._sync_once(self._syncs)
+            self.metrics["misses"] += 1
+            return "MISS", calls
+
+        with self._lock:
+            dirty = set(self._dirty)
+        if dirty:
+            calls = self._refresh_products(dirty)
+            self.metrics["misses"] += 1
+            return "REFRESH", calls
+
+        self.metrics["hits"] += 1
+        return "HIT", 0
+
+    def _sync_once(self, seen_syncs: int) -> int:
+        # Concurrent readers share one sync instead of each calling Shopify
+        with self._sync_lock:
+            if self._syncs != seen_syncs:
+                return 0
+            return self._sync()[1]
+
+    def _refresh_products(self, product_ids: Set[int]) -> int:
+        ids = sorted(product_ids)
+        calls = 0
+        for start in range(0, len(ids), SHOPIFY_PAGE_SIZE):
+            chunk = ids[start:start + SHOPIFY_PAGE_SIZE]
+            products, _ = self.service.list_products(
+                limit=SHOPIFY_PAGE_SIZE, ids=",".join(str(i) for i in chunk)
+            )
+            calls += 1
+            with self._lock:
+                self.metrics["api_calls"] += 1
+                returned = set()
+                for product in products:
+                    returned.add(_as_id(product.get("id")))
+                    self._upsert(product)
+                for product_id in chunk:
+                    if product_id not in returned:
+                        self._remove(product_id)
+                    self._dirty.discard(product_id)
+        return calls
+
+    def _upsert(self, product: Dict[str, Any], check_order: bool = False) -> bool:
+        product_id = _as_id(product.get("id"))
+        if product_id is None:
+            return False
+
+        current = self._products.get(product_id)
+        if current is not None:
+            if check_order and _is_older(product.get("updated_at"), current.get("updated_at")):
+                return False  # Out-of-order webhook delivery
+            if current == product:
+                return False
+            self._unindex(current)
+
+        self._products[product_id] = product
+        for variant in product.get("variants") or []:
+            variant_id = _as_id(variant.get("id"))
+            if variant_id is not None:
+                self._by_variant[variant_id] = product_id
+            inventory_item_id = _as_id(variant.get("inventory_item_id"))
+            if inventory_item_id is not None:
+                self._by_inventory_item[inventory_item_id] = product_id
+
+        self.version += 1
+        self._versions[product_id] = self.version
+        return True
+
+    def _remove(self, product_id: Optional[int]) -> bool:
+        product = self._products.pop(product_id, None)
+        if product is None:
+            return False
+        self._unindex(product)
+        self._versions.pop(product_id, None)
+        self._dirty.discard(product_id)
+        self.version += 1
+        return True
+
+    def _unindex(self, product: Dict[str, Any]):
+        for variant in product.get("variants") or []:
+            self._by_variant.pop(_as_id(variant.get("id")), None)
+            self._by_inventory_item.pop(_as_id(variant.get("inventory_item_id")), None)
+
+    def _sync_loop(self):
+        while not self._stop.wait(self.sync_interval):
+            try:
+                self._sync_once(self._syncs)
+            except Exception as e:
+                logger.warning(f"Background catalog sync failed, serving cached catalog: {e}")
+
+
+def _as_id(value: Any) -> Optional[int]:
+    """Shopify IDs arrive as ints, numeric strings or GIDs."""
+    if value is None:
+        return None
+    try:
+        return int(str(value).rsplit("/", 1)[-1])
+    except ValueError:
+        return None
+
+
+def _is_older(candidate: Optional[str], current: Optional[str]) -> bool:
+    if not candidate or not current:
+        return False
+    try:
+        return _parse_time(candidate) < _parse_time(current)
+    except ValueError:
+        return False
+
+
+def _parse_time(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+# Singleton instance
+_catalog_cache: Optional[CatalogCache] = None
+_catalog_cache_lock = threading.Lock()
+
+
+def create_catalog_bus() -> Optional[CatalogBus]:
+    """
+    Create the webhook relay from ``CATALOG_CACHE_REDIS_URL`` (or a Redis
+    ``SOCKETIO_MESSAGE_QUEUE``), or None without one.
+    """
+    redis_url = os.getenv("CATALOG_CACHE_REDIS_URL")
+    message_queue = os.getenv("SOCKETIO_MESSAGE_QUEUE", "")
+    if not redis_url and message_queue.startswith(("redis://", "rediss://")):
+        redis_url = message_queue
+    if not redis_url:
+        return None
+
+    try:
+        import redis
+
+        return CatalogBus(redis.from_url(redis_url, socket_timeout=5.0, decode_responses=True))
+    except ImportError:
+        logger.warning("redis package not installed; catalog webhooks are not shared between workers")
+        return None
+
+
+def get_catalog_cache() -> CatalogCache:
+    """Get the shared catalog cache, starting its background sync."""
+    global _catalog_cache
+    if _catalog_cache is None:
+        with _catalog_cache_lock:
+            if _catalog_cache is None:
+                sync_interval = float(os.getenv("CATALOG_SYNC_INTERVAL", "300"))
+                bus = create_catalog_bus()
+                if bus is None and int(os.getenv("WEB_CONCURRENCY", "1")) > 1 \
+                        and sync_interval > UNSHARED_SYNC_INTERVAL:
+                    # Other workers' webhooks never reach this cache; bound how stale it gets
+                    logger.warning(
+                        f"Multiple workers without a Redis catalog relay; syncing the catalog "
+                        f"every {UNSHARED_SYNC_INTERVAL:.0f}s instead of {sync_interval:.0f}s"
+                    )
+                    sync_interval = UNSHARED_SYNC_INTERVAL
+                cache = CatalogCache(sync_interval=sync_interval, bus=bus)
+                if cache.service.is_configured():
+                    cache.start()
+                _catalog_cache = cache
+    return _catalog_cache
@@ -5,12 +5,16 @@ Provides dependency health checks with fallback mechanisms
 and graceful degradation patterns.
 """
 
+import heapq
 import logging
+import random
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import requests
 from flask import current_app
@@ -131,6 +135,178 @@ class CircuitBreaker:
         }
 
 
+class DependencyProber:
+    """Refreshes dependency health checks in the background.
+
+    Each probe runs on its own interval with jitter so probes do not align,
+    on a small thread pool so a slow upstream only delays its own result.
+    A probe is never started while its previous run is still in flight.
+    Readers get the last completed result of every probe from ``snapshot``
+    without doing any I/O or waiting; a probe that has never completed is
+    reported as pending and started in the background.
+    """
+
+    def __init__(
+        self,
+        app,
+        probes: Dict[str, Tuple[Callable[[], Dict[str, Any]], float]],
+        jitter: float = 0.2,
+        timeout: float = 5.0,
+        required: Iterable[str] = (),
+    ):
+        """
+        Args:
+            app: Flask application the checks run under
+            probes: Probe name -> (check function, refresh interval in seconds)
+            jitter: Random spread applied to each interval, as a fraction
+            timeout: Longest ``refresh`` waits for the probes it runs
+            required: Probes whose pending result must hold back readiness
+        """
+        self.app = app
+        self.probes = probes
+        self.jitter = jitter
+        self.timeout = timeout
+        self.required = set(required)
+
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._completed_at: Dict[str, float] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self):
+        """Start the background scheduler."""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self.probes), thread_name_prefix="health-probe"
+            )
+            self._thread = threading.Thread(
+                target=self._schedule_loop, name="health-prober", daemon=True
+            )
+            self._thread.start()
+        logger.info(f"Health prober started for {len(self.probes)} dependencies")
+
+    def stop(self):
+        """Stop the scheduler; probes already running are left to finish."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False)
+
+    def refresh(self, names: Optional[List[str]] = None, timeout: Optional[float] = None):
+        """Run probes now, concurrently, and wait for them to finish."""
+        futures = [self._submit(name) for name in (names or list(self.probes))]
+        wait(futures, timeout=self.timeout if timeout is None else timeout)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Return the latest result of every probe with staleness metadata."""
+        for name in self.probes:
+            if name not in self._results:
+                self._submit(name)
+
+        now = time.monotonic()
+        checks = []
+        for name, (_, interval) in self.probes.items():
+            result = self._results.get(name)
+            if result is None:
+                checks.append({
+                    "name": name,
+                    "healthy": False,
+                    "message": "Dependency probe has not completed yet",
+                    "required": name in self.required,
+                    "stale": True,
+                })
+                continue
+
+            age = now - self._completed_at[name]
+            checks.append({
+                **result,
+                "age_seconds": round(age, 3),
+                # Missing two refreshes in a row means the probe itself is stuck
+                "stale": age > interval * (1 + self.jitter) * 2,
+            })
+        return checks
+
+    def _submit(self, name: str) -> Future:
+        with self._lock:
+            future = self._in_flight.get(name)
+            if future is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=len(self.probes), thread_name_prefix="health-probe"
+                    )
+                future = self._executor.submit(self._run_probe, name)
+                self._in_flight[name] = future
+            return future
+
+    def _run_probe(self, name: str):
+        check, _ = self.probes[name]
+        started = time.monotonic()
+        try:
+            with self.app.app_context():
+                result = check()
+        except Exception as e:
+            result = {"name": name, "healthy": False, "message": f"Probe failed: {e}", "required": False}
+        finished = time.monotonic()
+
+        result["checked_at"] = datetime.now(timezone.utc).isoformat()
+        result["duration_ms"] = round((finished - started) * 1000, 1)
+        with self._lock:
+            self._results[name] = result
+            self._completed_at[name] = finished
+            self._in_flight.pop(name, None)
+
+    def _next_delay(self, interval: float) -> float:
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _schedule_loop(self):
+        now = time.monotonic()
+        # Spread the first round over the jitter window
+        schedule = [
+            (now + random.uniform(0, interval * self.jitter), name)
+            for name, (_, interval) in self.probes.items()
+        ]
+        heapq.heapify(schedule)
+
+        while self._running:
+            due, name = schedule[0]
+            delay = due - time.monotonic()
+            if delay > 0:
+                self._wakeup.wait(delay)
+                continue
+
+            heapq.heappop(schedule)
+            interval = self.probes[name][1]
+            completed_at = self._completed_at.get(name)
+            if completed_at is not None and time.monotonic() - completed_at < interval * (1 - self.jitter):
+                # A reader started this probe recently; count the interval from that run
+                heapq.heappush(schedule, (completed_at + self._next_delay(interval), name))
+                continue
+            try:
+                self._submit(name)
+            except RuntimeError:
+                # Executor shut down while stopping
+                break
+            heapq.heappush(schedule, (time.monotonic() + self._next_delay(interval), name))
+
+
 class HealthService:
     """Health monitoring service with dependency checks and empire-level analysis."""
 
@@ -184,6 +360,9 @@ class HealthService:
         self._last_empire_scan = None
         self._empire_scan_interval = timedelta(hours=6)  # Scan every 6 hours
 
+        self._prober: Optional[DependencyProber] = None
+        self._prober_lock = threading.Lock()
+
         # Error budget tracking (99.99% SLO = 4.32 min/month downtime)
         self._error_budget = {
             "monthly_budget_seconds": 259.2,  # 4.32 min in seconds
@@ -246,7 +425,12 @@ class HealthService:
 
     def check_readiness(self) -> Dict[str, Any]:
         """
-        Comprehensive readiness check with dependency verification.
+        Readiness check served from the background dependency prober.
+
+        Only the core service check runs inline; external dependencies are
+        reported from their last background probe, so this never waits on a
+        slow upstream. Until a required probe has completed once, the service
+        is reported not ready.
 
         Returns:
             Dictionary with readiness status and dependency details
@@ -260,19 +444,10 @@ class HealthService:
         if not core_check["healthy"]:
             overall_ready = False
 
-        # External dependency checks
-        dependency_checks = [
-            self._check_shopify_connection(),
-            self._check_bigquery_connection(),
-            self._check_github_connection(),
-            self._check_ai_assistant(),
-            self._check_workspace_service(),
-        ]
-
-        for check in dependency_checks:
+        for check in self.get_prober().snapshot():
             checks.append(check)
             # External dependencies don't fail readiness if feature-flagged
-            if not check["healthy"] and check.get("required", False):
+            if check.get("required", False) and (not check["healthy"] or check.get("stale")):
                 overall_ready = False
 
         return {
@@ -282,6 +457,29 @@ class HealthService:
             "checks": checks,
         }
 
+    def get_prober(self) -> DependencyProber:
+        """Get the dependency prober, starting it on first use."""
+        with self._prober_lock:
+            if self._prober is None:
+                config = current_app.config
+                interval = float(config.get("HEALTH_PROBE_INTERVAL", 30))
+                self._prober = DependencyProber(
+                    current_app._get_current_object(),
+                    {
+                        "shopify_api": (self._check_shopify_connection, interval),
+                        # Probed less often to spare API quota
+                        "bigquery": (self._check_bigquery_connection, interval * 2),
+                        "github_api": (self._check_github_connection, interval * 2),
+                        "ai_assistant": (self._check_ai_assistant, interval),
+                        "workspace_service": (self._check_workspace_service, interval),
+                    },
+                    jitter=float(config.get("HEALTH_PROBE_JITTER", 0.2)),
+                    timeout=float(config.get("HEALTH_PROBE_TIMEOUT", 5)),
+                    required=("workspace_service",),
+                )
+                self._prober.start()
+            return self._prober
+
     def _check_core_service(self) -> Dict[str, Any]:
         """Check core service health."""
         try:
@@ -0,0 +1,226 @@
+"""
+Leader election across worker processes.
+
+When the app runs with several gunicorn workers, periodic work (such as the
+Socket.IO dashboard emitters) should run in exactly one of them. Each
+worker starts a ``LeaderElector``; at most one holds leadership at a time,
+and another takes over when the leader exits.
+
+Backends:
+- ``RedisLeaderElector``: a lease key set with ``SET NX PX`` and renewed by
+  its holder, shared by workers on any number of hosts
+- ``FileLeaderElector``: an exclusive ``flock`` on a lock file, shared by
+  workers on one host and released by the OS when the holder dies
+"""
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from typing import Any, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Renew the lease only if we still hold it
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Delete the lease only if we still hold it
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaderElector:
+    """Base elector; subclasses implement ``_try_acquire`` and ``_release``."""
+
+    def __init__(self, name: str, renew_interval: float = 5.0):
+        """
+        Args:
+            name: Name of the election, e.g. "socketio-emitters"
+            renew_interval: Seconds between acquisition attempts/lease renewals
+        """
+        self.name = name
+        self.renew_interval = renew_interval
+        self.identity = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._leader = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._leader
+
+    def start(self):
+        """Campaign for leadership now and keep campaigning in the background."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self.campaign()
+        self._thread = threading.Thread(target=self._loop, name=f"leader-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop campaigning and give up leadership."""
+        self._stop.set()
+        if self._leader:
+            try:
+                self._release()
+            except Exception as e:
+                logger.warning(f"Failed to release {self.name} leadership: {e}")
+            self._set_leader(False)
+
+    def campaign(self) -> bool:
+        """Acquire or renew leadership once and return whether we hold it."""
+        try:
+            self._set_leader(self._try_acquire())
+        except Exception as e:
+            # An unreachable coordinator must not leave two leaders running
+            logger.warning(f"Leader election for {self.name} failed: {e}")
+            self._set_leader(False)
+        return self._leader
+
+    def _loop(self):
+        while not self._stop.wait(self.renew_interval):
+            self.campaign()
+
+    def _set_leader(self, leader: bool):
+        if leader != self._leader:
+            logger.info(
+                f"{self.identity} {'became' if leader else 'is no longer'} leader for {self.name}"
+            )
+        self._leader = leader
+
+    def _try_acquire(self) -> bool:
+        raise NotImplementedError
+
+    def _release(self):
+        raise NotImplementedError
+
+
+class LocalLeaderElector(LeaderElector):
+    """Always the leader; for single-process deployments."""
+
+    def _try_acquire(self) -> bool:
+        return True
+
+    def _release(self):
+        pass
+
+
+class FileLeaderElector(LeaderElector):
+    """Leadership held through an exclusive lock on a file."""
+
+    def __init__(self, name: str, lock_path: str, renew_interval: float = 5.0):
+        super().__init__(name, renew_interval)
+        self.lock_path = lock_path
+        self._fd: Optional[int] = None
+
+    def _try_acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+        directory = os.path.dirname(self.lock_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, self.identity.encode())
+        self._fd = fd
+        return True
+
+    def _release(self):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+class RedisLeaderElector(LeaderElector):
+    """Leadership held through a renewed lease key in Redis."""
+
+    def __init__(self, name: str, client: Any, ttl: float = 15.0, renew_interval: float = 5.0):
+        """
+        Args:
+            name: Name of the election
+            client: ``redis.Redis`` compatible client
+            ttl: Lease lifetime in seconds; a crashed leader is replaced
+                within this time
+            renew_interval: Seconds between renewals, well below ``ttl``
+        """
+        super().__init__(name, renew_interval)
+        self.client = client
+        self.key = f"leader:{name}"
+        self.ttl_ms = int(ttl * 1000)
+
+    def _try_acquire(self) -> bool:
+        if self._leader and self.client.eval(_RENEW_SCRIPT, 1, self.key, self.identity, self.ttl_ms):
+            return True
+        return bool(self.client.set(self.key, self.identity, nx=True, px=self.ttl_ms))
+
+    def _release(self):
+        self.client.eval(_RELEASE_SCRIPT, 1, self.key, self.identity)
+
+
+def create_leader_elector(name: str, backend: Optional[str] = None) -> LeaderElector:
+    """
+    Create the elector selected by ``LEADER_ELECTION_BACKEND``.
+
+    ``auto`` uses Redis when ``LEADER_ELECTION_REDIS_URL`` (or a Redis
+    ``SOCKETIO_MESSAGE_QUEUE``) is set, and otherwise a lock file, which
+    covers multiple workers on one host.
+
+    Args:
+        name: Name of the election
+        backend: "auto", "redis", "file" or "local"; read from the
+            environment when omitted
+    """
+    backend = (backend or os.getenv('LEADER_ELECTION_BACKEND', 'auto')).lower()
+    renew_interval = float(os.getenv('LEADER_ELECTION_RENEW_INTERVAL', '5'))
+
+    if backend == 'local' or (backend == 'file' and fcntl is None):
+        return LocalLeaderElector(name, renew_interval)
+
+    redis_url = os.getenv('LEADER_ELECTION_REDIS_URL')
+    message_queue = os.getenv('SOCKETIO_MESSAGE_QUEUE', '')
+    if not redis_url and message_queue.startswith(('redis://', 'rediss://')):
+        redis_url = message_queue
+
+    if backend == 'redis' or (backend == 'auto' and redis_url):
+        if redis_url:
+            try:
+                import redis
+
+                client = redis.from_url(redis_url, socket_timeout=1.0, decode_responses=True)
+                return RedisLeaderElector(
+                    name,
+                    client,
+                    ttl=float(os.getenv('LEADER_ELECTION_TTL', '15')),
+                    renew_interval=renew_interval,
+                )
+            except ImportError:
+                logger.warning("redis package not installed; using a lock file for leader election")
+        else:
+            logger.warning("LEADER_ELECTION_BACKEND=redis but no Redis URL is set; using a lock file")
+
+    if fcntl is None:
+        return LocalLeaderElector(name, renew_interval)
+    lock_dir = os.getenv('LEADER_ELECTION_LOCK_DIR', 'data')
+    return FileLeaderElector(name, os.path.join(lock_dir, f"{name}.lock"), renew_interval)
@@ -5,11 +5,13 @@ Replaces mock agent execution with real business logic and database persistence
 
 import asyncio
 import logging
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from sqlalchemy import (
     JSON,
@@ -25,11 +27,14 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from app.services.agent_metrics import get_agent_metrics
 from core.secrets.secret_provider import UnifiedSecretResolver
 
 logger = logging.getLogger(__name__)
 Base = declarative_base()
 
+T = TypeVar("T")
+
 
 class ExecutionStatus(str, Enum):
     QUEUED = "queued"
@@ -94,6 +99,16 @@ class ProductionAgentExecutor:
         self.SessionLocal = None
         self.active_executions: Dict[str, AgentExecutionResult] = {}
 
+        # Blocking database work runs here so it never stalls the event loop
+        self._db_pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv("AGENT_EXECUTOR_DB_THREADS", "8")),
+            thread_name_prefix="agent-executor-db"
+        )
+
+    async def _run_db(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a blocking database call on the executor's database thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._db_pool, fn, *args)
+
     async def initialize(self):
         """Initialize database connection and agent registry."""
         try:
@@ -111,7 +126,7 @@ class ProductionAgentExecutor:
             self.SessionLocal = sessionmaker(bind=self.engine)
 
             # Create tables
-            Base.metadata.create_all(self.engine)
+            await self._run_db(Base.metadata.create_all, self.engine)
 
             logger.info("Agent executor service initialized with database")
 
@@ -134,38 +149,43 @@ class ProductionAgentExecutor:
         parameters = parameters or {}
 
         # Create database record
-        db = self.SessionLocal()
-        try:
-            execution_record = AgentExecution(
-                execution_id=execution_id,
-                agent_id=agent_id,
-                agent_type=agent_type,
-                parameters=parameters,
-                user_id=user_id,
-                session_id=session_id,
-                priority=priority,
-                status=ExecutionStatus.QUEUED
-            )
+        execution_record = AgentExecution(
+            execution_id=execution_id,
+            agent_id=agent_id,
+            agent_type=agent_type,
+            parameters=parameters,
+            user_id=user_id,
+            session_id=session_id,
+            priority=priority,
+            status=ExecutionStatus.QUEUED
+        )
 
-            db.add(execution_record)
-            db.commit()
+        try:
+            await self._run_db(self._insert_execution, execution_record)
+        except Exception as e:
+            logger.error(f"Failed to queue agent execution: {e}")
+            raise
 
-            # Create in-memory tracking
-            result = AgentExecutionResult(
-                execution_id=execution_id,
-                agent_id=agent_id,
-                status=ExecutionStatus.QUEUED
-            )
-            self.active_executions[execution_id] = result
+        # Create in-memory tracking
+        result = AgentExecutionResult(
+            execution_id=execution_id,
+            agent_id=agent_id,
+            status=ExecutionStatus.QUEUED
+        )
+        self.active_executions[execution_id] = result
 
-            # Execute agent asynchronously
-            asyncio.create_task(self._execute_agent_task(execution_id, agent_type, parameters, db))
+        # Execute agent asynchronously
+        asyncio.create_task(self._execute_agent_task(execution_id, agent_type, parameters))
 
-            logger.info(f"Queued agent execution: {execution_id} for {agent_id}")
-            return execution_id
+        logger.info(f"Queued agent execution: {execution_id} for {agent_id}")
+        return execution_id
 
-        except Exception as e:
-            logger.error(f"Failed to queue agent execution: {e}")
+    def _insert_execution(self, execution_record: AgentExecution) -> None:
+        db = self.SessionLocal()
+        try:
+            db.add(execution_record)
+            db.commit()
+        except Exception:
             db.rollback()
             raise
         finally:
@@ -175,8 +195,7 @@ class ProductionAgentExecutor:
         self,
         execution_id: str,
         agent_type: str,
-        parameters: Dict[str, Any],
-        db_session
+        parameters: Dict[str, Any]
     ):
         """Execute the actual agent task."""
         start_time = datetime.now(timezone.utc)
@@ -205,15 +224,20 @@ class ProductionAgentExecutor:
                 progress_percent=100
             )
 
+            get_agent_metrics().record_execution(agent_type, ExecutionStatus.COMPLETED, duration, completed_time)
             logger.info(f"Agent execution completed: {execution_id} in {duration:.2f}s")
 
         except Exception as e:
             logger.error(f"Agent execution failed: {execution_id} - {e}")
 
+            failed_time = datetime.now(timezone.utc)
+            get_agent_metrics().record_execution(
+                agent_type, ExecutionStatus.FAILED, (failed_time - start_time).total_seconds(), failed_time
+            )
             await self._update_execution_status(
                 execution_id,
                 ExecutionStatus.FAILED,
-                completed_at=datetime.now(timezone.utc),
+                completed_at=failed_time,
                 error_message=str(e)
             )
 
@@ -320,6 +344,22 @@ class ProductionAgentExecutor:
                 result.progress_percent = progress_percent
 
         # Update database
+        await self._run_db(
+            self._write_execution_status, execution_id, status, started_at, completed_at,
+            duration_seconds, result_data, error_message, progress_percent
+        )
+
+    def _write_execution_status(
+        self,
+        execution_id: str,
+        status: ExecutionStatus,
+        started_at: Optional[datetime],
+        completed_at: Optional[datetime],
+        duration_seconds: Optional[float],
+        result_data: Optional[Dict[str, Any]],
+        error_message: Optional[str],
+        progress_percent: Optional[int]
+    ) -> None:
         db = self.SessionLocal()
         try:
             execution = db.query(AgentExecution).filter(
@@ -376,7 +416,14 @@ class ProductionAgentExecutor:
         limit: int = 100
     ) -> List[Dict[str, Any]]:
         """Get execution history from database."""
+        return await self._run_db(self._query_executions, agent_id, status, limit)
 
+    def _query_executions(
+        self,
+        agent_id: Optional[str],
+        status: Optional[ExecutionStatus],
+        limit: int
+    ) -> List[Dict[str, Any]]:
         db = self.SessionLocal()
         try:
             query = db.query(AgentExecution)
@@ -1,6 +1,10 @@
 """
 Real-time Agent Status Service
 Production monitoring and health checking for all empire agents
+
+Execution statistics come from the incremental aggregator in
+``app.services.agent_metrics``, which the agent executor feeds as executions
+finish; execution history is only read once, to seed it after a restart.
 """
 
 import asyncio
@@ -11,6 +15,7 @@ from typing import Any, Dict, List, Optional
 
 import psutil
 
+from app.services.agent_metrics import get_agent_metrics
 from core.secrets.secret_provider import UnifiedSecretResolver
 
 logger = logging.getLogger(__name__)
@@ -32,14 +37,23 @@ class AgentHealthMetrics:
     error_rate_percent: float
     throughput_per_hour: float
     health_score: int  # 0-100
+    ewma_execution_time_seconds: float = 0.0
+    p50_execution_time_seconds: float = 0.0
+    p95_execution_time_seconds: float = 0.0
+    p99_execution_time_seconds: float = 0.0
 
 
 class RealTimeAgentMonitor:
     """Production agent monitoring with real health metrics."""
 
+    # Executions read from history to seed the aggregator after a restart
+    SEED_EXECUTIONS = 1000
+
     def __init__(self):
         self.secrets = UnifiedSecretResolver()
+        self.aggregator = get_agent_metrics()
         self.agent_metrics: Dict[str, AgentHealthMetrics] = {}
+        self._cpu_sample = 0.0
         self.monitoring_active = False
         self.update_interval = 30  # seconds
 
@@ -72,30 +86,14 @@ class RealTimeAgentMonitor:
     async def _collect_agent_metrics(self):
         """Collect real metrics for all agents."""
         try:
-            # Get agent execution data from database
-            from app.services.production_agent_executor import get_agent_executor
-            agent_executor = await get_agent_executor()
+            if not self.aggregator.seeded:
+                await self._seed_from_history()
 
-            # Validate executor is available and has callable get_agent_executions method
-            if agent_executor is None or not callable(getattr(agent_executor, 'get_agent_executions', None)):
-                logger.debug("Agent executor not initialized yet, skipping metrics collection")
-                return
+            # Sample CPU once per cycle (usage since the previous cycle) rather than per agent
+            self._cpu_sample = psutil.cpu_percent(interval=None)
 
-            # Get recent executions for analysis
-            recent_executions = await agent_executor.get_agent_executions(limit=1000)
-
-            # Group executions by agent type
-            agent_execution_data = {}
-            for execution in recent_executions:
-                agent_type = execution['agent_type']
-                if agent_type not in agent_execution_data:
-                    agent_execution_data[agent_type] = []
-                agent_execution_data[agent_type].append(execution)
-
-            # Calculate metrics for each agent
-            for agent_type, executions in agent_execution_data.items():
-                metrics = await self._calculate_agent_metrics(agent_type, executions)
-                self.agent_metrics[agent_type] = metrics
+            for agent_type, stats in self.aggregator.snapshot_all().items():
+                self.agent_metrics[agent_type] = await self._calculate_agent_metrics(agent_type, stats)
 
             # Add system resource metrics
             await self._add_system_metrics()
@@ -103,34 +101,32 @@ class RealTimeAgentMonitor:
         except Exception as e:
             logger.error(f"Failed to collect agent metrics: {e}")
 
-    async def _calculate_agent_metrics(self, agent_type: str, executions: List[Dict]) -> AgentHealthMetrics:
-        """Calculate comprehensive metrics for an agent."""
+    async def _seed_from_history(self):
+        """Seed the aggregator with executions that finished before it started."""
+        from app.services.production_agent_executor import get_agent_executor
+        agent_executor = await get_agent_executor()
 
-        # Basic counts
-        total_executions = len(executions)
-        successful_executions = len([e for e in executions if e['status'] == 'completed'])
-        failed_executions = len([e for e in executions if e['status'] == 'failed'])
+        # Validate executor is available and has callable get_agent_executions method
+        if agent_executor is None or not callable(getattr(agent_executor, 'get_agent_executions', None)):
+            logger.debug("Agent executor not initialized yet, skipping metrics seeding")
+            return
 
-        # Success rate and error rate
-        success_rate = (successful_executions / total_executions * 100) if total_executions > 0 else 0
-        error_rate = (failed_executions / total_executions * 100) if total_executions > 0 else 0
+        history = await agent_executor.get_agent_executions(limit=self.SEED_EXECUTIONS)
+        loaded = self.aggregator.seed(history)
+        logger.info(f"Seeded agent metrics with {loaded} historical executions")
 
-        # Execution time analysis
-        completed_executions = [e for e in executions if e['status'] == 'completed' and e['duration_seconds']]
-        avg_execution_time = sum(e['duration_seconds'] for e in completed_executions) / len(completed_executions) if completed_executions else 0
+    async def _calculate_agent_metrics(self, agent_type: str, stats: Dict[str, Any]) -> AgentHealthMetrics:
+        """Build health metrics for an agent from its aggregated statistics."""
 
-        # Last execution time
-        last_execution = None
-        if executions:
-            latest_exec = max(executions, key=lambda x: x['queued_at'])
-            last_execution = datetime.fromisoformat(latest_exec['queued_at'].replace('Z', '+00:00'))
+        total_executions = stats['total_executions']
+        successful_executions = stats['successful_executions']
+        failed_executions = stats['failed_executions']
 
-        # Throughput calculation (executions per hour in last 24 hours)
-        recent_executions = [
-            e for e in executions
-            if datetime.fromisoformat(e['queued_at'].replace('Z', '+00:00')) > datetime.now(timezone.utc) - timedelta(hours=24)
-        ]
-        throughput_per_hour = len(recent_executions) / 24 if recent_executions else 0
+        # Success rate over all executions, error rate over the sliding window
+        success_rate = (successful_executions / total_executions * 100) if total_executions > 0 else 0
+        error_rate = stats['error_rate_percent']
+        throughput_per_hour = stats['throughput_per_hour']
+        last_execution = stats['last_execution_time']
 
         # Determine status
         if error_rate > 50:
@@ -162,17 +158,21 @@ class RealTimeAgentMonitor:
             total_executions=total_executions,
             successful_executions=successful_executions,
             failed_executions=failed_executions,
-            avg_execution_time_seconds=avg_execution_time,
+            avg_execution_time_seconds=stats['avg_execution_time_seconds'],
             error_rate_percent=error_rate,
             throughput_per_hour=throughput_per_hour,
-            health_score=health_score
+            health_score=health_score,
+            ewma_execution_time_seconds=stats['ewma_execution_time_seconds'],
+            p50_execution_time_seconds=stats['p50_execution_time_seconds'],
+            p95_execution_time_seconds=stats['p95_execution_time_seconds'],
+            p99_execution_time_seconds=stats['p99_execution_time_seconds']
         )
 
     async def _get_agent_resource_usage(self, agent_type: str) -> tuple[float, float]:
         """Get real CPU and memory usage for an agent."""
         try:
             # Get system-wide metrics (would be agent-specific in production with proper containerization)
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = self._cpu_sample
             memory_info = psutil.virtual_memory()
 
             # Estimate agent-specific usage based on activity
@@ -113,8 +113,8 @@ class ShopifyGraphQLService:
         query_filter = f"created_at:>={start_date.strftime('%Y-%m-%d')}"
 
         query = """
-        query($first: Int!, $query: String) {
-            orders(first: $first, query: $query) {
+        query($first: Int!, $after: String, $query: String) {
+            orders(first: $first, after: $after, query: $query) {
                 edges {
                     node {
                         id
@@ -151,28 +151,36 @@ class ShopifyGraphQLService:
 
         variables = {
             'first': 250,
+            'after': None,
             'query': query_filter
         }
 
-        result = await self._execute_query(query, variables)
-        orders = result.get('orders', {}).get('edges', [])
-
-        # Calculate metrics
-        total_orders = len(orders)
+        # Calculate metrics over every page (250 orders is the page size cap)
+        total_orders = 0
         total_revenue = 0
         pending_orders = 0
         fulfilled_orders = 0
 
-        for edge in orders:
-            order = edge['node']
-            total_revenue += float(order['currentTotalPriceSet']['shopMoney']['amount'])
-
-            # Note: displayFulfillmentStatus returns values like "FULFILLED", "UNFULFILLED", "PARTIALLY_FULFILLED"
-            fulfillment_status = order['displayFulfillmentStatus']
-            if fulfillment_status == 'FULFILLED':
-                fulfilled_orders += 1
-            elif fulfillment_status in ['UNFULFILLED', 'PARTIALLY_FULFILLED']:
-                pending_orders += 1
+        while True:
+            result = await self._execute_query(query, variables)
+            connection = result.get('orders', {})
+
+            for edge in connection.get('edges', []):
+                order = edge['node']
+                total_orders += 1
+                total_revenue += float(order['currentTotalPriceSet']['shopMoney']['amount'])
+
+                # Note: displayFulfillmentStatus returns values like "FULFILLED", "UNFULFILLED", "PARTIALLY_FULFILLED"
+                fulfillment_status = order['displayFulfillmentStatus']
+                if fulfillment_status == 'FULFILLED':
+                    fulfilled_orders += 1
+                elif fulfillment_status in ['UNFULFILLED', 'PARTIALLY_FULFILLED']:
+                    pending_orders += 1
+
+            page_info = connection.get('pageInfo', {})
+            if not page_info.get('hasNextPage') or not page_info.get('endCursor'):
+                break
+            variables = {**variables, 'after': page_info['endCursor']}
 
         return {
             'total_orders': total_orders,
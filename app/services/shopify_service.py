@@ -4,36 +4,51 @@ Shopify Service for Royal Equips Orchestrator.
 Handles Shopify Admin API operations:
 - Authentication and API calls
 - Products, collections, inventory, orders
-- Rate limit monitoring and exponential backoff
+- Rate limit pacing and retries
 - Error handling with custom exceptions
+
+Requests go through ``ShopifyTransport``, an async httpx client with pooled
+keep-alive connections (HTTP/2 when ``h2`` is installed). It follows ``Link``
+header cursors across pages, and paces requests with a leaky bucket kept in
+step with ``X-Shopify-Shop-Api-Call-Limit``. Rate limited requests are
+retried there, after ``Retry-After``, and nowhere else. ``ShopifyService``
+is the synchronous facade used by Flask views and jobs; it runs transport
+calls on the shared async bridge loop and blocks until they finish, so it
+must not be called from a coroutine. Async code awaits ``fetch_async`` and
+``request_async`` or iterates ``iter_products``, ``iter_orders`` and
+``iter_customers`` instead.
+
+Transports are shared per shop through ``get_shopify_transport``, so every
+service instance paces against the same bucket and reuses the same pooled
+connections. Their clients are closed at interpreter exit.
 """
 
+import asyncio
+import atexit
 import logging
 import os
+import threading
+import time
+import weakref
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import httpx
 
-import requests
+from app.services.async_bridge import AsyncBridgeError, run_async
 
 try:
-    from tenacity import (
-        retry,
-        retry_if_exception_type,
-        stop_after_attempt,
-        wait_exponential,
-    )
-    HAS_TENACITY = True
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
 except ImportError:
-    HAS_TENACITY = False
-    # Create dummy decorators
-    def retry(*args, **kwargs):
-        def decorator(func):
-            return func
-        return decorator
-    stop_after_attempt = wait_exponential = retry_if_exception_type = lambda *args, **kwargs: None
+    HAS_HTTP2 = False
 
 logger = logging.getLogger(__name__)
 
+# Shopify's maximum REST page size
+MAX_PAGE_SIZE = 250
+
 
 class ShopifyRateLimitError(Exception):
     """Raised when Shopify rate limit is exceeded."""
@@ -55,12 +70,361 @@ class ShopifyAPIError(Exception):
         self.response_data = response_data
 
 
+class LeakyBucket:
+    """
+    Client-side model of Shopify's leaky-bucket REST rate limit.
+
+    Each request adds one unit and the bucket drains at ``leak_rate`` units
+    per second. ``acquire`` waits while the bucket is full, and ``observe``
+    re-syncs the level (and capacity, which is larger on Shopify Plus) from
+    ``X-Shopify-Shop-Api-Call-Limit``, so requests run at the allowed rate
+    without tripping 429s.
+    """
+
+    def __init__(self, capacity: int = 40, leak_rate: float = 2.0, headroom: int = 1):
+        self.capacity = capacity
+        self.leak_rate = leak_rate
+        self.headroom = headroom
+        self.waits = 0
+        self._level = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def level(self) -> float:
+        with self._lock:
+            self._leak()
+            return self._level
+
+    async def acquire(self):
+        """Wait until a request fits in the bucket, then reserve it."""
+        while True:
+            with self._lock:
+                self._leak()
+                limit = max(1, self.capacity - self.headroom)
+                if self._level + 1 <= limit:
+                    self._level += 1
+                    return
+                wait = (self._level + 1 - limit) / self.leak_rate
+                self.waits += 1
+            await asyncio.sleep(wait)
+
+    def observe(self, used: int, capacity: int):
+        """Adopt Shopify's view of the bucket after a response."""
+        with self._lock:
+            self._leak()
+            if capacity != self.capacity:
+                # Standard shops get 40 at 2/s, Plus shops 400 at 20/s
+                self.leak_rate = self.leak_rate * capacity / self.capacity
+                self.capacity = capacity
+            self._level = max(self._level, float(used))
+
+    def _leak(self):
+        now = time.monotonic()
+        self._level = max(0.0, self._level - (now - self._updated) * self.leak_rate)
+        self._updated = now
+
+
+def parse_call_limit(header: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Parse ``X-Shopify-Shop-Api-Call-Limit`` ("used/capacity")."""
+    if not header or '/' not in header:
+        return None
+    try:
+        used, capacity = header.split('/', 1)
+        return int(used), int(capacity)
+    except ValueError:
+        return None
+
+
+def page_info_from_links(response: httpx.Response) -> Dict[str, Optional[str]]:
+    """Cursor for the next and previous pages from the ``Link`` header."""
+    cursors: Dict[str, Optional[str]] = {'next': None, 'previous': None}
+    for rel in cursors:
+        link = response.links.get(rel)
+        if link and link.get('url'):
+            values = parse_qs(urlparse(link['url']).query).get('page_info')
+            cursors[rel] = values[0] if values else None
+    return cursors
+
+
+class ShopifyTransport:
+    """
+    Async Shopify REST transport with pooled connections and pacing.
+
+    One ``httpx.AsyncClient`` is kept per event loop, so the transport can be
+    shared by the async bridge loop and any other loop that awaits it.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        auth: Optional[Tuple[str, str]] = None,
+        timeout: float = 30.0,
+        max_connections: int = 10,
+        bucket: Optional[LeakyBucket] = None,
+        max_retries: int = 3,
+        on_response: Optional[Callable[[httpx.Response], None]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            base_url: Admin API base URL, e.g. https://shop.myshopify.com/admin/api/2024-01
+            auth: (API key, password) for basic auth
+            timeout: Per-request timeout in seconds
+            max_connections: Connection pool size
+            bucket: Rate limit model; a standard-plan bucket by default
+            max_retries: Attempts after a 429 before giving up
+            on_response: Called with every response, e.g. for rate limit tracking
+            transport: Custom httpx transport (used in tests)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.auth = auth
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.bucket = bucket or LeakyBucket()
+        self.max_retries = max_retries
+        self.on_response = on_response
+        self.call_limit: Optional[Tuple[int, int]] = None
+        self.call_limit_at: Optional[datetime] = None
+        self._transport = transport
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                auth=self.auth,
+                timeout=self.timeout,
+                http2=HAS_HTTP2 and self._transport is None,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self._transport,
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self):
+        """Close the client bound to the running loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def close(self, timeout: float = 5.0):
+        """Close the clients of every loop; for use at shutdown, outside those loops."""
+        clients = list(self._clients.items())
+        self._clients.clear()
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+
+        for loop, client in clients:
+            if client.is_closed or loop.is_closed() or loop is current:
+                continue
+            try:
+                if loop.is_running():
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout)
+                else:
+                    loop.run_until_complete(client.aclose())
+            except Exception as e:
+                logger.debug(f"Failed to close Shopify client: {e}")
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        Send a paced request, retrying after 429 responses.
+
+        Raises:
+            ShopifyRateLimitError: When still rate limited after retries
+            ShopifyAuthError: When authentication fails
+            ShopifyAPIError: For other API errors
+        """
+        url = f"{self.base_url}{endpoint}"
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire()
+            logger.info(f"Shopify API request: {method} {url}")
+            try:
+                response = await self._client().request(method, url, params=params, json=json_data)
+            except httpx.TimeoutException:
+                raise ShopifyAPIError("Request timeout - Shopify API may be slow")
+            except httpx.ConnectError:
+                raise ShopifyAPIError("Connection error - unable to reach Shopify API")
+            except httpx.HTTPError as e:
+                raise ShopifyAPIError(f"Request failed: {e}")
+
+            limit = parse_call_limit(response.headers.get('X-Shopify-Shop-Api-Call-Limit'))
+            if limit:
+                self.bucket.observe(*limit)
+                self.call_limit, self.call_limit_at = limit, datetime.now()
+            if self.on_response:
+                self.on_response(response)
+
+            if response.status_code != 429:
+                break
+
+            retry_after = float(response.headers.get('Retry-After', 2))
+            self.bucket.observe(self.bucket.capacity, self.bucket.capacity)
+            if attempt == self.max_retries:
+                logger.warning(f"Shopify rate limit hit, retry after {retry_after}s")
+                raise ShopifyRateLimitError(
+                    f"Rate limit exceeded, retry after {retry_after}s", int(retry_after)
+                )
+            logger.warning(f"Shopify rate limit hit, retrying in {retry_after}s")
+            await asyncio.sleep(retry_after)
+
+        # Handle authentication errors
+        if response.status_code == 401:
+            raise ShopifyAuthError("Authentication failed - check API credentials")
+
+        if response.status_code == 403:
+            raise ShopifyAuthError("Access forbidden - check API permissions/scopes")
+
+        # Handle other errors
+        if not response.is_success:
+            error_data = None
+            try:
+                error_data = response.json()
+            except ValueError:
+                pass
+
+            raise ShopifyAPIError(
+                f"Shopify API error: {response.status_code} {response.reason_phrase}",
+                status_code=response.status_code,
+                response_data=error_data
+            )
+
+        return response
+
+    async def iter_pages(
+        self,
+        endpoint: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        page_info: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], Dict[str, Optional[str]]]]:
+        """
+        Yield each page of a list endpoint with its ``Link`` cursors.
+
+        Args:
+            endpoint: List endpoint, e.g. "/products.json"
+            key: Response key holding the items, e.g. "products"
+            params: Filters for the first page
+            page_size: Items per page (max 250)
+            page_info: Cursor to start from instead of the first page
+        """
+        params = dict(params or {})
+        params['limit'] = min(page_size, MAX_PAGE_SIZE)
+        if page_info:
+            params = self._cursor_params(params, page_info)
+
+        while True:
+            response = await self.request('GET', endpoint, params=params)
+            cursors = page_info_from_links(response)
+            yield response.json().get(key, []), cursors
+
+            if not cursors['next']:
+                return
+            params = self._cursor_params(params, cursors['next'])
+
+    async def fetch(
+        self,
+        endpoint: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        page_info: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Collect up to ``limit`` items (all when None) across pages.
+
+        Returns:
+            Tuple of (items, pagination_info)
+        """
+        items: List[Dict[str, Any]] = []
+        cursors: Dict[str, Optional[str]] = {'next': None, 'previous': None}
+        page_size = MAX_PAGE_SIZE if limit is None else min(limit, MAX_PAGE_SIZE)
+
+        pages = self.iter_pages(endpoint, key, params, page_size=page_size, page_info=page_info)
+        try:
+            async for page, cursors in pages:
+                items.extend(page)
+                if limit is not None and len(items) >= limit:
+                    break
+        finally:
+            await pages.aclose()
+
+        if limit is not None and len(items) > limit:
+            items = items[:limit]
+        return items, {
+            'has_next': cursors['next'] is not None,
+            'has_previous': cursors['previous'] is not None,
+            'next_page_info': cursors['next'],
+            'previous_page_info': cursors['previous'],
+            'count': len(items),
+        }
+
+    @staticmethod
+    def _cursor_params(params: Dict[str, Any], page_info: str) -> Dict[str, Any]:
+        # Shopify rejects filters alongside page_info; only limit and fields carry over
+        cursor_params = {k: v for k, v in params.items() if k in ('limit', 'fields')}
+        cursor_params['page_info'] = page_info
+        return cursor_params
+
+
+_transports: Dict[Tuple[str, str], ShopifyTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_shopify_transport(base_url: str, api_key: str, api_secret: str) -> ShopifyTransport:
+    """Get the transport shared by all callers of one shop and API key."""
+    key = (base_url, api_key)
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None or transport.auth != (api_key, api_secret):
+            if transport is not None:
+                transport.close()
+            transport = ShopifyTransport(
+                base_url,
+                auth=(api_key, api_secret),
+                max_connections=int(os.getenv('SHOPIFY_MAX_CONNECTIONS', '10')),
+            )
+            _transports[key] = transport
+        return transport
+
+
+def close_shopify_transports():
+    """Close the pooled connections of every shared transport."""
+    with _transports_lock:
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        transport.close()
+
+
+atexit.register(close_shopify_transports)
+
+
 class ShopifyService:
     """
     Service for interacting with Shopify Admin API.
 
     Provides methods for products, collections, inventory, orders
     with built-in rate limiting and error handling.
+
+    The ``list_*``, ``update_*`` and ``get_*`` methods are synchronous and
+    raise ``AsyncBridgeError`` when called from a running event loop; the
+    ``*_async`` and ``iter_*`` methods are the entry points for async code.
     """
     _instance = None
     _initialized = False
@@ -89,13 +453,8 @@ class ShopifyService:
             self._configured = True
 
         self.base_url = f"https://{self.shop_name}.myshopify.com/admin/api/2024-01" if self.shop_name else ""
-        self.session = requests.Session()
-        self.session.auth = (self.api_key, self.api_secret or '')
-
-        # Rate limit tracking
-        self._rate_limit_used = 0
-        self._rate_limit_bucket = 40  # Default Shopify bucket size
-        self._last_rate_limit_check = datetime.now()
+        self.transport = get_shopify_transport(self.base_url, self.api_key or '', self.api_secret or '')
+        self._created_at = datetime.now()
 
         self._initialized = True
 
@@ -108,22 +467,31 @@ class ShopifyService:
         if not self.is_configured():
             raise ShopifyAuthError("Shopify credentials not configured")
 
-        try:
-            response = self._make_request('GET', '/shop.json')
-            shop_data = response.get('shop', {})
-
-            return {
-                'shop_name': shop_data.get('name'),
-                'domain': shop_data.get('domain'),
-                'plan_name': shop_data.get('plan_name'),
-                'currency': shop_data.get('currency'),
-                'timezone': shop_data.get('timezone'),
-                'primary_location_id': shop_data.get('primary_location_id'),
-                'created_at': shop_data.get('created_at')
-            }
-
-        except requests.exceptions.RequestException as e:
-            raise ShopifyAuthError(f"Failed to authenticate with Shopify: {e}")
+        response = self._make_request('GET', '/shop.json')
+        shop_data = response.get('shop', {})
+
+        return {
+            'shop_name': shop_data.get('name'),
+            'domain': shop_data.get('domain'),
+            'plan_name': shop_data.get('plan_name'),
+            'currency': shop_data.get('currency'),
+            'timezone': shop_data.get('timezone'),
+            'primary_location_id': shop_data.get('primary_location_id'),
+            'created_at': shop_data.get('created_at')
+        }
+
+    @property
+    def _rate_limit_used(self) -> int:
+        return self.transport.call_limit[0] if self.transport.call_limit else 0
+
+    @property
+    def _rate_limit_bucket(self) -> int:
+        # Default Shopify bucket size until a response reports it
+        return self.transport.call_limit[1] if self.transport.call_limit else 40
+
+    @property
+    def _last_rate_limit_check(self) -> datetime:
+        return self.transport.call_limit_at or self._created_at
 
     def get_rate_limit_status(self) -> Dict[str, Any]:
         """Get current rate limit status."""
@@ -135,47 +503,38 @@ class ShopifyService:
             'last_check': self._last_rate_limit_check.isoformat()
         }
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(ShopifyRateLimitError)
-    )
-    def list_products(self, limit: int = 50, fields: Optional[str] = None) -> Tuple[List[Dict], Dict]:
+    def list_products(
+        self,
+        limit: Optional[int] = 50,
+        fields: Optional[str] = None,
+        ids: Optional[str] = None,
+        page_info: Optional[str] = None
+    ) -> Tuple[List[Dict], Dict]:
         """
         List products from Shopify.
 
         Args:
-            limit: Number of products to retrieve (max 250)
+            limit: Number of products to retrieve; pages are followed past
+                250, and None reads the whole store
             fields: Comma-separated list of fields to include
+            ids: Comma-separated list of product IDs to restrict to
+            page_info: Cursor from a previous call's pagination info
 
         Returns:
             Tuple of (products_list, pagination_info)
         """
-        params = {'limit': min(limit, 250)}
+        params = {}
         if fields:
             params['fields'] = fields
+        if ids:
+            params['ids'] = ids
 
-        response = self._make_request('GET', '/products.json', params=params)
-
-        return response.get('products', []), self._extract_pagination_info(response)
+        return self._list('/products.json', 'products', params, limit, page_info)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(ShopifyRateLimitError)
-    )
-    def list_collections(self, limit: int = 50) -> Tuple[List[Dict], Dict]:
+    def list_collections(self, limit: Optional[int] = 50) -> Tuple[List[Dict], Dict]:
         """List collections from Shopify."""
-        params = {'limit': min(limit, 250)}
-        response = self._make_request('GET', '/collections.json', params=params)
-
-        return response.get('collections', []), self._extract_pagination_info(response)
+        return self._list('/collections.json', 'collections', {}, limit)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(ShopifyRateLimitError)
-    )
     def update_inventory(self, inventory_item_id: int, location_id: int, available: int) -> Dict[str, Any]:
         """
         Update inventory level for a specific item and location.
@@ -197,53 +556,120 @@ class ShopifyService:
         response = self._make_request('POST', '/inventory_levels/set.json', json_data=data)
         return response.get('inventory_level', {})
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(ShopifyRateLimitError)
-    )
-    def list_orders(self, limit: int = 50, status: str = 'any', financial_status: Optional[str] = None) -> Tuple[List[Dict], Dict]:
+    def list_orders(
+        self,
+        limit: Optional[int] = 50,
+        status: str = 'any',
+        financial_status: Optional[str] = None,
+        page_info: Optional[str] = None
+    ) -> Tuple[List[Dict], Dict]:
         """
         List orders from Shopify.
 
         Args:
-            limit: Number of orders to retrieve (max 250)
+            limit: Number of orders to retrieve; None reads every page
             status: Order status filter (any, open, closed, cancelled)
             financial_status: Financial status filter
+            page_info: Cursor from a previous call's pagination info
 
         Returns:
             Tuple of (orders_list, pagination_info)
         """
-        params = {
-            'limit': min(limit, 250),
-            'status': status
-        }
+        params = {'status': status}
         if financial_status:
             params['financial_status'] = financial_status
 
-        response = self._make_request('GET', '/orders.json', params=params)
-
-        return response.get('orders', []), self._extract_pagination_info(response)
+        return self._list('/orders.json', 'orders', params, limit, page_info)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(ShopifyRateLimitError)
-    )
-    def list_customers(self, limit: int = 50) -> Tuple[List[Dict], Dict]:
+    def list_customers(self, limit: Optional[int] = 50, page_info: Optional[str] = None) -> Tuple[List[Dict], Dict]:
         """
         List customers from Shopify.
 
         Args:
-            limit: Number of customers to retrieve (max 250)
+            limit: Number of customers to retrieve; None reads every page
+            page_info: Cursor from a previous call's pagination info
 
         Returns:
             Tuple of (customers_list, pagination_info)
         """
-        params = {'limit': min(limit, 250)}
-        response = self._make_request('GET', '/customers.json', params=params)
+        return self._list('/customers.json', 'customers', {}, limit, page_info)
+
+    async def iter_products(self, **params: Any) -> AsyncIterator[List[Dict]]:
+        """Yield every page of products, following ``Link`` cursors."""
+        async for page in self._iter_pages('/products.json', 'products', params):
+            yield page
 
-        return response.get('customers', []), self._extract_pagination_info(response)
+    async def iter_orders(self, status: str = 'any', **params: Any) -> AsyncIterator[List[Dict]]:
+        """Yield every page of orders, following ``Link`` cursors."""
+        async for page in self._iter_pages('/orders.json', 'orders', {'status': status, **params}):
+            yield page
+
+    async def iter_customers(self, **params: Any) -> AsyncIterator[List[Dict]]:
+        """Yield every page of customers, following ``Link`` cursors."""
+        async for page in self._iter_pages('/customers.json', 'customers', params):
+            yield page
+
+    async def _iter_pages(self, endpoint: str, key: str, params: Dict[str, Any]) -> AsyncIterator[List[Dict]]:
+        if not self.is_configured():
+            raise ShopifyAuthError("Shopify service not configured")
+        async for page, _ in self.transport.iter_pages(endpoint, key, params):
+            yield page
+
+    async def fetch_async(
+        self,
+        endpoint: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = 50,
+        page_info: Optional[str] = None
+    ) -> Tuple[List[Dict], Dict]:
+        """
+        Paginated read for async callers, e.g. ``fetch_async('/orders.json', 'orders')``.
+
+        Returns:
+            Tuple of (items, pagination_info), as the ``list_*`` methods
+        """
+        if not self.is_configured():
+            raise ShopifyAuthError("Shopify service not configured")
+        return await self.transport.fetch(endpoint, key, params, limit=limit, page_info=page_info)
+
+    async def request_async(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json_data: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Authenticated request for async callers; returns the response JSON."""
+        if not self.is_configured():
+            raise ShopifyAuthError("Shopify service not configured")
+        response = await self.transport.request(method, endpoint, params=params, json_data=json_data)
+        return response.json()
+
+    @staticmethod
+    def _run(coro: Any) -> Any:
+        """Block on a transport coroutine for a synchronous caller."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run_async(coro)
+        coro.close()
+        # Blocking here would stall the loop, or deadlock when it is the bridge loop itself
+        raise AsyncBridgeError(
+            "ShopifyService's synchronous methods cannot be called from a running event loop; "
+            "await fetch_async/request_async or use the iter_* methods instead"
+        )
+
+    def _list(
+        self,
+        endpoint: str,
+        key: str,
+        params: Dict[str, Any],
+        limit: Optional[int],
+        page_info: Optional[str] = None
+    ) -> Tuple[List[Dict], Dict]:
+        """Run a paginated read on the shared event loop."""
+        return self._run(self.fetch_async(endpoint, key, params, limit=limit, page_info=page_info))
 
     def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, json_data: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -263,86 +689,8 @@ class ShopifyService:
             ShopifyAuthError: When authentication fails
             ShopifyAPIError: For other API errors
         """
-        if not self.is_configured():
-            raise ShopifyAuthError("Shopify service not configured")
-
-        url = f"{self.base_url}{endpoint}"
-
-        try:
-            logger.info(f"Shopify API request: {method} {url}")
-
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data,
-                timeout=30
-            )
-
-            # Update rate limit tracking
-            self._update_rate_limit_from_headers(response.headers)
+        return self._run(self.request_async(method, endpoint, params=params, json_data=json_data))
 
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 2))
-                logger.warning(f"Shopify rate limit hit, retry after {retry_after}s")
-                raise ShopifyRateLimitError(f"Rate limit exceeded, retry after {retry_after}s", retry_after)
-
-            # Handle authentication errors
-            if response.status_code == 401:
-                raise ShopifyAuthError("Authentication failed - check API credentials")
-
-            if response.status_code == 403:
-                raise ShopifyAuthError("Access forbidden - check API permissions/scopes")
-
-            # Handle other errors
-            if not response.ok:
-                error_data = None
-                try:
-                    error_data = response.json()
-                except:
-                    pass
-
-                raise ShopifyAPIError(
-                    f"Shopify API error: {response.status_code} {response.reason}",
-                    status_code=response.status_code,
-                    response_data=error_data
-                )
-
-            return response.json()
-
-        except requests.exceptions.Timeout:
-            raise ShopifyAPIError("Request timeout - Shopify API may be slow")
-        except requests.exceptions.ConnectionError:
-            raise ShopifyAPIError("Connection error - unable to reach Shopify API")
-        except requests.exceptions.RequestException as e:
-            raise ShopifyAPIError(f"Request failed: {e}")
-
-    def _update_rate_limit_from_headers(self, headers: Dict[str, str]) -> None:
-        """Update rate limit tracking from response headers."""
-        try:
-            # Shopify uses X-Shopify-Shop-Api-Call-Limit header
-            limit_header = headers.get('X-Shopify-Shop-Api-Call-Limit', '0/40')
-
-            if '/' in limit_header:
-                used, bucket = limit_header.split('/')
-                self._rate_limit_used = int(used)
-                self._rate_limit_bucket = int(bucket)
-                self._last_rate_limit_check = datetime.now()
-
-                logger.debug(f"Rate limit updated: {used}/{bucket}")
-
-        except (ValueError, AttributeError) as e:
-            logger.warning(f"Failed to parse rate limit headers: {e}")
-
-    def _extract_pagination_info(self, response: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract pagination information from API response."""
-        # For now, return basic info - can be enhanced with Link headers parsing
-        return {
-            'has_next': False,  # Would need to parse Link headers
-            'has_previous': False,
-            'count': len(response.get('products', response.get('collections', response.get('orders', []))))
-        }
 
 # Global Shopify service instance
 shopify_service = ShopifyService()
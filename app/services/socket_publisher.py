@@ -0,0 +1,306 @@
+"""
+Change-driven, delta-encoded Socket.IO publishing.
+
+``DeltaPublisher`` sits between the periodic emitters and the Socket.IO
+server:
+
+- a tick for a namespace with no connected clients is skipped before its
+  payload is computed
+- each payload is computed once per tick and compared with the last
+  snapshot of that event; an unchanged payload is not sent at all
+- a changed payload is sent in full, under its original ``<event>`` name
+  and payload shape, to clients in the ``FULL_ROOM``, which every client
+  joins on connect
+- clients that opted in to deltas move to the ``DELTA_ROOM`` and receive
+  ``<event>:delta`` instead, carrying a JSON merge patch (RFC 7386: changed
+  keys, removed keys set to null, lists replaced)
+- full snapshots are sent to clients on connect and on a ``resync`` request,
+  and broadcast to all clients after a namespace was idle, since clients may
+  then hold stale data
+
+Deltas carry ``seq`` and ``base``. A client applies a delta when ``base``
+matches the ``seq`` of the last delta it applied (or it has just received a
+full snapshot) and otherwise emits ``resync``.
+
+Snapshots live in a ``SnapshotStore``. With several workers only the
+elected leader publishes, so clients connected to other workers get their
+snapshots from a ``RedisSnapshotStore`` shared by all workers. Without a
+shared store, the publisher is created with ``deltas=False`` and broadcasts
+every change as a full snapshot. Likewise the leader only sees its own
+clients; ``RedisPresence`` tells it whether other workers have any.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Socket.IO rooms of clients receiving changes in full and as deltas
+FULL_ROOM = 'full'
+DELTA_ROOM = 'deltas'
+
+
+def merge_patch(old: Any, new: Any) -> Optional[Dict[str, Any]]:
+    """
+    JSON merge patch turning ``old`` into ``new``, or None if they are equal.
+
+    Both values are expected to be dicts; nested dicts are diffed key by key
+    and any other changed value is replaced whole. As in RFC 7386, a key
+    whose new value is None reads as removed, which clients see the same way.
+    """
+    patch: Dict[str, Any] = {}
+    for key, value in new.items():
+        if key not in old:
+            patch[key] = value
+        elif old[key] != value:
+            if isinstance(value, dict) and isinstance(old[key], dict):
+                patch[key] = merge_patch(old[key], value)
+            else:
+                patch[key] = value
+    for key in old:
+        if key not in new:
+            patch[key] = None
+    return patch or None
+
+
+def apply_merge_patch(target: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a JSON merge patch to ``target`` in place and return it."""
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            apply_merge_patch(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+@dataclass
+class Snapshot:
+    seq: int
+    data: Dict[str, Any]
+    stale: bool = False
+
+
+class MemorySnapshotStore:
+    """Snapshots kept in this process."""
+
+    def __init__(self):
+        self._snapshots: Dict[str, Dict[str, Snapshot]] = {}
+
+    def get(self, namespace: str, event: str) -> Optional[Snapshot]:
+        return self._snapshots.get(namespace, {}).get(event)
+
+    def put(self, namespace: str, event: str, snapshot: Snapshot):
+        self._snapshots.setdefault(namespace, {})[event] = snapshot
+
+    def all(self, namespace: str) -> Dict[str, Snapshot]:
+        return dict(self._snapshots.get(namespace, {}))
+
+    def count(self) -> int:
+        return sum(len(events) for events in self._snapshots.values())
+
+    def normalize(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return data
+
+
+class RedisSnapshotStore:
+    """Snapshots kept in one Redis hash per namespace, readable by every worker."""
+
+    def __init__(self, client: Any, key_prefix: str = 'socketio:snapshots:'):
+        """
+        Args:
+            client: ``redis.Redis`` compatible client
+            key_prefix: Namespace for the snapshot hashes
+        """
+        self.client = client
+        self.key_prefix = key_prefix
+        self._namespaces: set = set()
+
+    def get(self, namespace: str, event: str) -> Optional[Snapshot]:
+        raw = self.client.hget(self.key_prefix + namespace, event)
+        return self._decode(raw) if raw else None
+
+    def put(self, namespace: str, event: str, snapshot: Snapshot):
+        self._namespaces.add(namespace)
+        self.client.hset(self.key_prefix + namespace, event, json.dumps(asdict(snapshot), default=str))
+
+    def all(self, namespace: str) -> Dict[str, Snapshot]:
+        raw = self.client.hgetall(self.key_prefix + namespace) or {}
+        return {
+            (event.decode() if isinstance(event, bytes) else event): self._decode(value)
+            for event, value in raw.items()
+        }
+
+    def count(self) -> int:
+        return sum(self.client.hlen(self.key_prefix + namespace) for namespace in self._namespaces)
+
+    def normalize(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """The payload as it reads back from Redis, so diffs compare like with like."""
+        return json.loads(json.dumps(data, default=str))
+
+    @staticmethod
+    def _decode(raw: Any) -> Snapshot:
+        return Snapshot(**json.loads(raw))
+
+
+class RedisPresence:
+    """Which workers have clients on each namespace, shared through Redis.
+
+    Every worker keeps a field in one Redis hash per namespace holding the
+    time until which it is known to have clients there. Workers refresh
+    their fields while clients stay connected, so the fields of a worker
+    that dies expire instead of keeping the namespace busy.
+    """
+
+    def __init__(self, client: Any, ttl: float = 30.0, key_prefix: str = 'socketio:presence:'):
+        """
+        Args:
+            client: ``redis.Redis`` compatible client
+            ttl: Seconds a worker's presence lasts without a refresh
+            key_prefix: Namespace for the presence hashes
+        """
+        self.client = client
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self.identity = f"{socket.gethostname()}:{os.getpid()}"
+
+    def update(self, namespace: str, has_clients: bool):
+        """Record whether this worker has clients on ``namespace``."""
+        key = self.key_prefix + namespace
+        if has_clients:
+            self.client.hset(key, self.identity, str(time.time() + self.ttl))
+        else:
+            self.client.hdel(key, self.identity)
+
+    def any(self, namespace: str) -> bool:
+        """Whether any worker has clients on ``namespace``."""
+        key = self.key_prefix + namespace
+        now = time.time()
+        expired = []
+        for worker, until in (self.client.hgetall(key) or {}).items():
+            if float(until) > now:
+                return True
+            expired.append(worker)
+        if expired:
+            self.client.hdel(key, *expired)
+        return False
+
+
+class DeltaPublisher:
+    """Publishes periodic payloads to subscribed namespaces, as deltas to clients that opted in."""
+
+    def __init__(
+        self,
+        emit: Callable[..., None],
+        has_subscribers: Callable[[str], bool],
+        store: Optional[Any] = None,
+        deltas: bool = True,
+    ):
+        """
+        Args:
+            emit: ``socketio.emit``-compatible function
+            has_subscribers: Returns whether a namespace has clients
+            store: Where snapshots are kept; in-process by default
+            deltas: Broadcast changes as deltas; when False every change is
+                broadcast as a full snapshot, for clients whose worker
+                cannot read the publisher's snapshots
+        """
+        self.emit = emit
+        self.has_subscribers = has_subscribers
+        self.store = store or MemorySnapshotStore()
+        self.deltas = deltas
+        self.metrics = {'skipped': 0, 'unchanged': 0, 'deltas': 0, 'snapshots': 0, 'resyncs': 0}
+        self._lock = threading.Lock()
+
+    def publish(self, namespace: str, payloads: Callable[[], Dict[str, Dict[str, Any]]]) -> Dict[str, str]:
+        """
+        Compute a namespace's payloads for this tick and send what changed.
+
+        Args:
+            namespace: Socket.IO namespace
+            payloads: Returns {event: payload}; only called when the
+                namespace has clients
+
+        Returns:
+            Outcome per event: "snapshot", "delta" or "unchanged"; empty
+            when the tick was skipped
+        """
+        if not self.has_subscribers(namespace):
+            with self._lock:
+                self.metrics['skipped'] += 1
+                for event, snapshot in self.store.all(namespace).items():
+                    if not snapshot.stale:
+                        snapshot.stale = True
+                        self.store.put(namespace, event, snapshot)
+            return {}
+
+        outcomes = {}
+        for event, data in payloads().items():
+            outcomes[event] = self._publish_event(namespace, event, data)
+        return outcomes
+
+    def send_snapshots(self, namespace: str, to: str, events: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Send the latest full snapshots of a namespace to one client.
+
+        Args:
+            namespace: Socket.IO namespace
+            to: Client session ID
+            events: Limit to these events
+
+        Returns:
+            The ``seq`` of each snapshot sent, by event
+        """
+        wanted = set(events) if events else None
+        snapshots = [
+            (event, snapshot.seq, snapshot.data)
+            for event, snapshot in self.store.all(namespace).items()
+            if not snapshot.stale and (wanted is None or event in wanted)
+        ]
+        with self._lock:
+            self.metrics['resyncs'] += 1
+        for event, _, data in snapshots:
+            self.emit(event, data, namespace=namespace, to=to)
+        return {event: seq for event, seq, _ in snapshots}
+
+    def has_snapshot(self, namespace: str, event: str) -> bool:
+        snapshot = self.store.get(namespace, event)
+        return snapshot is not None and not snapshot.stale
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.metrics, 'events': self.store.count()}
+
+    def _publish_event(self, namespace: str, event: str, data: Dict[str, Any]) -> str:
+        data = self.store.normalize(data)
+        with self._lock:
+            previous = self.store.get(namespace, event)
+            if previous is not None and not previous.stale:
+                patch = merge_patch(previous.data, data)
+                if patch is None:
+                    self.metrics['unchanged'] += 1
+                    return 'unchanged'
+            seq = previous.seq + 1 if previous else 1
+            self.store.put(namespace, event, Snapshot(seq, data))
+
+            if previous is None or previous.stale or not self.deltas:
+                self.metrics['snapshots'] += 1
+                outcome, message = 'snapshot', data
+            else:
+                self.metrics['deltas'] += 1
+                outcome = 'delta'
+                message = {'seq': seq, 'base': previous.seq, 'patch': patch}
+
+        if outcome == 'snapshot':
+            self.emit(event, message, namespace=namespace)
+        else:
+            self.emit(event, data, namespace=namespace, to=FULL_ROOM)
+            self.emit(f"{event}:delta", message, namespace=namespace, to=DELTA_ROOM)
+        return outcome
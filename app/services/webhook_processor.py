@@ -1,16 +1,68 @@
 """
 Webhook Processor Service - Routes webhook data to appropriate agents for processing.
 
-This service receives webhook data from Shopify and other sources, stores it in the database,
-and routes it to the appropriate agents for real-time processing. No mock data is used.
+Verified webhooks are appended to the durable webhook queue and acknowledged
+straight away; the queue's dispatcher then hands each one to
+``process_shopify_webhook``, which fans it out to the relevant agents in
+parallel.
+
+High-volume catalog topics (``inventory_levels/update`` and
+``products/update``) are coalesced instead: they are held in the queue for a
+short window, then claimed as a batch, collapsed to the latest update per
+inventory item/location (or product), and delivered to the agents as a
+single task per shop. No mock data is used.
 """
 
+import asyncio
+import json
 import logging
+import os
+import threading
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.services.catalog_cache import get_catalog_cache
+from app.services.webhook_queue import QueuedWebhook, WebhookDispatcher, WebhookQueue, get_webhook_queue
 
 logger = logging.getLogger(__name__)
 
+# Topics whose bursts are collapsed to the latest update per key
+COALESCED_TOPICS = ("inventory_levels/update", "products/update")
+
+
+def coalesce_key(topic: str, data: Dict[str, Any]) -> Optional[tuple]:
+    """Identity of the record a catalog webhook updates, or None if unknown."""
+    if topic.startswith("inventory_levels/"):
+        if data.get("inventory_item_id") is None:
+            return None
+        return ("inventory_level", data["inventory_item_id"], data.get("location_id"))
+    if topic.startswith("products/") and data.get("id") is not None:
+        return ("product", data["id"])
+    return None
+
+
+def coalesce_updates(topic: str, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collapse updates to the latest one per inventory item/location or product.
+
+    Args:
+        topic: Webhook topic shared by the updates
+        updates: Payloads in arrival order
+
+    Returns:
+        The surviving payloads, ordered by first arrival of their key
+    """
+    latest: Dict[Any, Dict[str, Any]] = {}
+    for position, data in enumerate(updates):
+        key = coalesce_key(topic, data)
+        if key is None:
+            key = ("uncoalesced", position)
+        current = latest.get(key)
+        # Ties and missing updated_at timestamps fall back to arrival order
+        if current is None or str(data.get("updated_at") or "") >= str(current.get("updated_at") or ""):
+            latest[key] = data
+    return list(latest.values())
+
 
 class WebhookProcessor:
     """Process incoming webhooks and route to agents for real-time business logic."""
@@ -18,20 +70,209 @@ class WebhookProcessor:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self._agent_registry = None
-        
+        self._dispatcher: Optional[WebhookDispatcher] = None
+        self._dispatcher_lock = threading.Lock()
+        self.coalesce_window = float(os.getenv("WEBHOOK_COALESCE_WINDOW", "2.0"))
+        self.coalescing_metrics = {"received": 0, "delivered": 0, "batches": 0}
+
+    def enqueue_shopify_webhook(
+        self,
+        topic: str,
+        payload: bytes,
+        shop_domain: Optional[str],
+        webhook_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Durably queue a verified Shopify webhook for background processing.
+
+        Args:
+            topic: Webhook topic (e.g., "orders/create")
+            payload: Raw request body
+            shop_domain: Shopify shop domain
+            webhook_id: ``X-Shopify-Webhook-Id``; retries of a webhook share it
+
+        Returns:
+            Dict with the webhook ID and whether it was a duplicate delivery
+        """
+        delay = self.coalesce_window if topic in COALESCED_TOPICS else 0.0
+        webhook_id, enqueued = get_webhook_queue().enqueue(
+            topic, payload, shop_domain, webhook_id, delay=delay
+        )
+        if enqueued:
+            self.start_dispatcher().notify()
+        else:
+            self.logger.info(f"Ignoring duplicate webhook delivery {webhook_id} ({topic})")
+
+        return {"webhook_id": webhook_id, "queued": enqueued, "duplicate": not enqueued}
+
+    def start_dispatcher(self) -> WebhookDispatcher:
+        """Start draining the webhook queue on the shared async loop."""
+        with self._dispatcher_lock:
+            if self._dispatcher is None or not self._dispatcher.running:
+                from app.services.async_bridge import get_async_bridge
+
+                self._dispatcher = WebhookDispatcher(
+                    get_webhook_queue(),
+                    self._process_queued_webhook,
+                    workers=int(os.getenv("WEBHOOK_WORKERS", "8")),
+                    per_topic_concurrency=int(os.getenv("WEBHOOK_TOPIC_CONCURRENCY", "4")),
+                    batch_handlers={topic: self._process_webhook_batch for topic in COALESCED_TOPICS},
+                    batch_size=int(os.getenv("WEBHOOK_COALESCE_BATCH", "1000")),
+                    processing_timeout=float(os.getenv("WEBHOOK_PROCESSING_TIMEOUT", "300")),
+                    retention=float(os.getenv("WEBHOOK_RETENTION_DAYS", "7")) * 86400,
+                )
+                get_async_bridge().submit_nowait(self._dispatcher.run())
+                self.logger.info("Webhook dispatcher started")
+            return self._dispatcher
+
+    async def _process_queued_webhook(self, entry: QueuedWebhook):
+        """Dispatcher handler; raising schedules a retry."""
+        try:
+            data = json.loads(entry.payload) if entry.payload else {}
+        except ValueError:
+            data = {}
+
+        result = await self.process_shopify_webhook(
+            entry.topic, data, entry.shop_domain, entry.webhook_id, entry=entry
+        )
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+
+    async def _process_webhook_batch(self, entries: List[QueuedWebhook]):
+        """Batch dispatcher handler; raising retries the batch for the agents that failed."""
+        result = await self.process_shopify_webhook_batch(
+            entries[0].topic, entries, entries[0].shop_domain
+        )
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+
+    async def process_shopify_webhook_batch(
+        self,
+        topic: str,
+        entries: List[QueuedWebhook],
+        shop_domain: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Coalesce a burst of catalog webhooks and route them as one batch.
+
+        Each agent only receives the entries it has not received on an earlier
+        attempt. When some agents fail, the ones that succeeded are recorded
+        on the entries so the retry does not submit their tasks again.
+
+        Args:
+            topic: Webhook topic shared by the batch
+            entries: Claimed webhooks in arrival order
+            shop_domain: Shopify shop domain shared by the batch
+
+        Returns:
+            Dict with processing and coalescing results
+        """
+        try:
+            parsed = []
+            for entry in entries:
+                try:
+                    parsed.append((entry, json.loads(entry.payload) if entry.payload else {}))
+                except ValueError:
+                    self.logger.warning(f"Dropping unparseable webhook {entry.webhook_id} ({entry.topic})")
+
+            updates = [data for _, data in parsed]
+            coalesced = coalesce_updates(topic, updates)
+            self._update_catalog(topic, coalesced)
+
+            async def deliver(agent, route):
+                pending = [(entry, data) for entry, data in parsed if agent not in entry.delivered]
+                if not pending:
+                    return {"agent": agent, "status": "already_delivered"}
+                return await route(
+                    topic,
+                    coalesce_updates(topic, [data for _, data in pending]),
+                    [entry.webhook_id for entry, _ in pending],
+                    shop_domain,
+                )
+
+            routes = self._batch_routes(topic)
+            results = await asyncio.gather(
+                *(deliver(agent, route) for agent, route in routes.items()), return_exceptions=True
+            )
+
+            failed = [(agent, r) for agent, r in zip(routes, results) if isinstance(r, Exception)]
+            if failed:
+                loop = asyncio.get_running_loop()
+                queue = self._queue()
+                for agent, result in zip(routes, results):
+                    if not isinstance(result, Exception):
+                        await loop.run_in_executor(
+                            None, queue.mark_delivered, agent, *(entry for entry, _ in parsed)
+                        )
+                raise failed[0][1]
+
+            # Counted once, when the batch is delivered, not on every attempt
+            self.coalescing_metrics["received"] += len(updates)
+            self.coalescing_metrics["delivered"] += len(coalesced)
+            self.coalescing_metrics["batches"] += 1
+            self.logger.info(f"Coalesced {len(updates)} {topic} webhooks into {len(coalesced)} updates")
+
+            return {
+                "success": True,
+                "topic": topic,
+                "received": len(updates),
+                "delivered": len(coalesced),
+                "agents_notified": len(results),
+                "agent_results": list(results),
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error processing webhook batch {topic}: {e}", exc_info=True)
+            return {
+                "success": False,
+                "error": str(e),
+                "topic": topic,
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
+
+    def _queue(self) -> WebhookQueue:
+        """Queue drained by the dispatcher, or the global queue before it starts."""
+        return self._dispatcher.queue if self._dispatcher is not None else get_webhook_queue()
+
+    def get_coalescing_metrics(self) -> Dict[str, Any]:
+        """Webhook coalescing counters and the received/delivered ratio."""
+        metrics = dict(self.coalescing_metrics)
+        metrics["coalescing_ratio"] = (
+            round(metrics["received"] / metrics["delivered"], 2) if metrics["delivered"] else 0.0
+        )
+        return metrics
+
+    def get_queue_metrics(self) -> Dict[str, Any]:
+        """Queue depth by status, dispatcher counters and coalescing metrics."""
+        dispatcher = self._dispatcher
+        return {
+            "queue": self._queue().stats(),
+            "dispatcher": dict(dispatcher.metrics) if dispatcher is not None else None,
+            "coalescing": self.get_coalescing_metrics(),
+        }
+
     async def process_shopify_webhook(
         self, 
         topic: str, 
         data: Dict[str, Any],
-        shop_domain: str
+        shop_domain: str,
+        webhook_id: Optional[str] = None,
+        entry: Optional[QueuedWebhook] = None
     ) -> Dict[str, Any]:
         """
         Process Shopify webhook and route to appropriate agents.
+
+        The result is unsuccessful when any agent could not be reached. For
+        queued webhooks the agents that were reached are recorded on the
+        entry, and the retry skips them.
         
         Args:
             topic: Webhook topic (e.g., "orders/create", "products/update")
             data: Webhook payload data
             shop_domain: Shopify shop domain
+            webhook_id: Queue ID of the webhook, generated if not given
+            entry: Queue entry of the webhook, if it came from the queue
             
         Returns:
             Dict with processing results
@@ -39,41 +280,31 @@ class WebhookProcessor:
         self.logger.info(f"Processing Shopify webhook: {topic} from {shop_domain}")
         
         try:
-            # Store webhook data in database first
-            webhook_id = await self._store_webhook_data(topic, data, shop_domain)
-            
-            # Route to appropriate agent based on topic
-            agent_results = []
-            
-            if topic.startswith("orders/"):
-                # Route order webhooks to order fulfillment agent
-                result = await self._route_to_order_agent(topic, data, webhook_id)
-                agent_results.append(result)
-                
-            elif topic.startswith("products/"):
-                # Route product webhooks to inventory and pricing agents
-                inventory_result = await self._route_to_inventory_agent(topic, data, webhook_id)
-                agent_results.append(inventory_result)
-                
-                # Also update product research data
-                research_result = await self._route_to_product_research_agent(topic, data, webhook_id)
-                agent_results.append(research_result)
-                
-            elif topic.startswith("inventory_levels/"):
-                # Route inventory webhooks to inventory agent
-                result = await self._route_to_inventory_agent(topic, data, webhook_id)
-                agent_results.append(result)
-                
-            elif topic.startswith("customers/"):
-                # Route customer webhooks to customer support and marketing agents
-                support_result = await self._route_to_customer_support_agent(topic, data, webhook_id)
-                agent_results.append(support_result)
-                
-                marketing_result = await self._route_to_marketing_agent(topic, data, webhook_id)
-                agent_results.append(marketing_result)
-                
-            else:
+            if webhook_id is None:
+                webhook_id = f"wh_{data.get('id', '0')}_{int(datetime.now(timezone.utc).timestamp())}"
+
+            self._update_catalog(topic, [data])
+            routes = self._agent_routes(topic)
+            if not routes:
                 self.logger.warning(f"No agent routing configured for topic: {topic}")
+
+            if entry is not None:
+                routes = {agent: route for agent, route in routes.items() if agent not in entry.delivered}
+
+            # Notify every agent for the topic concurrently
+            agent_results = list(await asyncio.gather(
+                *(route(topic, data, webhook_id) for route in routes.values()), return_exceptions=True
+            ))
+
+            failed = [r for r in agent_results if isinstance(r, Exception)]
+            if failed:
+                if entry is not None:
+                    loop = asyncio.get_running_loop()
+                    queue = self._queue()
+                    for agent, result in zip(routes, agent_results):
+                        if not isinstance(result, Exception):
+                            await loop.run_in_executor(None, queue.mark_delivered, agent, entry)
+                raise failed[0]
             
             return {
                 "success": True,
@@ -92,56 +323,49 @@ class WebhookProcessor:
                 "topic": topic,
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
-    
-    async def _store_webhook_data(
-        self, 
-        topic: str, 
-        data: Dict[str, Any],
-        shop_domain: str
-    ) -> str:
-        """Store webhook data in database for audit trail and agent processing."""
-        try:
-            from app.services.production_agent_executor import get_agent_executor
-            
-            executor = await get_agent_executor()
-            
-            # Store in webhook_events table
-            if executor.SessionLocal:
-                session = executor.SessionLocal()
-                try:
-                    # Create webhook event record
-                    # Note: This requires a WebhookEvent model in the database
-                    # For now, log the data - proper database integration can be added
-                    self.logger.info(f"Webhook data stored: {topic} - ID: {data.get('id', 'N/A')}")
-                    
-                    # Generate webhook ID
-                    webhook_id = f"wh_{data.get('id', '0')}_{int(datetime.now(timezone.utc).timestamp())}"
-                    
-                    # TODO: Add proper database model and storage
-                    # webhook_event = WebhookEvent(
-                    #     webhook_id=webhook_id,
-                    #     topic=topic,
-                    #     shop_domain=shop_domain,
-                    #     payload=data,
-                    #     processed=False,
-                    #     created_at=datetime.now(timezone.utc)
-                    # )
-                    # session.add(webhook_event)
-                    # session.commit()
-                    
-                    return webhook_id
-                finally:
-                    session.close()
-            else:
-                # Fallback: just log and return ID
-                webhook_id = f"wh_{data.get('id', '0')}_{int(datetime.now(timezone.utc).timestamp())}"
-                self.logger.warning("Database not available, webhook data logged only")
-                return webhook_id
-                
-        except Exception as e:
-            self.logger.error(f"Failed to store webhook data: {e}")
-            # Return ID anyway so processing can continue
-            return f"wh_error_{int(datetime.now(timezone.utc).timestamp())}"
+
+    def _update_catalog(self, topic: str, updates: List[Dict[str, Any]]):
+        """Keep the shared catalog cache in step with product and inventory webhooks."""
+        if not topic.startswith(("products/", "inventory_levels/")):
+            return
+        catalog = get_catalog_cache()
+        for data in updates:
+            catalog.apply_webhook(topic, data)
+
+    def _agent_routes(
+        self, topic: str
+    ) -> Dict[str, Callable[[str, Dict[str, Any], str], Awaitable[Dict[str, Any]]]]:
+        """Agent routing functions for a webhook topic, by agent.
+
+        Routing errors propagate, so the dispatcher retries the webhook with backoff.
+        """
+        if topic.startswith("orders/"):
+            # Order webhooks go to the order fulfillment agent
+            return {"order_fulfillment": self._route_to_order_agent}
+        if topic.startswith("products/"):
+            # Product webhooks update inventory/pricing and product research data
+            return {
+                "inventory": self._route_to_inventory_agent,
+                "product_research": self._route_to_product_research_agent,
+            }
+        if topic.startswith("inventory_levels/"):
+            return {"inventory": self._route_to_inventory_agent}
+        if topic.startswith("customers/"):
+            # Customer webhooks go to customer support and marketing agents
+            return {
+                "customer_support": self._route_to_customer_support_agent,
+                "marketing": self._route_to_marketing_agent,
+            }
+        return {}
+
+    def _batch_routes(
+        self, topic: str
+    ) -> Dict[str, Callable[[str, List[Dict[str, Any]], List[str], Optional[str]], Awaitable[Dict[str, Any]]]]:
+        """Batch routing functions for a coalesced topic, by agent."""
+        routes = {"inventory": self._route_batch_to_inventory_agent}
+        if topic.startswith("products/"):
+            routes["product_research"] = self._route_batch_to_product_research_agent
+        return routes
     
     async def _get_agent_registry(self):
         """Get AIRA integration for routing webhooks to agents."""
@@ -160,40 +384,35 @@ class WebhookProcessor:
         webhook_id: str
     ) -> Dict[str, Any]:
         """Route order webhook to order fulfillment agent."""
-        try:
-            aira = await self._get_agent_registry()
-            if not aira:
-                return {"agent": "order_fulfillment", "status": "aira_unavailable"}
-            
-            # Import required types
-            from orchestrator.core.aira_integration import AgentCapability, TaskPriority
-            
-            # Queue task for order agent via AIRA
-            task_data = {
-                "type": "shopify_webhook",
-                "webhook_id": webhook_id,
-                "topic": topic,
-                "order_data": data
-            }
-            
-            # Generate unique task ID
-            task_id = f"{webhook_id}_order"
-            priority = TaskPriority.HIGH if topic == "orders/create" else TaskPriority.NORMAL
-            
-            # Submit task through AIRA integration
-            result = await aira.submit_task(
-                task_id=task_id,
-                capability=AgentCapability.ORDER_FULFILLMENT,
-                parameters=task_data,
-                priority=priority
-            )
-            
-            self.logger.info(f"Routed {topic} to order fulfillment agent: {result}")
-            return {"agent": "order_fulfillment", "status": "queued", "task_id": result.task_id}
-            
-        except Exception as e:
-            self.logger.error(f"Failed to route to order agent: {e}")
-            return {"agent": "order_fulfillment", "status": "error", "error": str(e)}
+        aira = await self._get_agent_registry()
+        if not aira:
+            return {"agent": "order_fulfillment", "status": "aira_unavailable"}
+        
+        # Import required types
+        from orchestrator.core.aira_integration import AgentCapability, TaskPriority
+        
+        # Queue task for order agent via AIRA
+        task_data = {
+            "type": "shopify_webhook",
+            "webhook_id": webhook_id,
+            "topic": topic,
+            "order_data": data
+        }
+        
+        # Generate unique task ID
+        task_id = f"{webhook_id}_order"
+        priority = TaskPriority.HIGH if topic == "orders/create" else TaskPriority.NORMAL
+        
+        # Submit task through AIRA integration
+        result = await aira.submit_task(
+            task_id=task_id,
+            capability=AgentCapability.ORDER_FULFILLMENT,
+            parameters=task_data,
+            priority=priority
+        )
+        
+        self.logger.info(f"Routed {topic} to order fulfillment agent: {result}")
+        return {"agent": "order_fulfillment", "status": "queued", "task_id": result.task_id}
     
     async def _route_to_inventory_agent(
         self, 
@@ -202,35 +421,103 @@ class WebhookProcessor:
         webhook_id: str
     ) -> Dict[str, Any]:
         """Route inventory/product webhook to inventory agent."""
-        try:
-            aira = await self._get_agent_registry()
-            if not aira:
-                return {"agent": "inventory", "status": "aira_unavailable"}
-            
-            from orchestrator.core.aira_integration import AgentCapability, TaskPriority
-            
-            task_data = {
-                "type": "shopify_webhook",
-                "webhook_id": webhook_id,
-                "topic": topic,
-                "product_data": data
-            }
-            
-            task_id = f"{webhook_id}_inventory"
-            result = await aira.submit_task(
-                task_id=task_id,
-                capability=AgentCapability.INVENTORY_MANAGEMENT,
-                parameters=task_data,
-                priority=TaskPriority.NORMAL
-            )
-            
-            self.logger.info(f"Routed {topic} to inventory agent: {result}")
-            return {"agent": "inventory", "status": "queued", "task_id": result.task_id}
-            
-        except Exception as e:
-            self.logger.error(f"Failed to route to inventory agent: {e}")
-            return {"agent": "inventory", "status": "error", "error": str(e)}
+        aira = await self._get_agent_registry()
+        if not aira:
+            return {"agent": "inventory", "status": "aira_unavailable"}
+        
+        from orchestrator.core.aira_integration import AgentCapability, TaskPriority
+        
+        task_data = {
+            "type": "shopify_webhook",
+            "webhook_id": webhook_id,
+            "topic": topic,
+            "product_data": data
+        }
+        
+        task_id = f"{webhook_id}_inventory"
+        result = await aira.submit_task(
+            task_id=task_id,
+            capability=AgentCapability.INVENTORY_MANAGEMENT,
+            parameters=task_data,
+            priority=TaskPriority.NORMAL
+        )
+        
+        self.logger.info(f"Routed {topic} to inventory agent: {result}")
+        return {"agent": "inventory", "status": "queued", "task_id": result.task_id}
     
+    async def _route_batch_to_inventory_agent(
+        self,
+        topic: str,
+        updates: List[Dict[str, Any]],
+        webhook_ids: List[str],
+        shop_domain: Optional[str]
+    ) -> Dict[str, Any]:
+        """Route a coalesced batch of inventory/product webhooks to the inventory agent.
+
+        Errors propagate, so the dispatcher retries the batch with backoff.
+        """
+        aira = await self._get_agent_registry()
+        if not aira:
+            return {"agent": "inventory", "status": "aira_unavailable"}
+
+        from orchestrator.core.aira_integration import AgentCapability, TaskPriority
+
+        task_data = {
+            "type": "shopify_webhook_batch",
+            "webhook_ids": webhook_ids,
+            "topic": topic,
+            "shop_domain": shop_domain,
+            "updates": updates
+        }
+
+        task_id = f"{webhook_ids[0]}_batch_inventory"
+        result = await aira.submit_task(
+            task_id=task_id,
+            capability=AgentCapability.INVENTORY_MANAGEMENT,
+            parameters=task_data,
+            priority=TaskPriority.NORMAL
+        )
+
+        self.logger.info(f"Routed {len(updates)} {topic} updates to inventory agent: {result}")
+        return {"agent": "inventory", "status": "queued", "task_id": result.task_id}
+
+    async def _route_batch_to_product_research_agent(
+        self,
+        topic: str,
+        updates: List[Dict[str, Any]],
+        webhook_ids: List[str],
+        shop_domain: Optional[str]
+    ) -> Dict[str, Any]:
+        """Route a coalesced batch of product webhooks to the product research agent.
+
+        Errors propagate, so the dispatcher retries the batch with backoff.
+        """
+        aira = await self._get_agent_registry()
+        if not aira:
+            return {"agent": "product_research", "status": "aira_unavailable"}
+
+        from orchestrator.core.aira_integration import AgentCapability, TaskPriority
+
+        task_data = {
+            "type": "shopify_webhook_batch",
+            "webhook_ids": webhook_ids,
+            "topic": topic,
+            "shop_domain": shop_domain,
+            "updates": updates,
+            "action": "analyze_market_opportunity"
+        }
+
+        task_id = f"{webhook_ids[0]}_batch_research"
+        result = await aira.submit_task(
+            task_id=task_id,
+            capability=AgentCapability.PRODUCT_RESEARCH,
+            parameters=task_data,
+            priority=TaskPriority.NORMAL
+        )
+
+        self.logger.info(f"Routed {len(updates)} {topic} updates to product research agent: {result}")
+        return {"agent": "product_research", "status": "queued", "task_id": result.task_id}
+
     async def _route_to_product_research_agent(
         self, 
         topic: str, 
@@ -238,35 +525,30 @@ class WebhookProcessor:
         webhook_id: str
     ) -> Dict[str, Any]:
         """Route product webhook to product research agent for market analysis."""
-        try:
-            aira = await self._get_agent_registry()
-            if not aira:
-                return {"agent": "product_research", "status": "aira_unavailable"}
-            
-            from orchestrator.core.aira_integration import AgentCapability, TaskPriority
-            
-            task_data = {
-                "type": "shopify_webhook",
-                "webhook_id": webhook_id,
-                "topic": topic,
-                "product_data": data,
-                "action": "analyze_market_opportunity"
-            }
-            
-            task_id = f"{webhook_id}_research"
-            result = await aira.submit_task(
-                task_id=task_id,
-                capability=AgentCapability.PRODUCT_RESEARCH,
-                parameters=task_data,
-                priority=TaskPriority.NORMAL
-            )
-            
-            self.logger.info(f"Routed {topic} to product research agent: {result}")
-            return {"agent": "product_research", "status": "queued", "task_id": result.task_id}
-            
-        except Exception as e:
-            self.logger.error(f"Failed to route to product research agent: {e}")
-            return {"agent": "product_research", "status": "error", "error": str(e)}
+        aira = await self._get_agent_registry()
+        if not aira:
+            return {"agent": "product_research", "status": "aira_unavailable"}
+        
+        from orchestrator.core.aira_integration import AgentCapability, TaskPriority
+        
+        task_data = {
+            "type": "shopify_webhook",
+            "webhook_id": webhook_id,
+            "topic": topic,
+            "product_data": data,
+            "action": "analyze_market_opportunity"
+        }
+        
+        task_id = f"{webhook_id}_research"
+        result = await aira.submit_task(
+            task_id=task_id,
+            capability=AgentCapability.PRODUCT_RESEARCH,
+            parameters=task_data,
+            priority=TaskPriority.NORMAL
+        )
+        
+        self.logger.info(f"Routed {topic} to product research agent: {result}")
+        return {"agent": "product_research", "status": "queued", "task_id": result.task_id}
     
     async def _route_to_customer_support_agent(
         self, 
@@ -275,34 +557,29 @@ class WebhookProcessor:
         webhook_id: str
     ) -> Dict[str, Any]:
         """Route customer webhook to customer support agent."""
-        try:
-            aira = await self._get_agent_registry()
-            if not aira:
-                return {"agent": "customer_support", "status": "aira_unavailable"}
-            
-            from orchestrator.core.aira_integration import AgentCapability, TaskPriority
-            
-            task_data = {
-                "type": "shopify_webhook",
-                "webhook_id": webhook_id,
-                "topic": topic,
-                "customer_data": data
-            }
-            
-            task_id = f"{webhook_id}_support"
-            result = await aira.submit_task(
-                task_id=task_id,
-                capability=AgentCapability.CUSTOMER_SUPPORT,
-                parameters=task_data,
-                priority=TaskPriority.NORMAL
-            )
-            
-            self.logger.info(f"Routed {topic} to customer support agent: {result}")
-            return {"agent": "customer_support", "status": "queued", "task_id": result.task_id}
-            
-        except Exception as e:
-            self.logger.error(f"Failed to route to customer support agent: {e}")
-            return {"agent": "customer_support", "status": "error", "error": str(e)}
+        aira = await self._get_agent_registry()
+        if not aira:
+            return {"agent": "customer_support", "status": "aira_unavailable"}
+        
+        from orchestrator.core.aira_integration import AgentCapability, TaskPriority
+        
+        task_data = {
+            "type": "shopify_webhook",
+            "webhook_id": webhook_id,
+            "topic": topic,
+            "customer_data": data
+        }
+        
+        task_id = f"{webhook_id}_support"
+        result = await aira.submit_task(
+            task_id=task_id,
+            capability=AgentCapability.CUSTOMER_SUPPORT,
+            parameters=task_data,
+            priority=TaskPriority.NORMAL
+        )
+        
+        self.logger.info(f"Routed {topic} to customer support agent: {result}")
+        return {"agent": "customer_support", "status": "queued", "task_id": result.task_id}
     
     async def _route_to_marketing_agent(
         self, 
@@ -311,34 +588,29 @@ class WebhookProcessor:
         webhook_id: str
     ) -> Dict[str, Any]:
         """Route customer webhook to marketing automation agent."""
-        try:
-            aira = await self._get_agent_registry()
-            if not aira:
-                return {"agent": "marketing", "status": "aira_unavailable"}
-            
-            from orchestrator.core.aira_integration import AgentCapability, TaskPriority
-            
-            task_data = {
-                "type": "shopify_webhook",
-                "webhook_id": webhook_id,
-                "topic": topic,
-                "customer_data": data
-            }
-            
-            task_id = f"{webhook_id}_marketing"
-            result = await aira.submit_task(
-                task_id=task_id,
-                capability=AgentCapability.MARKETING_AUTOMATION,
-                parameters=task_data,
-                priority=TaskPriority.LOW
-            )
-            
-            self.logger.info(f"Routed {topic} to marketing agent: {result}")
-            return {"agent": "marketing", "status": "queued", "task_id": result.task_id}
-            
-        except Exception as e:
-            self.logger.error(f"Failed to route to marketing agent: {e}")
-            return {"agent": "marketing", "status": "error", "error": str(e)}
+        aira = await self._get_agent_registry()
+        if not aira:
+            return {"agent": "marketing", "status": "aira_unavailable"}
+        
+        from orchestrator.core.aira_integration import AgentCapability, TaskPriority
+        
+        task_data = {
+            "type": "shopify_webhook",
+            "webhook_id": webhook_id,
+            "topic": topic,
+            "customer_data": data
+        }
+        
+        task_id = f"{webhook_id}_marketing"
+        result = await aira.submit_task(
+            task_id=task_id,
+            capability=AgentCapability.MARKETING_AUTOMATION,
+            parameters=task_data,
+            priority=TaskPriority.LOW
+        )
+        
+        self.logger.info(f"Routed {topic} to marketing agent: {result}")
+        return {"agent": "marketing", "status": "queued", "task_id": result.task_id}
 
 
 # Global webhook processor instance
@@ -0,0 +1,503 @@
+"""
+Durable webhook queue - persists verified webhooks before they are processed.
+
+The HTTP handler appends the raw payload to a local SQLite database in WAL
+mode and acknowledges immediately; a dispatcher running on the shared async
+bridge loop drains the queue with bounded concurrency per topic. Webhooks are
+deduplicated on Shopify's ``X-Shopify-Webhook-Id`` so delivery retries are
+never processed twice.
+
+Claims are leases: a handler is cancelled once it has run for
+``processing_timeout``, and entries still ``processing`` well past that
+(their worker crashed) are returned to the queue by whichever dispatcher
+runs maintenance next. Several worker processes can therefore share one
+queue file without re-queueing each other's in-flight webhooks. Maintenance
+also purges finished entries after the retention period.
+
+Handlers that fan an entry out to several destinations can record which ones
+already received it (``mark_delivered``); a retry then only needs to reach
+the destinations that failed.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS webhook_queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    webhook_id TEXT NOT NULL UNIQUE,
+    topic TEXT NOT NULL,
+    shop_domain TEXT,
+    payload BLOB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    received_at REAL NOT NULL,
+    available_at REAL NOT NULL,
+    claimed_at REAL,
+    completed_at REAL,
+    last_error TEXT,
+    delivered TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS ix_webhook_queue_ready ON webhook_queue (status, available_at);
+"""
+
+
+@dataclass
+class QueuedWebhook:
+    """A webhook claimed from the queue for processing."""
+    id: int
+    webhook_id: str
+    topic: str
+    shop_domain: Optional[str]
+    payload: bytes
+    attempts: int
+    received_at: float
+    delivered: Set[str] = field(default_factory=set)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'webhook_id': self.webhook_id,
+            'topic': self.topic,
+            'shop_domain': self.shop_domain,
+            'attempts': self.attempts,
+            'received_at': self.received_at,
+        }
+
+
+class WebhookQueue:
+    """SQLite-backed persistent webhook queue with idempotent enqueue."""
+
+    def __init__(self, path: str, max_attempts: int = 5, retry_backoff: float = 5.0):
+        """
+        Args:
+            path: Database file (``:memory:`` for a throwaway queue)
+            max_attempts: Attempts before an entry is marked ``failed``
+            retry_backoff: Base delay in seconds, doubled on every retry
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL with NORMAL sync survives process crashes; only an OS crash can lose the last commits
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(webhook_queue)")}
+        if "delivered" not in columns:
+            # Queue files created before delivery tracking
+            self._conn.execute("ALTER TABLE webhook_queue ADD COLUMN delivered TEXT NOT NULL DEFAULT ''")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(
+        self,
+        topic: str,
+        payload: bytes,
+        shop_domain: Optional[str] = None,
+        webhook_id: Optional[str] = None,
+        delay: float = 0.0,
+    ) -> Tuple[str, bool]:
+        """
+        Persist a webhook unless one with the same ID was already received.
+
+        Args:
+            delay: Seconds before the entry may be claimed, letting batched
+                topics accumulate
+
+        Returns:
+            Tuple of (webhook_id, enqueued); ``enqueued`` is False for duplicates
+        """
+        webhook_id = webhook_id or f"wh_{uuid.uuid4().hex}"
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO webhook_queue "
+                "(webhook_id, topic, shop_domain, payload, received_at, available_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (webhook_id, topic, shop_domain, payload, now, now + delay),
+            )
+        return webhook_id, cursor.rowcount == 1
+
+    def claim(
+        self,
+        limit: int,
+        skip_topics: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+    ) -> List[QueuedWebhook]:
+        """Atomically move up to ``limit`` ready entries to ``processing``.
+
+        Args:
+            limit: Maximum entries to claim
+            skip_topics: Topics to leave in the queue
+            topics: Only claim entries of these topics
+        """
+        if limit <= 0:
+            return []
+
+        now = time.time()
+        query = (
+            "SELECT id, webhook_id, topic, shop_domain, payload, attempts, received_at, delivered "
+            "FROM webhook_queue WHERE status = 'pending' AND available_at <= ?"
+        )
+        params: List[Any] = [now]
+        if skip_topics:
+            query += f" AND topic NOT IN ({', '.join('?' * len(skip_topics))})"
+            params.extend(skip_topics)
+        if topics:
+            query += f" AND topic IN ({', '.join('?' * len(topics))})"
+            params.extend(topics)
+        query += " ORDER BY id LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(query, params).fetchall()
+                self._conn.executemany(
+                    "UPDATE webhook_queue SET status = 'processing', claimed_at = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    [(now, row[0]) for row in rows],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return [self._entry(row) for row in rows]
+
+    def claim_batch(self, topic: str, limit: int) -> List[QueuedWebhook]:
+        """Claim up to ``limit`` ready entries of ``topic`` from a single shop.
+
+        The shop of the oldest ready entry goes first, so shops take turns.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                oldest = self._conn.execute(
+                    "SELECT shop_domain FROM webhook_queue WHERE status = 'pending' AND available_at <= ? "
+                    "AND topic = ? ORDER BY id LIMIT 1",
+                    (now, topic),
+                ).fetchone()
+                rows = []
+                if oldest is not None:
+                    rows = self._conn.execute(
+                        "SELECT id, webhook_id, topic, shop_domain, payload, attempts, received_at, delivered "
+                        "FROM webhook_queue WHERE status = 'pending' AND available_at <= ? "
+                        "AND topic = ? AND shop_domain IS ? ORDER BY id LIMIT ?",
+                        (now, topic, oldest[0], limit),
+                    ).fetchall()
+                    self._conn.executemany(
+                        "UPDATE webhook_queue SET status = 'processing', claimed_at = ?, "
+                        "attempts = attempts + 1 WHERE id = ?",
+                        [(now, row[0]) for row in rows],
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return [self._entry(row) for row in rows]
+
+    @staticmethod
+    def _entry(row: tuple) -> QueuedWebhook:
+        return QueuedWebhook(
+            id=row[0], webhook_id=row[1], topic=row[2], shop_domain=row[3],
+            payload=row[4], attempts=row[5] + 1, received_at=row[6],
+            delivered=set(filter(None, row[7].split(","))),
+        )
+
+    def complete(self, *entries: QueuedWebhook):
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE webhook_queue SET status = 'done', completed_at = ?, last_error = NULL WHERE id = ?",
+                [(now, entry.id) for entry in entries],
+            )
+
+    def mark_delivered(self, destination: str, *entries: QueuedWebhook):
+        """Record that ``destination`` received the entries, so retries skip it."""
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE webhook_queue SET delivered = CASE WHEN delivered = '' THEN ? "
+                "ELSE delivered || ',' || ? END WHERE id = ?",
+                [(destination, destination, entry.id) for entry in entries if destination not in entry.delivered],
+            )
+        for entry in entries:
+            entry.delivered.add(destination)
+
+    def release(self, entry: QueuedWebhook):
+        """Put a claimed entry back without counting the attempt."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE webhook_queue SET status = 'pending', attempts = attempts - 1 WHERE id = ?",
+                (entry.id,),
+            )
+
+    def fail(self, entry: QueuedWebhook, error: str):
+        """Schedule a retry with exponential backoff, or give up after ``max_attempts``."""
+        with self._lock:
+            if entry.attempts >= self.max_attempts:
+                self._conn.execute(
+                    "UPDATE webhook_queue SET status = 'failed', completed_at = ?, last_error = ? WHERE id = ?",
+                    (time.time(), error, entry.id),
+                )
+                logger.error(f"Webhook {entry.webhook_id} ({entry.topic}) failed after {entry.attempts} attempts: {error}")
+                return
+
+            delay = self.retry_backoff * (2 ** (entry.attempts - 1))
+            self._conn.execute(
+                "UPDATE webhook_queue SET status = 'pending', available_at = ?, last_error = ? WHERE id = ?",
+                (time.time() + delay, error, entry.id),
+            )
+
+    def recover(self, older_than: float = 0.0) -> int:
+        """Return entries stuck in ``processing`` (e.g. after a crash) to the queue."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE webhook_queue SET status = 'pending', available_at = ? "
+                "WHERE status = 'processing' AND claimed_at <= ?",
+                (time.time(), time.time() - older_than),
+            )
+        return cursor.rowcount
+
+    def purge(self, older_than: float) -> int:
+        """Delete finished entries; their IDs stop deduplicating after this."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM webhook_queue WHERE status IN ('done', 'failed') AND completed_at < ?",
+                (time.time() - older_than,),
+            )
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM webhook_queue GROUP BY status"
+            ).fetchall()
+        counts = {'pending': 0, 'processing': 0, 'done': 0, 'failed': 0}
+        counts.update(dict(rows))
+        return counts
+
+
+class WebhookDispatcher:
+    """Drains a WebhookQueue on an event loop with per-topic concurrency limits.
+
+    Topics with a batch handler are claimed up to ``batch_size`` entries of
+    one shop at a time and handed over together, one batch per topic at once;
+    all entries of a batch complete or fail together.
+    """
+
+    # Claims older than this many processing timeouts belong to a dead worker
+    LEASE_FACTOR = 2
+
+    def __init__(
+        self,
+        queue: WebhookQueue,
+        handler: Callable[[QueuedWebhook], Awaitable[Any]],
+        workers: int = 8,
+        per_topic_concurrency: int = 4,
+        poll_interval: float = 1.0,
+        batch_handlers: Optional[Dict[str, Callable[[List[QueuedWebhook]], Awaitable[Any]]]] = None,
+        batch_size: int = 1000,
+        processing_timeout: float = 300.0,
+        retention: float = 7 * 24 * 3600,
+        maintenance_interval: float = 60.0,
+    ):
+        """
+        Args:
+            queue: Queue to drain
+            handler: Processes one entry; raising schedules a retry
+            workers: Maximum entries or batches in flight
+            per_topic_concurrency: Maximum entries in flight per topic
+            poll_interval: Seconds between polls when idle
+            batch_handlers: Handlers for topics processed in batches
+            batch_size: Maximum entries per batch
+            processing_timeout: Seconds a handler may run before it is
+                cancelled and the attempt counted as failed
+            retention: Seconds finished entries are kept (and deduplicate)
+            maintenance_interval: Seconds between lease recovery and purge runs
+        """
+        self.queue = queue
+        self.handler = handler
+        self.workers = workers
+        self.per_topic_concurrency = per_topic_concurrency
+        self.poll_interval = poll_interval
+        self.batch_handlers = batch_handlers or {}
+        self.batch_size = batch_size
+        self.processing_timeout = processing_timeout
+        self.retention = retention
+        self.maintenance_interval = maintenance_interval
+
+        self._last_maintenance = 0.0
+        self._active: Dict[str, int] = {}
+        self._tasks: set = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._running = False
+        self.metrics = {'processed': 0, 'failed': 0, 'batches': 0}
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def notify(self):
+        """Wake the dispatcher after an enqueue; safe to call from any thread."""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def run(self):
+        """Dispatch until ``stop`` is called."""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._running = True
+
+        try:
+            while self._running:
+                if time.monotonic() - self._last_maintenance >= self.maintenance_interval:
+                    await self.maintain()
+                dispatched = await self.dispatch_ready()
+                if not dispatched:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._wakeup.clear()
+        finally:
+            self._running = False
+
+    def stop(self):
+        self._running = False
+        self.notify()
+
+    async def maintain(self) -> Dict[str, int]:
+        """Recover expired claims and purge finished entries past retention."""
+        loop = asyncio.get_running_loop()
+        self._last_maintenance = time.monotonic()
+        try:
+            recovered = await loop.run_in_executor(
+                None, self.queue.recover, self.processing_timeout * self.LEASE_FACTOR
+            )
+            purged = await loop.run_in_executor(None, self.queue.purge, self.retention)
+        except Exception as e:
+            logger.error(f"Webhook queue maintenance failed: {e}")
+            return {'recovered': 0, 'purged': 0}
+
+        if recovered:
+            logger.warning(f"Recovered {recovered} webhooks whose processing lease expired")
+        if purged:
+            logger.info(f"Purged {purged} finished webhooks")
+        return {'recovered': recovered, 'purged': purged}
+
+    async def dispatch_ready(self) -> int:
+        """Claim as many ready webhooks as capacity allows and start processing them."""
+        loop = asyncio.get_running_loop()
+        started = 0
+
+        for topic in self.batch_handlers:
+            if self._active.get(topic) or len(self._tasks) >= self.workers:
+                continue
+            batch = await loop.run_in_executor(None, self.queue.claim_batch, topic, self.batch_size)
+            if batch:
+                self._start(topic, self._process_batch(topic, batch))
+                started += 1
+
+        capacity = self.workers - len(self._tasks)
+        if capacity <= 0:
+            return started
+
+        saturated = [topic for topic, count in self._active.items() if count >= self.per_topic_concurrency]
+        entries = await loop.run_in_executor(
+            None, self.queue.claim, capacity, saturated + list(self.batch_handlers)
+        )
+
+        for entry in entries:
+            if self._active.get(entry.topic, 0) >= self.per_topic_concurrency:
+                # Claimed in the same batch as other entries of a now-busy topic
+                await loop.run_in_executor(None, self.queue.release, entry)
+                continue
+            self._start(entry.topic, self._process(entry))
+            started += 1
+        return started
+
+    def _start(self, topic: str, coro: Awaitable[Any]):
+        self._active[topic] = self._active.get(topic, 0) + 1
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def drain(self):
+        """Process everything currently ready and wait for it to finish (for tests and shutdown)."""
+        while await self.dispatch_ready() or self._tasks:
+            if self._tasks:
+                await asyncio.wait(set(self._tasks), return_when=asyncio.FIRST_COMPLETED)
+
+    async def _process(self, entry: QueuedWebhook):
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(self.handler(entry), self.processing_timeout)
+            await loop.run_in_executor(None, self.queue.complete, entry)
+            self.metrics['processed'] += 1
+        except Exception as e:
+            logger.warning(f"Webhook {entry.webhook_id} ({entry.topic}) attempt {entry.attempts} failed: {e}")
+            await loop.run_in_executor(None, self.queue.fail, entry, str(e))
+            self.metrics['failed'] += 1
+        finally:
+            self._finish(entry.topic)
+
+    async def _process_batch(self, topic: str, entries: List[QueuedWebhook]):
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(self.batch_handlers[topic](entries), self.processing_timeout)
+            await loop.run_in_executor(None, self.queue.complete, *entries)
+            self.metrics['processed'] += len(entries)
+            self.metrics['batches'] += 1
+        except Exception as e:
+            logger.warning(f"Webhook batch of {len(entries)} {topic} entries failed: {e}")
+            for entry in entries:
+                await loop.run_in_executor(None, self.queue.fail, entry, str(e))
+            self.metrics['failed'] += len(entries)
+        finally:
+            self._finish(topic)
+
+    def _finish(self, topic: str):
+        self._active[topic] -= 1
+        if not self._active[topic]:
+            del self._active[topic]
+        self.notify()
+
+
+# Global queue instance
+_webhook_queue: Optional[WebhookQueue] = None
+_webhook_queue_lock = threading.Lock()
+
+
+def get_webhook_queue() -> WebhookQueue:
+    """Get or create the global webhook queue."""
+    global _webhook_queue
+    if _webhook_queue is None:
+        with _webhook_queue_lock:
+            if _webhook_queue is None:
+                _webhook_queue = WebhookQueue(
+                    os.getenv("WEBHOOK_QUEUE_PATH", "data/webhook_queue.sqlite3"),
+                    max_attempts=int(os.getenv("WEBHOOK_MAX_ATTEMPTS", "5")),
+                )
+    return _webhook_queue
@@ -7,15 +7,30 @@ Provides real-time updates across namespaces:
 - /ws/logs: Live log streaming with ring buffer
 - /ws/aria: ARIA AI assistant real-time interactions and command execution
 - /ws/empire: Empire operations monitoring and control
+
+Scaling out: with ``SOCKETIO_MESSAGE_QUEUE`` set (e.g. a Redis URL), emits
+from any worker or process are relayed to clients connected to every worker.
+The periodic emitters run only in the worker elected leader, so dashboard
+data is computed once rather than once per worker. Gunicorn workers have no
+sticky sessions, so multi-worker deployments default to websocket-only
+transport.
+
+Periodic payloads go through ``DeltaPublisher``: namespaces without clients
+are skipped and unchanged payloads are not sent. With a Redis message queue,
+workers record in Redis which namespaces have clients, so the leader also
+skips namespaces that are idle on every other worker. Changes are sent in full
+under their original event names, except to clients that emitted
+``subscribe_deltas``: those receive ``<event>:delta`` merge patches and emit
+``resync`` to get full snapshots again when they miss one.
 """
 
-import asyncio
 import logging
+import os
 import threading
 import time
 from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # import psutil  # Will be added when available
 try:
@@ -23,27 +38,178 @@ try:
 except ImportError:
     psutil = None
 
-from flask_socketio import SocketIO, emit
+from flask import request
+from flask_socketio import SocketIO, emit, join_room, leave_room
+
+from app.services.async_bridge import gather_async, run_async
+from app.services.leader_election import LeaderElector, create_leader_elector
+from app.services.socket_publisher import (
+    DELTA_ROOM,
+    FULL_ROOM,
+    DeltaPublisher,
+    RedisPresence,
+    RedisSnapshotStore,
+)
 
 logger = logging.getLogger(__name__)
 
 # Global SocketIO instance
 socketio = None
 
+# Elects the worker that runs the periodic emitters
+emitter_elector: Optional[LeaderElector] = None
+
+# Publisher for periodic payloads, created by init_socketio
+delta_publisher: Optional[DeltaPublisher] = None
+
+# Clients connected to other workers, shared through Redis with a Redis message queue
+presence: Optional[RedisPresence] = None
+
+# Namespaces whose periodic payloads go through the delta publisher
+DELTA_NAMESPACES = ('/ws/system', '/ws/shopify', '/ws/aria', '/ws/empire')
+
+
+def count_local_clients(namespace: str, exclude: Optional[str] = None) -> int:
+    """Clients connected to ``namespace`` on this worker, optionally leaving one out."""
+    return sum(1 for sid, _ in socketio.server.manager.get_participants(namespace, None) if sid != exclude)
+
+
+def namespace_has_clients(namespace: str) -> bool:
+    """Whether any client is connected to ``namespace``, on this worker or another."""
+    if socketio is None:
+        return False
+    try:
+        if count_local_clients(namespace):
+            return True
+        if presence is not None:
+            return presence.any(namespace)
+    except Exception as e:
+        logger.warning(f"Could not check clients of {namespace}: {e}")
+        return True
+    # Without shared presence, clients on other workers are not visible from here
+    return bool(os.getenv('SOCKETIO_MESSAGE_QUEUE'))
+
+
+def update_presence(namespace: str, exclude: Optional[str] = None):
+    """Record in the shared presence whether this worker has clients on ``namespace``."""
+    if presence is None:
+        return
+    try:
+        presence.update(namespace, count_local_clients(namespace, exclude=exclude) > 0)
+    except Exception as e:
+        logger.warning(f"Could not update Socket.IO presence for {namespace}: {e}")
+
+
+def track_client(namespace: str):
+    """Register a client connecting to a published namespace.
+
+    It receives changes in full until it emits ``subscribe_deltas``.
+    """
+    join_room(FULL_ROOM, namespace=namespace)
+    update_presence(namespace)
+
+
+def untrack_client(namespace: str):
+    """Unregister a client disconnecting from a published namespace."""
+    # The client is still listed as a participant while its disconnect is handled
+    update_presence(namespace, exclude=request.sid)
+
+
+def refresh_presence(stop: Optional[threading.Event] = None):
+    """Keep this worker's presence alive while its clients stay connected."""
+    stop = stop or threading.Event()
+    while not stop.wait(presence.ttl / 3):
+        for namespace in DELTA_NAMESPACES:
+            update_presence(namespace)
+
+
+def connect_message_queue_redis() -> Optional[Any]:
+    """Redis client for a Redis ``SOCKETIO_MESSAGE_QUEUE``, or None with any other queue."""
+    message_queue = os.getenv('SOCKETIO_MESSAGE_QUEUE', '')
+    if not message_queue.startswith(('redis://', 'rediss://')):
+        return None
+    try:
+        import redis
+    except ImportError:
+        logger.warning("redis package not installed; Socket.IO snapshots and presence cannot be shared")
+        return None
+    return redis.from_url(message_queue, socket_timeout=1.0)
+
+
+def create_delta_publisher(redis_client: Optional[Any] = None) -> DeltaPublisher:
+    """
+    Create the publisher for periodic payloads.
+
+    With a message queue, the leader's snapshots must be readable by every
+    worker: they are kept in Redis next to a Redis message queue, and with
+    any other queue every change is broadcast as a full snapshot instead.
+
+    Args:
+        redis_client: Client for the Redis message queue, if it is one
+    """
+    def emit_to_clients(*args, **kwargs):
+        socketio.emit(*args, **kwargs)
+
+    if not os.getenv('SOCKETIO_MESSAGE_QUEUE'):
+        return DeltaPublisher(emit_to_clients, namespace_has_clients)
+
+    if redis_client is not None:
+        return DeltaPublisher(emit_to_clients, namespace_has_clients, store=RedisSnapshotStore(redis_client))
+
+    logger.warning("No shared Socket.IO snapshot store; broadcasting full snapshots instead of deltas")
+    return DeltaPublisher(emit_to_clients, namespace_has_clients, deltas=False)
+
+
 # In-memory ring buffer for logs
 _log_buffer = deque(maxlen=1000)
 _log_buffer_lock = threading.Lock()
 
+def get_socketio_options() -> Dict[str, Any]:
+    """
+    SocketIO server options from the environment.
+
+    - ``SOCKETIO_MESSAGE_QUEUE``: backplane URL (redis://, amqp://, kafka://)
+      shared by all workers; unset keeps emits local to the process
+    - ``SOCKETIO_CHANNEL``: backplane channel, to share one broker between apps
+    - ``SOCKETIO_ASYNC_MODE``: threading (default), eventlet or gevent
+    - ``SOCKETIO_TRANSPORTS``: comma-separated engine.io transports; defaults
+      to websocket only when ``WEB_CONCURRENCY`` > 1, because long-polling
+      requests must reach the worker that holds the session
+    """
+    options: Dict[str, Any] = {
+        'cors_allowed_origins': "*",
+        'async_mode': os.getenv('SOCKETIO_ASYNC_MODE', 'threading'),
+        'logger': False,
+        'engineio_logger': False,
+    }
+
+    message_queue = os.getenv('SOCKETIO_MESSAGE_QUEUE')
+    if message_queue:
+        options['message_queue'] = message_queue
+        options['channel'] = os.getenv('SOCKETIO_CHANNEL', 'flask-socketio')
+
+    workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+    transports = os.getenv('SOCKETIO_TRANSPORTS')
+    if transports:
+        options['transports'] = [t.strip() for t in transports.split(',') if t.strip()]
+    elif workers > 1:
+        options['transports'] = ['websocket']
+
+    if workers > 1 and not message_queue:
+        logger.warning(
+            f"Running {workers} workers without SOCKETIO_MESSAGE_QUEUE; "
+            "clients only receive events emitted by their own worker"
+        )
+    return options
+
+
 def init_socketio(app):
     """Initialize SocketIO with Flask app and namespaces."""
-    global socketio
-    socketio = SocketIO(
-        app,
-        cors_allowed_origins="*",
-        async_mode='threading',
-        logger=False,
-        engineio_logger=False
-    )
+    global socketio, delta_publisher, presence
+    socketio = SocketIO(app, **get_socketio_options())
+    redis_client = connect_message_queue_redis()
+    delta_publisher = create_delta_publisher(redis_client)
+    presence = RedisPresence(redis_client) if redis_client is not None else None
 
     # Register namespace handlers
     register_system_handlers()
@@ -60,6 +226,7 @@ def init_socketio(app):
     register_marketing_handlers()  # Production marketing automation WebSocket
     register_customer_support_handlers()  # Production customer support WebSocket
     register_security_handlers()  # Production security monitoring WebSocket
+    register_resync_handlers()
 
     # Start background tasks
     start_background_tasks()
@@ -76,6 +243,7 @@ def register_system_handlers():
     def handle_system_connect():
         """Handle client connection to system namespace."""
         logger.info('Client connected to /ws/system')
+        track_client('/ws/system')
         emit('connected', {
             'namespace': '/ws/system',
             'status': 'connected',
@@ -83,15 +251,20 @@ def register_system_handlers():
             'message': 'Connected to Royal Equips System Monitor'
         })
 
-        # Send initial status
-        emit('service_up', get_service_status())
-        emit('heartbeat', get_heartbeat_data())
-        emit('metrics', get_system_metrics())
+        # Send initial status, from the latest published snapshots when available
+        sent = delta_publisher.send_snapshots('/ws/system', to=request.sid)
+        if 'service_up' not in sent:
+            emit('service_up', get_service_status())
+        if 'heartbeat' not in sent:
+            emit('heartbeat', get_heartbeat_data())
+        if 'metrics' not in sent:
+            emit('metrics', get_system_metrics())
 
     @socketio.on('disconnect', namespace='/ws/system')
     def handle_system_disconnect():
         """Handle client disconnection from system namespace."""
         logger.info('Client disconnected from /ws/system')
+        untrack_client('/ws/system')
 
     @socketio.on('request_status', namespace='/ws/system')
     def handle_system_status_request():
@@ -108,6 +281,7 @@ def register_shopify_handlers():
     def handle_shopify_connect():
         """Handle client connection to Shopify namespace."""
         logger.info('Client connected to /ws/shopify')
+        track_client('/ws/shopify')
         emit('connected', {
             'namespace': '/ws/shopify',
             'status': 'connected',
@@ -122,6 +296,7 @@ def register_shopify_handlers():
     def handle_shopify_disconnect():
         """Handle client disconnection from Shopify namespace."""
         logger.info('Client disconnected from /ws/shopify')
+        untrack_client('/ws/shopify')
 
     @socketio.on('request_jobs', namespace='/ws/shopify')
     def handle_jobs_request():
@@ -180,58 +355,97 @@ def register_logs_handlers():
 
 
 def start_background_tasks():
-    """Start background tasks for real-time data emission across namespaces."""
-
-    def emit_system_heartbeat():
-        """Emit system heartbeat every 2 seconds to /ws/system."""
-        while True:
-            try:
-                if socketio:
-                    heartbeat_data = get_heartbeat_data()
-                    socketio.emit('heartbeat', heartbeat_data, namespace='/ws/system')
-                time.sleep(2)
-            except Exception as e:
-                logger.error(f"System heartbeat emission failed: {e}")
-                time.sleep(2)  # Reduced from 5 seconds to 2 seconds
-
-    def emit_system_metrics():
-        """Emit system metrics every 3 seconds to /ws/system."""
-        while True:
-            try:
-                if socketio:
-                    metrics_data = get_system_metrics()
-                    socketio.emit('metrics', metrics_data, namespace='/ws/system')
-
-                    # Also emit service status periodically
-                    service_status = get_service_status()
-                    socketio.emit('service_up', service_status, namespace='/ws/system')
-                time.sleep(3)
-            except Exception as e:
-                logger.error(f"System metrics emission failed: {e}")
-                time.sleep(3)  # Reduced from 5 seconds to 3 seconds
-
-    def emit_shopify_rate_limits():
-        """Emit Shopify rate limits every 10 seconds to /ws/shopify."""
-        while True:
-            try:
-                if socketio:
-                    rate_limit_data = get_shopify_rate_limit_status()
-                    socketio.emit('rate_limit', rate_limit_data, namespace='/ws/shopify')
-                time.sleep(10)
-            except Exception as e:
-                logger.error(f"Shopify rate limit emission failed: {e}")
-                time.sleep(10)
-
-    # Start background threads
-    threading.Thread(target=emit_system_heartbeat, daemon=True).start()
-    threading.Thread(target=emit_system_metrics, daemon=True).start()
-    threading.Thread(target=emit_shopify_rate_limits, daemon=True).start()
-    threading.Thread(target=emit_github_updates, daemon=True).start()
-    threading.Thread(target=emit_workspace_updates, daemon=True).start()
-    threading.Thread(target=emit_aria_updates, daemon=True).start()
-    threading.Thread(target=emit_empire_updates, daemon=True).start()
-
-    logger.info("Background data emission tasks started for all namespaces including ARIA and Empire")
+    """
+    Start the periodic emitters for all namespaces.
+
+    Every worker starts them, but each emission only runs while this worker
+    holds emitter leadership; with a message queue configured, the leader's
+    emits reach clients on all workers.
+    """
+    global emitter_elector
+    if emitter_elector is None:
+        emitter_elector = create_leader_elector('socketio-emitters')
+        emitter_elector.start()
+
+    for name, interval, emitter in PERIODIC_EMITTERS:
+        threading.Thread(
+            target=run_periodic_emitter,
+            args=(name, interval, emitter, emitter_elector),
+            name=f"emit-{name}",
+            daemon=True,
+        ).start()
+
+    if presence is not None:
+        # Runs in every worker: the leader needs to know about clients of followers
+        threading.Thread(target=refresh_presence, name="socketio-presence", daemon=True).start()
+
+    logger.info(
+        f"Background data emission tasks started for all namespaces including ARIA and Empire "
+        f"(leader: {emitter_elector.is_leader})"
+    )
+
+
+def run_periodic_emitter(
+    name: str,
+    interval: float,
+    emitter: Callable[[], None],
+    elector: LeaderElector,
+    stop: Optional[threading.Event] = None,
+):
+    """Run ``emitter`` every ``interval`` seconds while ``elector`` is leader."""
+    stop = stop or threading.Event()
+    while True:
+        try:
+            if socketio and elector.is_leader:
+                emitter()
+        except Exception as e:
+            logger.error(f"{name} emission failed: {e}")
+        if stop.wait(interval):
+            return
+
+
+def emit_system_heartbeat():
+    """Publish system heartbeat to /ws/system."""
+    delta_publisher.publish('/ws/system', lambda: {'heartbeat': get_heartbeat_data()})
+
+
+def emit_system_metrics():
+    """Publish system metrics and service status to /ws/system."""
+    delta_publisher.publish('/ws/system', lambda: {
+        'metrics': get_system_metrics(),
+        'service_up': get_service_status(),
+    })
+
+
+def emit_shopify_rate_limits():
+    """Publish Shopify rate limits to /ws/shopify."""
+    delta_publisher.publish('/ws/shopify', lambda: {'rate_limit': get_shopify_rate_limit_status()})
+
+
+def register_resync_handlers():
+    """Let clients of published namespaces opt in to deltas and request full snapshots."""
+
+    def make_subscribe_handler(namespace: str):
+        def handle_subscribe_deltas(data=None):
+            if not delta_publisher.deltas:
+                # Every change is broadcast in full; the client stays as it is
+                return None
+            leave_room(FULL_ROOM, namespace=namespace)
+            join_room(DELTA_ROOM, namespace=namespace)
+            # Deltas apply on top of these snapshots; the acknowledgement carries their seq
+            return delta_publisher.send_snapshots(namespace, to=request.sid)
+        return handle_subscribe_deltas
+
+    def make_resync_handler(namespace: str):
+        def handle_resync(data=None):
+            events = (data or {}).get('events') if isinstance(data, dict) else None
+            # The acknowledgement carries each snapshot's seq for delta checks
+            return delta_publisher.send_snapshots(namespace, to=request.sid, events=events)
+        return handle_resync
+
+    for namespace in DELTA_NAMESPACES:
+        socketio.on_event('subscribe_deltas', make_subscribe_handler(namespace), namespace=namespace)
+        socketio.on_event('resync', make_resync_handler(namespace), namespace=namespace)
 
 
 def get_heartbeat_data() -> Dict[str, Any]:
@@ -397,6 +611,9 @@ async def get_real_agent_status() -> Dict[str, Any]:
                 'success_rate': round(metrics['successful_executions'] / metrics['total_executions'] * 100, 2) if metrics['total_executions'] > 0 else 0,
                 'error_rate': round(metrics['error_rate_percent'], 2),
                 'avg_execution_time': round(metrics['avg_execution_time_seconds'], 2),
+                'p50_execution_time': round(metrics['p50_execution_time_seconds'], 2),
+                'p95_execution_time': round(metrics['p95_execution_time_seconds'], 2),
+                'p99_execution_time': round(metrics['p99_execution_time_seconds'], 2),
                 'throughput_per_hour': round(metrics['throughput_per_hour'], 2),
                 'health_score': metrics['health_score'],
                 'last_activity': metrics['last_execution_time'].isoformat() if metrics['last_execution_time'] else None
@@ -436,7 +653,7 @@ def get_current_status() -> Dict[str, Any]:
     """Get comprehensive current status using real data."""
     try:
         # Get real agent status
-        agent_status = asyncio.run(get_real_agent_status())
+        agent_status = run_async(get_real_agent_status())
         return {
             'timestamp': datetime.now(timezone.utc).isoformat(),
             'system': get_system_metrics(),
@@ -602,55 +819,39 @@ def broadcast_workspace_event(event_type: str, data: Dict[str, Any]):
 
 
 def emit_github_updates():
-    """Background task to emit GitHub updates periodically."""
-    while True:
-        try:
-            if socketio:
-                from app.services.github_service import github_service
-                if github_service.is_authenticated():
-                    # Get repository health
-                    health = github_service.get_repository_health()
-                    socketio.emit('github_health', health, namespace='/ws/github')
-
-                    # Get recent activity summary every 5 minutes
-                    recent_commits = github_service.get_recent_commits(3)
-                    workflow_runs = github_service.get_workflow_runs(3)
-
-                    activity_data = {
-                        'commits': recent_commits,
-                        'workflows': workflow_runs,
-                        'timestamp': datetime.now(timezone.utc).isoformat()
-                    }
-                    socketio.emit('github_activity', activity_data, namespace='/ws/github')
-
-            time.sleep(300)  # 5 minutes
-        except Exception as e:
-            logger.error(f"GitHub updates emission failed: {e}")
-            time.sleep(300)
+    """Emit GitHub repository health and recent activity to /ws/github."""
+    from app.services.github_service import github_service
+    if github_service.is_authenticated():
+        # Get repository health
+        health = github_service.get_repository_health()
+        socketio.emit('github_health', health, namespace='/ws/github')
+
+        # Get recent activity summary
+        recent_commits = github_service.get_recent_commits(3)
+        workflow_runs = github_service.get_workflow_runs(3)
+
+        activity_data = {
+            'commits': recent_commits,
+            'workflows': workflow_runs,
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+        socketio.emit('github_activity', activity_data, namespace='/ws/github')
 
 
 def emit_workspace_updates():
-    """Background task to emit workspace updates periodically."""
-    while True:
-        try:
-            if socketio:
-                from app.services.workspace_service import workspace_manager
+    """Emit the workspace overview and active workspace to /ws/workspace."""
+    from app.services.workspace_service import workspace_manager
 
-                # Get workspace overview
-                overview = workspace_manager.get_system_overview()
-                socketio.emit('workspace_overview', overview, namespace='/ws/workspace')
+    # Get workspace overview
+    overview = workspace_manager.get_system_overview()
+    socketio.emit('workspace_overview', overview, namespace='/ws/workspace')
 
-                # Get active workspace details
-                active_workspace = workspace_manager.get_active_workspace()
-                if active_workspace:
-                    status = active_workspace.get_status()
-                    status['is_active'] = True
-                    socketio.emit('active_workspace', status, namespace='/ws/workspace')
-
-            time.sleep(30)  # 30 seconds
-        except Exception as e:
-            logger.error(f"Workspace updates emission failed: {e}")
-            time.sleep(30)
+    # Get active workspace details
+    active_workspace = workspace_manager.get_active_workspace()
+    if active_workspace:
+        status = active_workspace.get_status()
+        status['is_active'] = True
+        socketio.emit('active_workspace', status, namespace='/ws/workspace')
 
 
 # =============================================================================
@@ -664,16 +865,19 @@ def register_aria_handlers():
     def handle_aria_connect():
         """Handle client connection to ARIA namespace."""
         logger.info("Client connected to ARIA namespace")
+        track_client('/ws/aria')
         emit('connected', {
             'message': 'Connected to ARIA - AI Empire Operator',
             'status': 'operational',
             'timestamp': datetime.now(timezone.utc).isoformat()
         })
+        delta_publisher.send_snapshots('/ws/aria', to=request.sid)
 
     @socketio.on('disconnect', namespace='/ws/aria')
     def handle_aria_disconnect():
         """Handle client disconnection from ARIA namespace."""
         logger.info("Client disconnected from ARIA namespace")
+        untrack_client('/ws/aria')
 
     @socketio.on('aria_query', namespace='/ws/aria')
     def handle_aria_query(data):
@@ -750,16 +954,19 @@ def register_empire_handlers():
     def handle_empire_connect():
         """Handle client connection to Empire namespace."""
         logger.info("Client connected to Empire operations namespace")
+        track_client('/ws/empire')
         emit('connected', {
             'message': 'Connected to Empire Operations Command Center',
             'status': 'ready_for_orders',
             'timestamp': datetime.now(timezone.utc).isoformat()
         })
+        delta_publisher.send_snapshots('/ws/empire', to=request.sid)
 
     @socketio.on('disconnect', namespace='/ws/empire')
     def handle_empire_disconnect():
         """Handle client disconnection from Empire namespace."""
         logger.info("Client disconnected from Empire operations namespace")
+        untrack_client('/ws/empire')
 
     @socketio.on('execute_command', namespace='/ws/empire')
     def handle_execute_command(data):
@@ -872,26 +1079,22 @@ def broadcast_empire_event(event_type: str, data: Dict[str, Any]):
 
 
 def emit_aria_updates():
-    """Background task to emit ARIA updates periodically."""
-    while True:
-        try:
-            if socketio:
-                from app.services.ai_assistant import control_center_assistant
-
-                # Emit ARIA status
-                stats = control_center_assistant.get_conversation_stats()
-                socketio.emit('aria_status', {
-                    'enabled': stats['enabled'],
-                    'model': stats['model'],
-                    'conversation_length': stats['conversation_length'],
-                    'status': 'operational' if stats['enabled'] else 'not_configured',
-                    'timestamp': datetime.now(timezone.utc).isoformat()
-                }, namespace='/ws/aria')
+    """Publish ARIA assistant status to /ws/aria."""
+    delta_publisher.publish('/ws/aria', lambda: {'aria_status': get_aria_status()})
 
-            time.sleep(60)  # 1 minute
-        except Exception as e:
-            logger.error(f"ARIA updates emission failed: {e}")
-            time.sleep(60)
+
+def get_aria_status() -> Dict[str, Any]:
+    """Get ARIA assistant status."""
+    from app.services.ai_assistant import control_center_assistant
+
+    stats = control_center_assistant.get_conversation_stats()
+    return {
+        'enabled': stats['enabled'],
+        'model': stats['model'],
+        'conversation_length': stats['conversation_length'],
+        'status': 'operational' if stats['enabled'] else 'not_configured',
+        'timestamp': datetime.now(timezone.utc).isoformat()
+    }
 
 
 async def get_real_empire_status() -> Dict[str, Any]:
@@ -1052,19 +1255,22 @@ async def get_real_empire_status() -> Dict[str, Any]:
         }
 
 def emit_empire_updates():
-    """Background task to emit real Empire operations updates periodically."""
-    while True:
-        try:
-            if socketio:
-                # Get real empire status using production services
-                empire_data = asyncio.run(get_real_empire_status())
-                socketio.emit('empire_metrics', empire_data, namespace='/ws/empire')
-                logger.debug(f"Emitted real empire metrics: {empire_data.get('system_status', {})}")
+    """Publish real Empire operations metrics to /ws/empire."""
+    # Get real empire status using production services
+    outcomes = delta_publisher.publish('/ws/empire', lambda: {'empire_metrics': run_async(get_real_empire_status())})
+    logger.debug(f"Published empire metrics: {outcomes}")
 
-            time.sleep(30)  # 30 seconds
-        except Exception as e:
-            logger.error(f"Empire updates emission failed: {e}")
-            time.sleep(30)
+
+# Periodic emitters run by the leader: (name, interval in seconds, emitter)
+PERIODIC_EMITTERS: List[Tuple[str, float, Callable[[], None]]] = [
+    ('system_heartbeat', 2, emit_system_heartbeat),
+    ('system_metrics', 3, emit_system_metrics),
+    ('shopify_rate_limits', 10, emit_shopify_rate_limits),
+    ('github_updates', 300, emit_github_updates),
+    ('workspace_updates', 30, emit_workspace_updates),
+    ('aria_updates', 60, emit_aria_updates),
+    ('empire_updates', 30, emit_empire_updates),
+]
 
 
 def register_marketing_handlers():
@@ -1075,7 +1281,7 @@ def register_marketing_handlers():
         logger.info("Marketing automation WebSocket client connected")
         # Send initial marketing status
         try:
-            initial_status = asyncio.run(get_marketing_status())
+            initial_status = run_async(get_marketing_status())
             socketio.emit('marketing_status', initial_status, namespace='/ws/marketing')
         except Exception as e:
             logger.error(f"Failed to send initial marketing status: {e}")
@@ -1096,7 +1302,7 @@ def register_marketing_handlers():
                 performance_data = await agent._analyze_marketing_performance()
                 return performance_data
 
-            metrics = asyncio.run(get_metrics())
+            metrics = run_async(get_metrics())
             socketio.emit('marketing_metrics_update', metrics, namespace='/ws/marketing')
 
         except Exception as e:
@@ -1120,7 +1326,7 @@ def register_marketing_handlers():
                     'timestamp': datetime.now(timezone.utc).isoformat()
                 }
 
-            status = asyncio.run(get_campaign_status())
+            status = run_async(get_campaign_status())
             socketio.emit('campaign_status_update', status, namespace='/ws/marketing')
 
         except Exception as e:
@@ -1139,7 +1345,7 @@ def register_marketing_handlers():
                 result = await agent.run()
                 return result
 
-            result = asyncio.run(execute_automation())
+            result = run_async(execute_automation())
             socketio.emit('marketing_automation_result', {
                 'status': 'success',
                 'result': result,
@@ -1394,7 +1600,7 @@ def register_analytics_handlers():
         })
 
         # Send initial analytics data
-        analytics_status = asyncio.run(get_analytics_status())
+        analytics_status = run_async(get_analytics_status())
         emit('analytics_status', analytics_status)
 
     @socketio.on('disconnect', namespace='/ws/analytics')
@@ -1610,13 +1816,8 @@ def register_inventory_handlers():
             inventory_agent = orchestrator.get_agent('production-inventory')
             if inventory_agent:
                 # Run async status check
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    status = loop.run_until_complete(inventory_agent.get_status())
-                    emit('status_update', status)
-                finally:
-                    loop.close()
+                status = run_async(inventory_agent.get_status())
+                emit('status_update', status)
         except Exception as e:
             logger.error(f"Failed to get initial inventory status: {e}")
 
@@ -1637,47 +1838,39 @@ def register_inventory_handlers():
                 return
 
             # Get dashboard data
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                tasks = [
-                    inventory_agent._fetch_current_inventory(),
-                    inventory_agent._analyze_reorder_requirements(),
-                    inventory_agent._generate_inventory_analytics(),
-                    inventory_agent._monitor_supplier_performance()
-                ]
+            tasks = [
+                inventory_agent._fetch_current_inventory(),
+                inventory_agent._analyze_reorder_requirements(),
+                inventory_agent._generate_inventory_analytics(),
+                inventory_agent._monitor_supplier_performance()
+            ]
 
-                inventory_data, reorder_analysis, analytics, supplier_performance = loop.run_until_complete(
-                    asyncio.gather(*tasks)
-                )
+            inventory_data, reorder_analysis, analytics, supplier_performance = gather_async(*tasks)
 
-                dashboard_data = {
-                    'inventory_overview': {
-                        'total_skus': len(inventory_data),
-                        'total_value': sum(item.get('current_stock', 0) * item.get('unit_cost', 0) for item in inventory_data),
-                        'items_needing_reorder': reorder_analysis.get('items_to_reorder', 0),
-                        'out_of_stock_items': len([item for item in inventory_data if item.get('current_stock', 0) <= 0]),
-                        'low_stock_items': len([item for item in inventory_data if 0 < item.get('current_stock', 0) <= item.get('reorder_point', 0)])
-                    },
-                    'performance_metrics': analytics.get('performance_kpis', {}),
-                    'reorder_summary': {
-                        'urgent_reorders': len(reorder_analysis.get('urgent_reorders', [])),
-                        'recommended_reorders': len(reorder_analysis.get('recommended_reorders', [])),
-                        'total_reorder_value': reorder_analysis.get('total_value', 0.0),
-                        'critical_stockouts': len(reorder_analysis.get('critical_stockouts', []))
-                    },
-                    'supplier_summary': {
-                        'active_suppliers': supplier_performance.get('suppliers_monitored', 0),
-                        'top_performers': len(supplier_performance.get('top_performers', [])),
-                        'underperformers': len(supplier_performance.get('underperformers', []))
-                    },
-                    'timestamp': datetime.now(timezone.utc).isoformat()
-                }
-
-                emit('dashboard_data', dashboard_data)
+            dashboard_data = {
+                'inventory_overview': {
+                    'total_skus': len(inventory_data),
+                    'total_value': sum(item.get('current_stock', 0) * item.get('unit_cost', 0) for item in inventory_data),
+                    'items_needing_reorder': reorder_analysis.get('items_to_reorder', 0),
+                    'out_of_stock_items': len([item for item in inventory_data if item.get('current_stock', 0) <= 0]),
+                    'low_stock_items': len([item for item in inventory_data if 0 < item.get('current_stock', 0) <= item.get('reorder_point', 0)])
+                },
+                'performance_metrics': analytics.get('performance_kpis', {}),
+                'reorder_summary': {
+                    'urgent_reorders': len(reorder_analysis.get('urgent_reorders', [])),
+                    'recommended_reorders': len(reorder_analysis.get('recommended_reorders', [])),
+                    'total_reorder_value': reorder_analysis.get('total_value', 0.0),
+                    'critical_stockouts': len(reorder_analysis.get('critical_stockouts', []))
+                },
+                'supplier_summary': {
+                    'active_suppliers': supplier_performance.get('suppliers_monitored', 0),
+                    'top_performers': len(supplier_performance.get('top_performers', [])),
+                    'underperformers': len(supplier_performance.get('underperformers', []))
+                },
+                'timestamp': datetime.now(timezone.utc).isoformat()
+            }
 
-            finally:
-                loop.close()
+            emit('dashboard_data', dashboard_data)
 
         except Exception as e:
             logger.error(f"Failed to get inventory dashboard data: {e}")
@@ -1695,13 +1888,8 @@ def register_inventory_handlers():
                 return
 
             # Analyze reorder requirements
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                reorder_analysis = loop.run_until_complete(inventory_agent._analyze_reorder_requirements())
-                emit('reorder_analysis', reorder_analysis)
-            finally:
-                loop.close()
+            reorder_analysis = run_async(inventory_agent._analyze_reorder_requirements())
+            emit('reorder_analysis', reorder_analysis)
 
         except Exception as e:
             logger.error(f"Failed to get reorder analysis: {e}")
@@ -1719,13 +1907,8 @@ def register_inventory_handlers():
                 return
 
             # Monitor supplier performance
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                performance_report = loop.run_until_complete(inventory_agent._monitor_supplier_performance())
-                emit('supplier_performance', performance_report)
-            finally:
-                loop.close()
+            performance_report = run_async(inventory_agent._monitor_supplier_performance())
+            emit('supplier_performance', performance_report)
 
         except Exception as e:
             logger.error(f"Failed to get supplier performance: {e}")
@@ -1743,23 +1926,17 @@ def register_inventory_handlers():
                 return
 
             # Execute procurement
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                procurement_results = loop.run_until_complete(inventory_agent._execute_automated_procurement())
-                emit('procurement_results', procurement_results)
-
-                # Also send updated dashboard data
-                dashboard_data = loop.run_until_complete(inventory_agent._fetch_current_inventory())
-                emit('inventory_updated', {
-                    'type': 'procurement_executed',
-                    'orders_created': procurement_results.get('orders_created', 0),
-                    'total_value': procurement_results.get('total_value', 0.0),
-                    'timestamp': datetime.now(timezone.utc).isoformat()
-                })
-
-            finally:
-                loop.close()
+            procurement_results = run_async(inventory_agent._execute_automated_procurement())
+            emit('procurement_results', procurement_results)
+
+            # Also send updated dashboard data
+            dashboard_data = run_async(inventory_agent._fetch_current_inventory())
+            emit('inventory_updated', {
+                'type': 'procurement_executed',
+                'orders_created': procurement_results.get('orders_created', 0),
+                'total_value': procurement_results.get('total_value', 0.0),
+                'timestamp': datetime.now(timezone.utc).isoformat()
+            })
 
         except Exception as e:
             logger.error(f"Failed to execute procurement: {e}")
@@ -1780,70 +1957,64 @@ def register_inventory_handlers():
                 return
 
             # Get item data and optimize
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                inventory_data = loop.run_until_complete(inventory_agent._fetch_current_inventory())
-
-                if sku:
-                    # Optimize specific SKU
-                    item = next((item for item in inventory_data if item.get('sku') == sku), None)
-                    if not item:
-                        emit('error', {'message': f'SKU {sku} not found'})
-                        return
+            inventory_data = run_async(inventory_agent._fetch_current_inventory())
+
+            if sku:
+                # Optimize specific SKU
+                item = next((item for item in inventory_data if item.get('sku') == sku), None)
+                if not item:
+                    emit('error', {'message': f'SKU {sku} not found'})
+                    return
+
+                if optimization_type == 'eoq':
+                    result = run_async(inventory_agent._optimize_eoq(item))
+                elif optimization_type == 'safety_stock':
+                    result = run_async(inventory_agent._optimize_safety_stock(item))
+                elif optimization_type == 'reorder_point':
+                    result = run_async(inventory_agent._optimize_reorder_point(item))
+                else:
+                    emit('error', {'message': f'Unknown optimization type: {optimization_type}'})
+                    return
+
+                if result:
+                    emit('optimization_result', {
+                        'sku': sku,
+                        'type': optimization_type,
+                        'result': result,
+                        'timestamp': datetime.now(timezone.utc).isoformat()
+                    })
+                else:
+                    emit('error', {'message': 'Optimization failed - insufficient data'})
 
+            else:
+                # Optimize all items
+                emit('optimization_progress', {'status': 'started', 'total_items': len(inventory_data)})
+
+                optimization_results = []
+                for i, item in enumerate(inventory_data[:10]):  # Limit to first 10 for performance
                     if optimization_type == 'eoq':
-                        result = loop.run_until_complete(inventory_agent._optimize_eoq(item))
+                        result = run_async(inventory_agent._optimize_eoq(item))
                     elif optimization_type == 'safety_stock':
-                        result = loop.run_until_complete(inventory_agent._optimize_safety_stock(item))
+                        result = run_async(inventory_agent._optimize_safety_stock(item))
                     elif optimization_type == 'reorder_point':
-                        result = loop.run_until_complete(inventory_agent._optimize_reorder_point(item))
-                    else:
-                        emit('error', {'message': f'Unknown optimization type: {optimization_type}'})
-                        return
+                        result = run_async(inventory_agent._optimize_reorder_point(item))
 
                     if result:
-                        emit('optimization_result', {
-                            'sku': sku,
-                            'type': optimization_type,
-                            'result': result,
-                            'timestamp': datetime.now(timezone.utc).isoformat()
-                        })
-                    else:
-                        emit('error', {'message': 'Optimization failed - insufficient data'})
-
-                else:
-                    # Optimize all items
-                    emit('optimization_progress', {'status': 'started', 'total_items': len(inventory_data)})
-
-                    optimization_results = []
-                    for i, item in enumerate(inventory_data[:10]):  # Limit to first 10 for performance
-                        if optimization_type == 'eoq':
-                            result = loop.run_until_complete(inventory_agent._optimize_eoq(item))
-                        elif optimization_type == 'safety_stock':
-                            result = loop.run_until_complete(inventory_agent._optimize_safety_stock(item))
-                        elif optimization_type == 'reorder_point':
-                            result = loop.run_until_complete(inventory_agent._optimize_reorder_point(item))
-
-                        if result:
-                            optimization_results.append(result)
-
-                        # Send progress update
-                        emit('optimization_progress', {
-                            'status': 'processing',
-                            'completed': i + 1,
-                            'total_items': min(len(inventory_data), 10)
-                        })
+                        optimization_results.append(result)
 
-                    emit('optimization_complete', {
-                        'type': optimization_type,
-                        'results': optimization_results,
-                        'total_optimized': len(optimization_results),
-                        'timestamp': datetime.now(timezone.utc).isoformat()
+                    # Send progress update
+                    emit('optimization_progress', {
+                        'status': 'processing',
+                        'completed': i + 1,
+                        'total_items': min(len(inventory_data), 10)
                     })
 
-            finally:
-                loop.close()
+                emit('optimization_complete', {
+                    'type': optimization_type,
+                    'results': optimization_results,
+                    'total_optimized': len(optimization_results),
+                    'timestamp': datetime.now(timezone.utc).isoformat()
+                })
 
         except Exception as e:
             logger.error(f"Failed to optimize inventory: {e}")
@@ -1880,34 +2051,26 @@ def register_security_handlers():
                 return
 
             # Get security agent health status
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            try:
-                health_status = loop.run_until_complete(security_agent.health_check())
-
-                # Get recent alerts summary
-                fraud_alerts_count = len([alert for alert in security_agent.fraud_alerts[-24:]])
-                security_events_count = len([event for event in security_agent.security_events[-24:]])
-
-                security_metrics = {
-                    'agent_status': health_status.get('status', 'unknown'),
-                    'fraud_alerts_24h': fraud_alerts_count,
-                    'security_events_24h': security_events_count,
-                    'risk_threshold': security_agent.risk_threshold,
-                    'last_scan': health_status.get('last_run'),
-                    'systems_operational': health_status.get('systems_status') == 'operational'
-                }
-
-                emit('security_status_update', {
-                    'type': 'status_update',
-                    'security_metrics': security_metrics,
-                    'timestamp': datetime.now(timezone.utc).isoformat()
-                })
+            health_status = run_async(security_agent.health_check())
+
+            # Get recent alerts summary
+            fraud_alerts_count = len([alert for alert in security_agent.fraud_alerts[-24:]])
+            security_events_count = len([event for event in security_agent.security_events[-24:]])
+
+            security_metrics = {
+                'agent_status': health_status.get('status', 'unknown'),
+                'fraud_alerts_24h': fraud_alerts_count,
+                'security_events_24h': security_events_count,
+                'risk_threshold': security_agent.risk_threshold,
+                'last_scan': health_status.get('last_run'),
+                'systems_operational': health_status.get('systems_status') == 'operational'
+            }
 
-            finally:
-                loop.close()
+            emit('security_status_update', {
+                'type': 'status_update',
+                'security_metrics': security_metrics,
+                'timestamp': datetime.now(timezone.utc).isoformat()
+            })
 
         except Exception as e:
             logger.error(f"Failed to get security status: {e}")
@@ -1934,59 +2097,51 @@ def register_security_handlers():
             })
 
             # Run fraud detection
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            try:
-                suspicious_transactions = loop.run_until_complete(
-                    security_agent._detect_fraudulent_transactions()
-                )
+            suspicious_transactions = run_async(
+                security_agent._detect_fraudulent_transactions()
+            )
+
+            # Process high-risk transactions
+            high_risk_count = 0
+            alerts_generated = []
+
+            for transaction in suspicious_transactions:
+                if transaction.get('risk_score', 0) >= security_agent.risk_threshold:
+                    high_risk_count += 1
+                    alert_result = run_async(
+                        security_agent._handle_fraud_alert(transaction)
+                    )
+                    alerts_generated.append({
+                        'transaction_id': transaction.get('id'),
+                        'risk_score': transaction.get('risk_score'),
+                        'action_taken': alert_result.get('action', 'reviewed')
+                    })
 
-                # Process high-risk transactions
-                high_risk_count = 0
-                alerts_generated = []
-
-                for transaction in suspicious_transactions:
-                    if transaction.get('risk_score', 0) >= security_agent.risk_threshold:
-                        high_risk_count += 1
-                        alert_result = loop.run_until_complete(
-                            security_agent._handle_fraud_alert(transaction)
-                        )
-                        alerts_generated.append({
-                            'transaction_id': transaction.get('id'),
-                            'risk_score': transaction.get('risk_score'),
-                            'action_taken': alert_result.get('action', 'reviewed')
-                        })
+            # Send scan results
+            scan_results = {
+                'status': 'completed',
+                'transactions_analyzed': len(suspicious_transactions),
+                'high_risk_detected': high_risk_count,
+                'alerts_generated': len(alerts_generated),
+                'scan_duration': '2.3s',
+                'alerts_details': alerts_generated[-5:]
+            }
 
-                # Send scan results
-                scan_results = {
-                    'status': 'completed',
-                    'transactions_analyzed': len(suspicious_transactions),
-                    'high_risk_detected': high_risk_count,
-                    'alerts_generated': len(alerts_generated),
-                    'scan_duration': '2.3s',
-                    'alerts_details': alerts_generated[-5:]
-                }
+            emit('fraud_scan_completed', {
+                'results': scan_results,
+                'timestamp': datetime.now(timezone.utc).isoformat()
+            })
 
-                emit('fraud_scan_completed', {
-                    'results': scan_results,
+            # If high-risk transactions found, send alert
+            if high_risk_count > 0:
+                emit('security_alert', {
+                    'type': 'fraud_detection',
+                    'severity': 'high' if high_risk_count > 3 else 'medium',
+                    'message': f'{high_risk_count} high-risk transactions detected',
+                    'details': scan_results,
                     'timestamp': datetime.now(timezone.utc).isoformat()
                 })
 
-                # If high-risk transactions found, send alert
-                if high_risk_count > 0:
-                    emit('security_alert', {
-                        'type': 'fraud_detection',
-                        'severity': 'high' if high_risk_count > 3 else 'medium',
-                        'message': f'{high_risk_count} high-risk transactions detected',
-                        'details': scan_results,
-                        'timestamp': datetime.now(timezone.utc).isoformat()
-                    })
-
-            finally:
-                loop.close()
-
         except Exception as e:
             logger.error(f"Failed to run fraud scan: {e}")
             emit('fraud_scan_error', {
@@ -3,6 +3,10 @@ Multi-layer secret resolution system for Royal Equips Orchestrator.
 
 Provides encrypted caching and fallback resolution across multiple secret sources:
 ENV → GitHub Actions → Cloudflare → External Vault → Cache
+
+Cached secrets are refreshed ahead of expiry in the background, concurrent
+lookups of the same key share one provider walk, and an expired secret is
+still served for a while if every provider that could have it is failing.
 """
 
 from __future__ import annotations
@@ -17,7 +21,7 @@ import time
 import warnings
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Protocol
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Tuple
 
 try:
     from cryptography.hazmat.primitives.ciphers.aead import AESGCM
@@ -170,6 +174,14 @@ class UnifiedSecretResolver:
     Unified secret resolver with multi-layer fallback and encrypted caching.
     
     Resolution order: ENV → GitHub Actions → Cloudflare → External Vault → Cache
+
+    - Concurrent lookups of a key that is not cached share one resolution.
+    - A lookup in the last ``1 - refresh_ahead`` of a secret's TTL returns
+      the cached value and refreshes it in the background.
+    - When an expired secret cannot be resolved because providers are
+      failing, the cached value is served for up to ``max_stale`` seconds.
+    - With ``hot_cache`` enabled, decrypted values are kept in process
+      memory, so cache hits skip AES-GCM decryption.
     """
 
     def __init__(
@@ -177,8 +189,24 @@ class UnifiedSecretResolver:
         providers: Optional[List[SecretProvider]] = None,
         cache_ttl: int = 300,  # 5 minutes default
         encryption_key: Optional[bytes] = None,
-        metrics: Optional[SecretMetrics] = None
+        metrics: Optional[SecretMetrics] = None,
+        refresh_ahead: float = 0.8,
+        max_stale: float = 3600,
+        hot_cache: Optional[bool] = None
     ):
+        """
+        Args:
+            providers: Providers in resolution order
+            cache_ttl: Default cache TTL in seconds
+            encryption_key: 32-byte AES key for the cache
+            metrics: Resolution metrics callbacks
+            refresh_ahead: Fraction of the TTL after which a cache hit also
+                triggers a background refresh
+            max_stale: Seconds past expiry an entry may be served while
+                providers are failing
+            hot_cache: Keep decrypted values in memory; defaults to the
+                SECRET_HOT_CACHE environment variable (off)
+        """
         self.providers = providers or [
             EnvProvider(),
             GitHubActionsProvider(),
@@ -189,6 +217,13 @@ class UnifiedSecretResolver:
         self.metrics = metrics
         self.cache: Dict[str, Dict] = {}
         self.key = encryption_key or self._derive_key()
+        self.refresh_ahead = refresh_ahead
+        self.max_stale = max_stale
+        if hot_cache is None:
+            hot_cache = os.getenv("SECRET_HOT_CACHE", "false").lower() in ("1", "true", "yes")
+        self.hot_cache = hot_cache
+        self._hot: Dict[str, str] = {}
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = {}
 
     def _derive_key(self) -> bytes:
         """Derive encryption key from environment or use default."""
@@ -243,6 +278,48 @@ class UnifiedSecretResolver:
             return False
         return (time.time() - entry["ts"]) > ttl
 
+    def _due_for_refresh(self, entry: Dict) -> bool:
+        """Check if cache entry is close enough to expiry to refresh it."""
+        ttl = entry.get("ttl")
+        if ttl is None:
+            return False
+        return (time.time() - entry["ts"]) > ttl * self.refresh_ahead
+
+    def _servable_stale(self, entry: Optional[Dict]) -> bool:
+        """Check if an expired entry may still be served on provider errors."""
+        if not entry or "data" not in entry:
+            return False
+        ttl = entry.get("ttl") or 0
+        return (time.time() - entry["ts"]) <= ttl + self.max_stale
+
+    def _cached_value(self, key: str, entry: Dict) -> str:
+        """Value of a cache entry, from the hot cache when enabled."""
+        if self.hot_cache:
+            value = self._hot.get(key)
+            if value is not None:
+                return value
+        value = self._decrypt(entry["data"])
+        if self.hot_cache:
+            self._hot[key] = value
+        return value
+
+    def _store(self, key: str, value: str, source: SecretSource, ttl: Optional[int]) -> None:
+        """Cache a resolved secret, encrypted."""
+        self.cache[key] = {
+            "data": self._encrypt(value),
+            "ttl": ttl,
+            "source": source.value,
+            "ts": time.time()
+        }
+        if self.hot_cache:
+            self._hot[key] = value
+        else:
+            self._hot.pop(key, None)
+
+    def _evict(self, key: str) -> None:
+        self.cache.pop(key, None)
+        self._hot.pop(key, None)
+
     def _create_key_hash(self, key: str) -> str:
         """Create hash of key for logging (never log actual key)."""
         return hashlib.sha256(key.encode()).hexdigest()[:8]
@@ -266,7 +343,9 @@ class UnifiedSecretResolver:
         # Check cache first
         if cached and not self._expired(cached):
             start = time.time()
-            value = self._decrypt(cached["data"])
+            if self._due_for_refresh(cached):
+                self._refresh_in_background(key, ttl)
+            value = self._cached_value(key, cached)
             latency_ms = (time.time() - start) * 1000
 
             key_hash = self._create_key_hash(key)
@@ -284,31 +363,88 @@ class UnifiedSecretResolver:
                 ttl=cached["ttl"]
             )
 
-        # Remove expired entry
-        if cached:
-            del self.cache[key]
-
         key_hash = self._create_key_hash(key)
         if self.metrics and self.metrics.on_cache_miss:
             self.metrics.on_cache_miss(key_hash)
 
+        # Concurrent misses for the same key wait on one resolution
+        task = self._resolution(key, ttl)
+        return await asyncio.shield(task)
+
+    def get_cached(self, key: str) -> Optional[str]:
+        """
+        Get an unexpired cached secret without consulting providers.
+
+        For synchronous callers on hot paths; returns None when the secret
+        is not cached, so callers can fall back to ``get_secret``.
+        """
+        cached = self.cache.get(key)
+        if not cached or self._expired(cached):
+            return None
+        return self._cached_value(key, cached)
+
+    async def prefetch(self, keys: Iterable[str], ttl: Optional[int] = None) -> Dict[str, str]:
+        """
+        Resolve several secrets concurrently and warm the cache.
+
+        Args:
+            keys: Secret keys to resolve
+            ttl: Cache TTL override in seconds
+
+        Returns:
+            Values of the secrets that were found, by key
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        results = await asyncio.gather(
+            *(self.get_secret(key, ttl) for key in unique_keys),
+            return_exceptions=True
+        )
+
+        values = {}
+        for key, result in zip(unique_keys, results):
+            if isinstance(result, SecretResult):
+                values[key] = result.value
+            elif not isinstance(result, SecretNotFoundError):
+                print(json.dumps({
+                    "level": "warn",
+                    "event": "secret_prefetch_error",
+                    "key_hash": self._create_key_hash(key),
+                    "error": str(result)
+                }))
+        return values
+
+    def _resolution(self, key: str, ttl: Optional[int]) -> asyncio.Task:
+        """The in-flight resolution of ``key`` on this loop, started if needed."""
+        loop = asyncio.get_running_loop()
+        flight = (loop, key)
+        task = self._inflight.get(flight)
+        if task is None:
+            task = loop.create_task(self._resolve(key, ttl))
+            self._inflight[flight] = task
+            task.add_done_callback(lambda _: self._inflight.pop(flight, None))
+        return task
+
+    def _refresh_in_background(self, key: str, ttl: Optional[int]) -> None:
+        """Start a refresh of ``key`` unless one is already running."""
+        try:
+            task = self._resolution(key, ttl)
+        except RuntimeError:
+            return  # No running event loop
+        # Failures are handled (stale serving, eviction) inside _resolve
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def _resolve(self, key: str, ttl: Optional[int]) -> SecretResult:
+        """Walk the providers for ``key`` and cache the result."""
+        key_hash = self._create_key_hash(key)
         start = time.time()
+        provider_failed = False
 
         # Try each provider in order
         for depth, provider in enumerate(self.providers, start=1):
             try:
                 res = await provider.get(key)
                 if res:
-                    effective_ttl = ttl or self.cache_ttl
-                    enc = self._encrypt(res.value)
-
-                    # Cache encrypted result
-                    self.cache[key] = {
-                        "data": enc,
-                        "ttl": effective_ttl,
-                        "source": res.source.value,
-                        "ts": time.time()
-                    }
+                    self._store(key, res.value, res.source, ttl or self.cache_ttl)
 
                     latency_ms = (time.time() - start) * 1000
                     if self.metrics and self.metrics.on_resolve:
@@ -317,6 +453,7 @@ class UnifiedSecretResolver:
                     return res
             except Exception as e:
                 # Log error but continue to next provider
+                provider_failed = True
                 print(json.dumps({
                     "level": "warn",
                     "event": "secret_provider_error",
@@ -326,7 +463,25 @@ class UnifiedSecretResolver:
                 }))
                 continue
 
+        cached = self.cache.get(key)
+        if provider_failed and self._servable_stale(cached):
+            # A failing provider may hold the secret; keep serving what we had
+            print(json.dumps({
+                "level": "warn",
+                "event": "secret_serving_stale",
+                "key_hash": key_hash,
+                "age": time.time() - cached["ts"]
+            }))
+            return SecretResult(
+                key=key,
+                value=self._cached_value(key, cached),
+                source=SecretSource.CACHE,
+                fetched_at=cached["ts"],
+                ttl=cached["ttl"]
+            )
+
         # Not found in any provider
+        self._evict(key)
         if self.metrics and self.metrics.on_miss:
             self.metrics.on_miss(key_hash)
         raise SecretNotFoundError(key)
@@ -344,6 +499,7 @@ class UnifiedSecretResolver:
     def clear_cache(self) -> None:
         """Clear all cached secrets."""
         self.cache.clear()
+        self._hot.clear()
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics for monitoring."""
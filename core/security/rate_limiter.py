@@ -1,46 +1,339 @@
 """
 Rate Limiter for API endpoints.
 
-Provides simple in-memory rate limiting for Flask routes.
-For production, use Redis-backed rate limiting.
+Limits are enforced with sliding-window counters: each client keeps the
+request count of the current and the previous fixed window, and the previous
+count is weighted by how much of it still overlaps the sliding window. That is
+O(1) time and memory per client regardless of the limit, unlike storing every
+request timestamp.
+
+Two backends are available:
+
+- ``MemoryRateLimitBackend``: per-process, thread safe, evicts idle clients
+- ``RedisRateLimitBackend``: shared across gunicorn workers and hosts
+
+The backend is chosen with ``RATE_LIMIT_BACKEND`` (``memory`` or ``redis``);
+the Redis URL comes from ``RATE_LIMIT_REDIS_URL`` or ``REDIS_URL``.
 """
 
 import logging
+import math
+import os
+import threading
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from functools import wraps
-from typing import Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from flask import jsonify, request
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LIMIT = (100, 3600)
+
+
+@dataclass
+class RateLimitResult:
+    """Outcome of a rate limit check."""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # seconds until a request would be allowed (0 if allowed)
+    reset_after: float  # seconds until the current fixed window rolls over
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'allowed': self.allowed,
+            'limit': self.limit,
+            'remaining': self.remaining,
+            'retry_after': self.retry_after,
+            'reset_after': self.reset_after,
+        }
+
+
+def sliding_window_result(previous: float, current: float, limit: int, window: int,
+                          elapsed: float, counted: bool) -> RateLimitResult:
+    """Evaluate a sliding-window counter.
+
+    Args:
+        previous: Requests counted in the previous fixed window
+        current: Requests counted in the current fixed window, including this
+            request when ``counted`` is true
+        limit: Maximum requests per sliding window
+        window: Window length in seconds
+        elapsed: Seconds since the current fixed window started
+        counted: Whether ``current`` already includes the request being checked
+
+    Returns:
+        RateLimitResult for the request
+    """
+    weight = max(0.0, 1.0 - elapsed / window)
+    estimated = previous * weight + current
+    allowed = estimated <= limit if counted else estimated + 1 <= limit
+    used = current if counted else current + 1
+    remaining = max(0, math.floor(limit - estimated - (0 if counted else 1)))
+
+    retry_after = 0.0
+    if not allowed:
+        if used > limit or previous <= 0:
+            # Nothing left to decay in this window: wait for the next one
+            retry_after = window - elapsed
+        else:
+            # Time until the previous window's share has decayed enough
+            retry_after = window * (1.0 - (limit - used) / previous) - elapsed
+        retry_after = max(retry_after, 0.001)
+
+    return RateLimitResult(
+        allowed=allowed,
+        limit=limit,
+        remaining=remaining,
+        retry_after=retry_after,
+        reset_after=window - elapsed,
+    )
+
+
+class RateLimitBackend:
+    """Storage for sliding-window counters."""
+
+    def hit(self, key: str, limit: int, window: int) -> RateLimitResult:
+        """Count a request for ``key`` and report whether it is allowed."""
+        raise NotImplementedError
+
+    def peek(self, key: str, limit: int, window: int) -> RateLimitResult:
+        """Report whether a request would be allowed, without counting it."""
+        raise NotImplementedError
+
+    def reset(self, prefix: str = '') -> None:
+        """Forget counters for ``prefix`` and keys below it (``prefix:...``).
+
+        An empty prefix forgets every counter.
+        """
+        raise NotImplementedError
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """In-process counters with idle-client eviction.
+
+    Counters are grouped by window length in insertion-ordered dicts that are
+    kept in last-seen order, so clients idle for two windows (whose counts can
+    no longer affect a decision) are popped from the front in amortized O(1).
+    ``max_keys`` additionally caps memory under scanning traffic by evicting
+    the least recently seen clients.
+    """
+
+    def __init__(self, max_keys: Optional[int] = None, clock: Callable[[], float] = time.time):
+        """Initialize the backend.
+
+        Args:
+            max_keys: Maximum tracked clients (env ``RATE_LIMIT_MAX_CLIENTS``, default 100000)
+            clock: Time source in seconds
+        """
+        self.max_keys = max_keys or int(os.getenv('RATE_LIMIT_MAX_CLIENTS', '100000'))
+        self.clock = clock
+        # window -> key -> [window_index, previous, current, last_seen]
+        self._counters: Dict[int, 'OrderedDict[str, List[float]]'] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def hit(self, key: str, limit: int, window: int) -> RateLimitResult:
+        return self._check(key, limit, window, count=True)
+
+    def peek(self, key: str, limit: int, window: int) -> RateLimitResult:
+        return self._check(key, limit, window, count=False)
+
+    def _check(self, key: str, limit: int, window: int, count: bool) -> RateLimitResult:
+        now = self.clock()
+        index, elapsed = divmod(now, window)
+
+        with self._lock:
+            counters = self._counters.setdefault(window, OrderedDict())
+            self._evict_idle(counters, window, now)
+
+            entry = counters.get(key)
+            if entry is None:
+                entry = [index, 0.0, 0.0, now]
+                if count:
+                    counters[key] = entry
+                    self._size += 1
+                    self._evict_overflow()
+            elif entry[0] != index:
+                # Roll the window forward; anything older than one window is gone
+                entry[1] = entry[2] if index - entry[0] == 1 else 0.0
+                entry[2] = 0.0
+                entry[0] = index
+
+            if not count:
+                return sliding_window_result(entry[1], entry[2], limit, window, elapsed, counted=False)
+
+            entry[2] += 1
+            entry[3] = now
+            counters.move_to_end(key)
+
+            result = sliding_window_result(entry[1], entry[2], limit, window, elapsed, counted=True)
+            if not result.allowed:
+                # Rejected requests do not consume quota
+                entry[2] -= 1
+            return result
+
+    def _evict_idle(self, counters: 'OrderedDict[str, List[float]]', window: int, now: float) -> None:
+        cutoff = now - 2 * window
+        while counters:
+            key, entry = next(iter(counters.items()))
+            if entry[3] > cutoff:
+                break
+            counters.popitem(last=False)
+            self._size -= 1
+            self.evictions += 1
+
+    def _evict_overflow(self) -> None:
+        while self._size > self.max_keys:
+            # Evict from the group whose least recently seen client is oldest
+            oldest = min(
+                (c for c in self._counters.values() if c),
+                key=lambda c: next(iter(c.values()))[3],
+            )
+            oldest.popitem(last=False)
+            self._size -= 1
+            self.evictions += 1
+
+    def reset(self, prefix: str = '') -> None:
+        with self._lock:
+            for counters in self._counters.values():
+                if not prefix:
+                    self._size -= len(counters)
+                    counters.clear()
+                    continue
+                scoped = f"{prefix}:"
+                for key in [k for k in counters if k == prefix or k.startswith(scoped)]:
+                    del counters[key]
+                    self._size -= 1
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Counters shared through Redis.
+
+    Each request costs one pipelined round trip: ``INCR`` + ``EXPIRE`` on the
+    current window's key and ``GET`` on the previous one. ``INCR`` hands every
+    concurrent request a distinct count, so no more than ``limit`` requests
+    are admitted across workers. A rejected request is given back with
+    ``DECR`` so it does not consume quota.
+    """
+
+    def __init__(self, client: Any, key_prefix: str = 'ratelimit:', clock: Callable[[], float] = time.time):
+        """Initialize the backend.
+
+        Args:
+            client: ``redis.Redis`` compatible client
+            key_prefix: Namespace for counter keys
+            clock: Time source in seconds
+        """
+        self.client = client
+        self.key_prefix = key_prefix
+        self.clock = clock
+
+    def _keys(self, key: str, window: int) -> Tuple[str, str, float]:
+        index, elapsed = divmod(self.clock(), window)
+        base = f"{self.key_prefix}{key}:{window}:"
+        return f"{base}{int(index)}", f"{base}{int(index) - 1}", elapsed
+
+    def hit(self, key: str, limit: int, window: int) -> RateLimitResult:
+        current_key, previous_key, elapsed = self._keys(key, window)
+
+        pipe = self.client.pipeline()
+        pipe.incr(current_key)
+        pipe.expire(current_key, 2 * window)
+        pipe.get(previous_key)
+        current, _, previous = pipe.execute()
+
+        result = sliding_window_result(float(previous or 0), float(current), limit, window, elapsed, counted=True)
+        if not result.allowed:
+            self.client.decr(current_key)
+        return result
+
+    def peek(self, key: str, limit: int, window: int) -> RateLimitResult:
+        current_key, previous_key, elapsed = self._keys(key, window)
+        current, previous = self.client.mget(current_key, previous_key)
+        return sliding_window_result(float(previous or 0), float(current or 0), limit, window, elapsed, counted=False)
+
+    def reset(self, prefix: str = '') -> None:
+        pattern = f"{self.key_prefix}{prefix}:*" if prefix else f"{self.key_prefix}*"
+        keys = list(self.client.scan_iter(match=pattern))
+        if keys:
+            self.client.delete(*keys)
+
+
+def create_rate_limit_backend(backend: Optional[str] = None) -> RateLimitBackend:
+    """Create the backend selected by ``RATE_LIMIT_BACKEND``.
+
+    Falls back to the in-memory backend if Redis is not reachable.
+    """
+    backend = (backend or os.getenv('RATE_LIMIT_BACKEND', 'memory')).lower()
+    if backend != 'redis':
+        return MemoryRateLimitBackend()
+
+    redis_url = os.getenv('RATE_LIMIT_REDIS_URL') or os.getenv('REDIS_URL')
+    if not redis_url:
+        logger.warning("RATE_LIMIT_BACKEND=redis but no Redis URL is set; using in-memory rate limits")
+        return MemoryRateLimitBackend()
+
+    try:
+        import redis
+
+        client = redis.from_url(redis_url, socket_timeout=1.0)
+        client.ping()
+        return RedisRateLimitBackend(client)
+    except Exception as e:
+        logger.warning(f"Redis rate limit backend unavailable, using in-memory rate limits: {e}")
+        return MemoryRateLimitBackend()
+
 
 class RateLimiter:
-    """Simple in-memory rate limiter for API endpoints."""
+    """Sliding-window rate limiter for API endpoints."""
 
-    def __init__(self, default_limits: Optional[Dict[str, Tuple[int, int]]] = None):
+    def __init__(self, default_limits: Optional[Dict[str, Tuple[int, int]]] = None,
+                 backend: Optional[RateLimitBackend] = None):
         """Initialize rate limiter.
-        
+
         Args:
             default_limits: Dict mapping endpoint names to (max_requests, window_seconds) tuples
+            backend: Counter storage (defaults to ``create_rate_limit_backend()``)
         """
         self.default_limits = default_limits or {}
-        self._requests: Dict[str, Dict[str, list]] = {}
+        self.backend = backend or create_rate_limit_backend()
+
+    def _limits_for(self, endpoint_name: str, max_requests: Optional[int] = None,
+                    window_seconds: Optional[int] = None) -> Tuple[int, int]:
+        default = self.default_limits.get(endpoint_name, DEFAULT_LIMIT)
+        return max_requests or default[0], int(window_seconds or default[1])
+
+    def hit(self, endpoint_name: str, client_id: str, max_requests: Optional[int] = None,
+            window_seconds: Optional[int] = None) -> RateLimitResult:
+        """Count a request and report whether it is allowed.
+
+        Backend failures are logged and the request is allowed (fail open).
+        """
+        max_requests, window_seconds = self._limits_for(endpoint_name, max_requests, window_seconds)
+        try:
+            return self.backend.hit(f"{endpoint_name}:{client_id}", max_requests, window_seconds)
+        except Exception as e:
+            logger.error(f"Rate limit backend error on {endpoint_name}: {e}")
+            return RateLimitResult(True, max_requests, max_requests, 0.0, float(window_seconds))
 
     def limit(self, endpoint_name: str, max_requests: Optional[int] = None,
               window_seconds: Optional[int] = None):
         """Decorator to rate limit an endpoint.
-        
+
         Args:
             endpoint_name: Name of the endpoint
             max_requests: Maximum requests allowed in window (overrides default)
             window_seconds: Time window in seconds (overrides default)
         """
-        # Get limits from defaults or parameters
-        if max_requests is None or window_seconds is None:
-            default = self.default_limits.get(endpoint_name, (100, 3600))
-            max_requests = max_requests or default[0]
-            window_seconds = window_seconds or default[1]
+        max_requests, window_seconds = self._limits_for(endpoint_name, max_requests, window_seconds)
 
         def decorator(f):
             @wraps(f)
@@ -48,36 +341,17 @@ class RateLimiter:
                 # Get client identifier (IP address)
                 client_id = request.remote_addr or 'unknown'
 
-                # Get current time
-                current_time = time.time()
-
-                # Initialize endpoint tracking
-                if endpoint_name not in self._requests:
-                    self._requests[endpoint_name] = {}
-
-                # Initialize client tracking
-                if client_id not in self._requests[endpoint_name]:
-                    self._requests[endpoint_name][client_id] = []
-
-                # Get client's request history
-                request_times = self._requests[endpoint_name][client_id]
-
-                # Remove old requests outside the window
-                cutoff_time = current_time - window_seconds
-                request_times = [t for t in request_times if t > cutoff_time]
-                self._requests[endpoint_name][client_id] = request_times
-
-                # Check if rate limit exceeded
-                if len(request_times) >= max_requests:
+                result = self.hit(endpoint_name, client_id, max_requests, window_seconds)
+                if not result.allowed:
                     logger.warning(f"Rate limit exceeded for {client_id} on {endpoint_name}")
-                    return jsonify({
+                    retry_after = math.ceil(result.retry_after)
+                    response = jsonify({
                         'error': 'Rate limit exceeded',
                         'message': f'Maximum {max_requests} requests per {window_seconds} seconds',
-                        'retry_after': int(request_times[0] + window_seconds - current_time)
-                    }), 429
-
-                # Add current request
-                request_times.append(current_time)
+                        'retry_after': retry_after
+                    })
+                    response.headers['Retry-After'] = str(retry_after)
+                    return response, 429
 
                 # Call the actual endpoint
                 return f(*args, **kwargs)
@@ -86,58 +360,39 @@ class RateLimiter:
         return decorator
 
     def check_limit(self, endpoint_name: str, client_id: str) -> Dict[str, any]:
-        """Check rate limit status for a client.
-        
+        """Check rate limit status for a client without counting a request.
+
         Args:
             endpoint_name: Name of the endpoint
             client_id: Client identifier
-            
+
         Returns:
             Dict with limit info
         """
-        if endpoint_name not in self._requests:
-            return {'allowed': True, 'remaining': 'unlimited'}
-
-        if client_id not in self._requests[endpoint_name]:
-            return {'allowed': True, 'remaining': 'unlimited'}
-
-        # Get limits
-        default = self.default_limits.get(endpoint_name, (100, 3600))
-        max_requests, window_seconds = default
-
-        # Get current time and request history
-        current_time = time.time()
-        request_times = self._requests[endpoint_name][client_id]
-
-        # Remove old requests
-        cutoff_time = current_time - window_seconds
-        request_times = [t for t in request_times if t > cutoff_time]
-
-        remaining = max_requests - len(request_times)
+        max_requests, window_seconds = self._limits_for(endpoint_name)
+        result = self.backend.peek(f"{endpoint_name}:{client_id}", max_requests, window_seconds)
 
         return {
-            'allowed': remaining > 0,
-            'remaining': remaining,
+            'allowed': result.allowed,
+            'remaining': result.remaining,
             'limit': max_requests,
             'window_seconds': window_seconds,
-            'reset_at': request_times[0] + window_seconds if request_times else None
+            'reset_at': time.time() + result.reset_after
         }
 
     def reset(self, endpoint_name: Optional[str] = None, client_id: Optional[str] = None):
         """Reset rate limit counters.
-        
+
         Args:
             endpoint_name: Specific endpoint to reset (None = all)
             client_id: Specific client to reset (None = all)
         """
         if endpoint_name is None:
-            self._requests.clear()
+            self.backend.reset()
             logger.info("All rate limits reset")
         elif client_id is None:
-            if endpoint_name in self._requests:
-                self._requests[endpoint_name].clear()
-                logger.info(f"Rate limits reset for endpoint: {endpoint_name}")
+            self.backend.reset(endpoint_name)
+            logger.info(f"Rate limits reset for endpoint: {endpoint_name}")
         else:
-            if endpoint_name in self._requests and client_id in self._requests[endpoint_name]:
-                del self._requests[endpoint_name][client_id]
-                logger.info(f"Rate limit reset for {client_id} on {endpoint_name}")
+            self.backend.reset(f"{endpoint_name}:{client_id}")
+            logger.info(f"Rate limit reset for {client_id} on {endpoint_name}")
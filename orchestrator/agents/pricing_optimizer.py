@@ -157,24 +157,31 @@ class PricingOptimizerAgent(AgentBase):
                 # Update price history with sentiment context
                 self._update_price_history(competitor_prices, market_sentiment)
 
-            # Step 5: Generate AI recommendations with enhanced context
+            # Step 5: Generate AI recommendations in concurrent, batched LLM calls
             if self.ai_service and competitor_prices:
-                for product_id, current_price in competitor_prices.items():
-                    try:
-                        # Enhanced market context for AI
-                        enhanced_context = {
-                            'competitor_prices': {product_id: current_price},
-                            'market_sentiment': market_sentiment.overall_sentiment.compound_score,
-                            'volatility_index': market_sentiment.volatility_index,
-                            'trend_analysis': market_sentiment.trend_analysis,
-                            'risk_factors': market_sentiment.risk_factors,
-                            'confidence_forecast': market_sentiment.confidence_forecast
+                shop_prices = await loop.run_in_executor(None, self._fetch_shop_prices)
+                recommendations = await self.ai_service.reprice_products(
+                    [
+                        {
+                            'product_id': product_id,
+                            'current_price': shop_prices[product_id],
+                            'competitor_prices': {"amazon": competitor_price},
+                            'historical_prices': self.price_history.get(product_id, [])
                         }
+                        for product_id, competitor_price in competitor_prices.items()
+                        if shop_prices.get(product_id)
+                    ],
+                    market_context={
+                        'sentiment': market_sentiment.overall_sentiment.sentiment_level.value,
+                        'sentiment_score': market_sentiment.overall_sentiment.compound_score,
+                        'trend': market_sentiment.trend_analysis,
+                        'volatility': market_sentiment.volatility_index,
+                        'risk_factors': market_sentiment.risk_factors
+                    }
+                )
 
-                        recommendation = await self.ai_service.get_ai_recommendation(
-                            product_id, current_price, enhanced_context
-                        )
-
+                for product_id, recommendation in recommendations.items():
+                    try:
                         # Process recommendation with ML-optimized rules
                         await self._process_ml_enhanced_recommendation(recommendation, market_sentiment)
 
@@ -218,14 +225,15 @@ class PricingOptimizerAgent(AgentBase):
             shop_prices = await loop.run_in_executor(None, self._fetch_shop_prices)
             self.logger.info(f"Fetched Shopify prices for {len(shop_prices)} products")
 
-            # Process each product with AI recommendations
+            # Process products concurrently; the AI gateway bounds in-flight LLM calls
             if competitor_prices and shop_prices:
-                for product, competitor_price in competitor_prices.items():
-                    current_price = shop_prices.get(product)
-                    if current_price:
-                        await self._process_product_pricing(
-                            product, current_price, {"amazon": competitor_price}
-                        )
+                await asyncio.gather(*(
+                    self._process_product_pricing(
+                        product, shop_prices[product], {"amazon": competitor_price}
+                    )
+                    for product, competitor_price in competitor_prices.items()
+                    if shop_prices.get(product)
+                ))
         except Exception as e:
             self.logger.error(f"Error in basic pricing optimization: {e}")
 
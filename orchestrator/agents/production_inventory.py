@@ -12,19 +12,100 @@ from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import httpx
 import numpy as np
 import pandas as pd
 import redis.asyncio as redis
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, create_engine, text
 
 from core.secrets.secret_provider import UnifiedSecretResolver
 from orchestrator.core.agent_base import AgentBase
+from orchestrator.services.batch_demand_forecaster import (
+    BatchDemandForecaster,
+    DemandMatrix,
+    build_demand_matrix,
+    history_window,
+)
+from orchestrator.services.compute_executor import get_compute_executor
 
 logger = logging.getLogger(__name__)
 
+PROPHET_PARAMS = {
+    'yearly_seasonality': True,
+    'weekly_seasonality': True,
+    'daily_seasonality': False,
+    'changepoint_prior_scale': 0.05
+}
+
+
+def fit_prophet_forecast(historical_data: List[Dict[str, Any]],
+                         horizon_days: int,
+                         params: Dict[str, Any]) -> Tuple[float, float]:
+    """Fit Prophet on daily demand and return ``(avg_predicted_demand, accuracy)``.
+
+    Runs on the compute executor; Prophet models can only be fitted once, so
+    a fresh model is built for the forecast and for the holdout check.
+    """
+    from prophet import Prophet
+
+    df = pd.DataFrame(historical_data)
+    df['ds'] = pd.to_datetime(df['date'])
+    df['y'] = df['demand']
+
+    model = Prophet(**params)
+    model.fit(df[['ds', 'y']])
+
+    future = model.make_future_dataframe(periods=horizon_days)
+    forecast = model.predict(future)
+    avg_predicted_demand = forecast.tail(horizon_days)['yhat'].mean()
+
+    return float(avg_predicted_demand), float(prophet_holdout_accuracy(df, params))
+
+
+def prophet_holdout_accuracy(data: pd.DataFrame, params: Dict[str, Any]) -> float:
+    """Accuracy (1 - MAPE) of Prophet on the last 20% of ``data``."""
+    from prophet import Prophet
+
+    try:
+        # Use last 20% of data for validation
+        split_point = int(len(data) * 0.8)
+        train_data = data[:split_point]
+        test_data = data[split_point:]
+
+        if len(test_data) < 3:
+            return 0.85  # Default accuracy if not enough test data
+
+        model = Prophet(**params)
+        model.fit(train_data[['ds', 'y']])
+
+        test_future = model.make_future_dataframe(periods=len(test_data))
+        test_forecast = model.predict(test_future)
+
+        # Calculate MAPE (Mean Absolute Percentage Error)
+        actual = test_data['y'].values
+        predicted = test_forecast['yhat'].tail(len(test_data)).values
+
+        mape = np.mean(np.abs((actual - predicted) / np.maximum(actual, 1))) * 100
+        return max(0, (100 - mape) / 100)
+
+    except Exception as e:
+        logger.error(f"Accuracy calculation failed: {e}")
+        return 0.75  # Default accuracy on error
+
+
+def fit_neural_network_forecast(estimator: Any,
+                                X: np.ndarray,
+                                y: np.ndarray,
+                                future_X: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Fit a copy of ``estimator`` and return ``(future_predictions, r2_score)``."""
+    from sklearn.base import clone
+
+    model = clone(estimator)
+    model.fit(X, y)
+    return model.predict(future_X), float(model.score(X, y))
+
 
 class InventoryStatus(Enum):
     """Inventory status levels."""
@@ -198,6 +279,9 @@ class ProductionInventoryAgent(AgentBase):
         self.config = {
             'cache_ttl_seconds': 900,  # 15 minutes
             'forecast_horizon_days': 30,
+            'forecast_history_days': 90,
+            'forecast_batch_limit': 10000,
+            'forecast_min_sales_days': 10,
             'reorder_safety_factor': 1.2,
             'max_forecast_models': 3,
             'supplier_timeout_seconds': 30,
@@ -215,9 +299,17 @@ class ProductionInventoryAgent(AgentBase):
         self.forecast_models = {}
         self.optimization_algorithms = {}
 
-        # Thread pool for concurrent operations
+        # Thread pool for concurrent operations; also runs blocking DB queries
+        # so they do not stall the event loop
         self.thread_pool = ThreadPoolExecutor(max_workers=10)
 
+        # Vectorized catalog-wide demand forecasting
+        self.batch_forecaster = BatchDemandForecaster()
+
+    async def _run_db(self, fn: Callable[[], Any]) -> Any:
+        """Run a blocking database call on the agent's thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(self.thread_pool, fn)
+
     async def initialize(self):
         """Initialize all inventory management services."""
         try:
@@ -340,12 +432,7 @@ class ProductionInventoryAgent(AgentBase):
             # Prophet for time series forecasting
             try:
                 from prophet import Prophet
-                self.forecast_models['prophet'] = Prophet(
-                    yearly_seasonality=True,
-                    weekly_seasonality=True,
-                    daily_seasonality=False,
-                    changepoint_prior_scale=0.05
-                )
+                self.forecast_models['prophet'] = Prophet(**PROPHET_PARAMS)
                 logger.info("Prophet forecasting model initialized")
             except ImportError:
                 logger.warning("Prophet library not available")
@@ -725,12 +812,11 @@ class ProductionInventoryAgent(AgentBase):
 
             # Get inventory items that need forecasting
             items_to_forecast = await self._get_items_for_forecasting()
-
-            for item in items_to_forecast:
-                forecast = await self._generate_item_forecast(item)
-                if forecast:
-                    forecast_results['forecasts'].append(forecast)
-                    forecast_results['total_forecasts'] += 1
+            if items_to_forecast:
+                forecast_results['forecasts'] = await self._generate_batch_forecasts(items_to_forecast)
+                forecast_results['total_forecasts'] = len(forecast_results['forecasts'])
+                if forecast_results['forecasts']:
+                    forecast_results['models_used'] = ['linear_regression', 'weekly_seasonal']
 
             # Calculate average accuracy
             if forecast_results['forecasts']:
@@ -761,29 +847,109 @@ class ProductionInventoryAgent(AgentBase):
                 WHERE active = true 
                 AND (last_forecast_date IS NULL 
                      OR last_forecast_date < NOW() - INTERVAL '6 hours')
-                LIMIT 100
+                LIMIT :limit
             """
 
-            with db_engine.connect() as conn:
-                result = conn.execute(text(query))
-                items = []
-
-                for row in result:
-                    items.append({
-                        'sku': row[0],
-                        'name': row[1],
-                        'category': row[2],
-                        'current_stock': row[3],
-                        'selling_price': float(row[4]) if row[4] else 0.0,
-                        'last_forecast_date': row[5]
-                    })
+            def load() -> List[Dict[str, Any]]:
+                with db_engine.connect() as conn:
+                    result = conn.execute(text(query), {'limit': self.config['forecast_batch_limit']})
+                    return [
+                        {
+                            'sku': row[0],
+                            'name': row[1],
+                            'category': row[2],
+                            'current_stock': row[3],
+                            'selling_price': float(row[4]) if row[4] else 0.0,
+                            'last_forecast_date': row[5]
+                        }
+                        for row in result
+                    ]
 
-                return items
+            return await self._run_db(load)
 
         except Exception as e:
             logger.error(f"Failed to get items for forecasting: {e}")
             return []
 
+    async def _generate_batch_forecasts(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Forecast demand for many items with one query and one vectorized fit.
+
+        History for all SKUs is loaded into a dense SKU x day matrix and every
+        SKU is fitted in closed form by ``BatchDemandForecaster`` off the event
+        loop. SKUs with too few sales days are skipped, as in the per-item path.
+        """
+        skus = [item['sku'] for item in items]
+        matrix = await self._get_historical_sales_matrix(skus)
+        if matrix is None:
+            return []
+
+        sales_days = np.count_nonzero(matrix.values, axis=1)
+        eligible = np.flatnonzero(sales_days >= self.config['forecast_min_sales_days'])
+        if eligible.size == 0:
+            return []
+
+        subset = DemandMatrix(
+            skus=[matrix.skus[i] for i in eligible],
+            start_date=matrix.start_date,
+            values=matrix.values[eligible]
+        )
+        result = await self.batch_forecaster.forecast_async(subset, self.config['forecast_horizon_days'])
+
+        forecast_date = datetime.now(timezone.utc).isoformat()
+        predicted = result.predicted_demand.tolist()
+        accuracy = result.accuracy_score.tolist()
+
+        return [
+            {
+                'sku': sku,
+                'forecast_date': forecast_date,
+                'predicted_demand': demand,
+                'confidence_interval_lower': demand * 0.8,
+                'confidence_interval_upper': demand * 1.2,
+                'model_used': 'ensemble',
+                'accuracy_score': score,
+                'models_included': result.models_included,
+                'forecast_horizon_days': self.config['forecast_horizon_days']
+            }
+            for sku, demand, score in zip(result.skus, predicted, accuracy)
+        ]
+
+    async def _get_historical_sales_matrix(self, skus: List[str]) -> Optional[DemandMatrix]:
+        """Load daily demand for all ``skus`` with a single grouped query."""
+        db_engine = self.db_connections.get('main')
+        if not db_engine or not skus:
+            return None
+
+        days = self.config['forecast_history_days']
+        start_date, end_date = history_window(days)
+
+        query = text("""
+            SELECT oi.sku,
+                   DATE(so.created_at) as sale_date,
+                   SUM(oi.quantity) as daily_demand
+            FROM order_items oi
+            JOIN shopify_orders so ON oi.order_id = so.id
+            WHERE oi.sku IN :skus
+            AND so.created_at >= :start_date
+            AND so.created_at < :end_date
+            GROUP BY oi.sku, DATE(so.created_at)
+        """).bindparams(bindparam('skus', expanding=True))
+
+        def load() -> DemandMatrix:
+            with db_engine.connect() as conn:
+                rows = conn.execute(query, {
+                    'skus': skus,
+                    'start_date': start_date,
+                    'end_date': end_date
+                })
+                return build_demand_matrix(rows, skus, start_date, days)
+
+        try:
+            return await self._run_db(load)
+        except Exception as e:
+            logger.error(f"Failed to load sales history for {len(skus)} SKUs: {e}")
+            return None
+
     async def _generate_item_forecast(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Generate demand forecast for a specific item."""
         try:
@@ -854,17 +1020,18 @@ class ProductionInventoryAgent(AgentBase):
                 ORDER BY sale_date
             """
 
-            with db_engine.connect() as conn:
-                result = conn.execute(text(query), sku=sku)
-                data = []
-
-                for row in result:
-                    data.append({
-                        'date': row[0],
-                        'demand': int(row[1]) if row[1] else 0
-                    })
+            def load() -> List[Dict[str, Any]]:
+                with db_engine.connect() as conn:
+                    result = conn.execute(text(query), {'sku': sku})
+                    return [
+                        {
+                            'date': row[0],
+                            'demand': int(row[1]) if row[1] else 0
+                        }
+                        for row in result
+                    ]
 
-                return data
+            return await self._run_db(load)
 
         except Exception as e:
             logger.error(f"Failed to get historical data for {sku}: {e}")
@@ -876,25 +1043,11 @@ class ProductionInventoryAgent(AgentBase):
             if 'prophet' not in self.forecast_models:
                 return None
 
-            # Prepare data for Prophet
-            df = pd.DataFrame(historical_data)
-            df['ds'] = pd.to_datetime(df['date'])
-            df['y'] = df['demand']
-
-            # Create and fit model
-            model = self.forecast_models['prophet']
-            model.fit(df[['ds', 'y']])
-
-            # Generate future dates
-            future = model.make_future_dataframe(periods=self.config['forecast_horizon_days'])
-            forecast = model.predict(future)
-
-            # Get the forecast for tomorrow
-            future_forecast = forecast.tail(self.config['forecast_horizon_days'])
-            avg_predicted_demand = future_forecast['yhat'].mean()
-
-            # Calculate accuracy based on recent predictions
-            accuracy = self._calculate_forecast_accuracy(model, df)
+            # Fit and validate off the event loop
+            avg_predicted_demand, accuracy = await get_compute_executor().run(
+                fit_prophet_forecast, historical_data, self.config['forecast_horizon_days'], PROPHET_PARAMS,
+                name=f"prophet:{sku}"
+            )
 
             return {
                 'predicted_demand': float(avg_predicted_demand),
@@ -969,26 +1122,24 @@ class ProductionInventoryAgent(AgentBase):
             X = np.array(X)
             y = np.array(y)
 
-            # Fit model
-            model = self.forecast_models['neural_network']
-            model.fit(X, y)
-
-            # Generate future predictions
-            future_predictions = []
-            for i in range(self.config['forecast_horizon_days']):
-                future_features = [
+            # Future feature rows
+            future_X = np.array([
+                [
                     len(historical_data) + i,
                     (datetime.now(timezone.utc) + timedelta(days=i)).weekday(),
                     (datetime.now(timezone.utc) + timedelta(days=i)).day,
                     np.mean(y[-7:]) if len(y) >= 7 else np.mean(y)
                 ]
-                prediction = model.predict([future_features])[0]
-                future_predictions.append(max(0, prediction))
+                for i in range(self.config['forecast_horizon_days'])
+            ])
 
-            avg_predicted_demand = np.mean(future_predictions)
+            # Fit and predict off the event loop
+            future_predictions, accuracy = await get_compute_executor().run(
+                fit_neural_network_forecast, self.forecast_models['neural_network'], X, y, future_X,
+                name=f"neural_network:{sku}"
+            )
 
-            # Calculate accuracy using cross-validation
-            accuracy = model.score(X, y)
+            avg_predicted_demand = np.mean(np.maximum(future_predictions, 0))
 
             return {
                 'predicted_demand': float(avg_predicted_demand),
@@ -1000,37 +1151,6 @@ class ProductionInventoryAgent(AgentBase):
             logger.error(f"Neural network forecast failed for {sku}: {e}")
             return None
 
-    def _calculate_forecast_accuracy(self, model, data: pd.DataFrame) -> float:
-        """Calculate forecast accuracy for a model."""
-        try:
-            # Use last 20% of data for validation
-            split_point = int(len(data) * 0.8)
-            train_data = data[:split_point]
-            test_data = data[split_point:]
-
-            if len(test_data) < 3:
-                return 0.85  # Default accuracy if not enough test data
-
-            # Fit model on training data
-            model.fit(train_data[['ds', 'y']])
-
-            # Predict on test data
-            test_future = model.make_future_dataframe(periods=len(test_data))
-            test_forecast = model.predict(test_future)
-
-            # Calculate MAPE (Mean Absolute Percentage Error)
-            actual = test_data['y'].values
-            predicted = test_forecast['yhat'].tail(len(test_data)).values
-
-            mape = np.mean(np.abs((actual - predicted) / np.maximum(actual, 1))) * 100
-            accuracy = max(0, (100 - mape) / 100)
-
-            return accuracy
-
-        except Exception as e:
-            logger.error(f"Accuracy calculation failed: {e}")
-            return 0.75  # Default accuracy on error
-
     async def _optimize_inventory_parameters(self) -> Dict[str, Any]:
         """Optimize inventory parameters using advanced algorithms."""
         try:
@@ -2161,16 +2281,19 @@ class ProductionInventoryAgent(AgentBase):
                 ]
 
             # Real database query (implement when DB is properly configured)
-            with self.db_connections['main'].connect() as conn:
-                result = conn.execute(text("""
-                    SELECT sku, name, category, current_stock, reorder_point, 
-                           max_stock_level, unit_cost, annual_demand, avg_daily_demand,
-                           lead_time_days, supplier_id, seasonal_factor, trend_factor,
-                           supplier_reliability_score
-                    FROM inventory_items 
-                    WHERE status = 'active'
-                """))
-                return [dict(row) for row in result]
+            def load() -> List[Dict[str, Any]]:
+                with self.db_connections['main'].connect() as conn:
+                    result = conn.execute(text("""
+                        SELECT sku, name, category, current_stock, reorder_point, 
+                               max_stock_level, unit_cost, annual_demand, avg_daily_demand,
+                               lead_time_days, supplier_id, seasonal_factor, trend_factor,
+                               supplier_reliability_score
+                        FROM inventory_items 
+                        WHERE status = 'active'
+                    """))
+                    return [dict(row._mapping) for row in result]
+
+            return await self._run_db(load)
 
         except Exception as e:
             logger.error(f"Failed to fetch inventory data: {e}")
@@ -11,14 +11,17 @@ Provides enterprise-grade AI consciousness with:
 
 import asyncio
 import logging
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from orchestrator.intelligence.memory import DecisionLog, MemoryStore, retention_score
+
 
 class AwarenessLevel(Enum):
     """Levels of consciousness awareness"""
@@ -50,7 +53,7 @@ class ConsciousnessState:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryFragment:
     """Memory system fragment"""
     content: Dict[str, Any]
@@ -74,7 +77,7 @@ class DecisionContext:
     stakeholders: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class IntelligenceDecision:
     """AI decision with confidence and reasoning"""
     action: str
@@ -96,6 +99,13 @@ class ConsciousnessEngine:
     capabilities for the entire business ecosystem.
     """
 
+    # Memory capacities; every store is bounded so a long-running engine stays flat
+    WORKING_MEMORY_CAPACITY = 100
+    EPISODIC_MEMORY_CAPACITY = 1000
+    SEMANTIC_MEMORY_CAPACITY = 1000
+    DECISION_HISTORY_CAPACITY = 1000
+    PENDING_DECISIONS_CAPACITY = 100
+
     def __init__(self, empire_context: Optional[Dict[str, Any]] = None):
         self.logger = logging.getLogger(__name__)
         self.empire_context = empire_context or {}
@@ -111,10 +121,14 @@ class ConsciousnessEngine:
             decision_queue_depth=0
         )
 
-        # Memory systems
-        self.working_memory: Dict[str, MemoryFragment] = {}
-        self.episodic_memory: List[MemoryFragment] = []
-        self.semantic_memory: Dict[str, MemoryFragment] = {}
+        # Memory systems; episodic memories are indexed by the decision they record
+        self.working_memory = MemoryStore(self.WORKING_MEMORY_CAPACITY)
+        self.episodic_memory = MemoryStore(
+            self.EPISODIC_MEMORY_CAPACITY,
+            index_key=lambda fragment: fragment.content.get('decision'),
+            low_water=0.8
+        )
+        self.semantic_memory = MemoryStore(self.SEMANTIC_MEMORY_CAPACITY)
 
         # Learning and adaptation
         self.behavior_patterns: Dict[str, Dict[str, float]] = {}
@@ -122,8 +136,10 @@ class ConsciousnessEngine:
         self.failure_patterns: Dict[str, float] = {}
 
         # Decision making
-        self.decision_history: List[IntelligenceDecision] = []
-        self.pending_decisions: List[Tuple[DecisionContext, datetime]] = []
+        self.decision_history: DecisionLog[IntelligenceDecision] = DecisionLog(self.DECISION_HISTORY_CAPACITY)
+        self.pending_decisions: Deque[Tuple[DecisionContext, datetime]] = deque(
+            maxlen=self.PENDING_DECISIONS_CAPACITY
+        )
 
         # Performance metrics
         self.metrics = {
@@ -290,6 +306,10 @@ class ConsciousnessEngine:
             # Calculate success score
             success_score = self._calculate_success_score(decision.expected_outcome, actual_outcome)
 
+            # The action's track record, from the per-action indexes
+            prior_scores = [f.content['success_score'] for f in self.recall_outcomes(decision.action)]
+            confidences = [d.confidence for d in self.decision_history.for_key(decision.action)]
+
             # Update behavior patterns
             self._update_behavior_patterns(decision.action, success_score)
 
@@ -299,10 +319,15 @@ class ConsciousnessEngine:
             else:
                 self.failure_patterns[decision.action] = self.failure_patterns.get(decision.action, 0) + 0.1
 
-            # Update confidence calibration
-            confidence_error = abs(decision.confidence - success_score)
+            # Update confidence calibration against the track record, not one noisy outcome
+            confidence_error = abs(
+                np.mean(confidences or [decision.confidence]) - np.mean(prior_scores + [success_score])
+            )
             self._calibrate_confidence(confidence_error)
 
+            # Outcomes that depart from the track record are worth remembering longer
+            surprise = abs(success_score - np.mean(prior_scores)) if prior_scores else 0.0
+
             # Store learning memory
             learning_memory = MemoryFragment(
                 content={
@@ -312,13 +337,13 @@ class ConsciousnessEngine:
                     'success_score': success_score
                 },
                 memory_type='episodic',
-                importance_score=min(1.0, success_score + 0.3),
+                importance_score=float(min(1.0, max(success_score, surprise) + 0.3)),
                 access_count=1,
                 created_at=datetime.now(timezone.utc),
                 last_accessed=datetime.now(timezone.utc)
             )
 
-            self.episodic_memory.append(learning_memory)
+            self.episodic_memory.add(learning_memory)
 
             # Update metrics
             self._update_learning_metrics(success_score)
@@ -329,6 +354,11 @@ class ConsciousnessEngine:
             self.logger.error(f"Learning error: {e}")
 
 
+    def recall_outcomes(self, action: str) -> List[MemoryFragment]:
+        """Recall the learned outcomes of an action, oldest first"""
+        return self.episodic_memory.by_index(action)
+
+
     async def get_consciousness_status(self) -> Dict[str, Any]:
         """Get current consciousness engine status"""
         return {
@@ -344,7 +374,13 @@ class ConsciousnessEngine:
             'memory_systems': {
                 'working_memory_size': len(self.working_memory),
                 'episodic_memory_size': len(self.episodic_memory),
-                'semantic_memory_size': len(self.semantic_memory)
+                'semantic_memory_size': len(self.semantic_memory),
+                'episodic_memory_capacity': self.episodic_memory.capacity,
+                'evictions': (
+                    self.working_memory.evictions
+                    + self.episodic_memory.evictions
+                    + self.semantic_memory.evictions
+                )
             },
             'learning_progress': {
                 'behavior_patterns_count': len(self.behavior_patterns),
@@ -562,7 +598,7 @@ class ConsciousnessEngine:
         if len(self.decision_history) > 10:
             recent_scores = [
                 self._calculate_success_score(d.expected_outcome, {'actual_success': 0.7})
-                for d in self.decision_history[-10:]
+                for d in self.decision_history.recent(10)
             ]
             self.metrics['learning_rate'] = np.mean(recent_scores) - np.mean(recent_scores[:5])
 
@@ -606,26 +642,21 @@ class ConsciousnessEngine:
     async def _cleanup_working_memory(self):
         """Clean up old working memory items"""
         current_time = datetime.now(timezone.utc)
-        items_to_remove = []
-
-        for key, memory in self.working_memory.items():
-            # Remove items older than 1 hour with low importance
-            age = current_time - memory.last_accessed
-            if age > timedelta(hours=1) and memory.importance_score < 0.3:
-                items_to_remove.append(key)
 
-        for key in items_to_remove:
-            del self.working_memory[key]
+        # Remove items older than 1 hour with low importance
+        self.working_memory.prune(
+            lambda memory: current_time - memory.last_accessed > timedelta(hours=1)
+            and memory.importance_score < 0.3
+        )
 
-        self.state.memory_utilization = len(self.working_memory) / 100.0  # Assume max 100 items
+        self.state.memory_utilization = len(self.working_memory) / self.working_memory.capacity
 
 
     async def _consolidate_episodic_memory(self):
         """Consolidate episodic memories into semantic knowledge"""
-        if len(self.episodic_memory) > 100:
-            # Keep only the most important 80 memories
-            self.episodic_memory.sort(key=lambda m: m.importance_score, reverse=True)
-            self.episodic_memory = self.episodic_memory[:80]
+        # Capacity is enforced on insert; drop memories whose importance has decayed away
+        now = datetime.now(timezone.utc)
+        self.episodic_memory.prune(lambda m: retention_score(m, now) < 0.01)
 
 
     async def _update_semantic_memory(self):
@@ -652,7 +683,7 @@ class ConsciousnessEngine:
             return
 
         # Process oldest decision first
-        context, queued_at = self.pending_decisions.pop(0)
+        context, queued_at = self.pending_decisions.popleft()
 
         # Check if decision is still relevant (not too old)
         if datetime.now(timezone.utc) - queued_at < timedelta(hours=1):
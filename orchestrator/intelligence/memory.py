@@ -0,0 +1,199 @@
+"""
+Bounded memory stores for the consciousness engine.
+
+A long-running engine records memories and decisions continuously, so every
+store here has a fixed capacity:
+
+- MemoryStore keeps keyed memory fragments and, when full, evicts the ones
+  with the lowest retention score (importance decayed by time since last
+  access). An optional secondary index gives O(1) recall by tag.
+- DecisionLog is a ring buffer of decisions with a per-action index.
+"""
+
+import heapq
+import itertools
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Generic, Hashable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def retention_score(fragment: Any, now: datetime) -> float:
+    """Importance decayed per hour since the fragment was last accessed."""
+    hours = max(0.0, (now - fragment.last_accessed).total_seconds() / 3600)
+    return fragment.importance_score * (fragment.decay_factor ** hours)
+
+
+class MemoryStore:
+    """Capacity-bounded memory with importance/recency-based eviction.
+
+    Eviction runs in batches: once the store exceeds ``capacity`` it drops
+    the lowest-scoring fragments down to ``low_water``, so the cost of
+    scoring is amortised over many inserts.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        index_key: Optional[Callable[[Any], Optional[Hashable]]] = None,
+        low_water: float = 0.9,
+    ):
+        """
+        Args:
+            capacity: Maximum number of fragments kept
+            index_key: Returns the tag a fragment is indexed under, or None
+            low_water: Fraction of capacity to evict down to when full
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.low_water = max(1, int(capacity * low_water))
+        self.index_key = index_key
+        self.evictions = 0
+
+        self._items: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._index: Dict[Hashable, "OrderedDict[Hashable, None]"] = {}
+        self._tags: Dict[Hashable, Hashable] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._items.values()))
+
+    def keys(self) -> List[Hashable]:
+        return list(self._items)
+
+    def values(self) -> List[Any]:
+        return list(self._items.values())
+
+    def items(self) -> List[tuple]:
+        return list(self._items.items())
+
+    def add(self, fragment: Any) -> Hashable:
+        """Store a fragment under a generated key and return the key."""
+        key = next(self._sequence)
+        self.put(key, fragment)
+        return key
+
+    def put(self, key: Hashable, fragment: Any):
+        """Store or replace a fragment."""
+        if key in self._items:
+            self._unindex(key)
+        self._items[key] = fragment
+        self._items.move_to_end(key)
+
+        if self.index_key is not None:
+            tag = self.index_key(fragment)
+            if tag is not None:
+                self._index.setdefault(tag, OrderedDict())[key] = None
+                self._tags[key] = tag
+
+        if len(self._items) > self.capacity:
+            self._evict(len(self._items) - self.low_water)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Recall a fragment, recording the access."""
+        fragment = self._items.get(key)
+        if fragment is None:
+            return default
+        fragment.access_count += 1
+        fragment.last_accessed = datetime.now(timezone.utc)
+        self._items.move_to_end(key)
+        return fragment
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Look up a fragment without recording an access."""
+        return self._items.get(key, default)
+
+    def by_index(self, tag: Hashable) -> List[Any]:
+        """Fragments indexed under ``tag``, oldest first."""
+        keys = self._index.get(tag)
+        if not keys:
+            return []
+        return [self._items[key] for key in keys]
+
+    def remove(self, key: Hashable) -> Optional[Any]:
+        if key not in self._items:
+            return None
+        self._unindex(key)
+        return self._items.pop(key)
+
+    def prune(self, predicate: Callable[[Any], bool]) -> int:
+        """Remove every fragment for which ``predicate`` is true."""
+        doomed = [key for key, fragment in self._items.items() if predicate(fragment)]
+        for key in doomed:
+            self.remove(key)
+        return len(doomed)
+
+    def shrink_to(self, size: int) -> int:
+        """Evict the lowest-scoring fragments until at most ``size`` remain."""
+        excess = len(self._items) - size
+        if excess > 0:
+            self._evict(excess)
+        return max(0, excess)
+
+    def clear(self):
+        self._items.clear()
+        self._index.clear()
+        self._tags.clear()
+
+    def _evict(self, count: int):
+        now = datetime.now(timezone.utc)
+        victims = heapq.nsmallest(
+            count, self._items.items(), key=lambda item: retention_score(item[1], now)
+        )
+        for key, _ in victims:
+            self.remove(key)
+        self.evictions += len(victims)
+
+    def _unindex(self, key: Hashable):
+        tag = self._tags.pop(key, None)
+        if tag is None:
+            return
+        keys = self._index.get(tag)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del self._index[tag]
+
+
+class DecisionLog(Generic[T]):
+    """Ring buffer of decisions indexed by action."""
+
+    def __init__(self, capacity: int, key: Callable[[T], Hashable] = lambda d: d.action):
+        self.capacity = capacity
+        self._key = key
+        self._entries: Deque[T] = deque()
+        self._by_key: Dict[Hashable, Deque[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(list(self._entries))
+
+    def append(self, entry: T):
+        if len(self._entries) >= self.capacity:
+            oldest = self._entries.popleft()
+            # The globally oldest entry is also the oldest one for its key
+            bucket = self._by_key[self._key(oldest)]
+            bucket.popleft()
+            if not bucket:
+                del self._by_key[self._key(oldest)]
+        self._entries.append(entry)
+        self._by_key.setdefault(self._key(entry), deque()).append(entry)
+
+    def recent(self, count: int) -> List[T]:
+        """The last ``count`` entries, oldest first."""
+        if count <= 0:
+            return []
+        return list(itertools.islice(reversed(self._entries), count))[::-1]
+
+    def for_key(self, key: Hashable) -> List[T]:
+        return list(self._by_key.get(key, ()))
@@ -9,12 +9,35 @@ This service provides intelligent pricing recommendations based on:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
+import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-import openai
+from orchestrator.services.llm_gateway import LLMGateway
+from orchestrator.services.llm_response_cache import LLMResponseCache
+
+MARKET_ANALYSIS_SYSTEM_PROMPT = (
+    "You are an expert e-commerce pricing strategist with deep knowledge of "
+    "competitive pricing, market analysis, and consumer behavior."
+)
+
+PRICING_SYSTEM_PROMPT = (
+    "You are an expert pricing strategist. Analyze the market data and provide a "
+    "specific pricing recommendation with confidence score (0.0-1.0), detailed "
+    "reasoning, and risk assessment."
+)
+
+MARKET_ANALYSIS_TEMPERATURE = 0.3
+PRICING_TEMPERATURE = 0.2
+
+BATCH_RESPONSE_INSTRUCTIONS = (
+    "Respond with a single JSON object only. Use each product ID as a key and, as "
+    "its value, the plain-text answer you would give for that product on its own."
+)
 
 
 @dataclass
@@ -43,22 +66,56 @@ class MarketAnalysis:
 class AIPricingService:
     """AI-powered pricing recommendation service."""
 
-    def __init__(self, openai_api_key: str, model: str = "gpt-4"):
+    def __init__(
+        self,
+        openai_api_key: str,
+        model: str = "gpt-4",
+        max_concurrency: Optional[int] = None,
+        request_timeout: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        base_url: Optional[str] = None,
+        gateway: Optional[LLMGateway] = None,
+        cache: Optional[LLMResponseCache] = None,
+    ):
         """Initialize the AI pricing service.
         
         Args:
             openai_api_key: OpenAI API key
             model: OpenAI model to use for analysis
+            max_concurrency: Maximum concurrent LLM requests
+            request_timeout: Per-request timeout in seconds
+            batch_size: Products per batched LLM request (env ``AI_PRICING_BATCH_SIZE``)
+            base_url: OpenAI-compatible endpoint override (e.g. a local fake server)
+            gateway: Pre-built gateway, shared between services or injected in tests
+            cache: Prompt response cache; built from ``AI_PRICING_CACHE_*`` env
+                vars when omitted. ``AI_PRICING_CACHE_SIZE=0`` disables caching.
         """
-        self.client = openai.OpenAI(api_key=openai_api_key)
         self.model = model
+        if cache is None and gateway is None:
+            cache = LLMResponseCache(
+                max_entries=int(os.getenv("AI_PRICING_CACHE_SIZE", "10000")),
+                ttl_seconds=float(os.getenv("AI_PRICING_CACHE_TTL", "3600")),
+                price_tolerance=float(os.getenv("AI_PRICING_PRICE_TOLERANCE", "0.005")),
+            )
+        self.gateway = gateway or LLMGateway(
+            openai_api_key,
+            model=model,
+            max_concurrency=max_concurrency,
+            timeout=request_timeout,
+            base_url=base_url,
+            cache=cache,
+        )
+        if gateway is not None and cache is not None:
+            self.gateway.cache = cache
+        self.batch_size = max(1, batch_size or int(os.getenv("AI_PRICING_BATCH_SIZE", "10")))
         self.logger = logging.getLogger(__name__)
 
     async def analyze_market_conditions(
         self,
         product_id: str,
         competitor_prices: Dict[str, float],
-        historical_prices: List[Dict[str, any]] = None
+        historical_prices: List[Dict[str, any]] = None,
+        market_context: Optional[Dict[str, Any]] = None
     ) -> MarketAnalysis:
         """Analyze market conditions for pricing decisions.
         
@@ -66,41 +123,27 @@ class AIPricingService:
             product_id: Product identifier
             competitor_prices: Mapping of competitor names to prices
             historical_prices: Historical pricing data
+            market_context: Market-wide sentiment, see ``_build_market_data``
             
         Returns:
             MarketAnalysis object with market insights
         """
         try:
             # Prepare market data for AI analysis
-            market_data = {
-                "product_id": product_id,
-                "competitor_prices": competitor_prices,
-                "price_range": {
-                    "min": min(competitor_prices.values()) if competitor_prices else 0,
-                    "max": max(competitor_prices.values()) if competitor_prices else 0,
-                    "avg": sum(competitor_prices.values()) / len(competitor_prices) if competitor_prices else 0
-                },
-                "historical_data": historical_prices or []
-            }
+            market_data = self._build_market_data(
+                product_id, competitor_prices, historical_prices, market_context
+            )
 
             # AI prompt for market analysis
             prompt = self._build_market_analysis_prompt(market_data)
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert e-commerce pricing strategist with deep knowledge of competitive pricing, market analysis, and consumer behavior."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
+            analysis_text = await self.gateway.complete(
+                self._market_analysis_messages(prompt),
+                temperature=MARKET_ANALYSIS_TEMPERATURE,
                 max_tokens=800
             )
 
             # Parse AI response
-            analysis_text = response.choices[0].message.content
             market_analysis = self._parse_market_analysis(analysis_text, competitor_prices)
 
             self.logger.info(f"Market analysis completed for {product_id}")
@@ -130,32 +173,20 @@ class AIPricingService:
             PriceRecommendation with detailed analysis
         """
         try:
-            objectives = business_objectives or {
-                "primary_goal": "balanced_growth",
-                "min_margin": 0.15,
-                "max_discount": 0.30
-            }
+            objectives = business_objectives or self._default_objectives()
 
             # Build AI prompt for pricing recommendation
             prompt = self._build_pricing_prompt(
                 product_id, current_price, market_analysis, objectives
             )
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert pricing strategist. Analyze the market data and provide a specific pricing recommendation with confidence score (0.0-1.0), detailed reasoning, and risk assessment."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2,
+            recommendation_text = await self.gateway.complete(
+                self._pricing_messages(prompt),
+                temperature=PRICING_TEMPERATURE,
                 max_tokens=1000
             )
 
             # Parse recommendation
-            recommendation_text = response.choices[0].message.content
             recommendation = self._parse_pricing_recommendation(
                 product_id, current_price, recommendation_text
             )
@@ -168,6 +199,318 @@ class AIPricingService:
             # Return fallback recommendation
             return self._fallback_recommendation(product_id, current_price, market_analysis)
 
+    async def analyze_market_conditions_batch(
+        self,
+        products: List[Dict[str, Any]],
+        market_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, MarketAnalysis]:
+        """Analyze market conditions for many products with batched LLM calls.
+
+        Products with a cached answer are served from the response cache; the
+        rest are grouped ``batch_size`` at a time into a single prompt and the
+        batches run concurrently through the gateway. Products missing from a
+        batch response are retried individually.
+
+        Args:
+            products: Dicts with ``product_id``, ``competitor_prices`` and
+                optional ``historical_prices``
+            market_context: Market-wide sentiment shared by every product
+
+        Returns:
+            Mapping of product ID to MarketAnalysis; products whose analysis
+            failed are omitted and logged.
+        """
+        market_data = {
+            p["product_id"]: self._build_market_data(
+                p["product_id"], p["competitor_prices"], p.get("historical_prices"), market_context
+            )
+            for p in products
+        }
+
+        texts = await self._run_batches(
+            {pid: self._build_market_analysis_prompt(data) for pid, data in market_data.items()},
+            self._market_analysis_messages,
+            temperature=MARKET_ANALYSIS_TEMPERATURE,
+            tokens_per_product=400
+        )
+
+        results: Dict[str, MarketAnalysis] = {}
+        missing = []
+        for pid, data in market_data.items():
+            if pid in texts:
+                results[pid] = self._parse_market_analysis(texts[pid], data["competitor_prices"])
+            else:
+                missing.append(pid)
+
+        if missing:
+            single = await asyncio.gather(
+                *(
+                    self.analyze_market_conditions(
+                        pid,
+                        market_data[pid]["competitor_prices"],
+                        market_data[pid]["historical_data"],
+                        market_context,
+                    )
+                    for pid in missing
+                ),
+                return_exceptions=True
+            )
+            for pid, analysis in zip(missing, single):
+                if isinstance(analysis, BaseException):
+                    self.logger.error(f"Market analysis failed for {pid}: {analysis}")
+                else:
+                    results[pid] = analysis
+
+        self.logger.info(f"Batched market analysis completed for {len(results)}/{len(products)} products")
+        return results
+
+    async def generate_pricing_recommendations_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> Dict[str, PriceRecommendation]:
+        """Generate pricing recommendations for many products with batched LLM calls.
+
+        Args:
+            items: Dicts with ``product_id``, ``current_price``, ``market_analysis``
+                and optional ``business_objectives``
+
+        Returns:
+            Mapping of product ID to PriceRecommendation; failures are omitted
+            and logged.
+        """
+        by_id = {item["product_id"]: item for item in items}
+
+        texts = await self._run_batches(
+            {
+                pid: self._build_pricing_prompt(
+                    pid,
+                    item["current_price"],
+                    item["market_analysis"],
+                    item.get("business_objectives") or self._default_objectives(),
+                )
+                for pid, item in by_id.items()
+            },
+            self._pricing_messages,
+            temperature=PRICING_TEMPERATURE,
+            tokens_per_product=500
+        )
+
+        results: Dict[str, PriceRecommendation] = {}
+        missing = []
+        for pid, item in by_id.items():
+            if pid in texts:
+                try:
+                    results[pid] = self._parse_pricing_recommendation(pid, item["current_price"], texts[pid])
+                except Exception as e:
+                    self.logger.error(f"Pricing recommendation failed for {pid}: {e}")
+            else:
+                missing.append(pid)
+
+        if missing:
+            single = await asyncio.gather(
+                *(
+                    self.generate_pricing_recommendation(
+                        pid,
+                        by_id[pid]["current_price"],
+                        by_id[pid]["market_analysis"],
+                        by_id[pid].get("business_objectives"),
+                    )
+                    for pid in missing
+                ),
+                return_exceptions=True
+            )
+            for pid, recommendation in zip(missing, single):
+                if isinstance(recommendation, BaseException):
+                    self.logger.error(f"Pricing recommendation failed for {pid}: {recommendation}")
+                else:
+                    results[pid] = recommendation
+
+        self.logger.info(f"Batched pricing recommendations generated for {len(results)}/{len(items)} products")
+        return results
+
+    async def reprice_products(
+        self,
+        products: List[Dict[str, Any]],
+        business_objectives: Dict[str, Any] = None,
+        market_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, PriceRecommendation]:
+        """Run market analysis and pricing recommendation for a whole catalog.
+
+        Args:
+            products: Dicts with ``product_id``, ``current_price``,
+                ``competitor_prices`` and optional ``historical_prices``
+            business_objectives: Objectives applied to every product
+            market_context: Market-wide sentiment shared by every product
+
+        Returns:
+            Mapping of product ID to PriceRecommendation
+        """
+        analyses = await self.analyze_market_conditions_batch(products, market_context)
+        return await self.generate_pricing_recommendations_batch([
+            {
+                "product_id": p["product_id"],
+                "current_price": p["current_price"],
+                "market_analysis": analyses[p["product_id"]],
+                "business_objectives": business_objectives,
+            }
+            for p in products
+            if p["product_id"] in analyses
+        ])
+
+    def get_gateway_stats(self) -> Dict[str, Any]:
+        """Get LLM gateway statistics, including response cache hit/miss counts."""
+        return self.gateway.get_stats()
+
+    @staticmethod
+    def _market_analysis_messages(prompt: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": MARKET_ANALYSIS_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+
+    @staticmethod
+    def _pricing_messages(prompt: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": PRICING_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+
+    async def _run_batches(
+        self,
+        prompts: Dict[str, str],
+        build_messages,
+        temperature: float,
+        tokens_per_product: int
+    ) -> Dict[str, str]:
+        """Answer per-product prompts from cache or batched LLM calls.
+
+        Each product's answer is cached under its single-product prompt, so
+        cache hits are shared with the non-batched methods.
+        """
+        merged: Dict[str, str] = {}
+        uncached: List[str] = []
+        for pid, prompt in prompts.items():
+            cached = self.gateway.cache_lookup(build_messages(prompt), temperature)
+            if cached is not None:
+                merged[pid] = cached
+            else:
+                uncached.append(pid)
+
+        async def run_batch(batch_ids: List[str]) -> Dict[str, str]:
+            combined = "\n\n".join(f"### Product {pid}\n{prompts[pid]}" for pid in batch_ids)
+            text = await self.gateway.complete(
+                build_messages(f"{combined}\n\n{BATCH_RESPONSE_INSTRUCTIONS}"),
+                temperature=temperature,
+                max_tokens=min(4000, tokens_per_product * len(batch_ids) + 200),
+                use_cache=False
+            )
+            return self._parse_batch_response(text)
+
+        batches = [
+            uncached[i:i + self.batch_size]
+            for i in range(0, len(uncached), self.batch_size)
+        ]
+        responses = await asyncio.gather(*(run_batch(b) for b in batches), return_exceptions=True)
+
+        for batch, response in zip(batches, responses):
+            if isinstance(response, BaseException):
+                self.logger.warning(f"Batched LLM request for {len(batch)} products failed: {response}")
+                continue
+            for pid in batch:
+                if pid in response:
+                    merged[pid] = response[pid]
+                    self.gateway.cache_store(build_messages(prompts[pid]), temperature, response[pid])
+        return merged
+
+    @staticmethod
+    def _parse_batch_response(text: str) -> Dict[str, str]:
+        """Parse a batched JSON response into product ID -> answer text."""
+        cleaned = text.strip()
+        fenced = re.search(r"```(?:json)?\s*(.*?)```", cleaned, re.DOTALL)
+        if fenced:
+            cleaned = fenced.group(1)
+
+        try:
+            payload = json.loads(cleaned)
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+
+        return {
+            str(pid): answer if isinstance(answer, str) else json.dumps(answer)
+            for pid, answer in payload.items()
+        }
+
+    @staticmethod
+    def _build_market_data(
+        product_id: str,
+        competitor_prices: Dict[str, float],
+        historical_prices: Optional[List[Dict[str, Any]]] = None,
+        market_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Assemble the market data used by the analysis prompt.
+
+        ``market_context`` may carry ``sentiment`` (level), ``sentiment_score``
+        (-1 to 1), ``trend``, ``volatility`` (0 to 1) and ``risk_factors``.
+        """
+        return {
+            "product_id": product_id,
+            "competitor_prices": competitor_prices,
+            "price_range": {
+                "min": min(competitor_prices.values()) if competitor_prices else 0,
+                "max": max(competitor_prices.values()) if competitor_prices else 0,
+                "avg": sum(competitor_prices.values()) / len(competitor_prices) if competitor_prices else 0
+            },
+            "historical_data": historical_prices or [],
+            "market_context": market_context or {}
+        }
+
+    @staticmethod
+    def _default_objectives() -> Dict[str, Any]:
+        return {
+            "primary_goal": "balanced_growth",
+            "min_margin": 0.15,
+            "max_discount": 0.30
+        }
+
+    @staticmethod
+    def _history_depth(points: int) -> str:
+        """Coarse size of the price history.
+
+        The raw count grows every repricing cycle, which would change the
+        prompt, and so its response cache key, on every run.
+        """
+        if points == 0:
+            return "none"
+        if points < 10:
+            return "limited"
+        if points < 50:
+            return "moderate"
+        return "extensive"
+
+    @staticmethod
+    def _market_context_section(context: Dict[str, Any]) -> str:
+        """Market sentiment lines for the analysis prompt.
+
+        Scores are rounded to one decimal: the prompt is the response cache
+        key, and sentiment jitters slightly between runs.
+        """
+        if not context:
+            return ""
+        lines = ["Market Sentiment:"]
+        if context.get("sentiment") is not None:
+            lines.append(f"- Level: {context['sentiment']}")
+        if context.get("sentiment_score") is not None:
+            lines.append(f"- Score: {context['sentiment_score']:.1f} (-1.0 to 1.0)")
+        if context.get("trend"):
+            lines.append(f"- Trend: {context['trend']}")
+        if context.get("volatility") is not None:
+            lines.append(f"- Volatility: {context['volatility']:.1f}")
+        if context.get("risk_factors"):
+            lines.append(f"- Risk Factors: {', '.join(context['risk_factors'])}")
+        return "\n        ".join(lines)
+
     def _build_market_analysis_prompt(self, market_data: Dict) -> str:
         """Build AI prompt for market analysis."""
         return f"""
@@ -180,7 +523,8 @@ class AIPricingService:
         - Max: ${market_data['price_range']['max']:.2f}
         - Average: ${market_data['price_range']['avg']:.2f}
         
-        Historical Data Points: {len(market_data['historical_data'])}
+        Price History: {self._history_depth(len(market_data['historical_data']))}
+        {self._market_context_section(market_data.get('market_context') or {})}
         
         Please provide:
         1. Market trend analysis (rising/falling/stable)
@@ -281,7 +625,6 @@ class AIPricingService:
             lines = text.lower()
 
             # Extract recommended price
-            import re
             price_match = re.search(r'\$?([0-9,]+\.?[0-9]*)', text)
             recommended_price = float(price_match.group(1).replace(',', '')) if price_match else current_price
 
@@ -20,6 +20,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 from sklearn.ensemble import GradientBoostingRegressor, RandomForestClassifier
 
+from orchestrator.services.compute_executor import get_compute_executor
+
 
 class CompetitorActionType(Enum):
     """Types of competitor actions."""
@@ -120,6 +122,34 @@ class MarketMovementPrediction:
     threat_areas: List[str]
 
 
+def train_synthetic_models(action_model: RandomForestClassifier,
+                           price_model: GradientBoostingRegressor,
+                           market_model: RandomForestClassifier) -> Tuple[Any, Any, Any]:
+    """Fit the three models on seeded synthetic data and return them.
+
+    Module-level so it can run on the compute executor.
+    """
+    rng = np.random.RandomState(42)
+    n_samples = 1000
+
+    # Action prediction training data
+    X_action = rng.rand(n_samples, 12)  # 12 features
+    y_action = rng.randint(0, len(CompetitorActionType), n_samples)
+    action_model.fit(X_action, y_action)
+
+    # Price trend training data
+    X_price = rng.rand(n_samples, 8)
+    y_price = rng.uniform(-0.2, 0.2, n_samples)  # ±20% price changes
+    price_model.fit(X_price, y_price)
+
+    # Market movement training data
+    X_market = rng.rand(n_samples, 10)
+    y_market = rng.randint(0, 4, n_samples)  # 4 movement types
+    market_model.fit(X_market, y_market)
+
+    return action_model, price_model, market_model
+
+
 class AdvancedCompetitorIntelligence:
     """Advanced competitor intelligence system with ML predictions."""
 
@@ -188,30 +218,42 @@ class AdvancedCompetitorIntelligence:
             random_state=42
         )
 
-        # Train models with synthetic data
-        self._train_models_with_synthetic_data()
+        # Models are trained with synthetic data on first use, off the event loop
+        self._models_trained = False
 
     def _train_models_with_synthetic_data(self) -> None:
         """Train ML models with synthetic data for initial functionality."""
-        np.random.seed(42)
-        n_samples = 1000
+        (self.action_prediction_model,
+         self.price_trend_model,
+         self.market_movement_model) = train_synthetic_models(
+            self.action_prediction_model, self.price_trend_model, self.market_movement_model
+        )
+        self._models_trained = True
 
-        # Action prediction training data
-        X_action = np.random.rand(n_samples, 12)  # 12 features
-        y_action = np.random.randint(0, len(CompetitorActionType), n_samples)
-        self.action_prediction_model.fit(X_action, y_action)
+        self.logger.info("ML models trained with synthetic data")
 
-        # Price trend training data
-        X_price = np.random.rand(n_samples, 8)
-        y_price = np.random.uniform(-0.2, 0.2, n_samples)  # ±20% price changes
-        self.price_trend_model.fit(X_price, y_price)
+    async def _ensure_models_trained(self) -> None:
+        """Train the synthetic models on the compute executor if not done yet."""
+        if self._models_trained:
+            return
 
-        # Market movement training data
-        X_market = np.random.rand(n_samples, 10)
-        y_market = np.random.randint(0, 4, n_samples)  # 4 movement types
-        self.market_movement_model.fit(X_market, y_market)
+        try:
+            models = await get_compute_executor().run(
+                train_synthetic_models,
+                self.action_prediction_model, self.price_trend_model, self.market_movement_model,
+                name="competitor_intelligence.train_synthetic_models"
+            )
+        except Exception as e:
+            self.logger.warning(f"Compute executor unavailable for model training ({e}); training in a thread")
+            await asyncio.to_thread(self._train_models_with_synthetic_data)
+            return
 
-        self.logger.info("ML models trained with synthetic data")
+        if not self._models_trained:
+            (self.action_prediction_model,
+             self.price_trend_model,
+             self.market_movement_model) = models
+            self._models_trained = True
+            self.logger.info("ML models trained with synthetic data")
 
     def _load_sample_competitor_data(self) -> None:
         """Load sample competitor data for demonstration."""
@@ -507,6 +549,7 @@ class AdvancedCompetitorIntelligence:
             List of action predictions
         """
         self.logger.info(f"Predicting actions for competitor {competitor_id}")
+        await self._ensure_models_trained()
 
         # Get competitor data and history
         competitor = self.competitor_data.get(competitor_id, {})
@@ -664,6 +707,7 @@ class AdvancedCompetitorIntelligence:
 
     async def _predict_category_price_trend(self, competitor_id: str, category: str, forecast_days: int) -> Optional[PriceTrendPrediction]:
         """Predict price trend for a specific category."""
+        await self._ensure_models_trained()
         competitor = self.competitor_data.get(competitor_id, {})
 
         # Generate synthetic price history for demo
@@ -941,6 +985,8 @@ class AdvancedCompetitorIntelligence:
 
     async def _predict_segment_movement(self, segment: str, time_horizon: str) -> Optional[MarketMovementPrediction]:
         """Predict movement for a specific market segment."""
+        await self._ensure_models_trained()
+
         # Analyze competitor activities in this segment
         segment_competitors = [comp_id for comp_id, comp_data in self.competitor_data.items()
                              if segment in comp_data.get('primary_categories', [])]
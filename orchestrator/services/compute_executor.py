@@ -0,0 +1,251 @@
+"""Shared executor for CPU-heavy work such as model fits.
+
+Model training (Prophet, scikit-learn, NumPy least squares) holds the GIL for
+seconds at a time. Running it directly in a coroutine freezes the event loop,
+which stalls agent heartbeats and Socket.IO emission. Agents submit such work
+here instead:
+
+- Tasks run in a process pool sized to the machine, so fits use every core
+- The backlog is bounded; submissions beyond it fail fast with
+  ``ComputeQueueFull`` instead of piling up unbounded work
+- Every task has a timeout; queued tasks can be cancelled
+- Counters and latency figures are available through ``get_stats()``
+
+Submitted callables and their arguments must be picklable, so fit logic lives
+in module-level functions that take data and return fitted estimators.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ComputeExecutorError(RuntimeError):
+    """Base error for compute executor failures."""
+
+
+class ComputeQueueFull(ComputeExecutorError):
+    """Raised when the executor's backlog is at capacity."""
+
+
+@dataclass
+class ComputeStats:
+    """Running counters for compute tasks."""
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    timed_out: int = 0
+    rejected: int = 0
+    pool_restarts: int = 0
+    total_runtime: float = 0.0
+    peak_pending: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "timed_out": self.timed_out,
+            "rejected": self.rejected,
+            "pool_restarts": self.pool_restarts,
+            "avg_runtime": self.total_runtime / finished if finished else 0.0,
+            "peak_pending": self.peak_pending,
+        }
+
+
+class ComputeExecutor:
+    """Bounded process pool for CPU-bound tasks."""
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 max_queue: Optional[int] = None,
+                 default_timeout: Optional[float] = None,
+                 use_processes: Optional[bool] = None,
+                 start_method: Optional[str] = None):
+        """Initialize the executor. The pool itself starts on first use.
+
+        Args:
+            max_workers: Worker count (env ``COMPUTE_MAX_WORKERS``, default CPU count)
+            max_queue: Tasks allowed to wait beyond the running ones
+                (env ``COMPUTE_MAX_QUEUE``, default 64)
+            default_timeout: Seconds before ``run`` gives up on a task
+                (env ``COMPUTE_TASK_TIMEOUT``, default 300)
+            use_processes: Use processes rather than threads
+                (env ``COMPUTE_USE_PROCESSES``, default true)
+            start_method: multiprocessing start method
+                (env ``COMPUTE_START_METHOD``, default ``spawn``; forking a
+                process that already runs loop threads is unsafe)
+        """
+        self.max_workers = max_workers or int(os.getenv("COMPUTE_MAX_WORKERS", str(os.cpu_count() or 2)))
+        self.max_queue = max_queue if max_queue is not None else int(os.getenv("COMPUTE_MAX_QUEUE", "64"))
+        self.default_timeout = default_timeout or float(os.getenv("COMPUTE_TASK_TIMEOUT", "300"))
+        if use_processes is None:
+            use_processes = os.getenv("COMPUTE_USE_PROCESSES", "true").lower() in ("1", "true", "yes")
+        self.use_processes = use_processes
+        self.start_method = start_method or os.getenv("COMPUTE_START_METHOD", "spawn")
+
+        self.stats = ComputeStats()
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+
+    @property
+    def capacity(self) -> int:
+        """Maximum tasks running or queued at once."""
+        return self.max_workers + self.max_queue
+
+    @property
+    def pending(self) -> int:
+        """Tasks currently running or queued."""
+        return self._pending
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.use_processes:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="compute")
+            logger.info(
+                f"Compute executor started: {self.max_workers} "
+                f"{'processes' if self.use_processes else 'threads'}"
+            )
+        return self._pool
+
+    def _restart_pool(self) -> None:
+        """Replace a pool whose worker process died."""
+        broken, self._pool = self._pool, None
+        self.stats.pool_restarts += 1
+        if broken is not None:
+            broken.shutdown(wait=False, cancel_futures=True)
+        logger.warning("Compute pool was broken; starting a new one")
+
+    def submit(self, fn: Callable[..., Any], *args: Any, name: Optional[str] = None, **kwargs: Any) -> Future:
+        """Submit a task and return its future.
+
+        Queued tasks can be cancelled with ``future.cancel()``.
+
+        Raises:
+            ComputeQueueFull: If ``capacity`` tasks are already pending
+            ComputeExecutorError: If the executor has been shut down
+        """
+        task_name = name or getattr(fn, "__name__", "task")
+
+        with self._lock:
+            if self._closed:
+                raise ComputeExecutorError("Compute executor is shut down")
+            if self._pending >= self.capacity:
+                self.stats.rejected += 1
+                raise ComputeQueueFull(f"Compute backlog full ({self._pending} pending); rejected {task_name}")
+
+            try:
+                future = self._get_pool().submit(fn, *args, **kwargs)
+            except BrokenProcessPool:
+                self._restart_pool()
+                future = self._get_pool().submit(fn, *args, **kwargs)
+
+            self._pending += 1
+            self.stats.submitted += 1
+            self.stats.peak_pending = max(self.stats.peak_pending, self._pending)
+
+        started = time.perf_counter()
+        future.add_done_callback(lambda f: self._on_done(f, task_name, started))
+        return future
+
+    def _on_done(self, future: Future, name: str, started: float) -> None:
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled():
+                self.stats.cancelled += 1
+                return
+
+            self.stats.total_runtime += time.perf_counter() - started
+            error = future.exception()
+            if error is None:
+                self.stats.completed += 1
+                return
+
+            self.stats.failed += 1
+            if isinstance(error, BrokenProcessPool) and self._pool is not None:
+                self._restart_pool()
+
+        logger.error(f"Compute task {name} failed: {error}")
+
+    async def run(self,
+                  fn: Callable[..., Any],
+                  *args: Any,
+                  timeout: Optional[float] = None,
+                  name: Optional[str] = None,
+                  **kwargs: Any) -> Any:
+        """Run a task and await its result without blocking the event loop.
+
+        On timeout or caller cancellation, a still-queued task is cancelled.
+        A task that has already started runs to completion in its worker and
+        its result is discarded.
+
+        Raises:
+            asyncio.TimeoutError: If the task does not finish within ``timeout``
+            ComputeQueueFull: If the backlog is full
+        """
+        future = self.submit(fn, *args, name=name, **kwargs)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout or self.default_timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.stats.timed_out += 1
+            future.cancel()
+            logger.warning(f"Compute task {name or getattr(fn, '__name__', 'task')} timed out")
+            raise
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = True) -> None:
+        """Stop accepting work and shut down the pool."""
+        with self._lock:
+            self._closed = True
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=cancel_pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get executor statistics."""
+        stats = self.stats.to_dict()
+        stats.update({
+            "pending": self._pending,
+            "capacity": self.capacity,
+            "max_workers": self.max_workers,
+            "mode": "process" if self.use_processes else "thread",
+            "started": self._pool is not None,
+        })
+        return stats
+
+
+_compute_executor: Optional[ComputeExecutor] = None
+_compute_executor_lock = threading.Lock()
+
+
+def get_compute_executor() -> ComputeExecutor:
+    """Get the process-wide compute executor."""
+    global _compute_executor
+    with _compute_executor_lock:
+        if _compute_executor is None or _compute_executor._closed:
+            _compute_executor = ComputeExecutor()
+        return _compute_executor
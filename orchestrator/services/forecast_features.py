@@ -0,0 +1,179 @@
+"""Incremental feature store for confidence forecasting.
+
+Lagged values and rolling statistics for the forecaster are computed once,
+when an observation is appended, and kept in preallocated NumPy ring buffers.
+Retraining then slices ready-made feature rows instead of rebuilding a
+DataFrame and recomputing every lag and rolling window over the full history,
+and forecasting reads the latest window directly.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+SERIES = ("confidence_score", "sentiment_score", "volatility")
+LAGS = (1, 3, 6, 12, 24)
+WINDOWS = (3, 6, 12)
+TARGET_HORIZONS = (1, 3, 6, 12)
+
+_SERIES_PREFIX = {"confidence_score": "confidence", "sentiment_score": "sentiment", "volatility": "volatility"}
+
+FEATURE_COLUMNS: List[str] = (
+    list(SERIES)
+    + ["hour", "day_of_week", "month"]
+    + [f"{_SERIES_PREFIX[s]}_lag_{lag}" for lag in LAGS for s in SERIES]
+    + [f"{_SERIES_PREFIX[s]}_ma_{w}" for w in WINDOWS for s in SERIES]
+    + [f"confidence_std_{w}" for w in WINDOWS]
+)
+FEATURE_INDEX: Dict[str, int] = {name: i for i, name in enumerate(FEATURE_COLUMNS)}
+
+
+@dataclass
+class FeatureSnapshot:
+    """Point-in-time copy of the feature store, oldest row first."""
+    features: np.ndarray  # (rows, len(FEATURE_COLUMNS))
+    values: np.ndarray  # (rows, len(SERIES))
+    first_index: int  # absolute observation index of row 0
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def training_frame(self) -> pd.DataFrame:
+        """Feature rows joined with their future target values.
+
+        Only rows with complete lags/windows and all target horizons are kept,
+        matching the columns produced by the original pandas pipeline.
+        """
+        rows = len(self.features)
+        max_horizon = max(TARGET_HORIZONS)
+        start = max(0, max(LAGS) - self.first_index)
+        stop = rows - max_horizon
+        if stop <= start:
+            return pd.DataFrame(columns=FEATURE_COLUMNS)
+
+        df = pd.DataFrame(self.features[start:stop], columns=FEATURE_COLUMNS)
+        for horizon in TARGET_HORIZONS:
+            future = self.values[start + horizon:stop + horizon]
+            for j, series in enumerate(SERIES):
+                df[f"{_SERIES_PREFIX[series]}_future_{horizon}h"] = future[:, j]
+
+        return df.dropna()
+
+
+class RollingFeatureStore:
+    """Ring-buffered lag and rolling-window features, updated per observation."""
+
+    def __init__(self, capacity: int = 10000):
+        """Initialize empty buffers.
+
+        Args:
+            capacity: Number of feature rows retained
+        """
+        self.capacity = capacity
+        self._values = np.full((capacity, len(SERIES)), np.nan)
+        self._features = np.full((capacity, len(FEATURE_COLUMNS)), np.nan)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def extend(self, observations: Sequence[Dict[str, Any]]) -> None:
+        """Append observations in order, computing their features in one pass."""
+        if not observations:
+            return
+        values = np.array([[float(o.get(s, np.nan)) for s in SERIES] for o in observations])
+        calendar = np.array([self._calendar(o) for o in observations], dtype=float)
+        with self._lock:
+            # Only the newest ``capacity`` rows can be retained
+            if len(values) > self.capacity:
+                skipped = len(values) - self.capacity
+                rows = self._build_rows(values, calendar)[skipped:]
+                self._count += skipped
+                values = values[skipped:]
+            else:
+                rows = self._build_rows(values, calendar)
+            slots = np.arange(self._count, self._count + len(values)) % self.capacity
+            self._values[slots] = values
+            self._features[slots] = rows
+            self._count += len(values)
+
+    def append(self, observation: Dict[str, Any]) -> None:
+        """Append one observation and compute its feature row."""
+        self.extend([observation])
+
+    def peek(self,
+             confidence: float,
+             sentiment: float,
+             volatility: float,
+             when: datetime) -> Optional[np.ndarray]:
+        """Feature row for a hypothetical next observation, without storing it.
+
+        Returns:
+            The feature row, or None until enough history exists for every lag.
+        """
+        with self._lock:
+            if self._count < max(LAGS):
+                return None
+            return self._build_rows(
+                np.array([[confidence, sentiment, volatility]], dtype=float),
+                np.array([[when.hour, when.weekday(), when.month]], dtype=float),
+            )[0]
+
+    def snapshot(self) -> FeatureSnapshot:
+        """Copy the buffered rows in chronological order."""
+        with self._lock:
+            rows = len(self)
+            order = np.arange(self._count - rows, self._count) % self.capacity
+            return FeatureSnapshot(
+                features=self._features[order],
+                values=self._values[order],
+                first_index=self._count - rows,
+            )
+
+    def _build_rows(self, values: np.ndarray, calendar: np.ndarray) -> np.ndarray:
+        """Feature rows for ``values`` appended after the stored history."""
+        n = len(values)
+        lookback = max(max(LAGS), max(WINDOWS) - 1)
+
+        # Stored tail, NaN-padded so every lag/window index is in range
+        available = min(lookback, self._count, self.capacity)
+        tail = self._values[np.arange(self._count - available, self._count) % self.capacity]
+        padded = np.vstack([np.full((lookback - available, len(SERIES)), np.nan), tail, values])
+
+        rows = np.empty((n, len(FEATURE_COLUMNS)))
+        rows[:, 0:3] = values
+        rows[:, 3:6] = calendar
+
+        col = 6
+        for lag in LAGS:
+            rows[:, col:col + 3] = padded[lookback - lag:lookback - lag + n]
+            col += 3
+
+        # Rolling windows include the current observation, like pandas .rolling();
+        # NaN padding leaves incomplete windows as NaN.
+        for w in WINDOWS:
+            windows = sliding_window_view(padded[lookback - w + 1:], w, axis=0)
+            rows[:, col:col + 3] = windows.mean(axis=-1)
+            col += 3
+
+        for w in WINDOWS:
+            windows = sliding_window_view(padded[lookback - w + 1:, 0], w)
+            rows[:, col] = windows.std(axis=-1, ddof=1)
+            col += 1
+
+        return rows
+
+    @staticmethod
+    def _calendar(observation: Dict[str, Any]) -> Sequence[int]:
+        if all(k in observation for k in ("hour_of_day", "day_of_week", "month")):
+            return observation["hour_of_day"], observation["day_of_week"], observation["month"]
+        ts = pd.Timestamp(observation["timestamp"])
+        return ts.hour, ts.dayofweek, ts.month
@@ -0,0 +1,235 @@
+"""Async LLM gateway with bounded concurrency.
+
+All chat-completion traffic from the pricing services goes through a single
+``LLMGateway`` so that:
+- Calls use ``openai.AsyncOpenAI`` and never block the event loop
+- At most ``max_concurrency`` requests are in flight at once
+- Every call is bounded by a per-call timeout
+- Latency, failure and timeout counters are available for monitoring
+- Repeated prompts can be served from an optional ``LLMResponseCache``
+
+Setting ``OPENAI_BASE_URL`` (or passing ``base_url``) points the gateway at any
+OpenAI-compatible endpoint, e.g. ``scripts/fake_llm_server.py`` for local
+benchmarking without spending tokens.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import openai
+
+from orchestrator.services.llm_response_cache import LLMResponseCache
+
+
+@dataclass
+class LLMRequest:
+    """A single chat-completion request."""
+    messages: List[Dict[str, str]]
+    temperature: float = 0.2
+    max_tokens: int = 1000
+    timeout: Optional[float] = None
+
+
+@dataclass
+class LLMGatewayStats:
+    """Running counters for gateway calls."""
+    requests: int = 0
+    completed: int = 0
+    failed: int = 0
+    timeouts: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    total_latency: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    last_error: Optional[str] = field(default=None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed + self.timeouts
+        return {
+            "requests": self.requests,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "avg_latency": self.total_latency / finished if finished else 0.0,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "last_error": self.last_error,
+        }
+
+
+class LLMGateway:
+    """Concurrency-limited async gateway to an OpenAI-compatible API."""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4",
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        base_url: Optional[str] = None,
+        client: Optional[Any] = None,
+        cache: Optional[LLMResponseCache] = None,
+    ):
+        """Initialize the gateway.
+
+        Args:
+            api_key: OpenAI API key
+            model: Default model for completions
+            max_concurrency: Maximum in-flight requests (env ``LLM_MAX_CONCURRENCY``, default 8)
+            timeout: Per-call timeout in seconds (env ``LLM_REQUEST_TIMEOUT``, default 30)
+            base_url: Override API endpoint (env ``OPENAI_BASE_URL``)
+            client: Pre-built async client, mainly for tests
+            cache: Response cache consulted before each API call
+        """
+        self.model = model
+        self.max_concurrency = max_concurrency or int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+        self.timeout = timeout or float(os.getenv("LLM_REQUEST_TIMEOUT", "30"))
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL") or None
+        self.client = client or openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=self.base_url,
+            # Retries are handled by callers' fallbacks; keep the timeout honest.
+            max_retries=0,
+        )
+        self.cache = cache
+        self.stats = LLMGatewayStats()
+        self.logger = logging.getLogger(__name__)
+
+        # Semaphores bind to the loop they are first used on, so create lazily
+        # and recreate if the gateway is driven from a different loop.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def complete(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.2,
+        max_tokens: int = 1000,
+        timeout: Optional[float] = None,
+        model: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> str:
+        """Run one chat completion and return the message content.
+
+        Raises:
+            asyncio.TimeoutError: If the call exceeds its timeout
+            openai.OpenAIError: On API errors
+        """
+        if use_cache:
+            cached = self.cache_lookup(messages, temperature, model)
+            if cached is not None:
+                return cached
+
+        call_timeout = timeout or self.timeout
+        semaphore = self._get_semaphore()
+        self.stats.requests += 1
+
+        async with semaphore:
+            self.stats.in_flight += 1
+            self.stats.peak_in_flight = max(self.stats.peak_in_flight, self.stats.in_flight)
+            started = time.perf_counter()
+            try:
+                response = await asyncio.wait_for(
+                    self.client.chat.completions.create(
+                        model=model or self.model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    ),
+                    timeout=call_timeout,
+                )
+            except asyncio.TimeoutError:
+                self.stats.timeouts += 1
+                self.stats.last_error = f"timeout after {call_timeout}s"
+                raise
+            except Exception as e:
+                self.stats.failed += 1
+                self.stats.last_error = str(e)
+                raise
+            finally:
+                self.stats.in_flight -= 1
+                self.stats.total_latency += time.perf_counter() - started
+
+        self.stats.completed += 1
+        tokens = 0
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+            completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+            self.stats.prompt_tokens += prompt_tokens
+            self.stats.completion_tokens += completion_tokens
+            tokens = prompt_tokens + completion_tokens
+
+        content = response.choices[0].message.content or ""
+        if use_cache:
+            self.cache_store(messages, temperature, content, model, tokens)
+        return content
+
+    def cache_lookup(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        model: Optional[str] = None,
+    ) -> Optional[str]:
+        """Return a cached response for this request, if any."""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.cache.make_key(model or self.model, temperature, messages))
+
+    def cache_store(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        content: str,
+        model: Optional[str] = None,
+        tokens: int = 0,
+    ) -> None:
+        """Cache a response under this request's content address."""
+        if self.cache is None or not content:
+            return
+        self.cache.put(self.cache.make_key(model or self.model, temperature, messages), content, tokens)
+
+    async def complete_many(self, requests: List[LLMRequest]) -> List[Any]:
+        """Run many completions concurrently within the concurrency limit.
+
+        Returns:
+            One entry per request: the content string, or the exception raised.
+        """
+        return await asyncio.gather(
+            *(
+                self.complete(
+                    req.messages,
+                    temperature=req.temperature,
+                    max_tokens=req.max_tokens,
+                    timeout=req.timeout,
+                )
+                for req in requests
+            ),
+            return_exceptions=True,
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get gateway statistics."""
+        stats = self.stats.to_dict()
+        stats["max_concurrency"] = self.max_concurrency
+        stats["timeout"] = self.timeout
+        stats["model"] = self.model
+        if self.cache is not None:
+            stats["cache"] = self.cache.get_stats()
+        return stats
@@ -0,0 +1,167 @@
+"""Content-addressed response cache for LLM prompts.
+
+Pricing prompts are deterministic functions of their inputs, so an unchanged
+market produces an identical prompt on every repricing pass. This cache keys
+responses on a hash of the normalized prompt and serves repeats without an
+API call.
+
+Normalization collapses whitespace and buckets decimal numbers on a
+logarithmic scale, so prices that differ by less than ``price_tolerance``
+(relative) map to the same key. Integers are left untouched so product IDs
+and counts never collide.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+_WHITESPACE = re.compile(r"\s+")
+_DECIMAL = re.compile(r"\d+\.\d+")
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for the response cache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    tokens_saved: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "tokens_saved": self.tokens_saved,
+        }
+
+
+class LLMResponseCache:
+    """Thread-safe TTL + LRU cache for LLM completions."""
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float = 3600,
+        price_tolerance: float = 0.005,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached responses before LRU eviction
+            ttl_seconds: Lifetime of a cached response
+            price_tolerance: Relative difference under which decimal values
+                share a bucket (0 disables bucketing)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.price_tolerance = price_tolerance
+        self.stats = CacheStats()
+
+        # key -> (response, expires_at, tokens)
+        self._entries: OrderedDict[str, Tuple[str, float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._log_step = math.log1p(price_tolerance) if price_tolerance > 0 else 0.0
+
+    def normalize(self, text: str) -> str:
+        """Normalize prompt text for hashing."""
+        text = _WHITESPACE.sub(" ", text).strip()
+        if self._log_step:
+            text = _DECIMAL.sub(self._bucket, text)
+        return text
+
+    def _bucket(self, match: re.Match) -> str:
+        value = float(match.group(0))
+        if value == 0:
+            return "0"
+        return f"~{round(math.log(value) / self._log_step)}"
+
+    def make_key(
+        self,
+        model: str,
+        temperature: float,
+        messages: List[Dict[str, str]],
+    ) -> str:
+        """Build the content address for a chat request."""
+        payload = json.dumps(
+            {
+                "model": model,
+                "temperature": temperature,
+                "messages": [
+                    [m.get("role", ""), self.normalize(m.get("content", ""))]
+                    for m in messages
+                ],
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key``, or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            response, expires_at, tokens = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            self.stats.tokens_saved += tokens
+            return response
+
+    def put(self, key: str, response: str, tokens: int = 0) -> None:
+        """Store a response, evicting the least recently used entries if full."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (response, time.monotonic() + self.ttl_seconds, tokens)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def purge_expired(self) -> int:
+        """Drop expired entries; returns the number removed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, (_, expires_at, _) in self._entries.items() if expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+            self.stats.expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        stats = self.stats.to_dict()
+        stats["entries"] = len(self._entries)
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        stats["price_tolerance"] = self.price_tolerance
+        return stats
@@ -8,10 +8,11 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import joblib
 import numpy as np
@@ -21,6 +22,8 @@ from sklearn.metrics import mean_squared_error, r2_score
 from sklearn.model_selection import GridSearchCV, train_test_split
 from sklearn.preprocessing import StandardScaler
 
+from orchestrator.services.compute_executor import ComputeExecutorError, get_compute_executor
+
 
 @dataclass
 class RulePerformance:
@@ -67,6 +70,7 @@ class MLRuleOptimizer:
         self.models: Dict[str, Any] = {}
         self.scalers: Dict[str, StandardScaler] = {}
         self.performance_history: List[RulePerformance] = []
+        self._retrain_future: Optional[Future] = None
 
         # Load existing data and models
         self._load_historical_data()
@@ -191,7 +195,15 @@ class MLRuleOptimizer:
         return np.mean([p.success_score for p in relevant_history[-20:]])  # Last 20 records
 
     def _retrain_models(self) -> None:
-        """Retrain ML models with latest performance data."""
+        """Retrain ML models with latest performance data.
+
+        Fitting runs on the shared compute executor; the new models are
+        installed and saved when it finishes. At most one retrain is in flight.
+        """
+        if self._retrain_future is not None and not self._retrain_future.done():
+            self.logger.debug("Retrain already in progress; skipping")
+            return
+
         self.logger.info("Retraining ML models with latest performance data")
 
         df = self._prepare_features(self.performance_history)
@@ -199,152 +211,194 @@ class MLRuleOptimizer:
             self.logger.warning("Insufficient data for model training")
             return
 
-        # Train confidence threshold optimization model
-        self._train_confidence_model(df)
+        try:
+            self._retrain_future = get_compute_executor().submit(
+                MLRuleOptimizer._fit_rule_models, df, name="ml_rule_optimizer.retrain"
+            )
+        except ComputeExecutorError as e:
+            self.logger.warning(f"Could not schedule model retraining: {e}")
+            return
 
-        # Train price limit optimization model
-        self._train_price_limits_model(df)
+        self._retrain_future.add_done_callback(self._on_models_trained)
 
-        # Train profit margin optimization model
-        self._train_profit_margin_model(df)
+    @staticmethod
+    def _fit_rule_models(df: pd.DataFrame) -> Dict[str, Any]:
+        """Fit every rule model; runs in a compute worker.
 
-        self._save_models()
+        Returns:
+            Mapping of rule type to ``(model, scaler, mse, r2)``, or to an error message
+        """
+        trainers = {
+            # Confidence threshold optimization model
+            'confidence_threshold': MLRuleOptimizer._train_confidence_model,
+            # Price limit optimization model
+            'price_limits': MLRuleOptimizer._train_price_limits_model,
+            # Profit margin optimization model
+            'profit_margin': MLRuleOptimizer._train_profit_margin_model,
+        }
 
-    def _train_confidence_model(self, df: pd.DataFrame) -> None:
-        """Train model to predict optimal confidence threshold."""
-        try:
-            # Features for confidence threshold prediction
-            feature_cols = [
-                'price_change_percentage', 'profit_margin_change', 'market_response_time',
-                'day_of_week', 'hour_of_day', 'month', 'historical_success_avg'
-            ]
-            target_col = 'confidence_threshold'
-
-            X = df[feature_cols]
-            y = df[target_col]
-
-            # Split data
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42
-            )
+        results: Dict[str, Any] = {}
+        for rule_type, train in trainers.items():
+            try:
+                results[rule_type] = train(df)
+            except Exception as e:
+                results[rule_type] = str(e)
+        return results
 
-            # Scale features
-            scaler = StandardScaler()
-            X_train_scaled = scaler.fit_transform(X_train)
-            X_test_scaled = scaler.transform(X_test)
+    def _on_models_trained(self, future: Future) -> None:
+        """Install and persist models produced by ``_fit_rule_models``."""
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self.logger.error(f"Model retraining failed: {future.exception()}")
+            return
 
-            # Train model with hyperparameter tuning
-            param_grid = {
-                'n_estimators': [100, 200, 300],
-                'max_depth': [10, 20, 30],
-                'min_samples_split': [2, 5, 10]
-            }
+        models = dict(self.models)
+        scalers = dict(self.scalers)
+        for rule_type, result in future.result().items():
+            if isinstance(result, str):
+                self.logger.error(f"Error training {rule_type} model: {result}")
+                continue
+
+            model, scaler, mse, r2 = result
+            models[rule_type] = model
+            scalers[rule_type] = scaler
+            self.logger.info(f"{rule_type} model trained - MSE: {mse:.4f}, R²: {r2:.4f}")
+
+        # Swap whole dicts so concurrent predictions never see a partial update
+        self.models, self.scalers = models, scalers
+        self._save_models()
 
-            rf = RandomForestRegressor(random_state=42)
-            grid_search = GridSearchCV(rf, param_grid, cv=3, scoring='neg_mean_squared_error')
-            grid_search.fit(X_train_scaled, y_train)
+    @staticmethod
+    def _train_confidence_model(df: pd.DataFrame) -> Tuple[Any, StandardScaler, float, float]:
+        """Train model to predict optimal confidence threshold.
 
-            # Best model
-            best_model = grid_search.best_estimator_
+        Returns:
+            Fitted model, fitted scaler, test MSE and test R²
+        """
+        # Features for confidence threshold prediction
+        feature_cols = [
+            'price_change_percentage', 'profit_margin_change', 'market_response_time',
+            'day_of_week', 'hour_of_day', 'month', 'historical_success_avg'
+        ]
+        target_col = 'confidence_threshold'
+
+        X = df[feature_cols]
+        y = df[target_col]
+
+        # Split data
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.2, random_state=42
+        )
+
+        # Scale features
+        scaler = StandardScaler()
+        X_train_scaled = scaler.fit_transform(X_train)
+        X_test_scaled = scaler.transform(X_test)
+
+        # Train model with hyperparameter tuning
+        param_grid = {
+            'n_estimators': [100, 200, 300],
+            'max_depth': [10, 20, 30],
+            'min_samples_split': [2, 5, 10]
+        }
 
-            # Evaluate
-            y_pred = best_model.predict(X_test_scaled)
-            mse = mean_squared_error(y_test, y_pred)
-            r2 = r2_score(y_test, y_pred)
+        rf = RandomForestRegressor(random_state=42)
+        grid_search = GridSearchCV(rf, param_grid, cv=3, scoring='neg_mean_squared_error')
+        grid_search.fit(X_train_scaled, y_train)
 
-            self.models['confidence_threshold'] = best_model
-            self.scalers['confidence_threshold'] = scaler
+        # Best model
+        best_model = grid_search.best_estimator_
 
-            self.logger.info(f"Confidence threshold model trained - MSE: {mse:.4f}, R²: {r2:.4f}")
+        # Evaluate
+        y_pred = best_model.predict(X_test_scaled)
+        mse = mean_squared_error(y_test, y_pred)
+        r2 = r2_score(y_test, y_pred)
 
-        except Exception as e:
-            self.logger.error(f"Error training confidence model: {e}")
+        return best_model, scaler, mse, r2
 
-    def _train_price_limits_model(self, df: pd.DataFrame) -> None:
-        """Train model to predict optimal price change limits."""
-        try:
-            # Features for price limits prediction
-            feature_cols = [
-                'confidence_threshold', 'profit_margin_change', 'market_response_time',
-                'day_of_week', 'hour_of_day', 'month', 'historical_success_avg'
-            ]
-            target_col = 'price_change_percentage'
-
-            X = df[feature_cols]
-            y = df[target_col]
-
-            # Split and scale
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42
-            )
+    @staticmethod
+    def _train_price_limits_model(df: pd.DataFrame) -> Tuple[Any, StandardScaler, float, float]:
+        """Train model to predict optimal price change limits.
 
-            scaler = StandardScaler()
-            X_train_scaled = scaler.fit_transform(X_train)
-            X_test_scaled = scaler.transform(X_test)
+        Returns:
+            Fitted model, fitted scaler, test MSE and test R²
+        """
+        # Features for price limits prediction
+        feature_cols = [
+            'confidence_threshold', 'profit_margin_change', 'market_response_time',
+            'day_of_week', 'hour_of_day', 'month', 'historical_success_avg'
+        ]
+        target_col = 'price_change_percentage'
 
-            # Use Gradient Boosting for price limits
-            gb = GradientBoostingRegressor(
-                n_estimators=200,
-                learning_rate=0.1,
-                max_depth=6,
-                random_state=42
-            )
-            gb.fit(X_train_scaled, y_train)
+        X = df[feature_cols]
+        y = df[target_col]
 
-            # Evaluate
-            y_pred = gb.predict(X_test_scaled)
-            mse = mean_squared_error(y_test, y_pred)
-            r2 = r2_score(y_test, y_pred)
+        # Split and scale
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.2, random_state=42
+        )
 
-            self.models['price_limits'] = gb
-            self.scalers['price_limits'] = scaler
+        scaler = StandardScaler()
+        X_train_scaled = scaler.fit_transform(X_train)
+        X_test_scaled = scaler.transform(X_test)
 
-            self.logger.info(f"Price limits model trained - MSE: {mse:.4f}, R²: {r2:.4f}")
+        # Use Gradient Boosting for price limits
+        gb = GradientBoostingRegressor(
+            n_estimators=200,
+            learning_rate=0.1,
+            max_depth=6,
+            random_state=42
+        )
+        gb.fit(X_train_scaled, y_train)
 
-        except Exception as e:
-            self.logger.error(f"Error training price limits model: {e}")
+        # Evaluate
+        y_pred = gb.predict(X_test_scaled)
+        mse = mean_squared_error(y_test, y_pred)
+        r2 = r2_score(y_test, y_pred)
 
-    def _train_profit_margin_model(self, df: pd.DataFrame) -> None:
-        """Train model to predict optimal profit margin parameters."""
-        try:
-            feature_cols = [
-                'confidence_threshold', 'price_change_percentage', 'market_response_time',
-                'day_of_week', 'hour_of_day', 'month', 'historical_success_avg'
-            ]
-            target_col = 'profit_margin_change'
+        return gb, scaler, mse, r2
 
-            X = df[feature_cols]
-            y = df[target_col]
+    @staticmethod
+    def _train_profit_margin_model(df: pd.DataFrame) -> Tuple[Any, StandardScaler, float, float]:
+        """Train model to predict optimal profit margin parameters.
 
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42
-            )
+        Returns:
+            Fitted model, fitted scaler, test MSE and test R²
+        """
+        feature_cols = [
+            'confidence_threshold', 'price_change_percentage', 'market_response_time',
+            'day_of_week', 'hour_of_day', 'month', 'historical_success_avg'
+        ]
+        target_col = 'profit_margin_change'
 
-            scaler = StandardScaler()
-            X_train_scaled = scaler.fit_transform(X_train)
-            X_test_scaled = scaler.transform(X_test)
+        X = df[feature_cols]
+        y = df[target_col]
 
-            # Random Forest for profit margin
-            rf = RandomForestRegressor(
-                n_estimators=150,
-                max_depth=15,
-                min_samples_split=5,
-                random_state=42
-            )
-            rf.fit(X_train_scaled, y_train)
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.2, random_state=42
+        )
 
-            # Evaluate
-            y_pred = rf.predict(X_test_scaled)
-            mse = mean_squared_error(y_test, y_pred)
-            r2 = r2_score(y_test, y_pred)
+        scaler = StandardScaler()
+        X_train_scaled = scaler.fit_transform(X_train)
+        X_test_scaled = scaler.transform(X_test)
 
-            self.models['profit_margin'] = rf
-            self.scalers['profit_margin'] = scaler
+        # Random Forest for profit margin
+        rf = RandomForestRegressor(
+            n_estimators=150,
+            max_depth=15,
+            min_samples_split=5,
+            random_state=42
+        )
+        rf.fit(X_train_scaled, y_train)
 
-            self.logger.info(f"Profit margin model trained - MSE: {mse:.4f}, R²: {r2:.4f}")
+        # Evaluate
+        y_pred = rf.predict(X_test_scaled)
+        mse = mean_squared_error(y_test, y_pred)
+        r2 = r2_score(y_test, y_pred)
+
+        return rf, scaler, mse, r2
 
-        except Exception as e:
-            self.logger.error(f"Error training profit margin model: {e}")
 
     def predict_optimal_parameters(self, rule_id: str, current_market_context: Dict[str, Any]) -> OptimalParameters:
         """Predict optimal rule parameters using ML models.
@@ -0,0 +1,196 @@
+"""Append-only observation storage for forecasting services.
+
+Observations are kept in a fixed-capacity in-memory ring buffer and persisted
+as JSON Lines segments. Recording an observation appends one line to the
+active segment instead of rewriting the whole history, and the on-disk log is
+compacted down to the ring buffer's contents once it grows past
+``compaction_factor`` times the capacity, so appends stay amortized O(1).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+
+
+class ObservationStore:
+    """Ring-buffered, append-only JSONL observation log."""
+
+    def __init__(self,
+                 directory: Path,
+                 capacity: int = 10000,
+                 compaction_factor: float = 2.0,
+                 legacy_file: Optional[Path] = None):
+        """Initialize the store and load persisted observations.
+
+        Args:
+            directory: Directory holding the JSONL segments
+            capacity: Maximum observations retained in memory and after compaction
+            compaction_factor: Compact once the log holds this many times ``capacity`` lines
+            legacy_file: Optional JSON array file to import when no segments exist yet
+        """
+        self.logger = logging.getLogger(__name__)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity
+        self.compaction_threshold = max(capacity + 1, int(capacity * compaction_factor))
+
+        self._buffer: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._lines_on_disk = 0
+        self._segment_index = 0
+        self._handle = None
+
+        self._load(legacy_file)
+
+    # ------------------------------------------------------------------
+    # Read access
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __bool__(self) -> bool:
+        return bool(self._buffer)
+
+    def __iter__(self):
+        return iter(self._buffer)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return self._buffer[index]
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Copy of the buffered observations, oldest first."""
+        with self._lock:
+            return list(self._buffer)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(self, observation: Dict[str, Any]) -> None:
+        """Append one observation to the buffer and the active segment."""
+        line = json.dumps(observation, default=str, separators=(",", ":"))
+        with self._lock:
+            self._buffer.append(observation)
+            try:
+                handle = self._active_handle()
+                handle.write(line + "\n")
+                handle.flush()
+                self._lines_on_disk += 1
+            except OSError as e:
+                self.logger.error(f"Error appending observation: {e}")
+                return
+
+            if self._lines_on_disk >= self.compaction_threshold:
+                self._compact_locked()
+
+    def compact(self) -> None:
+        """Rewrite the log so it only holds the buffered observations."""
+        with self._lock:
+            self._compact_locked()
+
+    def close(self) -> None:
+        """Close the active segment."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _segments(self) -> List[Path]:
+        return sorted(self.directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"))
+
+    def _segment_path(self, index: int) -> Path:
+        return self.directory / f"{SEGMENT_PREFIX}{index:08d}{SEGMENT_SUFFIX}"
+
+    def _active_handle(self):
+        if self._handle is None:
+            self._handle = open(self._segment_path(self._segment_index), "a", encoding="utf-8")
+        return self._handle
+
+    def _load(self, legacy_file: Optional[Path]) -> None:
+        segments = self._segments()
+
+        if not segments and legacy_file is not None and legacy_file.exists():
+            self._import_legacy(legacy_file)
+            return
+
+        for segment in segments:
+            records = self._read_segment(segment)
+            self._buffer.extend(records)
+            self._lines_on_disk += len(records)
+
+        if segments:
+            self._segment_index = int(segments[-1].name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+            self.logger.info(f"Loaded {len(self._buffer)} observations from {len(segments)} segment(s)")
+
+    def _read_segment(self, path: Path) -> List[Dict[str, Any]]:
+        records = []
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn final write after a crash; skip it.
+                    self.logger.warning(f"Skipping corrupt observation at {path.name}:{line_number}")
+        return records
+
+    def _import_legacy(self, legacy_file: Path) -> None:
+        try:
+            with open(legacy_file, encoding="utf-8") as f:
+                records = json.load(f)
+        except Exception as e:
+            self.logger.error(f"Error importing legacy observations from {legacy_file}: {e}")
+            return
+
+        self._buffer.extend(records)
+        with self._lock:
+            self._compact_locked()
+        self.logger.info(f"Imported {len(self._buffer)} observations from {legacy_file.name}")
+
+    def _compact_locked(self) -> None:
+        """Write the buffer to a fresh segment, then drop older segments."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+        old_segments = self._segments()
+        new_index = self._segment_index + 1
+        new_path = self._segment_path(new_index)
+        tmp_path = new_path.with_suffix(".tmp")
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for observation in self._buffer:
+                    f.write(json.dumps(observation, default=str, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, new_path)
+        except OSError as e:
+            self.logger.error(f"Error compacting observation log: {e}")
+            return
+
+        for segment in old_segments:
+            try:
+                segment.unlink()
+            except OSError as e:
+                self.logger.warning(f"Could not remove old segment {segment.name}: {e}")
+
+        self._segment_index = new_index
+        self._lines_on_disk = len(self._buffer)
+        self.logger.debug(f"Compacted observation log to {self._lines_on_disk} entries")
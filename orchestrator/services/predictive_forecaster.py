@@ -6,12 +6,16 @@ confidence scores and market conditions to prevent issues before they occur.
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -28,6 +32,13 @@ from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import mean_absolute_error
 from sklearn.preprocessing import StandardScaler
 
+from orchestrator.services.forecast_features import (
+    FEATURE_INDEX,
+    FeatureSnapshot,
+    RollingFeatureStore,
+)
+from orchestrator.services.observation_store import ObservationStore
+
 
 @dataclass
 class ConfidenceForecast:
@@ -56,66 +67,86 @@ class MarketConditionForecast:
     forecast_timestamp: datetime
 
 
+# Model attribute -> persisted filename
+MODEL_FILES = {
+    'confidence_model': 'confidence_forecasting_model.joblib',
+    'sentiment_model': 'sentiment_forecasting_model.joblib',
+    'volatility_model': 'volatility_forecasting_model.joblib',
+    'scaler': 'forecasting_scaler.joblib'
+}
+
+# Feature columns used by the confidence model, in training order
+CONFIDENCE_FEATURES = [
+    'confidence_score', 'sentiment_score', 'volatility',
+    'hour', 'day_of_week', 'month',
+    'confidence_lag_1', 'confidence_lag_3', 'confidence_lag_6',
+    'sentiment_lag_1', 'sentiment_lag_3',
+    'volatility_lag_1', 'volatility_lag_3',
+    'confidence_ma_3', 'confidence_ma_6',
+    'sentiment_ma_3', 'volatility_ma_3',
+    'confidence_std_3'
+]
+CONFIDENCE_FEATURE_INDEX = [FEATURE_INDEX[col] for col in CONFIDENCE_FEATURES]
+
+MAX_OBSERVATIONS = 10000
+MIN_RETRAIN_OBSERVATIONS = 100
+
+
 class PredictiveForecaster:
     """Predictive confidence and market forecasting service."""
 
-    def __init__(self, data_storage_path: str = "data/forecasting"):
+    def __init__(self,
+                 data_storage_path: str = "data/forecasting",
+                 retrain_every: Optional[int] = None,
+                 retrain_interval: Optional[float] = None):
         """Initialize predictive forecasting service.
         
         Args:
             data_storage_path: Path to store forecasting models and data
+            retrain_every: Retrain after this many new observations
+                (env ``FORECASTER_RETRAIN_EVERY``, default 100)
+            retrain_interval: Also retrain when this many seconds have passed since
+                the last retrain and new data arrived (env ``FORECASTER_RETRAIN_INTERVAL``,
+                default 3600)
         """
         self.logger = logging.getLogger(__name__)
         self.data_path = Path(data_storage_path)
         self.data_path.mkdir(parents=True, exist_ok=True)
 
-        # Model storage
+        # Model storage; swapped as a unit under _model_lock after each retrain
         self.confidence_model = None
         self.sentiment_model = None
         self.volatility_model = None
         self.scaler = StandardScaler()
+        self._model_lock = threading.Lock()
 
-        # Historical data
-        self.historical_data: List[Dict[str, Any]] = []
+        # Historical data: ring buffer backed by an append-only log
+        self._store = ObservationStore(
+            self.data_path / "observations",
+            capacity=MAX_OBSERVATIONS,
+            legacy_file=self.data_path / "historical_data.json"
+        )
+        self.historical_data = self._store
+        self._features = RollingFeatureStore(MAX_OBSERVATIONS)
+        self._features.extend(self._store.snapshot())
         self.forecast_accuracy_history: List[float] = []
 
-        # Load existing models and data
-        self._load_historical_data()
-        self._load_models()
-
-        self.logger.info("Predictive forecaster initialized")
+        # Retrain scheduling
+        self.retrain_every = retrain_every or int(os.getenv("FORECASTER_RETRAIN_EVERY", "100"))
+        self.retrain_interval = retrain_interval or float(os.getenv("FORECASTER_RETRAIN_INTERVAL", "3600"))
+        self._observations_since_retrain = 0
+        self._last_retrain = time.monotonic()
+        self._retrain_future: Optional[Future] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="forecaster-retrain")
 
-    def _load_historical_data(self) -> None:
-        """Load historical forecasting data."""
-        data_file = self.data_path / "historical_data.json"
-        if data_file.exists():
-            try:
-                with open(data_file) as f:
-                    self.historical_data = json.load(f)
-                self.logger.info(f"Loaded {len(self.historical_data)} historical data points")
-            except Exception as e:
-                self.logger.error(f"Error loading historical data: {e}")
-                self.historical_data = []
+        # Load existing models
+        self._load_models()
 
-    def _save_historical_data(self) -> None:
-        """Save historical forecasting data."""
-        data_file = self.data_path / "historical_data.json"
-        try:
-            with open(data_file, 'w') as f:
-                json.dump(self.historical_data, f, indent=2, default=str)
-        except Exception as e:
-            self.logger.error(f"Error saving historical data: {e}")
+        self.logger.info(f"Predictive forecaster initialized with {len(self._store)} observations")
 
     def _load_models(self) -> None:
         """Load trained forecasting models."""
-        model_files = {
-            'confidence_model': 'confidence_forecasting_model.joblib',
-            'sentiment_model': 'sentiment_forecasting_model.joblib',
-            'volatility_model': 'volatility_forecasting_model.joblib',
-            'scaler': 'forecasting_scaler.joblib'
-        }
-
-        for model_name, filename in model_files.items():
+        for model_name, filename in MODEL_FILES.items():
             file_path = self.data_path / filename
             if file_path.exists():
                 try:
@@ -126,18 +157,13 @@ class PredictiveForecaster:
 
     def _save_models(self) -> None:
         """Save trained forecasting models."""
-        model_data = {
-            'confidence_model': self.confidence_model,
-            'sentiment_model': self.sentiment_model,
-            'volatility_model': self.volatility_model,
-            'scaler': self.scaler
-        }
+        with self._model_lock:
+            model_data = {model_name: getattr(self, model_name) for model_name in MODEL_FILES}
 
         for model_name, model in model_data.items():
             if model is not None:
                 try:
-                    file_path = self.data_path / f"{model_name.replace('_', '_')}.joblib"
-                    joblib.dump(model, file_path)
+                    joblib.dump(model, self.data_path / MODEL_FILES[model_name])
                     self.logger.info(f"Saved {model_name}")
                 except Exception as e:
                     self.logger.error(f"Error saving {model_name}: {e}")
@@ -149,58 +175,118 @@ class PredictiveForecaster:
                           market_context: Dict[str, Any] = None) -> None:
         """Record new observation for model training.
         
+        The observation is appended to the observation log; retraining is
+        scheduled in the background every ``retrain_every`` observations or
+        ``retrain_interval`` seconds, whichever comes first.
+        
         Args:
             confidence_score: Current confidence score (0-100)
             sentiment_score: Current sentiment score (-1 to 1)
             volatility: Current volatility index (0-1)
             market_context: Additional market context data
         """
+        now = datetime.now(timezone.utc)
         observation = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': now.isoformat(),
             'confidence_score': confidence_score,
             'sentiment_score': sentiment_score,
             'volatility': volatility,
-            'hour_of_day': datetime.now(timezone.utc).hour,
-            'day_of_week': datetime.now(timezone.utc).weekday(),
-            'month': datetime.now(timezone.utc).month,
+            'hour_of_day': now.hour,
+            'day_of_week': now.weekday(),
+            'month': now.month,
             'market_context': market_context or {}
         }
 
-        self.historical_data.append(observation)
+        self._store.append(observation)
+        self._features.append(observation)
+        self._observations_since_retrain += 1
+        self._maybe_schedule_retrain()
 
-        # Keep only last 10000 observations
-        if len(self.historical_data) > 10000:
-            self.historical_data = self.historical_data[-10000:]
+    def _maybe_schedule_retrain(self) -> None:
+        """Submit a background retrain if one is due and none is running."""
+        if len(self._store) < MIN_RETRAIN_OBSERVATIONS or self._observations_since_retrain == 0:
+            return
+
+        if self._retrain_future is not None and not self._retrain_future.done():
+            return
 
-        self._save_historical_data()
+        due_by_count = self._observations_since_retrain >= self.retrain_every
+        due_by_time = time.monotonic() - self._last_retrain >= self.retrain_interval
+        if not (due_by_count or due_by_time):
+            return
+
+        self._observations_since_retrain = 0
+        self._last_retrain = time.monotonic()
+        try:
+            self._retrain_future = self._executor.submit(self._retrain_models, self._features.snapshot())
+        except RuntimeError:
+            # Executor already shut down
+            self.logger.debug("Retrain skipped: forecaster is closed")
 
-        # Retrain models if we have enough data
-        if len(self.historical_data) >= 100:
-            self._retrain_models()
+    def wait_for_retrain(self, timeout: Optional[float] = None) -> bool:
+        """Block until any in-flight retrain finishes.
 
-    def _retrain_models(self) -> None:
-        """Retrain forecasting models with latest data."""
-        if len(self.historical_data) < 50:
+        Returns:
+            True if no retrain is pending when this returns
+        """
+        future = self._retrain_future
+        if future is None:
+            return True
+        try:
+            future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            return False
+        return True
+
+    def close(self) -> None:
+        """Wait for pending retrains and release the observation log."""
+        self._executor.shutdown(wait=True)
+        self._store.close()
+
+    def _retrain_models(self, snapshot: Optional[FeatureSnapshot] = None) -> None:
+        """Retrain forecasting models with latest data.
+
+        Args:
+            snapshot: Feature snapshot to train on; defaults to the current store
+        """
+        if snapshot is None:
+            snapshot = self._features.snapshot()
+
+        if len(snapshot) < 50:
             self.logger.warning("Insufficient data for model training")
             return
 
         self.logger.info("Retraining forecasting models")
 
         try:
-            df = self._prepare_training_data()
+            df = self._prepare_training_data(snapshot)
 
             if len(df) < 30:
                 self.logger.warning("Insufficient prepared data for training")
                 return
 
+            # Models are fitted against a fresh scaler and published together so
+            # concurrent forecasts never see a scaler/model mismatch.
+            scaler = StandardScaler()
+
             # Train confidence forecasting model
-            self._train_confidence_model(df)
+            confidence_model = self._train_confidence_model(df, scaler)
+            if confidence_model is None:
+                return
 
             # Train sentiment forecasting model
-            self._train_sentiment_model(df)
+            sentiment_model = self._train_sentiment_model(df, scaler)
 
             # Train volatility forecasting model
-            self._train_volatility_model(df)
+            volatility_model = self._train_volatility_model(df, scaler)
+
+            with self._model_lock:
+                self.scaler = scaler
+                self.confidence_model = confidence_model
+                if sentiment_model is not None:
+                    self.sentiment_model = sentiment_model
+                if volatility_model is not None:
+                    self.volatility_model = volatility_model
 
             # Save models
             self._save_models()
@@ -210,64 +296,22 @@ class PredictiveForecaster:
         except Exception as e:
             self.logger.error(f"Error during model retraining: {e}")
 
-    def _prepare_training_data(self) -> pd.DataFrame:
-        """Prepare training data from historical observations."""
-        # Convert historical data to DataFrame
-        df = pd.DataFrame(self.historical_data)
+    def _prepare_training_data(self, snapshot: Optional[FeatureSnapshot] = None) -> pd.DataFrame:
+        """Prepare training data from the incremental feature store.
 
-        # Convert timestamp to datetime
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-
-        # Sort by timestamp
-        df = df.sort_values('timestamp')
-
-        # Create time-based features
-        df['hour'] = df['timestamp'].dt.hour
-        df['day_of_week'] = df['timestamp'].dt.dayofweek
-        df['month'] = df['timestamp'].dt.month
-
-        # Create lagged features for time series
-        for lag in [1, 3, 6, 12, 24]:  # Various lag periods
-            df[f'confidence_lag_{lag}'] = df['confidence_score'].shift(lag)
-            df[f'sentiment_lag_{lag}'] = df['sentiment_score'].shift(lag)
-            df[f'volatility_lag_{lag}'] = df['volatility'].shift(lag)
-
-        # Create rolling statistics
-        for window in [3, 6, 12]:
-            df[f'confidence_ma_{window}'] = df['confidence_score'].rolling(window=window).mean()
-            df[f'sentiment_ma_{window}'] = df['sentiment_score'].rolling(window=window).mean()
-            df[f'volatility_ma_{window}'] = df['volatility'].rolling(window=window).mean()
-
-            df[f'confidence_std_{window}'] = df['confidence_score'].rolling(window=window).std()
-
-        # Create target variables (future values)
-        for horizon in [1, 3, 6, 12]:  # Hours ahead
-            df[f'confidence_future_{horizon}h'] = df['confidence_score'].shift(-horizon)
-            df[f'sentiment_future_{horizon}h'] = df['sentiment_score'].shift(-horizon)
-            df[f'volatility_future_{horizon}h'] = df['volatility'].shift(-horizon)
-
-        # Drop rows with NaN values
-        df = df.dropna()
-
-        return df
+        Lags, rolling statistics and calendar features are maintained per
+        observation by ``RollingFeatureStore``; this only joins the stored
+        feature rows with their future targets and drops incomplete rows.
+        """
+        if snapshot is None:
+            snapshot = self._features.snapshot()
+        return snapshot.training_frame()
 
-    def _train_confidence_model(self, df: pd.DataFrame) -> None:
+    def _train_confidence_model(self, df: pd.DataFrame, scaler: StandardScaler) -> Optional[RandomForestRegressor]:
         """Train confidence score forecasting model."""
         try:
-            # Features for confidence prediction
-            feature_cols = [
-                'confidence_score', 'sentiment_score', 'volatility',
-                'hour', 'day_of_week', 'month',
-                'confidence_lag_1', 'confidence_lag_3', 'confidence_lag_6',
-                'sentiment_lag_1', 'sentiment_lag_3',
-                'volatility_lag_1', 'volatility_lag_3',
-                'confidence_ma_3', 'confidence_ma_6',
-                'sentiment_ma_3', 'volatility_ma_3',
-                'confidence_std_3'
-            ]
-
             # Filter available columns
-            available_cols = [col for col in feature_cols if col in df.columns]
+            available_cols = [col for col in CONFIDENCE_FEATURES if col in df.columns]
 
             if not available_cols:
                 self.logger.error("No feature columns available for confidence model")
@@ -286,20 +330,20 @@ class PredictiveForecaster:
                 return
 
             # Scale features
-            X_scaled = self.scaler.fit_transform(X)
+            X_scaled = scaler.fit_transform(X.to_numpy())
 
             # Train Random Forest model
-            self.confidence_model = RandomForestRegressor(
+            model = RandomForestRegressor(
                 n_estimators=100,
                 max_depth=10,
                 min_samples_split=5,
                 random_state=42
             )
 
-            self.confidence_model.fit(X_scaled, y)
+            model.fit(X_scaled, y)
 
             # Calculate accuracy
-            y_pred = self.confidence_model.predict(X_scaled)
+            y_pred = model.predict(X_scaled)
             mae = mean_absolute_error(y, y_pred)
             accuracy = max(0, 1 - (mae / 100))  # Normalize to 0-1
 
@@ -308,11 +352,13 @@ class PredictiveForecaster:
                 self.forecast_accuracy_history = self.forecast_accuracy_history[-100:]
 
             self.logger.info(f"Confidence model trained - MAE: {mae:.2f}, Accuracy: {accuracy:.3f}")
+            return model
 
         except Exception as e:
             self.logger.error(f"Error training confidence model: {e}")
+            return None
 
-    def _train_sentiment_model(self, df: pd.DataFrame) -> None:
+    def _train_sentiment_model(self, df: pd.DataFrame, scaler: StandardScaler) -> Optional[RandomForestRegressor]:
         """Train sentiment forecasting model."""
         try:
             feature_cols = [
@@ -339,23 +385,25 @@ class PredictiveForecaster:
             if len(X) < 20:
                 return
 
-            X_scaled = self.scaler.transform(X)
+            X_scaled = scaler.transform(X.to_numpy())
 
-            self.sentiment_model = RandomForestRegressor(
+            model = RandomForestRegressor(
                 n_estimators=80,
                 max_depth=8,
                 min_samples_split=5,
                 random_state=42
             )
 
-            self.sentiment_model.fit(X_scaled, y)
+            model.fit(X_scaled, y)
 
             self.logger.info("Sentiment forecasting model trained")
+            return model
 
         except Exception as e:
             self.logger.error(f"Error training sentiment model: {e}")
+            return None
 
-    def _train_volatility_model(self, df: pd.DataFrame) -> None:
+    def _train_volatility_model(self, df: pd.DataFrame, scaler: StandardScaler) -> Optional[RandomForestRegressor]:
         """Train volatility forecasting model."""
         try:
             feature_cols = [
@@ -380,21 +428,23 @@ class PredictiveForecaster:
             if len(X) < 20:
                 return
 
-            X_scaled = self.scaler.transform(X)
+            X_scaled = scaler.transform(X.to_numpy())
 
-            self.volatility_model = RandomForestRegressor(
+            model = RandomForestRegressor(
                 n_estimators=60,
                 max_depth=6,
                 min_samples_split=3,
                 random_state=42
             )
 
-            self.volatility_model.fit(X_scaled, y)
+            model.fit(X_scaled, y)
 
             self.logger.info("Volatility forecasting model trained")
+            return model
 
         except Exception as e:
             self.logger.error(f"Error training volatility model: {e}")
+            return None
 
     def forecast_confidence(self,
                           current_confidence: float,
@@ -403,6 +453,9 @@ class PredictiveForecaster:
                           forecast_horizons: List[int] = [1, 3, 6, 12, 24]) -> List[ConfidenceForecast]:
         """Forecast confidence scores for multiple time horizons.
         
+        All horizons share one feature row and one model call; per-horizon
+        outputs are derived from that prediction with vectorized NumPy.
+        
         Args:
             current_confidence: Current confidence score (0-100)
             current_sentiment: Current sentiment score (-1 to 1)  
@@ -412,99 +465,103 @@ class PredictiveForecaster:
         Returns:
             List of confidence forecasts for each horizon
         """
-        forecasts = []
-
-        for horizon in forecast_horizons:
-            try:
-                forecast = self._generate_confidence_forecast(
-                    current_confidence, current_sentiment, current_volatility, horizon
-                )
-                forecasts.append(forecast)
-            except Exception as e:
-                self.logger.error(f"Error generating {horizon}h confidence forecast: {e}")
-                # Generate fallback forecast
-                fallback = self._generate_fallback_forecast(current_confidence, horizon)
-                forecasts.append(fallback)
+        if not forecast_horizons:
+            return []
 
-        return forecasts
-
-    def _generate_confidence_forecast(self,
-                                    confidence: float,
-                                    sentiment: float,
-                                    volatility: float,
-                                    horizon: int) -> ConfidenceForecast:
-        """Generate confidence forecast for specific horizon."""
+        with self._model_lock:
+            model, scaler = self.confidence_model, self.scaler
 
-        if self.confidence_model is None or self.scaler is None:
-            return self._generate_fallback_forecast(confidence, horizon)
+        if model is None or scaler is None:
+            return [self._generate_fallback_forecast(current_confidence, h) for h in forecast_horizons]
 
+        now = datetime.now(timezone.utc)
         try:
-            # Prepare features for prediction
-            now = datetime.now(timezone.utc)
-            features = [
-                confidence, sentiment, volatility,
-                now.hour, now.weekday(), now.month
-            ]
-
-            # Add lagged features (using current values as approximation)
-            for _ in [1, 3, 6]:  # lag periods
-                features.extend([confidence, sentiment, volatility])
-
-            # Add moving averages (approximate with current values)
-            features.extend([confidence, confidence, sentiment, volatility, confidence * 0.1])
-
-            # Pad features to match training data if necessary
-            expected_features = len(self.scaler.scale_) if hasattr(self.scaler, 'scale_') else 15
-            while len(features) < expected_features:
-                features.append(0.0)
-            features = features[:expected_features]  # Trim if too long
-
-            # Scale features
-            features_scaled = self.scaler.transform([features])
-
-            # Predict
-            predicted_confidence = self.confidence_model.predict(features_scaled)[0]
-
-            # Estimate confidence interval (simplified)
-            recent_errors = self.forecast_accuracy_history[-10:] if self.forecast_accuracy_history else [0.9]
-            avg_accuracy = sum(recent_errors) / len(recent_errors)
-            error_margin = (1 - avg_accuracy) * 100 * 1.96  # 95% CI approximation
-
-            ci_lower = max(0, predicted_confidence - error_margin)
-            ci_upper = min(100, predicted_confidence + error_margin)
-
-            # Determine trend direction
-            trend_direction = "stable"
-            if predicted_confidence > confidence + 5:
-                trend_direction = "rising"
-            elif predicted_confidence < confidence - 5:
-                trend_direction = "falling"
-
-            # Forecast volatility for this horizon
-            volatility_forecast = min(1.0, volatility + np.random.normal(0, 0.05))
+            features = self._confidence_features(
+                current_confidence, current_sentiment, current_volatility, now, scaler
+            )
+            predicted = float(model.predict(scaler.transform(features))[0])
+        except Exception as e:
+            self.logger.error(f"Error in confidence forecast generation: {e}")
+            return [self._generate_fallback_forecast(current_confidence, h) for h in forecast_horizons]
+
+        # Estimate confidence interval (simplified)
+        recent_errors = self.forecast_accuracy_history[-10:] if self.forecast_accuracy_history else [0.9]
+        avg_accuracy = sum(recent_errors) / len(recent_errors)
+        error_margin = (1 - avg_accuracy) * 100 * 1.96  # 95% CI approximation
+
+        ci_lower = max(0, predicted - error_margin)
+        ci_upper = min(100, predicted + error_margin)
+        predicted_confidence = max(0, min(100, predicted))
+
+        # Determine trend direction
+        trend_direction = "stable"
+        if predicted > current_confidence + 5:
+            trend_direction = "rising"
+        elif predicted < current_confidence - 5:
+            trend_direction = "falling"
+
+        # Forecast volatility for every horizon at once
+        volatility_forecasts = np.minimum(
+            1.0, current_volatility + np.random.normal(0, 0.05, size=len(forecast_horizons))
+        )
 
+        forecasts = []
+        for horizon, volatility_forecast in zip(forecast_horizons, volatility_forecasts.tolist()):
             # Determine risk level
             risk_level = "low"
-            if volatility_forecast > 0.7 or predicted_confidence < 50:
+            if volatility_forecast > 0.7 or predicted < 50:
                 risk_level = "high"
-            elif volatility_forecast > 0.5 or predicted_confidence < 70:
+            elif volatility_forecast > 0.5 or predicted < 70:
                 risk_level = "medium"
 
-            return ConfidenceForecast(
+            forecasts.append(ConfidenceForecast(
                 forecast_horizon=horizon,
-                predicted_confidence=max(0, min(100, predicted_confidence)),
+                predicted_confidence=predicted_confidence,
                 confidence_interval_lower=ci_lower,
                 confidence_interval_upper=ci_upper,
                 prediction_accuracy=avg_accuracy,
                 trend_direction=trend_direction,
                 volatility_forecast=volatility_forecast,
                 risk_level=risk_level,
-                timestamp=datetime.now(timezone.utc)
-            )
+                timestamp=now
+            ))
 
-        except Exception as e:
-            self.logger.error(f"Error in confidence forecast generation: {e}")
-            return self._generate_fallback_forecast(confidence, horizon)
+        return forecasts
+
+    def _confidence_features(self,
+                             confidence: float,
+                             sentiment: float,
+                             volatility: float,
+                             now: datetime,
+                             scaler: StandardScaler) -> np.ndarray:
+        """Build the (1, n_features) input row for the confidence model.
+
+        Uses real lags and rolling statistics from the feature store when the
+        scaler matches ``CONFIDENCE_FEATURES``; models trained before the feature
+        store existed get the legacy approximation from current values.
+        """
+        expected_features = len(scaler.scale_) if hasattr(scaler, 'scale_') else 15
+
+        if expected_features == len(CONFIDENCE_FEATURES):
+            row = self._features.peek(confidence, sentiment, volatility, now)
+            if row is not None and not np.isnan(row[CONFIDENCE_FEATURE_INDEX]).any():
+                return row[CONFIDENCE_FEATURE_INDEX].reshape(1, -1)
+
+        features = [
+            confidence, sentiment, volatility,
+            now.hour, now.weekday(), now.month
+        ]
+
+        # Add lagged features (using current values as approximation)
+        for _ in [1, 3, 6]:  # lag periods
+            features.extend([confidence, sentiment, volatility])
+
+        # Add moving averages (approximate with current values)
+        features.extend([confidence, confidence, sentiment, volatility, confidence * 0.1])
+
+        # Pad or trim features to match training data
+        features = (features + [0.0] * expected_features)[:expected_features]
+        return np.array([features], dtype=float)
 
     def _generate_fallback_forecast(self, current_confidence: float, horizon: int) -> ConfidenceForecast:
         """Raise error when ML models are unavailable - no fallback mock data."""
@@ -558,23 +615,26 @@ class PredictiveForecaster:
                                 period: str) -> MarketConditionForecast:
         """Generate market condition forecast."""
 
+        with self._model_lock:
+            sentiment_model, volatility_model, scaler = self.sentiment_model, self.volatility_model, self.scaler
+
         # Forecast sentiment
-        if self.sentiment_model and self.scaler:
+        if sentiment_model and scaler:
             try:
                 features = self._prepare_market_features(sentiment, volatility, confidence)
-                features_scaled = self.scaler.transform([features])
-                sentiment_forecast = self.sentiment_model.predict(features_scaled)[0]
+                features_scaled = scaler.transform([features])
+                sentiment_forecast = sentiment_model.predict(features_scaled)[0]
             except:
                 sentiment_forecast = sentiment * (0.98 ** (hours / 6))  # Slight decay
         else:
             sentiment_forecast = sentiment * (0.98 ** (hours / 6))
 
         # Forecast volatility
-        if self.volatility_model and self.scaler:
+        if volatility_model and scaler:
             try:
                 features = self._prepare_market_features(sentiment, volatility, confidence)
-                features_scaled = self.scaler.transform([features])
-                volatility_forecast = max(0, min(1, self.volatility_model.predict(features_scaled)[0]))
+                features_scaled = scaler.transform([features])
+                volatility_forecast = max(0, min(1, volatility_model.predict(features_scaled)[0]))
             except:
                 volatility_forecast = volatility + np.random.normal(0, 0.1)
                 volatility_forecast = max(0, min(1, volatility_forecast))
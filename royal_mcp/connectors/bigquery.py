@@ -4,10 +4,16 @@ Provides secure read-only access to BigQuery project with optimized query execut
 caching, and comprehensive error handling.
 """
 
+import asyncio
+import json
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from google.cloud import bigquery
 from google.cloud.exceptions import GoogleCloudError
@@ -24,32 +30,182 @@ class BigQueryConfig(BaseModel):
     location: str = Field(default="US", description="BigQuery location")
     max_results: int = Field(default=1000, description="Maximum query results")
     timeout: int = Field(default=60, description="Query timeout in seconds")
+    cache_ttl: int = Field(default=300, description="Result cache TTL in seconds")
+    cache_max_entries: int = Field(default=256, description="Maximum cached results")
+    cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024, description="Maximum cached result bytes"
+    )
 
 
-class QueryCache:
-    """Simple in-memory cache for BigQuery results."""
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+    size: int
+
 
-    def __init__(self, ttl_seconds: int = 300):  # 5 minutes default
-        self.cache: Dict[str, tuple[Any, datetime]] = {}
-        self.ttl = timedelta(seconds=ttl_seconds)
+class QueryCache:
+    """Size- and byte-bounded TTL cache for BigQuery results.
+
+    Entries are evicted least-recently-used first once either bound is hit,
+    and expired entries are swept in the background rather than only when
+    their key is read again. Concurrent loads of the same key share a single
+    query (single-flight).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 300,  # 5 minutes default
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        sweep_interval: float = 60.0,
+    ):
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self.bytes = 0
+        self.metrics = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "rejected": 0,
+        }
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self.cache)
 
     def get(self, key: str) -> Optional[Any]:
         """Get cached result if not expired."""
-        if key in self.cache:
-            result, timestamp = self.cache[key]
-            if datetime.now() - timestamp < self.ttl:
-                return result
-            else:
-                del self.cache[key]
-        return None
+        entry = self.cache.get(key)
+        if entry is None:
+            self.metrics["misses"] += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.metrics["expirations"] += 1
+            self.metrics["misses"] += 1
+            return None
+        self.cache.move_to_end(key)
+        self.metrics["hits"] += 1
+        return entry.value
 
     def set(self, key: str, value: Any) -> None:
-        """Cache a result."""
-        self.cache[key] = (value, datetime.now())
+        """Cache a result, evicting least recently used entries to fit."""
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            self.metrics["rejected"] += 1
+            return
+
+        if key in self.cache:
+            self._remove(key)
+        self.cache[key] = _CacheEntry(value, time.monotonic() + self.ttl, size)
+        self.bytes += size
+
+        while len(self.cache) > self.max_entries or self.bytes > self.max_bytes:
+            self._remove(next(iter(self.cache)))
+            self.metrics["evictions"] += 1
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """Return a cached result, or load it once for all concurrent callers.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the result on a miss
+
+        Returns:
+            Tuple of the result and whether it was served without querying
+        """
+        self._ensure_sweeper()
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached, True
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.metrics["coalesced"] += 1
+            return await asyncio.shield(pending), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except BaseException as e:
+            future.set_exception(e)
+            # Waiters re-raise the error; nobody may be waiting, so mark it seen
+            future.exception()
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value, False
+        finally:
+            del self._inflight[key]
+
+    def expire(self) -> int:
+        """Drop every expired entry and return how many were dropped."""
+        now = time.monotonic()
+        expired = [key for key, entry in self.cache.items() if entry.expires_at <= now]
+        for key in expired:
+            self._remove(key)
+        self.metrics["expirations"] += len(expired)
+        return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache occupancy and hit/miss counters."""
+        lookups = self.metrics["hits"] + self.metrics["misses"]
+        return {
+            **self.metrics,
+            "entries": len(self.cache),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "in_flight": len(self._inflight),
+            "hit_rate": round(self.metrics["hits"] / lookups, 4) if lookups else 0.0,
+        }
 
     def clear(self) -> None:
         """Clear all cached results."""
         self.cache.clear()
+        self.bytes = 0
+
+    def close(self) -> None:
+        """Stop the background expiry task."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+
+    def _remove(self, key: str) -> None:
+        entry = self.cache.pop(key)
+        self.bytes -= entry.size
+
+    def _ensure_sweeper(self) -> None:
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep())
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            expired = self.expire()
+            if expired:
+                logger.debug(f"Expired {expired} cached BigQuery results")
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate memory footprint of a result via its JSON encoding."""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
 
 
 class BigQueryConnector:
@@ -57,7 +213,14 @@ class BigQueryConnector:
 
     def __init__(self):
         """Initialize the BigQuery connector."""
-        self.config = BigQueryConfig(project_id=os.environ["BIGQUERY_PROJECT_ID"])
+        self.config = BigQueryConfig(
+            project_id=os.environ["BIGQUERY_PROJECT_ID"],
+            cache_ttl=int(os.environ.get("BIGQUERY_CACHE_TTL", "300")),
+            cache_max_entries=int(os.environ.get("BIGQUERY_CACHE_MAX_ENTRIES", "256")),
+            cache_max_bytes=int(
+                os.environ.get("BIGQUERY_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+            ),
+        )
 
         # Initialize BigQuery client with automatic credential detection
         try:
@@ -69,7 +232,11 @@ class BigQueryConnector:
             logger.error(f"Failed to initialize BigQuery client: {e}")
             raise
 
-        self.cache = QueryCache()
+        self.cache = QueryCache(
+            ttl_seconds=self.config.cache_ttl,
+            max_entries=self.config.cache_max_entries,
+            max_bytes=self.config.cache_max_bytes,
+        )
 
     def get_tools(self) -> List[Tool]:
         """Get all available BigQuery tools."""
@@ -139,6 +306,20 @@ class BigQueryConnector:
                     "required": ["dataset_id"],
                 },
             ),
+            Tool(
+                name="bigquery_cache_stats",
+                description="Get query result cache hit/miss and memory metrics",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "clear": {
+                            "type": "boolean",
+                            "description": "Clear the cache after reading its metrics",
+                            "default": False,
+                        }
+                    },
+                },
+            ),
         ]
 
     def _validate_query(self, query: str) -> bool:
@@ -192,64 +373,25 @@ class BigQueryConnector:
                     )
                 ]
 
-            # Check cache first
-            cache_key = f"{query}:{max_results}"
-            if use_cache:
-                cached_result = self.cache.get(cache_key)
-                if cached_result:
-                    logger.info("Returning cached BigQuery result")
-                    return [
-                        TextContent(
-                            type="text",
-                            text=f"BigQuery Query Result (cached):\n{cached_result}",
-                        )
-                    ]
-
-            # Configure query job
-            job_config = bigquery.QueryJobConfig(
-                maximum_bytes_billed=100 * 1024 * 1024,  # 100MB limit
-                use_query_cache=True,
-                dry_run=False,
-            )
-
-            # Execute query
-            logger.info(f"Executing BigQuery query: {query[:100]}...")
-            query_job = self.client.query(query, job_config=job_config)
+            if not use_cache:
+                result_data = await self._run_query(query, max_results)
+                return [
+                    TextContent(type="text", text=f"BigQuery Query Result:\n{result_data}")
+                ]
 
-            # Get results with timeout
-            results = query_job.result(
-                timeout=self.config.timeout, max_results=max_results
+            # Identical concurrent queries share one BigQuery job
+            cache_key = f"{query}:{max_results}"
+            result_data, cached = await self.cache.get_or_load(
+                cache_key, lambda: self._run_query(query, max_results)
             )
-
-            # Convert results to JSON-serializable format
-            rows = []
-            for row in results:
-                row_dict = {}
-                for key, value in row.items():
-                    # Handle BigQuery data types
-                    if isinstance(value, datetime):
-                        row_dict[key] = value.isoformat()
-                    elif hasattr(value, "total_seconds"):  # timedelta
-                        row_dict[key] = value.total_seconds()
-                    else:
-                        row_dict[key] = value
-                rows.append(row_dict)
-
-            result_data = {
-                "rows": rows,
-                "total_rows": results.total_rows,
-                "schema": [
-                    {"name": field.name, "type": field.field_type}
-                    for field in results.schema
-                ],
-                "job_id": query_job.job_id,
-                "bytes_processed": query_job.total_bytes_processed,
-                "slot_millis": query_job.slot_millis,
-            }
-
-            # Cache the result
-            if use_cache:
-                self.cache.set(cache_key, result_data)
+            if cached:
+                logger.info("Returning cached BigQuery result")
+                return [
+                    TextContent(
+                        type="text",
+                        text=f"BigQuery Query Result (cached):\n{result_data}",
+                    )
+                ]
 
             return [
                 TextContent(type="text", text=f"BigQuery Query Result:\n{result_data}")
@@ -266,6 +408,63 @@ class BigQueryConnector:
                 )
             ]
 
+    async def _run_query(self, query: str, max_results: int) -> Dict[str, Any]:
+        """Run a query job off the event loop and return its serialised result."""
+        return await asyncio.to_thread(self._execute_query, query, max_results)
+
+    def _execute_query(self, query: str, max_results: int) -> Dict[str, Any]:
+        # Configure query job
+        job_config = bigquery.QueryJobConfig(
+            maximum_bytes_billed=100 * 1024 * 1024,  # 100MB limit
+            use_query_cache=True,
+            dry_run=False,
+        )
+
+        # Execute query
+        logger.info(f"Executing BigQuery query: {query[:100]}...")
+        query_job = self.client.query(query, job_config=job_config)
+
+        # Get results with timeout
+        results = query_job.result(
+            timeout=self.config.timeout, max_results=max_results
+        )
+
+        # Convert results to JSON-serializable format
+        rows = []
+        for row in results:
+            row_dict = {}
+            for key, value in row.items():
+                # Handle BigQuery data types
+                if isinstance(value, datetime):
+                    row_dict[key] = value.isoformat()
+                elif hasattr(value, "total_seconds"):  # timedelta
+                    row_dict[key] = value.total_seconds()
+                else:
+                    row_dict[key] = value
+            rows.append(row_dict)
+
+        return {
+            "rows": rows,
+            "total_rows": results.total_rows,
+            "schema": [
+                {"name": field.name, "type": field.field_type}
+                for field in results.schema
+            ],
+            "job_id": query_job.job_id,
+            "bytes_processed": query_job.total_bytes_processed,
+            "slot_millis": query_job.slot_millis,
+        }
+
+    async def handle_bigquery_cache_stats(
+        self, arguments: Dict[str, Any]
+    ) -> List[TextContent]:
+        """Handle query cache metrics requests."""
+        stats = self.cache.stats()
+        if arguments.get("clear", False):
+            self.cache.clear()
+            stats["cleared"] = True
+        return [TextContent(type="text", text=f"BigQuery Cache Stats:\n{stats}")]
+
     async def handle_bigquery_schema(
         self, arguments: Dict[str, Any]
     ) -> List[TextContent]:
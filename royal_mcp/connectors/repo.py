@@ -4,9 +4,11 @@ Provides secure read-only access to repository files and search functionality
 with Git integration and comprehensive file handling.
 """
 
+import asyncio
 import fnmatch
 import logging
 import os
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -14,6 +16,8 @@ import git
 from mcp.types import TextContent, Tool
 from pydantic import BaseModel, Field
 
+from .repo_index import RepoContentIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +44,13 @@ class RepoConfig(BaseModel):
         ],
         description="File patterns to exclude from searches",
     )
+    index_path: Optional[str] = Field(
+        default=None,
+        description="Content index file (defaults to the user cache directory)",
+    )
+    index_refresh_interval: float = Field(
+        default=5.0, description="Minimum seconds between content index refreshes"
+    )
 
 
 class RepoConnector:
@@ -47,7 +58,14 @@ class RepoConnector:
 
     def __init__(self):
         """Initialize the Repository connector."""
-        self.config = RepoConfig(root_path=os.environ["REPO_ROOT"])
+        self.config = RepoConfig(
+            root_path=os.environ["REPO_ROOT"],
+            index_path=os.environ.get("REPO_INDEX_PATH") or None,
+            index_refresh_interval=float(
+                os.environ.get("REPO_INDEX_REFRESH_INTERVAL", "5.0")
+            ),
+        )
+        self.content_index: Optional[RepoContentIndex] = None
 
         # Validate repository path
         self.repo_path = Path(self.config.root_path)
@@ -131,6 +149,11 @@ class RepoConnector:
                             "description": "Whether search should be case-sensitive",
                             "default": False,
                         },
+                        "regex": {
+                            "type": "boolean",
+                            "description": "Treat the query as a regular expression",
+                            "default": False,
+                        },
                         "max_results": {
                             "type": "integer",
                             "description": "Maximum number of matching files to return",
@@ -343,6 +366,23 @@ class RepoConnector:
                 )
             ]
 
+    def _get_index(self) -> RepoContentIndex:
+        """Content index, created on first use."""
+        if self.content_index is None:
+            index_path = (
+                Path(self.config.index_path)
+                if self.config.index_path
+                else RepoContentIndex.default_index_path(self.repo_path)
+            )
+            self.content_index = RepoContentIndex(
+                self.repo_path,
+                self._is_excluded,
+                self.config.max_file_size,
+                index_path=index_path,
+                refresh_interval=self.config.index_refresh_interval,
+            )
+        return self.content_index
+
     async def handle_repo_search_content(
         self, arguments: Dict[str, Any]
     ) -> List[TextContent]:
@@ -351,70 +391,37 @@ class RepoConnector:
             query = arguments.get("query", "").strip()
             file_patterns = arguments.get("file_patterns", ["*"])
             case_sensitive = arguments.get("case_sensitive", False)
+            regex = arguments.get("regex", False)
             max_results = arguments.get("max_results", 50)
 
             if not query:
                 return [TextContent(type="text", text="Error: query is required")]
 
-            # Prepare search query
-            search_query = query if case_sensitive else query.lower()
-
-            matches = []
-            files_searched = 0
-
-            for pattern in file_patterns:
-                for file_path in self.repo_path.rglob(pattern):
-                    if len(matches) >= max_results:
-                        break
-
-                    if file_path.is_file() and not self._is_excluded(file_path):
-                        files_searched += 1
-                        content = self._safe_read_file(file_path)
-
-                        if content and not content.startswith(
-                            "["
-                        ):  # Skip error messages
-                            search_content = (
-                                content if case_sensitive else content.lower()
-                            )
-
-                            if search_query in search_content:
-                                # Find line numbers with matches
-                                lines = content.split("\n")
-                                matching_lines = []
-
-                                for i, line in enumerate(lines, 1):
-                                    check_line = (
-                                        line if case_sensitive else line.lower()
-                                    )
-                                    if search_query in check_line:
-                                        matching_lines.append(
-                                            {
-                                                "line_number": i,
-                                                "content": line.strip()[
-                                                    :200
-                                                ],  # Limit line length
-                                            }
-                                        )
-
-                                relative_path = file_path.relative_to(self.repo_path)
-                                matches.append(
-                                    {
-                                        "path": str(relative_path),
-                                        "size": file_path.stat().st_size,
-                                        "matching_lines": matching_lines[
-                                            :10
-                                        ],  # Limit lines per file
-                                    }
-                                )
+            # The index narrows the search to files containing the query's
+            # trigrams; indexing and scanning run off the event loop
+            try:
+                search = await asyncio.to_thread(
+                    self._get_index().search,
+                    query,
+                    regex=regex,
+                    case_sensitive=case_sensitive,
+                    file_patterns=file_patterns,
+                    max_results=max_results,
+                )
+            except re.error as e:
+                return [
+                    TextContent(type="text", text=f"Error: Invalid regular expression: {e}")
+                ]
 
             result_data = {
                 "query": query,
+                "regex": regex,
                 "case_sensitive": case_sensitive,
                 "file_patterns": file_patterns,
-                "files_searched": files_searched,
-                "matches": matches,
-                "total_matches": len(matches),
+                "files_searched": search["files_searched"],
+                "indexed_files": search["indexed_files"],
+                "matches": search["matches"],
+                "total_matches": len(search["matches"]),
             }
 
             return [
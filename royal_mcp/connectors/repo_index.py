@@ -0,0 +1,373 @@
+"""Trigram content index for the repository connector.
+
+Every indexed file is reduced to the set of lowercase character trigrams it
+contains. A search first intersects the posting lists for the trigrams its
+query must contain, then reads and scans only those candidate files,
+stopping as soon as ``max_results`` files have matched.
+
+The index is persisted to disk and refreshed incrementally: a refresh stats
+the tree and re-reads only files whose mtime or size changed.
+"""
+
+import fnmatch
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+BINARY_SNIFF_BYTES = 8192
+
+# Inline flags such as (?x) or (?i:...) change how the rest of a pattern reads
+_INLINE_FLAGS = re.compile(r"\(\?[aiLmsux-]+[:)]")
+_OCTAL_DIGITS = "01234567"
+
+
+@dataclass
+class IndexedFile:
+    """Index entry for one file."""
+
+    mtime_ns: int
+    size: int
+    trigrams: frozenset
+
+
+def trigrams(text: str) -> Set[str]:
+    """Lowercase character trigrams of ``text``."""
+    text = text.lower()
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def required_literals(pattern: str) -> List[str]:
+    """Literal substrings any match of a regex must contain.
+
+    The extraction is conservative: alternations and inline flags yield
+    nothing, and only top-level literal runs that are not made optional by a
+    quantifier count.
+    """
+    if "|" in pattern or _INLINE_FLAGS.search(pattern):
+        return []
+
+    literals: List[str] = []
+    current: List[str] = []
+    depth = 0
+
+    def flush():
+        if len(current) >= 3:
+            literals.append("".join(current))
+        current.clear()
+
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            if depth == 0 and escaped and not escaped.isalnum():
+                current.append(escaped)
+            else:
+                flush()
+            i += _escape_length(pattern, i)
+            continue
+        if char == "[":
+            flush()
+            close = pattern.find("]", i + 2)
+            i = len(pattern) if close == -1 else close + 1
+            continue
+        if char in "*?{":
+            # The preceding atom may be absent
+            if current:
+                current.pop()
+            flush()
+            if char == "{":
+                close = pattern.find("}", i)
+                i = len(pattern) if close == -1 else close + 1
+            else:
+                i += 1
+            continue
+        if char == "(":
+            depth += 1
+            flush()
+        elif char == ")":
+            depth = max(0, depth - 1)
+            flush()
+        elif char in ".^$+":
+            flush()
+        elif depth == 0:
+            current.append(char)
+        i += 1
+
+    flush()
+    return literals
+
+
+def _escape_length(pattern: str, start: int) -> int:
+    """Length of the escape sequence starting with the backslash at ``start``."""
+    escaped = pattern[start + 1 : start + 2]
+    if escaped in ("x", "u", "U"):
+        return 2 + {"x": 2, "u": 4, "U": 8}[escaped]
+    if escaped == "N" and pattern[start + 2 : start + 3] == "{":
+        close = pattern.find("}", start)
+        return len(pattern) - start if close == -1 else close - start + 1
+    if escaped == "0":
+        # \0 plus up to two more octal digits
+        following = pattern[start + 2 : start + 4]
+        return 2 + len(following) - len(following.lstrip(_OCTAL_DIGITS))
+    if escaped.isdigit():
+        # Three octal digits are a character, otherwise a group reference of one or two digits
+        digits = pattern[start + 1 : start + 4]
+        if len(digits) == 3 and all(d in _OCTAL_DIGITS for d in digits):
+            return 4
+        return 3 if pattern[start + 2 : start + 3].isdigit() else 2
+    return 2
+
+
+class RepoContentIndex:
+    """Persistent, incrementally refreshed trigram index over a repository."""
+
+    def __init__(
+        self,
+        root: Path,
+        is_excluded: Callable[[Path], bool],
+        max_file_size: int,
+        index_path: Optional[Path] = None,
+        refresh_interval: float = 5.0,
+    ):
+        """
+        Args:
+            root: Repository root
+            is_excluded: Returns True for files and directories to skip
+            max_file_size: Files larger than this are not indexed
+            index_path: Where the index is persisted; None keeps it in memory
+            refresh_interval: Minimum seconds between refreshes of the tree
+        """
+        self.root = root
+        self.is_excluded = is_excluded
+        self.max_file_size = max_file_size
+        self.index_path = index_path
+        self.refresh_interval = refresh_interval
+
+        self.files: Dict[str, IndexedFile] = {}
+        self.postings: Dict[str, Set[str]] = {}
+        self.last_refresh = 0.0
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def default_index_path(root: Path) -> Path:
+        """Per-repository index file under the user's cache directory."""
+        digest = hashlib.sha1(str(root.resolve()).encode()).hexdigest()[:12]
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        return cache_dir / "royal_mcp" / f"repo_index-{digest}.json.gz"
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """Bring the index up to date with the working tree.
+
+        Only files whose mtime or size changed since they were indexed are
+        re-read.
+
+        Args:
+            force: Refresh even if the last refresh was recent
+
+        Returns:
+            Counts of added, updated and removed files
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if not force and time.monotonic() - self.last_refresh < self.refresh_interval:
+                return {"added": 0, "updated": 0, "removed": 0}
+
+            counts = {"added": 0, "updated": 0, "removed": 0}
+            seen: Set[str] = set()
+            for path, stat in self._walk():
+                rel_path = path.relative_to(self.root).as_posix()
+                seen.add(rel_path)
+                entry = self.files.get(rel_path)
+                if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                    continue
+                self._index_file(rel_path, path, stat)
+                counts["updated" if entry else "added"] += 1
+
+            for rel_path in set(self.files) - seen:
+                self._unindex(rel_path)
+                counts["removed"] += 1
+
+            self.last_refresh = time.monotonic()
+            if any(counts.values()):
+                logger.info(f"Repository index refreshed: {counts}")
+                self._save()
+            return counts
+
+    def search(
+        self,
+        query: str,
+        regex: bool = False,
+        case_sensitive: bool = False,
+        file_patterns: Optional[Iterable[str]] = None,
+        max_results: int = 50,
+        max_lines: int = 10,
+    ) -> Dict[str, Any]:
+        """Find files whose content matches ``query``.
+
+        Args:
+            query: Text or regular expression to search for
+            regex: Treat ``query`` as a regular expression
+            case_sensitive: Whether matching is case-sensitive
+            file_patterns: Glob patterns a file's name or path must match
+            max_results: Stop after this many matching files
+            max_lines: Matching lines reported per file
+
+        Returns:
+            Dict with the matches and the number of files scanned
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+        matcher = re.compile(query if regex else re.escape(query), flags)
+        literals = required_literals(query) if regex else [query]
+        patterns = [p for p in (file_patterns or []) if p not in ("*", "**/*")]
+
+        self.refresh()
+        with self._lock:
+            candidates = self._candidates(literals)
+
+        matches = []
+        files_searched = 0
+        for rel_path in sorted(candidates):
+            if len(matches) >= max_results:
+                break
+            if patterns and not any(
+                fnmatch.fnmatch(rel_path, p) or fnmatch.fnmatch(rel_path.rsplit("/", 1)[-1], p)
+                for p in patterns
+            ):
+                continue
+
+            path = self.root / rel_path
+            try:
+                content = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            files_searched += 1
+
+            matching_lines = []
+            for line_number, line in enumerate(content.split("\n"), 1):
+                if matcher.search(line):
+                    matching_lines.append({"line_number": line_number, "content": line.strip()[:200]})
+                    if len(matching_lines) >= max_lines:
+                        break
+            if matching_lines:
+                matches.append(
+                    {"path": rel_path, "size": len(content.encode("utf-8")), "matching_lines": matching_lines}
+                )
+
+        return {
+            "matches": matches,
+            "files_searched": files_searched,
+            "candidates": len(candidates),
+            "indexed_files": len(self.files),
+        }
+
+    def _candidates(self, literals: List[str]) -> Set[str]:
+        required: Set[str] = set()
+        for literal in literals:
+            required |= trigrams(literal)
+        if not required:
+            return {path for path, entry in self.files.items() if entry.trigrams}
+
+        # Intersect the rarest posting lists first
+        candidates: Optional[Set[str]] = None
+        for trigram in sorted(required, key=lambda t: len(self.postings.get(t, ()))):
+            postings = self.postings.get(trigram)
+            if not postings:
+                return set()
+            candidates = set(postings) if candidates is None else candidates & postings
+            if not candidates:
+                return set()
+        return candidates or set()
+
+    def _walk(self):
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            directory = Path(dirpath)
+            dirnames[:] = [d for d in dirnames if not self.is_excluded(directory / d)]
+            for filename in filenames:
+                path = directory / filename
+                if self.is_excluded(path):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                if stat.st_size <= self.max_file_size:
+                    yield path, stat
+
+    def _index_file(self, rel_path: str, path: Path, stat: os.stat_result):
+        self._unindex(rel_path)
+        grams: frozenset = frozenset()
+        try:
+            data = path.read_bytes()
+            if b"\0" not in data[:BINARY_SNIFF_BYTES]:
+                grams = frozenset(trigrams(data.decode("utf-8")))
+        except (OSError, UnicodeDecodeError):
+            pass  # Unreadable and binary files are tracked but never match
+
+        self.files[rel_path] = IndexedFile(stat.st_mtime_ns, stat.st_size, grams)
+        for trigram in grams:
+            self.postings.setdefault(trigram, set()).add(rel_path)
+
+    def _unindex(self, rel_path: str):
+        entry = self.files.pop(rel_path, None)
+        if entry is None:
+            return
+        for trigram in entry.trigrams:
+            postings = self.postings.get(trigram)
+            if postings is not None:
+                postings.discard(rel_path)
+                if not postings:
+                    del self.postings[trigram]
+
+    def _load(self):
+        self._loaded = True
+        if self.index_path is None or not self.index_path.exists():
+            return
+        try:
+            with gzip.open(self.index_path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION or data.get("root") != str(self.root.resolve()):
+                return
+            for rel_path, (mtime_ns, size, packed) in data["files"].items():
+                grams = frozenset(packed[i : i + 3] for i in range(0, len(packed), 3))
+                self.files[rel_path] = IndexedFile(mtime_ns, size, grams)
+                for trigram in grams:
+                    self.postings.setdefault(trigram, set()).add(rel_path)
+            logger.info(f"Loaded repository index with {len(self.files)} files")
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable repository index {self.index_path}: {e}")
+            self.files.clear()
+            self.postings.clear()
+
+    def _save(self):
+        if self.index_path is None:
+            return
+        data = {
+            "version": INDEX_VERSION,
+            "root": str(self.root.resolve()),
+            "files": {
+                rel_path: [entry.mtime_ns, entry.size, "".join(entry.trigrams)]
+                for rel_path, entry in self.files.items()
+            },
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(".tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not persist repository index: {e}")
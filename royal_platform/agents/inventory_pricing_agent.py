@@ -5,10 +5,13 @@ from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Dict, List
 
+from sqlalchemy.exc import SQLAlchemyError
+
 from ..connectors.shopify import ShopifyClient
 from ..core.agent_base import AgentConfig, AgentPriority, AgentResult, BaseAgent
-from ..database.models import AgentMessage, AgentRun, Order, Product, ResearchHistory
-from ..database.session import get_db_session
+from ..database.models import AgentMessage, AgentRun, Product, ResearchHistory
+from ..database.sales_rollup import query_variant_demand
+from ..database.session import get_db_session, run_db
 
 logger = logging.getLogger(__name__)
 
@@ -215,69 +218,37 @@ class InventoryPricingAgent(BaseAgent):
 
     async def _calculate_demand_patterns(self) -> Dict[str, Any]:
         """Calculate demand patterns from historical order data."""
+        return await run_db(self._load_demand_patterns)
+
+    def _load_demand_patterns(self) -> Dict[str, Any]:
+        """Aggregate 90 days of sales per variant in SQL; runs on the database thread pool."""
         demand_patterns = {}
 
         try:
             with get_db_session() as session:
-                # Get orders from the last 90 days
-                cutoff_date = datetime.now(timezone.utc) - timedelta(days=90)
-
-                orders = session.query(Order).filter(
-                    Order.created_at >= cutoff_date,
-                    Order.financial_status.in_(['paid', 'partially_paid', 'authorized'])
-                ).all()
-
-                # Calculate demand by product variant
-                variant_demand = {}
-                for order in orders:
-                    for line_item in order.line_items:
-                        if line_item.variant_id:
-                            variant_id = str(line_item.variant_id)
-                            if variant_id not in variant_demand:
-                                variant_demand[variant_id] = {
-                                    'total_quantity': 0,
-                                    'total_revenue': Decimal('0'),
-                                    'order_count': 0,
-                                    'daily_sales': {},
-                                    'sku': line_item.sku
-                                }
-
-                            variant_demand[variant_id]['total_quantity'] += line_item.quantity
-                            variant_demand[variant_id]['total_revenue'] += Decimal(str(line_item.price)) * line_item.quantity
-                            variant_demand[variant_id]['order_count'] += 1
-
-                            # Track daily sales
-                            order_date = order.created_at.date()
-                            if order_date not in variant_demand[variant_id]['daily_sales']:
-                                variant_demand[variant_id]['daily_sales'][order_date] = 0
-                            variant_demand[variant_id]['daily_sales'][order_date] += line_item.quantity
-
-                # Calculate demand statistics
-                for variant_id, demand_data in variant_demand.items():
-                    daily_sales = list(demand_data['daily_sales'].values())
-
-                    if daily_sales:
-                        avg_daily_demand = sum(daily_sales) / len(daily_sales)
-                        max_daily_demand = max(daily_sales)
-
-                        # Calculate demand velocity (trend)
-                        if len(daily_sales) >= 14:
-                            recent_avg = sum(daily_sales[-14:]) / 14  # Last 2 weeks
-                            older_avg = sum(daily_sales[:-14]) / (len(daily_sales) - 14)  # Earlier period
-                            demand_velocity = (recent_avg - older_avg) / max(older_avg, 1)
-                        else:
-                            demand_velocity = 0
-
-                        demand_patterns[variant_id] = {
-                            'avg_daily_demand': avg_daily_demand,
-                            'max_daily_demand': max_daily_demand,
-                            'total_quantity_90d': demand_data['total_quantity'],
-                            'total_revenue_90d': float(demand_data['total_revenue']),
-                            'order_frequency': demand_data['order_count'],
-                            'demand_velocity': demand_velocity,  # Positive = increasing, negative = decreasing
-                            'stock_turn_90d': demand_data['total_quantity'],  # Will calculate turn rate later
-                            'sku': demand_data['sku']
-                        }
+                cutoff_date = (datetime.now(timezone.utc) - timedelta(days=90)).date()
+                try:
+                    demand = query_variant_demand(session, cutoff_date)
+                except SQLAlchemyError as e:
+                    # Rollup tables not migrated yet: aggregate the line items instead
+                    self.logger.warning(f"Sales rollup unavailable, aggregating line items: {e}")
+                    session.rollback()
+                    demand = query_variant_demand(session, cutoff_date, use_rollup=False)
+
+                avg_daily = demand.avg_daily_demand
+                velocity = demand.velocity  # Positive = increasing, negative = decreasing
+                for i, variant_id in enumerate(demand.variant_ids):
+                    total_quantity = int(demand.total_quantity[i])
+                    demand_patterns[variant_id] = {
+                        'avg_daily_demand': float(avg_daily[i]),
+                        'max_daily_demand': int(demand.max_daily[i]),
+                        'total_quantity_90d': total_quantity,
+                        'total_revenue_90d': float(demand.total_revenue[i]),
+                        'order_frequency': int(demand.order_count[i]),
+                        'demand_velocity': float(velocity[i]),
+                        'stock_turn_90d': total_quantity,  # Will calculate turn rate later
+                        'sku': demand.skus[i]
+                    }
 
                 self.logger.info(f"Calculated demand patterns for {len(demand_patterns)} variants")
                 return demand_patterns
@@ -1,5 +1,6 @@
 """Shopify integration components."""
 
+from .bulk import ShopifyBulkOperationError
 from .client import ShopifyClient
 from .graphql_client import ShopifyConfig, ShopifyGraphQLClient
 from .rest_client import ShopifyRESTClient, ShopifyRESTConfig
@@ -47,6 +48,9 @@ __all__ = [
     "ProductUpdatePayload",
     "InventoryAdjustQuantitiesPayload",
 
+    # Errors
+    "ShopifyBulkOperationError",
+
     # Enums
     "ProductStatus",
     "FinancialStatus",
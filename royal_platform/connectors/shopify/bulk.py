@@ -0,0 +1,264 @@
+"""Shopify Bulk Operations support for full-catalog exports.
+
+A bulk operation runs a connection query server-side with no page limit and
+no rate-limit cost beyond submitting and polling it. The result is a JSONL
+file in which every node is one line; nested connection nodes (variants,
+line items) are separate lines that carry a ``__parentId`` and follow their
+parent. ``BulkResultAssembler`` regroups those lines one parent at a time so
+exports of any size are parsed in constant memory.
+"""
+
+import logging
+import re
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from .types import FinancialStatus, FulfillmentStatus, Order, Product
+
+logger = logging.getLogger(__name__)
+
+
+class ShopifyBulkOperationError(Exception):
+    """Raised when a bulk operation cannot be started or does not complete."""
+
+
+BULK_PRODUCTS_QUERY = """
+{
+    products%(filter)s {
+        edges {
+            node {
+                id
+                title
+                handle
+                description
+                descriptionHtml
+                vendor
+                productType
+                status
+                tags
+                createdAt
+                updatedAt
+                publishedAt
+                seo {
+                    title
+                    description
+                }
+                options {
+                    id
+                    name
+                    values
+                }
+                variants {
+                    edges {
+                        node {
+                            id
+                            sku
+                            barcode
+                            price
+                            compareAtPrice
+                            inventoryQuantity
+                            inventoryItem {
+                                id
+                            }
+                            title
+                            availableForSale
+                            createdAt
+                            updatedAt
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+BULK_ORDERS_QUERY = """
+{
+    orders%(filter)s {
+        edges {
+            node {
+                id
+                name
+                email
+                phone
+                currentTotalPriceSet { shopMoney { amount currencyCode } }
+                currentSubtotalPriceSet { shopMoney { amount } }
+                currentTotalTaxSet { shopMoney { amount } }
+                currentTotalDiscountsSet { shopMoney { amount } }
+                displayFinancialStatus
+                displayFulfillmentStatus
+                createdAt
+                updatedAt
+                processedAt
+                tags
+                note
+                customer {
+                    id
+                    email
+                    firstName
+                    lastName
+                    createdAt
+                    updatedAt
+                }
+                shippingAddress {
+                    firstName
+                    lastName
+                    company
+                    address1
+                    address2
+                    city
+                    province
+                    country
+                    zip
+                    phone
+                }
+                lineItems {
+                    edges {
+                        node {
+                            id
+                            title
+                            quantity
+                            currentQuantity
+                            unfulfilledQuantity
+                            sku
+                            variantTitle
+                            originalUnitPriceSet { shopMoney { amount } }
+                            discountedUnitPriceSet { shopMoney { amount } }
+                            originalTotalSet { shopMoney { amount currencyCode } }
+                            discountedTotalSet { shopMoney { amount currencyCode } }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+# Child lines are routed to a list field by the type in their global ID
+CHILD_FIELDS = {
+    "ProductVariant": "variants",
+    "ProductImage": "images",
+    "LineItem": "line_items",
+}
+
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def bulk_query(template: str, query_filter: Optional[str] = None) -> str:
+    """Fill a bulk query template with an optional search filter."""
+    if not query_filter:
+        return template % {"filter": ""}
+    escaped = query_filter.replace("\\", "\\\\").replace('"', '\\"')
+    filter_arg = f'(query: "{escaped}")'
+    return template % {"filter": filter_arg}
+
+
+def snake_case_keys(value: Any) -> Any:
+    """Recursively convert camelCase keys to the snake_case used by the models."""
+    if isinstance(value, dict):
+        return {_CAMEL_BOUNDARY.sub("_", k).lower(): snake_case_keys(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [snake_case_keys(v) for v in value]
+    return value
+
+
+def _gid_type(gid: str) -> str:
+    # gid://shopify/ProductVariant/123 -> ProductVariant
+    parts = gid.split("/")
+    return parts[3] if len(parts) > 3 else ""
+
+
+class BulkResultAssembler:
+    """Regroup bulk JSONL lines into ``(parent, children)`` records.
+
+    Feed decoded lines in file order; a record is returned once the next
+    top-level line shows that all of its children have been seen.
+    """
+
+    def __init__(self):
+        self._parent: Optional[Dict[str, Any]] = None
+        self._children: Dict[str, List[Dict[str, Any]]] = {}
+        self.orphans = 0
+
+    def feed(self, line: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], Dict[str, List[Dict[str, Any]]]]]:
+        parent_id = line.pop("__parentId", None)
+        if parent_id is None:
+            completed = self.finish()
+            self._parent = line
+            return completed
+
+        if self._parent is None or parent_id != self._parent.get("id"):
+            # Grandchildren and out-of-order lines are not part of the models
+            self.orphans += 1
+            return None
+
+        field = CHILD_FIELDS.get(_gid_type(line.get("id", "")), "children")
+        self._children.setdefault(field, []).append(line)
+        return None
+
+    def finish(self) -> Optional[Tuple[Dict[str, Any], Dict[str, List[Dict[str, Any]]]]]:
+        """Return the record still being assembled, if any."""
+        if self._parent is None:
+            return None
+        completed = (self._parent, self._children)
+        self._parent, self._children = None, {}
+        return completed
+
+
+def product_from_bulk(node: Dict[str, Any], children: Dict[str, List[Dict[str, Any]]]) -> Product:
+    """Build a ``Product`` from a bulk product line and its child lines."""
+    data = snake_case_keys(node)
+    variants = []
+    for variant in snake_case_keys(children.get("variants", [])):
+        inventory_item = variant.pop("inventory_item", None) or {}
+        variant["inventory_item_id"] = inventory_item.get("id")
+        variants.append(variant)
+    data["variants"] = variants
+    data["images"] = snake_case_keys(children.get("images", []))
+    return Product.model_validate(data)
+
+
+def _money(value: Optional[Dict[str, Any]]) -> Decimal:
+    if not value:
+        return Decimal("0")
+    return Decimal(str(value.get("shop_money", {}).get("amount", "0")))
+
+
+def _enum_value(enum_cls, value: Optional[str], aliases: Dict[str, str], default: str):
+    value = aliases.get(value or "", value or default)
+    return value if value in enum_cls._value2member_map_ else default
+
+
+def order_from_bulk(node: Dict[str, Any], children: Dict[str, List[Dict[str, Any]]]) -> Order:
+    """Build an ``Order`` from a bulk order line and its line item lines."""
+    data = snake_case_keys(node)
+    total = data.pop("current_total_price_set", None)
+
+    data.update({
+        "order_number": int(re.sub(r"\D", "", data.get("name", "")) or 0),
+        "current_total_price": _money(total),
+        "current_subtotal_price": _money(data.pop("current_subtotal_price_set", None)),
+        "current_total_tax": _money(data.pop("current_total_tax_set", None)),
+        "current_total_discounts": _money(data.pop("current_total_discounts_set", None)),
+        "currency_code": (total or {}).get("shop_money", {}).get("currency_code", "EUR"),
+        "financial_status": _enum_value(
+            FinancialStatus, data.pop("display_financial_status", None), {}, "PENDING"
+        ),
+        "fulfillment_status": _enum_value(
+            FulfillmentStatus, data.pop("display_fulfillment_status", None),
+            {"PARTIALLY_FULFILLED": "PARTIAL"}, "UNFULFILLED"
+        ),
+    })
+
+    line_items = []
+    for item in snake_case_keys(children.get("line_items", [])):
+        item["fulfillable_quantity"] = item.pop("unfulfilled_quantity", 0)
+        item["original_unit_price"] = _money(item.pop("original_unit_price_set", None))
+        item["discounted_unit_price"] = _money(item.pop("discounted_unit_price_set", None))
+        item.setdefault("current_quantity", item.get("quantity", 0))
+        line_items.append(item)
+    data["line_items"] = line_items
+
+    return Order.model_validate(data)
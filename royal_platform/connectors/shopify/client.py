@@ -1,9 +1,10 @@
 """Main Shopify client facade with GraphQL-first approach and REST fallback."""
 
 import asyncio
+import contextlib
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
 from .graphql_client import ShopifyConfig, ShopifyGraphQLClient
 from .rest_client import ShopifyRESTClient, ShopifyRESTConfig
@@ -206,34 +207,84 @@ class ShopifyClient:
             return await rest_client.delete_webhook(webhook_id)
 
     # Bulk operations with GraphQL efficiency
-    async def get_all_products(
+    async def _stream_pages(
+        self,
+        fetch_page: Callable[..., Awaitable[Any]],
+        query_filter: Optional[str],
+        batch_size: int
+    ) -> AsyncIterator[List[Any]]:
+        """Yield the nodes of each page while the next page is being fetched.
+
+        The request for page N+1 is started as soon as page N's cursor is
+        known, before page N is handed to the caller, so network time overlaps
+        with the caller's processing. Pacing comes from the GraphQL cost
+        tracker, which waits only when the bucket is actually short. At most
+        two pages are held in memory.
+        """
+        def request(cursor: Optional[str]) -> asyncio.Task:
+            return asyncio.ensure_future(
+                fetch_page(limit=batch_size, cursor=cursor, query_filter=query_filter)
+            )
+
+        pending: Optional[asyncio.Task] = request(None)
+        try:
+            while pending is not None:
+                connection = await pending
+                pending = None
+
+                # Prefetch the next page before yielding this one
+                if connection.page_info.has_next_page:
+                    pending = request(connection.page_info.end_cursor)
+
+                yield [edge.node for edge in connection.edges]
+        finally:
+            if pending is not None:
+                pending.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await pending
+
+    def iter_products(
         self,
         query_filter: Optional[str] = None,
         batch_size: int = 50
-    ) -> List[Product]:
-        """Get all products using efficient GraphQL pagination."""
-        all_products = []
-        cursor = None
+    ) -> AsyncIterator[List[Product]]:
+        """Stream all products page by page.
 
-        while True:
-            connection = await self.get_products(
-                limit=batch_size,
-                cursor=cursor,
-                query_filter=query_filter
-            )
+        Usage::
 
-            # Extract products from edges
-            products = [edge.node for edge in connection.edges]
-            all_products.extend(products)
+            async for products in client.iter_products():
+                ...
+        """
+        return self._stream_pages(self.get_products, query_filter, batch_size)
+
+    def iter_customers(
+        self,
+        query_filter: Optional[str] = None,
+        batch_size: int = 50
+    ) -> AsyncIterator[List[Customer]]:
+        """Stream all customers page by page."""
+        return self._stream_pages(self.get_customers, query_filter, batch_size)
 
-            # Check if there are more pages
-            if not connection.page_info.has_next_page:
-                break
+    def iter_orders(
+        self,
+        query_filter: Optional[str] = None,
+        batch_size: int = 50
+    ) -> AsyncIterator[List[Order]]:
+        """Stream all orders page by page."""
+        return self._stream_pages(self.get_orders, query_filter, batch_size)
 
-            cursor = connection.page_info.end_cursor
+    async def get_all_products(
+        self,
+        query_filter: Optional[str] = None,
+        batch_size: int = 50
+    ) -> List[Product]:
+        """Get all products using efficient GraphQL pagination.
 
-            # Rate limiting pause
-            await asyncio.sleep(0.1)
+        Prefer ``iter_products`` for large catalogs; this collects every page.
+        """
+        all_products = []
+        async for products in self.iter_products(query_filter, batch_size):
+            all_products.extend(products)
 
         logger.info(f"Retrieved {len(all_products)} products using GraphQL")
         return all_products
@@ -245,28 +296,9 @@ class ShopifyClient:
     ) -> List[Customer]:
         """Get all customers using efficient GraphQL pagination."""
         all_customers = []
-        cursor = None
-
-        while True:
-            connection = await self.get_customers(
-                limit=batch_size,
-                cursor=cursor,
-                query_filter=query_filter
-            )
-
-            # Extract customers from edges
-            customers = [edge.node for edge in connection.edges]
+        async for customers in self.iter_customers(query_filter, batch_size):
             all_customers.extend(customers)
 
-            # Check if there are more pages
-            if not connection.page_info.has_next_page:
-                break
-
-            cursor = connection.page_info.end_cursor
-
-            # Rate limiting pause
-            await asyncio.sleep(0.1)
-
         logger.info(f"Retrieved {len(all_customers)} customers using GraphQL")
         return all_customers
 
@@ -277,30 +309,23 @@ class ShopifyClient:
     ) -> List[Order]:
         """Get all orders using efficient GraphQL pagination."""
         all_orders = []
-        cursor = None
-
-        while True:
-            connection = await self.get_orders(
-                limit=batch_size,
-                cursor=cursor,
-                query_filter=query_filter
-            )
-
-            # Extract orders from edges
-            orders = [edge.node for edge in connection.edges]
+        async for orders in self.iter_orders(query_filter, batch_size):
             all_orders.extend(orders)
 
-            # Check if there are more pages
-            if not connection.page_info.has_next_page:
-                break
+        logger.info(f"Retrieved {len(all_orders)} orders using GraphQL")
+        return all_orders
 
-            cursor = connection.page_info.end_cursor
+    def export_products(self, query_filter: Optional[str] = None) -> AsyncIterator[Product]:
+        """Export the full catalog through a Shopify bulk operation.
 
-            # Rate limiting pause
-            await asyncio.sleep(0.1)
+        Suited to nightly syncs: one server-side job instead of thousands of
+        paginated requests against the rate-limit bucket.
+        """
+        return self.graphql.bulk_export_products(query_filter)
 
-        logger.info(f"Retrieved {len(all_orders)} orders using GraphQL")
-        return all_orders
+    def export_orders(self, query_filter: Optional[str] = None) -> AsyncIterator[Order]:
+        """Export all matching orders through a Shopify bulk operation."""
+        return self.graphql.bulk_export_orders(query_filter)
 
     # Health and introspection
     async def test_connection(self) -> Dict[str, Any]:
@@ -1,18 +1,29 @@
 """GraphQL-first Shopify connector with production-grade resilience."""
 
 import asyncio
+import json
 import logging
 import os
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, TypeVar
 
 import httpx
 from pydantic import BaseModel, Field
 
+from .bulk import (
+    BULK_ORDERS_QUERY,
+    BULK_PRODUCTS_QUERY,
+    BulkResultAssembler,
+    ShopifyBulkOperationError,
+    bulk_query,
+    order_from_bulk,
+    product_from_bulk,
+)
 from .types import (
     CustomerConnection,
     InventoryAdjustQuantitiesPayload,
+    Order,
     OrderConnection,
     Product,
     ProductConnection,
@@ -22,6 +33,10 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+BULK_TERMINAL_STATUSES = {"COMPLETED", "FAILED", "CANCELED", "EXPIRED"}
+
 
 class ShopifyConfig(BaseModel):
     """Configuration for Shopify GraphQL client."""
@@ -32,6 +47,8 @@ class ShopifyConfig(BaseModel):
     timeout: int = Field(default=30, description="Request timeout in seconds")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
     rate_limit_buffer: float = Field(default=0.1, description="Rate limit buffer (10%)")
+    bulk_poll_interval: float = Field(default=2.0, description="Seconds between bulk operation status checks")
+    bulk_timeout: int = Field(default=3600, description="Maximum seconds to wait for a bulk operation")
 
     @property
     def graphql_endpoint(self) -> str:
@@ -40,7 +57,13 @@ class ShopifyConfig(BaseModel):
 
 
 class GraphQLCostTracker:
-    """Track GraphQL query costs and manage rate limiting."""
+    """Track GraphQL query costs and manage rate limiting.
+
+    Mirrors Shopify's leaky bucket: points restore continuously at
+    ``restore_rate`` and every response's ``throttleStatus`` resyncs the local
+    estimate. Capacity for a query is reserved before it is sent, so
+    concurrent requests cannot overdraw the bucket.
+    """
 
     def __init__(self, max_cost_per_second: int = 50):
         self.max_cost_per_second = max_cost_per_second
@@ -48,23 +71,29 @@ class GraphQLCostTracker:
         self.restore_rate = 50  # Points restored per second
         self.last_update = time.time()
         self.bucket_capacity = 1000
-        self.current_bucket = 1000
+        self.current_bucket = 1000.0
 
     def can_execute(self, estimated_cost: int) -> bool:
         """Check if query can be executed within cost limits."""
         self._update_bucket()
-        return self.current_bucket >= estimated_cost
+        return self.current_bucket >= min(estimated_cost, self.bucket_capacity)
 
-    def record_cost(self, actual_cost: int, throttle_status: Optional[Dict] = None) -> None:
-        """Record actual query cost and update bucket."""
+    def record_cost(self, actual_cost: int, throttle_status: Optional[Dict] = None, reserved: int = 0) -> None:
+        """Record actual query cost and update bucket.
+
+        Args:
+            actual_cost: Points the query actually consumed
+            throttle_status: ``throttleStatus`` from the response extensions
+            reserved: Points reserved for the query by ``wait_for_capacity``
+        """
         self._update_bucket()
-        self.current_bucket -= actual_cost
+        self.current_bucket += reserved - actual_cost
 
-        # Update from throttle status if available
+        # Update from throttle status if available (Shopify reports camelCase keys)
         if throttle_status:
-            self.current_bucket = throttle_status.get("currently_available", self.current_bucket)
-            self.bucket_capacity = throttle_status.get("maximum_available", self.bucket_capacity)
-            self.restore_rate = throttle_status.get("restore_rate", self.restore_rate)
+            self.current_bucket = float(_status_value(throttle_status, "currentlyAvailable", self.current_bucket))
+            self.bucket_capacity = _status_value(throttle_status, "maximumAvailable", self.bucket_capacity)
+            self.restore_rate = _status_value(throttle_status, "restoreRate", self.restore_rate)
 
     def _update_bucket(self) -> None:
         """Update cost bucket based on time elapsed."""
@@ -72,16 +101,30 @@ class GraphQLCostTracker:
         time_elapsed = now - self.last_update
         self.last_update = now
 
-        # Restore points based on time elapsed
-        restored_points = int(time_elapsed * self.restore_rate)
+        # Restore points based on time elapsed (kept fractional so frequent
+        # checks do not round the restoration away)
+        restored_points = time_elapsed * self.restore_rate
         self.current_bucket = min(self.bucket_capacity, self.current_bucket + restored_points)
 
+    def seconds_until_available(self, required_cost: int) -> float:
+        """Seconds until ``required_cost`` points are available."""
+        self._update_bucket()
+        missing = min(required_cost, self.bucket_capacity) - self.current_bucket
+        return max(0.0, missing / self.restore_rate) if self.restore_rate else 1.0
+
     async def wait_for_capacity(self, required_cost: int) -> None:
-        """Wait until enough capacity is available."""
+        """Wait until enough capacity is available, then reserve it."""
         while not self.can_execute(required_cost):
-            wait_time = (required_cost - self.current_bucket) / self.restore_rate
+            wait_time = self.seconds_until_available(required_cost)
             logger.info(f"Rate limit reached, waiting {wait_time:.2f}s for capacity")
-            await asyncio.sleep(min(wait_time, 1.0))
+            await asyncio.sleep(min(max(wait_time, 0.01), 1.0))
+        self.current_bucket -= required_cost
+
+
+def _status_value(throttle_status: Dict[str, Any], key: str, default: Any) -> Any:
+    """Read a throttle status field given in camelCase or snake_case."""
+    snake = "".join(f"_{c.lower()}" if c.isupper() else c for c in key)
+    return throttle_status.get(key, throttle_status.get(snake, default))
 
 
 class CircuitBreaker:
@@ -189,7 +232,7 @@ class ShopifyGraphQLClient:
                 if cost_info:
                     actual_cost = cost_info.get("actualQueryCost", estimated_cost)
                     throttle_status = cost_info.get("throttleStatus", {})
-                    self.cost_tracker.record_cost(actual_cost, throttle_status)
+                    self.cost_tracker.record_cost(actual_cost, throttle_status, reserved=estimated_cost)
 
                     logger.debug(f"Query cost: {actual_cost}, bucket: {self.cost_tracker.current_bucket}")
 
@@ -334,6 +377,7 @@ class ShopifyGraphQLClient:
             if "images" in node and isinstance(node["images"], dict):
                 node["images"] = self._extract_nodes_from_connection(node["images"])
 
+        return ProductConnection.model_validate(products_data)
 
     @staticmethod
     def _extract_nodes_from_connection(connection: dict) -> list:
@@ -341,7 +385,6 @@ class ShopifyGraphQLClient:
         if not isinstance(connection, dict) or "edges" not in connection:
             return []
         return [edge["node"] for edge in connection["edges"]]
-        return ProductConnection.model_validate(products_data)
 
     async def get_product_by_id(self, product_id: str) -> Optional[Product]:
         """Get a single product by ID."""
@@ -639,6 +682,148 @@ class ShopifyGraphQLClient:
             response["data"]["inventoryAdjustQuantities"]
         )
 
+    # Bulk operations
+    async def run_bulk_query(self, query: str) -> Optional[str]:
+        """Run a bulk query to completion and return the result file URL.
+
+        Args:
+            query: Connection query without pagination arguments
+
+        Returns:
+            URL of the JSONL result, or None if the query matched nothing
+
+        Raises:
+            ShopifyBulkOperationError: If the operation is rejected, fails or
+                does not finish within ``bulk_timeout``
+        """
+        mutation = """
+        mutation BulkOperationRunQuery($query: String!) {
+            bulkOperationRunQuery(query: $query) {
+                bulkOperation {
+                    id
+                    status
+                }
+                userErrors {
+                    field
+                    message
+                }
+            }
+        }
+        """
+
+        response = await self.execute_mutation(mutation, {"query": query}, estimated_cost=10)
+        payload = response["data"]["bulkOperationRunQuery"]
+        if payload.get("userErrors"):
+            raise ShopifyBulkOperationError(f"Bulk operation rejected: {payload['userErrors']}")
+
+        operation_id = payload["bulkOperation"]["id"]
+        logger.info(f"Started bulk operation {operation_id}")
+
+        deadline = time.monotonic() + self.config.bulk_timeout
+        while True:
+            operation = await self.get_bulk_operation(operation_id)
+            status = operation.get("status")
+            if status in BULK_TERMINAL_STATUSES:
+                break
+            if time.monotonic() >= deadline:
+                await self.cancel_bulk_operation(operation_id)
+                raise ShopifyBulkOperationError(f"Bulk operation {operation_id} timed out in status {status}")
+            await asyncio.sleep(self.config.bulk_poll_interval)
+
+        if status != "COMPLETED":
+            raise ShopifyBulkOperationError(
+                f"Bulk operation {operation_id} {status.lower()}: {operation.get('errorCode')}"
+            )
+
+        logger.info(f"Bulk operation {operation_id} completed with {operation.get('objectCount')} objects")
+        return operation.get("url")
+
+    async def get_bulk_operation(self, operation_id: str) -> Dict[str, Any]:
+        """Get the status of a bulk operation."""
+        query = """
+        query BulkOperation($id: ID!) {
+            node(id: $id) {
+                ... on BulkOperation {
+                    id
+                    status
+                    errorCode
+                    objectCount
+                    url
+                    partialDataUrl
+                }
+            }
+        }
+        """
+
+        response = await self.execute_query(query, {"id": operation_id}, estimated_cost=1)
+        return response["data"]["node"] or {}
+
+    async def cancel_bulk_operation(self, operation_id: str) -> None:
+        """Request cancellation of a running bulk operation."""
+        mutation = """
+        mutation BulkOperationCancel($id: ID!) {
+            bulkOperationCancel(id: $id) {
+                bulkOperation {
+                    id
+                    status
+                }
+                userErrors {
+                    field
+                    message
+                }
+            }
+        }
+        """
+
+        try:
+            await self.execute_mutation(mutation, {"id": operation_id}, estimated_cost=10)
+        except Exception as e:
+            logger.warning(f"Failed to cancel bulk operation {operation_id}: {e}")
+
+    async def iter_bulk_results(self, url: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the objects of a bulk result file one line at a time."""
+        # The result URL is pre-signed; the access token must not be sent to it
+        async with self.client.stream("GET", url) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line.strip():
+                    yield json.loads(line)
+
+    async def _bulk_export(
+        self,
+        query: str,
+        build: Callable[[Dict[str, Any], Dict[str, List[Dict[str, Any]]]], T]
+    ) -> AsyncIterator[T]:
+        url = await self.run_bulk_query(query)
+        if url is None:
+            return
+
+        assembler = BulkResultAssembler()
+        async for line in self.iter_bulk_results(url):
+            record = assembler.feed(line)
+            if record is not None:
+                yield build(*record)
+
+        record = assembler.finish()
+        if record is not None:
+            yield build(*record)
+        if assembler.orphans:
+            logger.warning(f"Skipped {assembler.orphans} bulk result lines without a parent in the export")
+
+    def bulk_export_products(self, query_filter: Optional[str] = None) -> AsyncIterator[Product]:
+        """Export every matching product with its variants through a bulk operation.
+
+        Usage::
+
+            async for product in client.bulk_export_products():
+                ...
+        """
+        return self._bulk_export(bulk_query(BULK_PRODUCTS_QUERY, query_filter), product_from_bulk)
+
+    def bulk_export_orders(self, query_filter: Optional[str] = None) -> AsyncIterator[Order]:
+        """Export every matching order with its line items through a bulk operation."""
+        return self._bulk_export(bulk_query(BULK_ORDERS_QUERY, query_filter), order_from_bulk)
+
     async def close(self) -> None:
         """Close the HTTP client."""
         await self.client.aclose()
@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 
 from ..database.models import AgentRun, AgentStatus
-from ..database.session import get_db_session
+from ..database.session import get_db_session, run_db
 
 
 class AgentPriority(int, Enum):
@@ -123,9 +123,7 @@ class BaseAgent(ABC):
         )
 
         try:
-            with get_db_session() as session:
-                session.add(run_record)
-                session.commit()
+            await run_db(self._record_run_started, run_record)
 
             self.logger.info(f"Starting agent {self.config.name} execution (run_id: {self.current_run_id})")
 
@@ -141,20 +139,7 @@ class BaseAgent(ABC):
             result.execution_time_seconds = execution_time
 
             # Update run record
-            with get_db_session() as session:
-                run_record = session.get(AgentRun, uuid.UUID(self.current_run_id))
-                if run_record:
-                    run_record.status = AgentStatus.ACTIVE if result.success else AgentStatus.ERROR
-                    run_record.completed_at = end_time
-                    run_record.duration_seconds = int(execution_time)
-                    run_record.actions_taken = result.actions_taken
-                    run_record.items_processed = result.items_processed
-                    run_record.errors_count = len(result.errors)
-                    run_record.logs = {"result": result.model_dump()}
-                    run_record.agent_metadata = result.metadata
-                    if result.errors:
-                        run_record.error_details = "; ".join(result.errors)
-                    session.commit()
+            await run_db(self._record_run_finished, result, end_time, execution_time)
 
             if result.success:
                 self.logger.info(
@@ -174,13 +159,7 @@ class BaseAgent(ABC):
             self.logger.error(error_msg)
 
             # Update run record with timeout
-            with get_db_session() as session:
-                run_record = session.get(AgentRun, uuid.UUID(self.current_run_id))
-                if run_record:
-                    run_record.status = AgentStatus.ERROR
-                    run_record.completed_at = datetime.now(timezone.utc)
-                    run_record.error_details = error_msg
-                    session.commit()
+            await run_db(self._record_run_error, error_msg)
 
             return AgentResult(success=False, errors=[error_msg])
 
@@ -189,47 +168,74 @@ class BaseAgent(ABC):
             self.logger.exception(error_msg)
 
             # Update run record with error
-            with get_db_session() as session:
-                run_record = session.get(AgentRun, uuid.UUID(self.current_run_id))
-                if run_record:
-                    run_record.status = AgentStatus.ERROR
-                    run_record.completed_at = datetime.now(timezone.utc)
-                    run_record.error_details = str(e)
-                    session.commit()
+            await run_db(self._record_run_error, str(e))
 
             return AgentResult(success=False, errors=[error_msg])
 
+    # Run tracking. These execute on the database thread pool via run_db.
+    def _record_run_started(self, run_record: AgentRun) -> None:
+        with get_db_session() as session:
+            session.add(run_record)
+            session.commit()
+
+    def _record_run_finished(self, result: AgentResult, end_time: datetime, execution_time: float) -> None:
+        with get_db_session() as session:
+            run_record = session.get(AgentRun, uuid.UUID(self.current_run_id))
+            if run_record:
+                run_record.status = AgentStatus.ACTIVE if result.success else AgentStatus.ERROR
+                run_record.completed_at = end_time
+                run_record.duration_seconds = int(execution_time)
+                run_record.actions_taken = result.actions_taken
+                run_record.items_processed = result.items_processed
+                run_record.errors_count = len(result.errors)
+                run_record.logs = {"result": result.model_dump()}
+                run_record.agent_metadata = result.metadata
+                if result.errors:
+                    run_record.error_details = "; ".join(result.errors)
+                session.commit()
+
+    def _record_run_error(self, error_details: str) -> None:
+        with get_db_session() as session:
+            run_record = session.get(AgentRun, uuid.UUID(self.current_run_id))
+            if run_record:
+                run_record.status = AgentStatus.ERROR
+                run_record.completed_at = datetime.now(timezone.utc)
+                run_record.error_details = error_details
+                session.commit()
+
     async def _check_rate_limits(self) -> bool:
         """Check if agent can run within rate limits."""
         try:
-            with get_db_session() as session:
-                now = datetime.now(timezone.utc)
+            return await run_db(self._within_rate_limits)
+        except Exception as e:
+            self.logger.error(f"Error checking rate limits: {e}")
+            return True  # Allow execution on error to avoid blocking
 
-                # Check hourly limit
-                hourly_runs = session.query(AgentRun).filter(
-                    AgentRun.agent_name == self.config.name,
-                    AgentRun.started_at >= now - timedelta(hours=1)
-                ).count()
+    def _within_rate_limits(self) -> bool:
+        with get_db_session() as session:
+            now = datetime.now(timezone.utc)
 
-                if hourly_runs >= self.config.max_runs_per_hour:
-                    self.logger.warning(f"Agent {self.config.name} exceeded hourly rate limit")
-                    return False
+            # Check hourly limit
+            hourly_runs = session.query(AgentRun).filter(
+                AgentRun.agent_name == self.config.name,
+                AgentRun.started_at >= now - timedelta(hours=1)
+            ).count()
 
-                # Check daily limit
-                daily_runs = session.query(AgentRun).filter(
-                    AgentRun.agent_name == self.config.name,
-                    AgentRun.started_at >= now - timedelta(days=1)
-                ).count()
+            if hourly_runs >= self.config.max_runs_per_hour:
+                self.logger.warning(f"Agent {self.config.name} exceeded hourly rate limit")
+                return False
 
-                if daily_runs >= self.config.max_runs_per_day:
-                    self.logger.warning(f"Agent {self.config.name} exceeded daily rate limit")
-                    return False
+            # Check daily limit
+            daily_runs = session.query(AgentRun).filter(
+                AgentRun.agent_name == self.config.name,
+                AgentRun.started_at >= now - timedelta(days=1)
+            ).count()
 
-                return True
+            if daily_runs >= self.config.max_runs_per_day:
+                self.logger.warning(f"Agent {self.config.name} exceeded daily rate limit")
+                return False
 
-        except Exception as e:
-            self.logger.error(f"Error checking rate limits: {e}")
-            return True  # Allow execution on error to avoid blocking
+            return True
 
     def should_retry(self, result: AgentResult, attempt: int) -> bool:
         """
@@ -2,10 +2,17 @@
 
 from .base import Base
 from .models import *
-from .session import get_session, init_db
+from .sales_rollup import query_variant_demand, rebuild_variant_sales_daily, record_order_sales
+from .session import get_db_session, get_session, init_db, run_db, run_in_session
 
 __all__ = [
     "Base",
+    "get_db_session",
     "get_session",
     "init_db",
+    "query_variant_demand",
+    "rebuild_variant_sales_daily",
+    "record_order_sales",
+    "run_db",
+    "run_in_session",
 ]
@@ -6,6 +6,7 @@ from enum import Enum
 from sqlalchemy import (
     Boolean,
     Column,
+    Date,
     DateTime,
     ForeignKey,
     Index,
@@ -251,6 +252,33 @@ class OrderLineItem(Base):
     )
 
 
+class VariantSalesDaily(Base):
+    """Daily sales rollup per variant, maintained from order ingestion."""
+    __tablename__ = "variant_sales_daily"
+
+    variant_id = Column(UUID(as_uuid=True), ForeignKey("product_variants.id"), primary_key=True)
+    sale_date = Column(Date, primary_key=True)
+    sku = Column(String(100))
+
+    quantity = Column(Integer, nullable=False, default=0)
+    revenue = Column(Numeric(12, 2), nullable=False, default=0)
+    order_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index('ix_variant_sales_daily_sale_date', 'sale_date'),
+    )
+
+
+class SalesRollupCoverage(Base):
+    """First day from which a sales rollup is complete."""
+    __tablename__ = "sales_rollup_coverage"
+
+    rollup = Column(String(100), primary_key=True)
+    covered_since = Column(Date, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+
+
 class WebhookOutbox(Base):
     """Webhook events processing queue."""
     __tablename__ = "webhook_outbox"
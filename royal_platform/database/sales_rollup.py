@@ -0,0 +1,296 @@
+"""Set-based sales aggregation and the ``variant_sales_daily`` rollup.
+
+Demand analysis used to load every order with its line items and aggregate in
+Python. Here the database does the work instead:
+
+- ``daily_variant_sales`` is a GROUP BY variant/day over line items
+- ``refresh_variant_sales_daily`` recomputes the rollup for the days touched by
+  ingested orders; recomputing a whole day keeps it correct when an order is
+  updated or refunded, and costs only that day's line items
+- session hooks call it on commit for every order or line item written
+  through the ORM, so ingestion keeps the rollup current without extra calls
+- ``rebuild_variant_sales_daily`` backfills a window and records in
+  ``sales_rollup_coverage`` the first day the rollup is complete from; the
+  rollup is only read for windows it fully covers
+- ``query_variant_demand`` computes per-variant demand statistics, including
+  recent-vs-older velocity via a window function, in a single query and
+  returns them as compact arrays
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+from sqlalchemy import Select, case, delete, distinct, event, func, inspect, insert, select
+from sqlalchemy.orm import Session
+
+from .models import Order, OrderLineItem, SalesRollupCoverage, VariantSalesDaily
+
+logger = logging.getLogger(__name__)
+
+# Orders counted as demand
+SALES_STATUSES = ('paid', 'partially_paid', 'authorized')
+
+# Sale days considered "recent" when computing demand velocity
+RECENT_SALE_DAYS = 14
+
+ROLLUP_NAME = 'variant_sales_daily'
+
+# Session.info keys for orders written since the last commit
+_PENDING_ORDER_IDS = 'sales_rollup_order_ids'
+_PENDING_DAYS = 'sales_rollup_days'
+
+
+def daily_variant_sales(since: Optional[Union[date, datetime]] = None,
+                        days: Optional[Iterable[date]] = None) -> Select:
+    """Select per-variant, per-day sales aggregated from order line items.
+
+    Columns: ``variant_id, sale_date, sku, quantity, revenue, order_count``.
+
+    Args:
+        since: Only include orders created at or after this time
+        days: Only include orders created on these days
+    """
+    sale_date = func.date(Order.created_at)
+    query = (
+        select(
+            OrderLineItem.variant_id.label('variant_id'),
+            sale_date.label('sale_date'),
+            func.max(OrderLineItem.sku).label('sku'),
+            func.sum(OrderLineItem.quantity).label('quantity'),
+            func.sum(OrderLineItem.price * OrderLineItem.quantity).label('revenue'),
+            func.count(distinct(OrderLineItem.order_id)).label('order_count'),
+        )
+        .join(Order, OrderLineItem.order_id == Order.id)
+        .where(
+            OrderLineItem.variant_id.is_not(None),
+            Order.financial_status.in_(SALES_STATUSES),
+        )
+        .group_by(OrderLineItem.variant_id, sale_date)
+    )
+    if since is not None:
+        query = query.where(Order.created_at >= since)
+    if days is not None:
+        query = query.where(sale_date.in_(list(days)))
+    return query
+
+
+def refresh_variant_sales_daily(session: Session, days: Iterable[date]) -> int:
+    """Recompute the rollup rows for ``days`` from the line items.
+
+    Call this from order ingestion with the creation day of every inserted or
+    updated order. The caller commits.
+
+    Returns:
+        Number of rollup rows written
+    """
+    days = sorted(set(days))
+    if not days:
+        return 0
+
+    session.execute(delete(VariantSalesDaily).where(VariantSalesDaily.sale_date.in_(days)))
+    source = daily_variant_sales(days=days).subquery()
+    result = session.execute(
+        insert(VariantSalesDaily).from_select(
+            ['variant_id', 'sale_date', 'sku', 'quantity', 'revenue', 'order_count'],
+            select(
+                source.c.variant_id,
+                source.c.sale_date,
+                source.c.sku,
+                source.c.quantity,
+                source.c.revenue,
+                source.c.order_count,
+            ),
+        )
+    )
+    return result.rowcount or 0
+
+
+def _sale_day(created_at: Optional[Union[date, datetime]]) -> Optional[date]:
+    return created_at.date() if isinstance(created_at, datetime) else created_at
+
+
+def record_order_sales(session: Session, orders: Iterable[Order]) -> int:
+    """Update the rollup for freshly ingested or updated orders."""
+    days = {_sale_day(order.created_at) for order in orders}
+    days.discard(None)
+    return refresh_variant_sales_daily(session, days)
+
+
+def rebuild_variant_sales_daily(session: Session, since: date) -> int:
+    """Backfill the rollup for every day from ``since`` onwards."""
+    session.execute(delete(VariantSalesDaily).where(VariantSalesDaily.sale_date >= since))
+    source = daily_variant_sales(since=datetime.combine(since, datetime.min.time())).subquery()
+    result = session.execute(
+        insert(VariantSalesDaily).from_select(
+            ['variant_id', 'sale_date', 'sku', 'quantity', 'revenue', 'order_count'],
+            select(source),
+        )
+    )
+    rows = result.rowcount or 0
+
+    coverage = session.get(SalesRollupCoverage, ROLLUP_NAME)
+    if coverage is None:
+        session.add(SalesRollupCoverage(rollup=ROLLUP_NAME, covered_since=since))
+    elif since < coverage.covered_since:
+        coverage.covered_since = since
+    session.flush()
+
+    logger.info(f"Rebuilt variant_sales_daily since {since}: {rows} rows")
+    return rows
+
+
+def rollup_available(session: Session, since: date) -> bool:
+    """Whether the rollup is complete for the whole window starting at ``since``.
+
+    Rows alone do not tell: incremental refreshes fill in only the days that
+    saw orders, so the rollup counts as complete only from the day a rebuild
+    started at.
+    """
+    covered_since = session.scalar(
+        select(SalesRollupCoverage.covered_since).where(SalesRollupCoverage.rollup == ROLLUP_NAME)
+    )
+    return covered_since is not None and covered_since <= since
+
+
+@event.listens_for(Session, 'after_flush')
+def _track_order_writes(session: Session, flush_context) -> None:
+    """Remember the orders whose sales changed in this flush."""
+    order_ids = session.info.setdefault(_PENDING_ORDER_IDS, set())
+    days = session.info.setdefault(_PENDING_DAYS, set())
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Order):
+            state = inspect(obj)
+            # Deleted orders cannot be looked up at commit; moved ones leave their old day behind
+            created_at = state.attrs.created_at
+            days.update(_sale_day(value) for value in created_at.history.deleted)
+            if obj in session.deleted:
+                days.add(_sale_day(state.dict.get('created_at')))
+            else:
+                order_ids.add(obj.id)
+        elif isinstance(obj, OrderLineItem):
+            order_id = inspect(obj).attrs.order_id
+            order_ids.update(order_id.history.deleted)
+            order_ids.add(obj.order_id)
+    order_ids.discard(None)
+    days.discard(None)
+
+
+@event.listens_for(Session, 'before_commit')
+def _refresh_rollup_on_commit(session: Session) -> None:
+    """Refresh the rollup for the days of orders written in this transaction."""
+    # Commit flushes only after this hook, so pick up unflushed orders first
+    session.flush()
+    order_ids = session.info.pop(_PENDING_ORDER_IDS, set())
+    days = session.info.pop(_PENDING_DAYS, set())
+    if not order_ids and not days:
+        return
+
+    if order_ids:
+        created = session.scalars(select(Order.created_at).where(Order.id.in_(order_ids)))
+        days.update(_sale_day(created_at) for created_at in created)
+        days.discard(None)
+    refresh_variant_sales_daily(session, days)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_order_writes(session: Session) -> None:
+    session.info.pop(_PENDING_ORDER_IDS, None)
+    session.info.pop(_PENDING_DAYS, None)
+
+
+@dataclass
+class VariantDemand:
+    """Per-variant demand statistics as parallel arrays."""
+    variant_ids: List[str]
+    skus: List[Optional[str]]
+    sales_days: np.ndarray
+    total_quantity: np.ndarray
+    max_daily: np.ndarray
+    total_revenue: np.ndarray
+    order_count: np.ndarray
+    recent_avg: np.ndarray
+    older_avg: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.variant_ids)
+
+    @property
+    def avg_daily_demand(self) -> np.ndarray:
+        """Average quantity per day with sales."""
+        return self.total_quantity / np.maximum(self.sales_days, 1)
+
+    @property
+    def velocity(self) -> np.ndarray:
+        """Relative change of recent vs older daily demand (0 without older history)."""
+        has_history = self.sales_days > RECENT_SALE_DAYS
+        return np.where(has_history, (self.recent_avg - self.older_avg) / np.maximum(self.older_avg, 1), 0.0)
+
+
+def query_variant_demand(session: Session, since: date, use_rollup: Optional[bool] = None) -> VariantDemand:
+    """Aggregate demand per variant since ``since`` in one query.
+
+    Args:
+        session: Database session
+        since: First day of the window
+        use_rollup: Read ``variant_sales_daily`` (True) or aggregate line items
+            directly (False); by default the rollup is used when it has data
+
+    Returns:
+        VariantDemand with one entry per variant that sold in the window
+    """
+    if use_rollup is None:
+        use_rollup = rollup_available(session, since)
+
+    if use_rollup:
+        daily = (
+            select(
+                VariantSalesDaily.variant_id,
+                VariantSalesDaily.sale_date,
+                VariantSalesDaily.sku,
+                VariantSalesDaily.quantity,
+                VariantSalesDaily.revenue,
+                VariantSalesDaily.order_count,
+            )
+            .where(VariantSalesDaily.sale_date >= since)
+            .subquery()
+        )
+    else:
+        daily = daily_variant_sales(since=datetime.combine(since, datetime.min.time())).subquery()
+
+    ranked = select(
+        daily,
+        func.row_number().over(partition_by=daily.c.variant_id, order_by=daily.c.sale_date.desc()).label('rn'),
+    ).subquery()
+
+    rows = session.execute(
+        select(
+            ranked.c.variant_id,
+            func.max(ranked.c.sku),
+            func.count(),
+            func.sum(ranked.c.quantity),
+            func.max(ranked.c.quantity),
+            func.sum(ranked.c.revenue),
+            func.sum(ranked.c.order_count),
+            func.avg(case((ranked.c.rn <= RECENT_SALE_DAYS, ranked.c.quantity))),
+            func.avg(case((ranked.c.rn > RECENT_SALE_DAYS, ranked.c.quantity))),
+        ).group_by(ranked.c.variant_id)
+    ).all()
+
+    def column(index: int) -> np.ndarray:
+        return np.array([float(r[index]) if r[index] is not None else 0.0 for r in rows], dtype=float)
+
+    return VariantDemand(
+        variant_ids=[str(r[0]) for r in rows],
+        skus=[r[1] for r in rows],
+        sales_days=column(2),
+        total_quantity=column(3),
+        max_daily=column(4),
+        total_revenue=column(5),
+        order_count=column(6),
+        recent_avg=column(7),
+        older_avg=column(8),
+    )
@@ -1,12 +1,29 @@
-"""Database session management."""
+"""Database session management.
 
+Sessions are synchronous. Coroutines must not use them directly, since every
+query would block the event loop and stall all other agents. They offload the
+work instead with ``run_db`` or ``run_in_session``, which run it on a thread
+pool sized to the engine's connection pool.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Callable, Generator, Optional, TypeVar
 
 from sqlalchemy.orm import Session
 
 from .base import Base, SessionLocal, engine
 
+T = TypeVar("T")
+
+_db_executor: Optional[ThreadPoolExecutor] = None
+_db_executor_lock = threading.Lock()
+
 
 def init_db() -> None:
     """Initialize database - create all tables."""
@@ -30,3 +47,64 @@ def get_db_session() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+
+
+def _default_db_workers() -> int:
+    pool = engine.pool
+    size = getattr(pool, "size", lambda: 5)()
+    overflow = max(getattr(pool, "_max_overflow", 0), 0)
+    return size + overflow
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs blocking database work.
+
+    Sized to the connection pool (env ``DB_THREADPOOL_SIZE`` overrides it), so
+    each worker can hold a connection without waiting on pool checkout.
+    """
+    global _db_executor
+    with _db_executor_lock:
+        if _db_executor is None:
+            workers = int(os.getenv("DB_THREADPOOL_SIZE", "0")) or _default_db_workers()
+            _db_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db")
+        return _db_executor
+
+
+def shutdown_db_executor(wait: bool = True) -> None:
+    """Shut down the database thread pool; it is recreated on next use."""
+    global _db_executor
+    with _db_executor_lock:
+        executor, _db_executor = _db_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+async def run_db(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking database callable without blocking the event loop.
+
+    Args:
+        fn: Callable that performs the database work
+        *args: Positional arguments for ``fn``
+        **kwargs: Keyword arguments for ``fn``
+
+    Returns:
+        The callable's result
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, fn, *args, **kwargs)
+    return await loop.run_in_executor(get_db_executor(), call)
+
+
+async def run_in_session(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``fn(session, *args, **kwargs)`` as one transaction off the event loop.
+
+    The session is committed if ``fn`` returns and rolled back if it raises.
+    Return plain values rather than ORM instances, which are expired once the
+    session closes.
+    """
+    def unit_of_work() -> T:
+        with get_db_session() as session:
+            return fn(session, *args, **kwargs)
+
+    return await run_db(unit_of_work)
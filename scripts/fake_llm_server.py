@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Fake OpenAI-compatible LLM server for local benchmarking.
+
+Serves ``POST /v1/chat/completions`` with a configurable artificial latency and
+canned pricing answers, so the AI pricing pipeline can be load-tested without
+spending tokens.
+
+Usage:
+    python scripts/fake_llm_server.py --port 8765 --latency 0.8
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=fake python ...
+
+    # Start the server and reprice 5,000 fake SKUs through AIPricingService
+    python scripts/fake_llm_server.py --benchmark 5000 --latency 0.8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import time
+import uuid
+
+from aiohttp import web
+
+PRODUCT_HEADER = re.compile(r"^### Product (\S+)", re.MULTILINE)
+CURRENT_PRICE = re.compile(r"Current Price: \$([0-9.]+)")
+
+
+def _answer_for(prompt: str) -> str:
+    """Build a plausible single-product answer."""
+    match = CURRENT_PRICE.search(prompt)
+    if match:
+        price = float(match.group(1)) * random.uniform(0.95, 1.05)
+        return (
+            f"Recommended price: ${price:.2f}. Confidence: {random.uniform(0.6, 0.95):.2f}. "
+            "Competitive positioning with low risk."
+        )
+    return (
+        "Market trend: stable. Moderate price sensitivity. "
+        "High competition; competitive positioning recommended."
+    )
+
+
+def build_completion(prompt: str) -> str:
+    """Answer a single or batched prompt in the format the pricing service expects."""
+    products = PRODUCT_HEADER.findall(prompt)
+    if not products:
+        return _answer_for(prompt)
+
+    sections = re.split(r"^### Product \S+", prompt, flags=re.MULTILINE)[1:]
+    return json.dumps({pid: _answer_for(section) for pid, section in zip(products, sections)})
+
+
+def create_app(latency: float, jitter: float) -> web.Application:
+    """Create the fake server application."""
+    stats = {"requests": 0, "in_flight": 0, "peak_in_flight": 0}
+
+    async def chat_completions(request: web.Request) -> web.Response:
+        body = await request.json()
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        stats["peak_in_flight"] = max(stats["peak_in_flight"], stats["in_flight"])
+        try:
+            await asyncio.sleep(max(0.0, latency + random.uniform(-jitter, jitter)))
+        finally:
+            stats["in_flight"] -= 1
+
+        prompt = "\n".join(m.get("content", "") for m in body.get("messages", []) if m.get("role") == "user")
+        content = build_completion(prompt)
+        return web.json_response({
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake-model"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": len(prompt) // 4,
+                "completion_tokens": len(content) // 4,
+                "total_tokens": (len(prompt) + len(content)) // 4,
+            },
+        })
+
+    async def get_stats(request: web.Request) -> web.Response:
+        return web.json_response(stats)
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    app.router.add_get("/stats", get_stats)
+    return app
+
+
+async def run_benchmark(port: int, sku_count: int) -> None:
+    """Reprice ``sku_count`` fake products through AIPricingService against the fake server."""
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from orchestrator.services.ai_pricing_service import AIPricingService
+
+    service = AIPricingService("fake-key", base_url=f"http://127.0.0.1:{port}/v1")
+    products = [
+        {
+            "product_id": f"SKU-{i:05d}",
+            "current_price": round(random.uniform(10, 200), 2),
+            "competitor_prices": {"amazon": round(random.uniform(10, 200), 2)},
+        }
+        for i in range(sku_count)
+    ]
+
+    started = time.perf_counter()
+    recommendations = await service.reprice_products(products)
+    elapsed = time.perf_counter() - started
+
+    print(f"Repriced {len(recommendations)}/{sku_count} SKUs in {elapsed:.2f}s")
+    print(json.dumps(service.get_gateway_stats(), indent=2))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds per completion")
+    parser.add_argument("--jitter", type=float, default=0.1, help="Random +/- latency in seconds")
+    parser.add_argument("--benchmark", type=int, metavar="SKUS", help="Run a repricing benchmark and exit")
+    args = parser.parse_args()
+
+    runner = web.AppRunner(create_app(args.latency, args.jitter))
+    await runner.setup()
+    site = web.TCPSite(runner, args.host, args.port)
+    await site.start()
+    print(f"Fake LLM server listening on http://{args.host}:{args.port}/v1")
+
+    try:
+        if args.benchmark:
+            await run_benchmark(args.port, args.benchmark)
+        else:
+            await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
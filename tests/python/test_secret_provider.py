@@ -285,6 +285,108 @@ class TestUnifiedSecretResolver:
         assert cache_latency >= 0
 
 
+class CountingProvider:
+    """Provider that counts lookups and can be made slow or failing."""
+    name = "CountingProvider"
+
+    def __init__(self, secrets=None, delay=0.0):
+        self.secrets = secrets or {}
+        self.delay = delay
+        self.calls = 0
+        self.fail = False
+
+    async def get(self, key: str):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("vault unreachable")
+        value = self.secrets.get(key)
+        if not value:
+            return None
+        return SecretResult(key=key, value=value, source=SecretSource.EXTERNAL, fetched_at=time.time())
+
+
+class TestResolverCaching:
+    """Test single-flight, refresh-ahead, stale serving and prefetch."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_lookup(self):
+        provider = CountingProvider({"API_KEY": "value"}, delay=0.02)
+        resolver = UnifiedSecretResolver(providers=[provider], encryption_key=b"test-key-32-chars-for-testing!!!")
+
+        results = await asyncio.gather(*(resolver.get_secret("API_KEY") for _ in range(10)))
+
+        assert {r.value for r in results} == {"value"}
+        assert provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_refreshes_ahead_of_expiry(self):
+        provider = CountingProvider({"API_KEY": "old"})
+        resolver = UnifiedSecretResolver(
+            providers=[provider], cache_ttl=0.1, refresh_ahead=0.5,
+            encryption_key=b"test-key-32-chars-for-testing!!!"
+        )
+        await resolver.get_secret("API_KEY")
+        provider.secrets["API_KEY"] = "new"
+        await asyncio.sleep(0.07)
+
+        # Served from cache while the refresh runs in the background
+        result = await resolver.get_secret("API_KEY")
+        assert result.source == SecretSource.CACHE and result.value == "old"
+
+        await asyncio.sleep(0.01)
+        assert provider.calls == 2
+        assert (await resolver.get_secret("API_KEY")).value == "new"
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_value_while_providers_fail(self):
+        provider = CountingProvider({"API_KEY": "value"})
+        resolver = UnifiedSecretResolver(
+            providers=[provider], cache_ttl=0.05, max_stale=60,
+            encryption_key=b"test-key-32-chars-for-testing!!!"
+        )
+        await resolver.get_secret("API_KEY")
+        await asyncio.sleep(0.06)
+        provider.fail = True
+
+        result = await resolver.get_secret("API_KEY")
+        assert result.source == SecretSource.CACHE and result.value == "value"
+
+        # A secret that is gone (not an outage) is evicted
+        provider.fail = False
+        provider.secrets.clear()
+        await asyncio.sleep(0.06)
+        with pytest.raises(SecretNotFoundError):
+            await resolver.get_secret("API_KEY")
+        assert "API_KEY" not in resolver.cache
+
+    @pytest.mark.asyncio
+    async def test_hot_cache_skips_decryption(self, monkeypatch):
+        resolver = UnifiedSecretResolver(
+            providers=[CountingProvider({"API_KEY": "value"})], hot_cache=True,
+            encryption_key=b"test-key-32-chars-for-testing!!!"
+        )
+        await resolver.get_secret("API_KEY")
+        decrypt = Mock(side_effect=AssertionError("decrypted on hit"))
+        monkeypatch.setattr(resolver, "_decrypt", decrypt)
+
+        assert (await resolver.get_secret("API_KEY")).value == "value"
+        assert resolver.get_cached("API_KEY") == "value"
+        assert "cipher" in resolver.cache["API_KEY"]["data"]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_resolves_keys_concurrently(self):
+        provider = CountingProvider({"A": "1", "B": "2"}, delay=0.05)
+        resolver = UnifiedSecretResolver(providers=[provider], encryption_key=b"test-key-32-chars-for-testing!!!")
+
+        started = time.monotonic()
+        values = await resolver.prefetch(["A", "B", "MISSING", "A"])
+
+        assert values == {"A": "1", "B": "2"}
+        assert time.monotonic() - started < 0.12
+        assert resolver.get_cached("B") == "2"
+
+
 class TestSecretResult:
     """Test SecretResult object behavior."""
 
@@ -1,10 +1,14 @@
 """Tests for the new GraphQL-first Shopify connector."""
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
-from royal_platform.connectors.shopify import ShopifyClient, ShopifyConfig
+from royal_platform.connectors.shopify import ShopifyBulkOperationError, ShopifyClient, ShopifyConfig
+from royal_platform.connectors.shopify.graphql_client import GraphQLCostTracker
 from royal_platform.connectors.shopify.types import Product, ProductConnection
 
 
@@ -266,6 +270,217 @@ class TestShopifyClient:
         await client.close()
 
 
+    @pytest.mark.asyncio
+    async def test_streaming_prefetches_next_page(self, mock_config):
+        """Test that page N+1 is requested before page N is processed."""
+        client = ShopifyClient(config=mock_config)
+        events = []
+
+        def page(n, has_next):
+            edge = {"cursor": f"c{n}", "node": {
+                "id": f"gid://shopify/Product/{n}", "title": f"Product {n}", "handle": f"p-{n}",
+                "status": "ACTIVE", "created_at": "2024-01-01T00:00:00Z", "updated_at": "2024-01-01T00:00:00Z",
+            }}
+            return ProductConnection.model_validate({
+                "edges": [edge],
+                "page_info": {"has_next_page": has_next, "has_previous_page": n > 1, "end_cursor": f"c{n}"},
+            })
+
+        async def fetch(first, after, query_filter):
+            n = 1 if after is None else int(after[1:]) + 1
+            events.append(f"fetch {n}")
+            await asyncio.sleep(0)
+            return page(n, n < 3)
+
+        with patch.object(client.graphql, 'get_products', side_effect=fetch):
+            titles = []
+            async for products in client.iter_products(batch_size=1):
+                await asyncio.sleep(0)  # caller does async work with the page
+                events.append(f"processed {products[0].title[-1]}")
+                titles.extend(p.title for p in products)
+
+        assert titles == ["Product 1", "Product 2", "Product 3"]
+        assert events.index("fetch 2") < events.index("processed 1")
+        assert events.index("fetch 3") < events.index("processed 2")
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_cancels_prefetch(self, mock_config):
+        """Test that breaking out of a stream cancels the in-flight request."""
+        client = ShopifyClient(config=mock_config)
+        started = asyncio.Event()
+        cancelled = []
+
+        async def fetch(first, after, query_filter):
+            if after is None:
+                return ProductConnection.model_validate({
+                    "edges": [],
+                    "page_info": {"has_next_page": True, "has_previous_page": False, "end_cursor": "c1"},
+                })
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(after)
+                raise
+
+        with patch.object(client.graphql, 'get_products', side_effect=fetch):
+            stream = client.iter_products()
+            async for _ in stream:
+                await started.wait()
+                break
+            await stream.aclose()
+
+        assert cancelled == ["c1"]
+
+        await client.close()
+
+
+class TestGraphQLCostTracker:
+    """Test cost-based pacing."""
+
+    @pytest.mark.asyncio
+    async def test_reserves_capacity_and_syncs_throttle_status(self):
+        tracker = GraphQLCostTracker()
+        tracker.current_bucket = 120.0
+
+        await tracker.wait_for_capacity(100)
+        assert tracker.can_execute(100) is False
+        assert tracker.seconds_until_available(100) > 1.0
+
+        tracker.record_cost(
+            40,
+            {"maximumAvailable": 2000.0, "currentlyAvailable": 1500.0, "restoreRate": 100.0},
+            reserved=100,
+        )
+        assert tracker.bucket_capacity == 2000.0
+        assert tracker.restore_rate == 100.0
+        assert tracker.can_execute(1000)
+
+
+class BulkFixtureServer:
+    """Stands in for Shopify's GraphQL endpoint and the bulk result storage."""
+
+    RESULT_URL = "https://storage.example.com/bulk/result.jsonl"
+
+    def __init__(self, lines, final_status="COMPLETED", polls_before_done=2):
+        self.lines = lines
+        self.final_status = final_status
+        self.polls_before_done = polls_before_done
+        self.polls = 0
+        self.downloads = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url == self.RESULT_URL:
+            self.downloads.append(dict(request.headers))
+            body = "\n".join(json.dumps(line) for line in self.lines) + "\n"
+            return httpx.Response(200, text=body)
+
+        payload = json.loads(request.content)
+        if "bulkOperationRunQuery" in payload["query"]:
+            assert "first:" not in payload["variables"]["query"]
+            return httpx.Response(200, json={"data": {"bulkOperationRunQuery": {
+                "bulkOperation": {"id": "gid://shopify/BulkOperation/1", "status": "CREATED"},
+                "userErrors": [],
+            }}})
+
+        self.polls += 1
+        done = self.polls > self.polls_before_done
+        return httpx.Response(200, json={"data": {"node": {
+            "id": "gid://shopify/BulkOperation/1",
+            "status": self.final_status if done else "RUNNING",
+            "errorCode": None if self.final_status == "COMPLETED" else "INTERNAL_SERVER_ERROR",
+            "objectCount": str(len(self.lines)),
+            "url": self.RESULT_URL if done and self.final_status == "COMPLETED" else None,
+        }}})
+
+    def client(self) -> ShopifyClient:
+        config = ShopifyConfig(shop_name="test-shop", access_token="test-token", bulk_poll_interval=0)
+        client = ShopifyClient(config=config)
+        client.graphql.client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return client
+
+
+def _variant_line(product, n):
+    return {
+        "id": f"gid://shopify/ProductVariant/{product}{n}", "sku": f"SKU-{product}-{n}", "price": "19.99",
+        "inventoryQuantity": n, "inventoryItem": {"id": f"gid://shopify/InventoryItem/{product}{n}"},
+        "createdAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-01-01T00:00:00Z",
+        "__parentId": f"gid://shopify/Product/{product}",
+    }
+
+
+class TestBulkOperations:
+    """Test bulk exports against a local fixture server."""
+
+    @pytest.mark.asyncio
+    async def test_exports_products_with_variants(self):
+        lines = []
+        for product in (1, 2, 3):
+            lines.append({
+                "id": f"gid://shopify/Product/{product}", "title": f"Product {product}", "handle": f"p-{product}",
+                "status": "ACTIVE", "productType": "Gear", "createdAt": "2024-01-01T00:00:00Z",
+                "updatedAt": "2024-01-01T00:00:00Z",
+            })
+            lines.extend(_variant_line(product, n) for n in range(product))
+        server = BulkFixtureServer(lines)
+        client = server.client()
+
+        products = [p async for p in client.export_products(query_filter="status:active")]
+
+        assert [p.title for p in products] == ["Product 1", "Product 2", "Product 3"]
+        assert [len(p.variants) for p in products] == [1, 2, 3]
+        assert products[2].variants[1].sku == "SKU-3-1"
+        assert products[2].variants[1].inventory_item_id == "gid://shopify/InventoryItem/31"
+        assert products[0].product_type == "Gear"
+        assert server.polls == 3
+        assert "x-shopify-access-token" not in server.downloads[0]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_exports_orders_with_line_items(self):
+        money = {"shopMoney": {"amount": "42.50", "currencyCode": "EUR"}}
+        lines = [
+            {
+                "id": "gid://shopify/Order/1", "name": "#1001", "currentTotalPriceSet": money,
+                "currentSubtotalPriceSet": money, "currentTotalTaxSet": {"shopMoney": {"amount": "0"}},
+                "currentTotalDiscountsSet": {"shopMoney": {"amount": "0"}},
+                "displayFinancialStatus": "PAID", "displayFulfillmentStatus": "PARTIALLY_FULFILLED",
+                "createdAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-01-01T00:00:00Z",
+            },
+            {
+                "id": "gid://shopify/LineItem/11", "title": "Widget", "quantity": 2, "currentQuantity": 2,
+                "unfulfilledQuantity": 1, "originalUnitPriceSet": {"shopMoney": {"amount": "21.25"}},
+                "discountedUnitPriceSet": {"shopMoney": {"amount": "21.25"}},
+                "originalTotalSet": money, "discountedTotalSet": money,
+                "__parentId": "gid://shopify/Order/1",
+            },
+        ]
+        client = BulkFixtureServer(lines).client()
+
+        orders = [o async for o in client.export_orders()]
+
+        assert len(orders) == 1
+        assert orders[0].order_number == 1001
+        assert str(orders[0].current_total_price) == "42.50"
+        assert orders[0].fulfillment_status.value == "PARTIAL"
+        assert orders[0].line_items[0].fulfillable_quantity == 1
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_operation_raises(self):
+        client = BulkFixtureServer([], final_status="FAILED").client()
+
+        with pytest.raises(ShopifyBulkOperationError, match="failed"):
+            async for _ in client.export_orders():
+                pass
+
+        await client.close()
+
+
 class TestShopifyTypes:
     """Test Pydantic type validation."""
 
@@ -0,0 +1,103 @@
+"""Unit tests for incremental agent execution metrics."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.agent_metrics import AgentMetricsAggregator, AgentStats, TDigest
+from app.services.realtime_agent_monitor import RealTimeAgentMonitor
+
+
+class TestTDigest:
+    """Test quantile accuracy and merging."""
+
+    def test_quantiles_match_exact_percentiles(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(0, 1) for _ in range(20000)]
+        digest = TDigest()
+        for value in values:
+            digest.add(value)
+
+        ordered = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            exact = ordered[int(q * len(ordered))]
+            assert digest.quantile(q) == pytest.approx(exact, rel=0.03)
+        assert len(digest._means) <= 2 * digest.compression
+
+    def test_merged_digests_equal_a_single_stream(self):
+        left, right = TDigest(), TDigest()
+        for value in range(1, 1001):
+            (left if value % 2 else right).add(float(value))
+        left.merge(right)
+
+        assert len(left) == 1000
+        assert left.quantile(0.5) == pytest.approx(500, rel=0.02)
+        assert left.quantile(0) == 1 and left.quantile(1) == 1000
+        assert TDigest().quantile(0.5) is None
+
+
+class TestAgentStats:
+    """Test the sliding window."""
+
+    def test_window_drops_old_hours(self):
+        now = datetime(2024, 1, 2, 12, 30, tzinfo=timezone.utc)
+        stats = AgentStats(window_hours=24)
+        stats.record("failed", None, now - timedelta(hours=30))
+        for minutes in range(48):
+            stats.record("completed", 2.0, now - timedelta(minutes=minutes * 10))
+
+        snapshot = stats.snapshot(now)
+
+        assert snapshot["total_executions"] == 49
+        assert snapshot["failed_executions"] == 1
+        assert snapshot["window_executions"] == 48
+        assert snapshot["error_rate_percent"] == 0
+        assert snapshot["throughput_per_hour"] == 2
+        assert snapshot["p95_execution_time_seconds"] == pytest.approx(2.0)
+
+
+class TestAgentMetricsAggregator:
+    """Test event recording and seeding."""
+
+    def test_seed_skips_executions_reported_live(self):
+        aggregator = AgentMetricsAggregator()
+        before = aggregator.created_at - timedelta(minutes=5)
+        after = aggregator.created_at + timedelta(seconds=1)
+        aggregator.record_execution("pricing", "completed", 1.0, after)
+
+        loaded = aggregator.seed([
+            {"agent_type": "pricing", "status": "completed", "duration_seconds": 3.0,
+             "completed_at": before.isoformat(), "queued_at": before.isoformat()},
+            {"agent_type": "pricing", "status": "completed", "duration_seconds": 1.0,
+             "completed_at": after.isoformat(), "queued_at": after.isoformat()},
+            {"agent_type": "pricing", "status": "running", "duration_seconds": None,
+             "completed_at": None, "queued_at": before.isoformat()},
+        ])
+
+        assert loaded == 1
+        assert aggregator.seeded
+        assert aggregator.snapshot("pricing", after)["total_executions"] == 2
+
+
+class TestRealTimeAgentMonitor:
+    """Test that the monitor reads aggregated metrics."""
+
+    @pytest.mark.asyncio
+    async def test_health_metrics_come_from_the_aggregator(self):
+        monitor = RealTimeAgentMonitor()
+        monitor.aggregator = AgentMetricsAggregator()
+        monitor.aggregator.seeded = True
+        for i in range(100):
+            status = "failed" if i % 10 == 0 else "completed"
+            monitor.aggregator.record_execution("inventory", status, float(i % 10 + 1))
+
+        await monitor._collect_agent_metrics()
+        metrics = (await monitor.get_agent_status())["inventory"]
+
+        assert metrics["total_executions"] == 100
+        assert metrics["failed_executions"] == 10
+        assert metrics["error_rate_percent"] == pytest.approx(10)
+        assert metrics["status"] == "active"
+        assert 2 <= metrics["p50_execution_time_seconds"] <= 8
+        assert metrics["p99_execution_time_seconds"] == pytest.approx(10, rel=0.05)
@@ -0,0 +1,32 @@
+"""Unit tests for the streaming AI assistant endpoint."""
+
+import json
+
+from flask import Flask
+
+from app.blueprints import ai_assistant
+
+
+def test_disconnect_closes_upstream_stream(monkeypatch):
+    closed = []
+
+    async def streaming_response(message, include_status):
+        try:
+            for i in range(100):
+                yield {"type": "content", "data": i}
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(ai_assistant.control_center_assistant, "is_enabled", lambda: True)
+    monkeypatch.setattr(ai_assistant.control_center_assistant, "get_streaming_response", streaming_response)
+    app = Flask(__name__)
+    app.register_blueprint(ai_assistant.assistant_bp)
+
+    response = app.test_client().post("/api/aria/chat/stream", json={"message": "hi"}, buffered=False)
+    first = next(iter(response.response))
+    assert json.loads(first[len(b"data: "):]) == {"type": "content", "data": 0}
+
+    # The client goes away after the first chunk
+    response.close()
+
+    assert closed == [True]
@@ -0,0 +1,222 @@
+"""Unit tests for the async LLM gateway and batched AI pricing."""
+
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeCompletions:
+    """Minimal async stand-in for ``client.chat.completions``."""
+
+    def __init__(self, latency: float = 0.05):
+        self.latency = latency
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def create(self, model, messages, temperature, max_tokens):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+        prompt = messages[-1]["content"]
+        products = re.findall(r"^### Product (\S+)", prompt, re.MULTILINE)
+        if products:
+            content = json.dumps({
+                pid: "Recommended price: $19.99. Confidence: 0.80. Stable market, low risk."
+                for pid in products
+            })
+        else:
+            content = "Recommended price: $19.99. Confidence: 0.80. Stable market, low risk."
+
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5),
+        )
+
+
+def _fake_client(latency: float = 0.05):
+    completions = FakeCompletions(latency)
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions)), completions
+
+
+class TestLLMGateway:
+    """Test concurrency limits and timeouts in the LLM gateway."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        from orchestrator.services.llm_gateway import LLMGateway, LLMRequest
+
+        client, completions = _fake_client()
+        gateway = LLMGateway("key", max_concurrency=3, client=client)
+
+        requests = [LLMRequest(messages=[{"role": "user", "content": "hi"}]) for _ in range(10)]
+        results = await gateway.complete_many(requests)
+
+        assert len(results) == 10
+        assert completions.peak_in_flight == 3
+        assert gateway.get_stats()["completed"] == 10
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_enforced(self):
+        from orchestrator.services.llm_gateway import LLMGateway
+
+        client, _ = _fake_client(latency=1.0)
+        gateway = LLMGateway("key", timeout=0.05, client=client)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await gateway.complete([{"role": "user", "content": "hi"}])
+
+        assert gateway.get_stats()["timeouts"] == 1
+
+
+class TestAIPricingServiceBatching:
+    """Test that repricing groups products into batched LLM requests."""
+
+    @pytest.mark.asyncio
+    async def test_reprice_products_batches_requests(self):
+        from orchestrator.services.ai_pricing_service import AIPricingService
+        from orchestrator.services.llm_gateway import LLMGateway
+
+        client, completions = _fake_client()
+        gateway = LLMGateway("key", max_concurrency=4, client=client)
+        service = AIPricingService("key", batch_size=10, gateway=gateway)
+
+        products = [
+            {"product_id": f"SKU-{i}", "current_price": 20.0, "competitor_prices": {"amazon": 21.0}}
+            for i in range(25)
+        ]
+        recommendations = await service.reprice_products(products)
+
+        assert set(recommendations) == {p["product_id"] for p in products}
+        # 3 analysis batches + 3 recommendation batches instead of 50 single calls
+        assert completions.calls == 6
+        assert recommendations["SKU-0"].recommended_price == pytest.approx(19.99)
+
+    def test_analysis_prompt_is_stable_as_history_grows(self):
+        from orchestrator.services.ai_pricing_service import AIPricingService
+        from orchestrator.services.llm_gateway import LLMGateway
+
+        client, _ = _fake_client()
+        service = AIPricingService("key", gateway=LLMGateway("key", client=client))
+        prompt = lambda points: service._build_market_analysis_prompt(
+            AIPricingService._build_market_data("SKU-1", {"amazon": 21.0}, [{"price": 20.0}] * points)
+        )
+
+        assert prompt(12) == prompt(13)
+        assert prompt(0) != prompt(12)
+
+    def test_analysis_prompt_carries_market_sentiment(self):
+        from orchestrator.services.ai_pricing_service import AIPricingService
+        from orchestrator.services.llm_gateway import LLMGateway
+
+        client, _ = _fake_client()
+        service = AIPricingService("key", gateway=LLMGateway("key", client=client))
+        prompt = lambda score: service._build_market_analysis_prompt(
+            AIPricingService._build_market_data("SKU-1", {"amazon": 21.0}, [], {
+                "sentiment": "positive", "sentiment_score": score, "trend": "rising",
+                "volatility": 0.32, "risk_factors": ["supply delays"],
+            })
+        )
+
+        assert "Trend: rising" in prompt(0.61)
+        assert "Risk Factors: supply delays" in prompt(0.61)
+        assert prompt(0.61) == prompt(0.63)
+        assert prompt(0.61) != prompt(-0.2)
+
+    @pytest.mark.asyncio
+    async def test_empty_catalog_makes_no_llm_calls(self):
+        from orchestrator.services.ai_pricing_service import AIPricingService
+        from orchestrator.services.llm_gateway import LLMGateway
+
+        client, completions = _fake_client()
+        service = AIPricingService("key", gateway=LLMGateway("key", client=client))
+
+        assert await service.reprice_products([], market_context={"trend": "stable"}) == {}
+        assert completions.calls == 0
+
+    def test_parse_batch_response_handles_code_fences(self):
+        from orchestrator.services.ai_pricing_service import AIPricingService
+
+        text = '```json\n{"A": "stable", "B": {"trend": "rising"}}\n```'
+        parsed = AIPricingService._parse_batch_response(text)
+
+        assert parsed["A"] == "stable"
+        assert json.loads(parsed["B"]) == {"trend": "rising"}
+        assert AIPricingService._parse_batch_response("not json") == {}
+
+
+class TestLLMResponseCache:
+    """Test the content-addressed prompt cache."""
+
+    def test_prices_within_tolerance_share_key(self):
+        from orchestrator.services.llm_response_cache import LLMResponseCache
+
+        cache = LLMResponseCache(price_tolerance=0.01)
+        messages = lambda price: [{"role": "user", "content": f"Current Price: ${price:.2f}\n  Product: 1234"}]
+
+        assert cache.make_key("m", 0.2, messages(100.00)) == cache.make_key("m", 0.2, messages(100.20))
+        assert cache.make_key("m", 0.2, messages(100.00)) != cache.make_key("m", 0.2, messages(110.00))
+
+    def test_integers_are_not_bucketed(self):
+        from orchestrator.services.llm_response_cache import LLMResponseCache
+
+        cache = LLMResponseCache(price_tolerance=0.5)
+
+        assert cache.normalize("Product ID: 12345") != cache.normalize("Product ID: 12346")
+
+    def test_lru_eviction_and_ttl(self, monkeypatch):
+        from orchestrator.services import llm_response_cache
+        from orchestrator.services.llm_response_cache import LLMResponseCache
+
+        now = [1000.0]
+        monkeypatch.setattr(llm_response_cache.time, "monotonic", lambda: now[0])
+
+        cache = LLMResponseCache(max_entries=2, ttl_seconds=10)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        assert cache.get("a") == "A"
+        cache.put("c", "C")  # evicts "b", the least recently used
+
+        assert cache.get("b") is None
+        assert cache.get("c") == "C"
+
+        now[0] += 11
+        assert cache.get("a") is None
+
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["expirations"] == 1
+        assert stats["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_repeated_repricing_is_served_from_cache(self):
+        from orchestrator.services.ai_pricing_service import AIPricingService
+        from orchestrator.services.llm_gateway import LLMGateway
+        from orchestrator.services.llm_response_cache import LLMResponseCache
+
+        client, completions = _fake_client(latency=0.01)
+        gateway = LLMGateway("key", client=client)
+        service = AIPricingService("key", batch_size=5, gateway=gateway, cache=LLMResponseCache())
+
+        products = [
+            {"product_id": f"SKU-{i}", "current_price": 20.0, "competitor_prices": {"amazon": 21.0}}
+            for i in range(10)
+        ]
+        await service.reprice_products(products)
+        calls_after_first_pass = completions.calls
+
+        second = await service.reprice_products(products)
+        single = await service.analyze_market_conditions("SKU-0", {"amazon": 21.0})
+
+        assert len(second) == 10
+        assert single.market_trend == "stable"
+        assert completions.calls == calls_after_first_pass
+        assert service.get_gateway_stats()["cache"]["hits"] == 21
@@ -0,0 +1,95 @@
+"""Unit tests for the shared async event loop bridge."""
+
+import asyncio
+import contextvars
+import time
+
+import pytest
+
+
+class TestAsyncLoopBridge:
+    """Test the persistent background event loop used by sync callers."""
+
+    def setup_method(self):
+        from app.services.async_bridge import AsyncLoopBridge
+
+        self.bridge = AsyncLoopBridge(name="test-async-bridge")
+
+    def teardown_method(self):
+        self.bridge.shutdown()
+
+    def test_submit_reuses_single_loop(self):
+        """Test that every submission runs on the same long-lived loop."""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = self.bridge.submit(current_loop())
+        second = self.bridge.submit(current_loop())
+
+        assert first is second
+        assert first is self.bridge.loop
+
+    def test_submit_propagates_exceptions(self):
+        """Test that coroutine exceptions are re-raised in the caller."""
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            self.bridge.submit(fail())
+
+        assert self.bridge.get_stats()['failed'] == 1
+
+    def test_timeout_cancels_task(self):
+        """Test that an expired timeout cancels the task on the loop."""
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with pytest.raises(TimeoutError):
+            self.bridge.submit(slow(), timeout=0.05)
+
+        deadline = time.monotonic() + 1.0
+        while not cancelled and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert cancelled == [True]
+        assert self.bridge.get_stats()['timed_out'] == 1
+
+    def test_caller_context_is_visible(self):
+        """Test that contextvars from the calling thread reach the coroutine."""
+        request_id = contextvars.ContextVar('request_id')
+        request_id.set('req-123')
+
+        async def read_context():
+            return request_id.get()
+
+        assert self.bridge.submit(read_context()) == 'req-123'
+
+    def test_restarts_after_shutdown(self):
+        """Test that the bridge lazily restarts after being shut down."""
+        async def answer():
+            return 42
+
+        assert self.bridge.submit(answer()) == 42
+        self.bridge.shutdown()
+        assert not self.bridge.is_running
+        assert self.bridge.submit(answer()) == 42
+
+    def test_gather_async_runs_concurrently(self):
+        """Test that gather_async runs coroutines concurrently on the shared loop."""
+        from app.services.async_bridge import gather_async
+
+        async def sleepy(value):
+            await asyncio.sleep(0.1)
+            return value
+
+        started = time.monotonic()
+        results = gather_async(sleepy(1), sleepy(2), sleepy(3))
+
+        assert results == [1, 2, 3]
+        assert time.monotonic() - started < 0.25
@@ -0,0 +1,68 @@
+"""Unit tests for vectorized catalog demand forecasting."""
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from orchestrator.services.batch_demand_forecaster import (
+    BatchDemandForecaster,
+    DemandMatrix,
+    build_demand_matrix,
+)
+from orchestrator.services.compute_executor import ComputeExecutor
+
+
+def _matrix(n_skus: int, days: int = 90, seed: int = 0) -> DemandMatrix:
+    rng = np.random.default_rng(seed)
+    trend = rng.uniform(-0.05, 0.2, size=(n_skus, 1)) * np.arange(days)
+    values = np.maximum(0, rng.poisson(5, size=(n_skus, days)) + trend)
+    return DemandMatrix([f"SKU-{i}" for i in range(n_skus)], date(2024, 1, 1), values)
+
+
+class TestBatchDemandForecaster:
+    """Test closed-form fits against per-SKU scikit-learn models."""
+
+    def test_build_demand_matrix_fills_missing_days(self):
+        start = date(2024, 1, 1)
+        rows = [
+            ("A", start, 3),
+            ("A", datetime(2024, 1, 3, 12), 2),
+            ("B", "2024-01-02", 5),
+            ("C", start, 9),  # unknown SKU
+            ("B", start - timedelta(days=1), 7),  # outside the window
+        ]
+
+        matrix = build_demand_matrix(rows, ["A", "B"], start, days=3)
+
+        np.testing.assert_array_equal(matrix.values, [[3, 0, 2], [0, 5, 0]])
+
+    def test_linear_trend_matches_sklearn(self):
+        matrix = _matrix(50)
+        result = BatchDemandForecaster().forecast(matrix, horizon=30)
+
+        X = np.arange(matrix.days).reshape(-1, 1)
+        for row in (0, 17, 49):
+            model = LinearRegression().fit(X, matrix.values[row])
+            assert result.trend_per_day[row] == pytest.approx(model.coef_[0])
+
+        assert result.models_included == 2
+        assert (result.predicted_demand >= 0).all()
+        assert ((result.accuracy_score >= 0) & (result.accuracy_score <= 1)).all()
+
+    @pytest.mark.asyncio
+    async def test_chunked_process_pool_matches_inline(self):
+        matrix = _matrix(250)
+        executor = ComputeExecutor(max_workers=2)
+        forecaster = BatchDemandForecaster(chunk_size=100, executor=executor)
+        try:
+            pooled = await forecaster.forecast_async(matrix, horizon=14)
+        finally:
+            executor.shutdown()
+
+        inline = BatchDemandForecaster().forecast(matrix, horizon=14)
+
+        assert pooled.skus == matrix.skus
+        np.testing.assert_allclose(pooled.predicted_demand, inline.predicted_demand)
+        np.testing.assert_allclose(pooled.accuracy_score, inline.accuracy_score)
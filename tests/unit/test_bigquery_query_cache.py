@@ -0,0 +1,80 @@
+"""Unit tests for the BigQuery MCP connector's query cache."""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("google.cloud.bigquery")
+pytest.importorskip("mcp")
+
+from royal_mcp.connectors.bigquery import QueryCache  # noqa: E402
+
+
+class TestQueryCache:
+    """Test bounds, expiry and single-flight loading."""
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = QueryCache(max_entries=2)
+        cache.set("a", {"rows": [1]})
+        cache.set("b", {"rows": [2]})
+        cache.get("a")
+        cache.set("c", {"rows": [3]})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"rows": [1]}
+        assert cache.stats()["evictions"] == 1
+
+    def test_byte_bound_is_enforced(self):
+        cache = QueryCache(max_bytes=100)
+        cache.set("small", {"rows": ["x" * 40]})
+        cache.set("other", {"rows": ["y" * 40]})
+        cache.set("huge", {"rows": ["z" * 500]})
+
+        assert cache.bytes <= 100
+        assert len(cache) == 1
+        assert cache.get("huge") is None
+        assert cache.stats()["rejected"] == 1
+
+    def test_expired_entries_are_swept(self):
+        cache = QueryCache(ttl_seconds=0)
+        for key in ("a", "b", "c"):
+            cache.set(key, {"rows": []})
+
+        assert cache.expire() == 3
+        assert cache.bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_queries_run_once(self):
+        cache = QueryCache()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"rows": [{"total": 42}]}
+
+        started = time.monotonic()
+        results = await asyncio.gather(*(cache.get_or_load("q", loader) for _ in range(10)))
+        cache.close()
+
+        assert calls == 1
+        assert time.monotonic() - started < 0.5
+        assert [cached for _, cached in results].count(False) == 1
+        assert all(value == {"rows": [{"total": 42}]} for value, _ in results)
+        assert cache.stats()["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_not_cached(self):
+        cache = QueryCache()
+
+        async def failing():
+            raise RuntimeError("quota exceeded")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("q", failing)
+        cache.close()
+
+        assert len(cache) == 0
+        assert cache.stats()["in_flight"] == 0
@@ -0,0 +1,236 @@
+"""Unit tests for the Shopify catalog cache."""
+
+import copy
+import queue
+import threading
+import time
+
+import pytest
+
+from app.services.catalog_cache import CatalogBus, CatalogCache
+from app.services.shopify_service import ShopifyAPIError
+
+
+def _product(product_id, quantity, updated_at="2024-01-01T10:00:00-05:00"):
+    return {
+        "id": product_id,
+        "title": f"Product {product_id}",
+        "updated_at": updated_at,
+        "variants": [
+            {"id": product_id * 10, "inventory_item_id": product_id * 100, "inventory_quantity": quantity}
+        ],
+    }
+
+
+class FakeShopify:
+    """Stands in for ShopifyService, recording the requests made."""
+
+    def __init__(self, products):
+        self.products = {p["id"]: p for p in products}
+        self.calls = []
+        self.fail = False
+
+    def is_configured(self):
+        return True
+
+    def list_products(self, limit=50, fields=None, ids=None, page_info=None):
+        if not isinstance(limit, int):
+            raise TypeError(f"limit must be an int, got {limit!r}")
+        self.calls.append(ids)
+        if self.fail:
+            raise ShopifyAPIError("Shopify unavailable", status_code=503)
+        wanted = {int(i) for i in ids.split(",")} if ids else set(self.products)
+        products = [copy.deepcopy(p) for pid, p in sorted(self.products.items()) if pid in wanted]
+        offset = int(page_info or 0)
+        next_offset = offset + limit
+        page_info = str(next_offset) if next_offset < len(products) else None
+        return products[offset:next_offset], {"has_next": page_info is not None, "next_page_info": page_info}
+
+
+@pytest.fixture
+def shopify():
+    return FakeShopify([_product(2, 5), _product(1, 3)])
+
+
+class TestCatalogCache:
+    """Test read-through loading and webhook invalidation."""
+
+    def test_reads_are_served_from_memory_after_first_load(self, shopify):
+        cache = CatalogCache(service=shopify)
+
+        products, meta = cache.get_products()
+        assert [p["id"] for p in products] == [1, 2]
+        assert meta["cache"] == "MISS" and meta["apiCalls"] == 1
+
+        for _ in range(100):
+            products, meta = cache.get_products(limit=1)
+        assert meta == {"cache": "HIT", "apiCalls": 0, "version": 2}
+        assert [p["id"] for p in products] == [1]
+        assert len(shopify.calls) == 1
+
+    def test_product_webhooks_update_in_place(self, shopify):
+        cache = CatalogCache(service=shopify)
+        cache.get_products()
+
+        assert cache.apply_webhook("products/update", _product(1, 42, "2024-01-01T16:00:00Z"))
+        assert cache.get_product(1)["variants"][0]["inventory_quantity"] == 42
+        assert cache.product_version(1) > cache.product_version(2)
+
+        # An older delivery arriving late is ignored
+        assert not cache.apply_webhook("products/update", _product(1, 7, "2024-01-01T10:30:00-05:00"))
+        assert cache.apply_webhook("products/delete", {"id": 2})
+        assert [p["id"] for p in cache.get_products()[0]] == [1]
+        assert len(shopify.calls) == 1
+
+    def test_inventory_webhook_refetches_only_affected_products(self, shopify):
+        cache = CatalogCache(service=shopify)
+        cache.get_products()
+        shopify.products[2]["variants"][0]["inventory_quantity"] = 0
+
+        assert cache.apply_webhook("inventory_levels/update", {"inventory_item_id": 200, "location_id": 1})
+        assert not cache.apply_webhook("inventory_levels/update", {"inventory_item_id": 999})
+
+        products, meta = cache.get_products()
+        assert meta["cache"] == "REFRESH" and meta["apiCalls"] == 1
+        assert shopify.calls[-1] == "2"
+        assert products[1]["variants"][0]["inventory_quantity"] == 0
+        assert cache.get_products()[1]["cache"] == "HIT"
+
+    def test_failed_sync_keeps_serving_cached_catalog(self, shopify):
+        cache = CatalogCache(service=shopify)
+        cache.get_products()
+        shopify.fail = True
+
+        with pytest.raises(ShopifyAPIError):
+            cache.get_products(force=True)
+        assert len(cache.get_products()[0]) == 2
+
+    def test_sync_follows_pages(self, shopify, monkeypatch):
+        monkeypatch.setattr("app.services.catalog_cache.SHOPIFY_PAGE_SIZE", 1)
+        cache = CatalogCache(service=shopify)
+
+        products, meta = cache.get_products()
+
+        assert [p["id"] for p in products] == [1, 2]
+        assert meta["apiCalls"] == 2
+
+    def test_webhooks_during_sync_are_not_lost(self, shopify):
+        cache = CatalogCache(service=shopify)
+        cache.get_products()
+        fetch = shopify.list_products
+
+        def list_products_with_webhooks(**kwargs):
+            result = fetch(**kwargs)
+            if kwargs.get("ids") is None:
+                # Deliveries racing the full fetch
+                cache.apply_webhook("products/update", _product(1, 99, "2024-01-02T00:00:00Z"))
+                cache.apply_webhook("inventory_levels/update", {"inventory_item_id": 200})
+                cache.apply_webhook("products/create", _product(3, 1))
+            return result
+
+        shopify.list_products = list_products_with_webhooks
+        cache.sync()
+
+        # The invalidation stays pending; the newer update and the new product are kept
+        assert cache.stats()["dirty"] == 1
+        assert cache.get_product(1)["variants"][0]["inventory_quantity"] == 99
+        assert cache.get_product(3) is not None
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.messages = queue.Queue()
+
+    def subscribe(self, channel):
+        if self.redis.fail_subscribe:
+            self.redis.fail_subscribe -= 1
+            raise ConnectionError("Redis unavailable")
+        self.redis.subscribers.setdefault(channel, []).append(self)
+
+    def get_message(self, timeout=0.0):
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        for subscribers in self.redis.subscribers.values():
+            if self in subscribers:
+                subscribers.remove(self)
+
+
+class FakeRedis:
+    """In-memory pub/sub shared by the workers of a test."""
+
+    def __init__(self):
+        self.subscribers = {}
+        self.fail_subscribe = 0
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+    def publish(self, channel, message):
+        for subscriber in list(self.subscribers.get(channel, [])):
+            subscriber.messages.put({"type": "message", "channel": channel, "data": message})
+        return len(self.subscribers.get(channel, []))
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestCatalogBus:
+    """Test relaying webhooks between the caches of several workers."""
+
+    def test_webhook_applied_in_one_worker_reaches_the_others(self):
+        redis = FakeRedis()
+        shopify = FakeShopify([_product(2, 5), _product(1, 3)])
+        caches = [CatalogCache(service=shopify, bus=CatalogBus(redis)) for _ in range(2)]
+        for cache in caches:
+            cache.get_products()
+            cache.start()
+        try:
+            _wait_for(lambda: len(redis.subscribers.get("catalog:webhooks", [])) == 2)
+            calls = len(shopify.calls)
+            shopify.products = {1: _product(1, 42, "2024-01-01T16:00:00Z")}
+
+            caches[0].apply_webhook("products/update", shopify.products[1])
+            caches[0].apply_webhook("products/delete", {"id": 2})
+            caches[0].apply_webhook("inventory_levels/update", {"inventory_item_id": 100})
+
+            _wait_for(lambda: caches[1].stats()["dirty"] == 1)
+            assert caches[1].get_product(1)["variants"][0]["inventory_quantity"] == 42
+            assert caches[1].get_product(2) is None
+            # Each webhook is applied once per worker, never echoed back
+            assert caches[0].stats()["webhooks"] == caches[1].stats()["webhooks"] == 3
+            # The relayed inventory change is re-fetched like a local one
+            assert len(shopify.calls) == calls + 1
+        finally:
+            for cache in caches:
+                cache.stop()
+
+    def test_catalog_resyncs_after_subscription_is_restored(self):
+        redis = FakeRedis()
+        shopify = FakeShopify([_product(1, 3)])
+        cache = CatalogCache(service=shopify, bus=CatalogBus(redis, retry_interval=0.01))
+        cache.get_products()
+        bus = cache.bus
+        stop = threading.Event()
+        listener = threading.Thread(target=bus.listen, args=(cache._apply_relayed, cache._resync, stop), daemon=True)
+        listener.start()
+        try:
+            _wait_for(lambda: redis.subscribers.get("catalog:webhooks"))
+            # The connection drops; relayed webhooks are missed meanwhile
+            redis.fail_subscribe = 1
+            redis.subscribers["catalog:webhooks"][0].messages.put({"type": "message", "data": "not json"})
+            shopify.products[1] = _product(1, 8, "2024-01-02T00:00:00Z")
+
+            _wait_for(lambda: cache.get_product(1)["variants"][0]["inventory_quantity"] == 8)
+            assert redis.subscribers["catalog:webhooks"]
+        finally:
+            stop.set()
+            listener.join(timeout=5)
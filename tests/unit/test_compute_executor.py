@@ -0,0 +1,72 @@
+"""Unit tests for the shared compute executor."""
+
+import asyncio
+import math
+import threading
+import time
+
+import pytest
+
+from orchestrator.services.compute_executor import ComputeExecutor, ComputeExecutorError, ComputeQueueFull
+
+
+class TestComputeExecutor:
+    """Test bounded submission, timeouts, cancellation and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_process(self):
+        executor = ComputeExecutor(max_workers=1)
+        try:
+            result = await executor.run(math.factorial, 20)
+        finally:
+            executor.shutdown()
+
+        assert result == math.factorial(20)
+        stats = executor.get_stats()
+        assert stats["completed"] == 1
+        assert stats["mode"] == "process"
+
+    def test_rejects_when_backlog_is_full(self):
+        executor = ComputeExecutor(max_workers=1, max_queue=1, use_processes=False)
+        release = threading.Event()
+        try:
+            running = executor.submit(release.wait)
+            queued = executor.submit(release.wait)
+
+            with pytest.raises(ComputeQueueFull):
+                executor.submit(release.wait)
+
+            assert queued.cancel()
+            release.set()
+            running.result(timeout=5)
+        finally:
+            executor.shutdown()
+
+        stats = executor.get_stats()
+        assert stats["rejected"] == 1
+        assert stats["cancelled"] == 1
+        assert stats["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_queued_task(self):
+        executor = ComputeExecutor(max_workers=1, use_processes=False)
+        release = threading.Event()
+        try:
+            blocker = executor.submit(release.wait)
+            with pytest.raises(asyncio.TimeoutError):
+                await executor.run(time.sleep, 0, timeout=0.05)
+            release.set()
+            blocker.result(timeout=5)
+        finally:
+            executor.shutdown()
+
+        stats = executor.get_stats()
+        assert stats["timed_out"] == 1
+        assert stats["cancelled"] == 1
+
+    def test_submit_after_shutdown_fails(self):
+        executor = ComputeExecutor(max_workers=1, use_processes=False)
+        executor.shutdown()
+
+        with pytest.raises(ComputeExecutorError):
+            executor.submit(math.sqrt, 4)
@@ -0,0 +1,121 @@
+"""Unit tests for the consciousness engine's bounded memory stores."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from orchestrator.intelligence.consciousness_engine import (
+    ConsciousnessEngine,
+    IntelligenceDecision,
+    MemoryFragment,
+)
+from orchestrator.intelligence.memory import DecisionLog, MemoryStore
+
+
+def _fragment(importance, age_hours=0.0, decision=None):
+    accessed = datetime.now(timezone.utc) - timedelta(hours=age_hours)
+    return MemoryFragment(
+        content={"decision": decision} if decision else {},
+        memory_type="episodic",
+        importance_score=importance,
+        access_count=0,
+        created_at=accessed,
+        last_accessed=accessed,
+    )
+
+
+def _decision(action):
+    return IntelligenceDecision(
+        action=action,
+        confidence=0.8,
+        reasoning=[],
+        expected_outcome={"success_probability": 0.8},
+        risk_assessment={},
+        alternative_actions=[],
+        execution_priority=5,
+        estimated_duration=timedelta(hours=1),
+        resource_requirements={},
+    )
+
+
+class TestMemoryStore:
+    """Test eviction and indexing."""
+
+    def test_evicts_least_important_and_stalest_first(self):
+        store = MemoryStore(capacity=10, low_water=0.5)
+        keep = store.add(_fragment(0.9))
+        stale = store.add(_fragment(0.9, age_hours=200))
+        for _ in range(9):
+            store.add(_fragment(0.5))
+
+        assert len(store) == 5
+        assert store.evictions == 6
+        assert keep in store
+        assert stale not in store
+
+    def test_index_tracks_evictions(self):
+        store = MemoryStore(capacity=4, index_key=lambda f: f.content.get("decision"), low_water=0.5)
+        for importance in (0.1, 0.2, 0.8, 0.9):
+            store.add(_fragment(importance, decision="reprice"))
+        store.add(_fragment(0.7, decision="restock"))
+
+        assert [f.importance_score for f in store.by_index("reprice")] == [0.8, 0.9]
+        assert store.by_index("restock") == []  # evicted along with the two weakest
+        assert store.by_index("unknown") == []
+
+    def test_slots_dataclasses(self):
+        with pytest.raises(AttributeError):
+            _fragment(0.5).unexpected = True
+        assert not hasattr(_decision("x"), "__dict__")
+
+
+class TestDecisionLog:
+    """Test the decision ring buffer."""
+
+    def test_ring_buffer_keeps_index_consistent(self):
+        log = DecisionLog(capacity=3)
+        for action in ("a", "b", "a", "c", "a"):
+            log.append(_decision(action))
+
+        assert [d.action for d in log] == ["a", "c", "a"]
+        assert len(log.for_key("a")) == 2
+        assert log.for_key("b") == []
+        assert [d.action for d in log.recent(2)] == ["c", "a"]
+
+
+class TestConsciousnessEngineMemory:
+    """Test that a long-running engine keeps flat memory."""
+
+    @pytest.mark.asyncio
+    async def test_learning_stays_within_capacity(self):
+        engine = ConsciousnessEngine()
+        engine.executor.shutdown(wait=False)
+
+        for i in range(engine.EPISODIC_MEMORY_CAPACITY * 2):
+            decision = _decision(f"action-{i % 5}")
+            engine.decision_history.append(decision)
+            await engine.learn_from_outcome(decision, {"actual_success": 0.8})
+
+        assert len(engine.episodic_memory) <= engine.EPISODIC_MEMORY_CAPACITY
+        assert len(engine.decision_history) == engine.DECISION_HISTORY_CAPACITY
+        assert all(f.content["decision"] == "action-3" for f in engine.recall_outcomes("action-3"))
+        assert engine.recall_outcomes("action-3")
+
+        status = await engine.get_consciousness_status()
+        assert status["memory_systems"]["evictions"] > 0
+
+    @pytest.mark.asyncio
+    async def test_learning_weighs_outcomes_against_track_record(self):
+        engine = ConsciousnessEngine()
+        engine.executor.shutdown(wait=False)
+
+        for actual in (0.4, 0.4, 0.4, 0.08):
+            decision = _decision("reprice")
+            engine.decision_history.append(decision)
+            await engine.learn_from_outcome(decision, {"actual_success": actual})
+
+        consistent, surprising = engine.recall_outcomes("reprice")[-2:]
+        # A poor outcome that breaks the track record is weighted by its surprise, not its low score
+        assert consistent.importance_score == pytest.approx(0.5 + 0.3)
+        assert surprising.content["success_score"] == pytest.approx(0.1)
+        assert surprising.importance_score == pytest.approx(0.4 + 0.3)
@@ -0,0 +1,86 @@
+"""Unit tests for offloading blocking database work from the event loop."""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from royal_platform.core.agent_base import AgentConfig, AgentResult, BaseAgent
+from royal_platform.database.session import run_db, run_in_session
+
+
+class SlowAgent(BaseAgent):
+    def __init__(self):
+        super().__init__(AgentConfig(name="slow_agent", max_execution_time=10))
+
+    async def execute(self) -> AgentResult:
+        return AgentResult(success=True)
+
+    def get_health_status(self):
+        return {"agent_name": self.config.name}
+
+
+class TestDatabaseOffload:
+    """Test that database calls run on the database thread pool."""
+
+    @pytest.mark.asyncio
+    async def test_run_in_session_commits_off_the_loop_thread(self):
+        session = MagicMock()
+
+        @contextmanager
+        def fake_session():
+            yield session
+            session.commit()
+
+        def unit_of_work(db, value):
+            db.add(value)
+            return threading.current_thread().name
+
+        with patch("royal_platform.database.session.get_db_session", fake_session):
+            thread_name = await run_in_session(unit_of_work, "row")
+
+        assert thread_name.startswith("db")
+        session.add.assert_called_once_with("row")
+        session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_slow_queries_do_not_serialize_agents(self):
+        threads = []
+
+        @contextmanager
+        def slow_session():
+            threads.append(threading.current_thread().name)
+            time.sleep(0.2)  # a slow query holding its connection
+            yield MagicMock()
+
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        with patch("royal_platform.core.agent_base.get_db_session", slow_session):
+            started = time.perf_counter()
+            results = await asyncio.gather(*(SlowAgent().run() for _ in range(4)))
+            elapsed = time.perf_counter() - started
+        beat.cancel()
+
+        assert all(r.success for r in results)
+        assert all(name.startswith("db") for name in threads)
+        # Three DB round trips per run, but the four runs overlap
+        assert elapsed < 4 * 3 * 0.2
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_run_db_propagates_errors(self):
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await run_db(fail)
@@ -0,0 +1,109 @@
+"""Unit tests for accelerated digital twin scenario simulation."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from orchestrator.intelligence.digital_twin import (
+    DigitalTwinEngine,
+    SimulationMode,
+    SimulationState,
+    TwinConfiguration,
+    TwinType,
+)
+
+
+def _engine_with_twin(values):
+    engine = DigitalTwinEngine()
+    engine.twins["finance"] = TwinConfiguration(
+        twin_id="finance",
+        twin_type=TwinType.FINANCIAL_MODEL,
+        name="Finance",
+        description="Revenue model",
+        simulation_mode=SimulationMode.ACCELERATED,
+        update_frequency=timedelta(minutes=5),
+        data_sources=["shopify_api"],
+        key_metrics=list(values),
+    )
+    engine.simulation_states["finance"] = SimulationState(
+        twin_id="finance",
+        current_values=dict(values),
+        predicted_values={},
+        confidence_scores={},
+        last_updated=datetime.now(timezone.utc),
+        simulation_time=datetime.now(timezone.utc),
+        iterations_run=0,
+        accuracy_score=0.0,
+    )
+    return engine
+
+
+class TestAcceleratedScenario:
+    """Test Monte Carlo scenarios on a virtual clock."""
+
+    @pytest.mark.asyncio
+    async def test_thirty_day_scenario_runs_in_seconds(self):
+        engine = _engine_with_twin({"daily_revenue": 1000.0, "conversion_rate": 0.03, "region": "EU"})
+        snapshots = []
+
+        started = time.monotonic()
+        results = await engine.run_scenario_test(
+            scenario_id="s1",
+            name="Growth",
+            description="Thirty days of growth",
+            parameters={"drift": {"daily_revenue": 0.01}, "volatility": 0.02},
+            twin_ids=["finance"],
+            duration=timedelta(days=30),
+            num_paths=10_000,
+            seed=7,
+            on_progress=snapshots.append,
+        )
+
+        assert time.monotonic() - started < 20
+        assert engine.scenarios["s1"].status == "completed"
+        assert results["steps"] == 720
+        assert results["simulated_duration"] == timedelta(days=30).total_seconds()
+        assert snapshots and snapshots == results["simulation_results"]
+        assert snapshots[-1]["step"] == 720
+
+        revenue = results["summary_metrics"]["finance.daily_revenue"]
+        assert revenue["p5"] < revenue["p50"] < revenue["p95"]
+        # E[x_T] = x_0 * exp(drift * days)
+        assert revenue["mean"] == pytest.approx(1000.0 * 1.01 ** 30, rel=0.03)
+        assert revenue["trend"] == "increasing"
+        assert "finance.region" not in results["summary_metrics"]
+
+        # Twin state is left untouched
+        assert engine.simulation_states["finance"].current_values["daily_revenue"] == 1000.0
+
+    @pytest.mark.asyncio
+    async def test_events_apply_at_their_virtual_time(self):
+        engine = _engine_with_twin({"daily_revenue": 1000.0})
+
+        results = await engine.run_scenario_test(
+            scenario_id="s2",
+            name="Price cut",
+            description="Demand halves after ten days",
+            parameters={"volatility": 0.0, "events": [{"at": 240, "metric": "daily_revenue", "multiplier": 0.5}]},
+            twin_ids=["finance"],
+            duration=timedelta(days=20),
+            num_paths=10,
+            time_step=timedelta(days=1),
+        )
+
+        timeline = [s["percentiles"]["finance.daily_revenue"]["p50"] for s in results["simulation_results"]]
+        assert timeline[8] == pytest.approx(1000.0)
+        assert timeline[9] == pytest.approx(500.0)
+        assert results["summary_metrics"]["finance.daily_revenue"]["probability_of_decline"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_seed_makes_runs_reproducible(self):
+        engine = _engine_with_twin({"daily_revenue": 1000.0})
+        kwargs = dict(name="n", description="d", parameters={}, twin_ids=["finance"],
+                      duration=timedelta(days=5), num_paths=500, seed=42)
+
+        first = await engine.run_scenario_test(scenario_id="a", **kwargs)
+        second = await engine.run_scenario_test(scenario_id="b", **kwargs)
+
+        assert first["summary_metrics"] == second["summary_metrics"]
@@ -0,0 +1,146 @@
+"""Unit tests for background dependency probes behind readiness checks."""
+
+import threading
+import time
+from datetime import datetime, timezone
+
+from flask import Flask
+
+from app.services.health_service import DependencyProber, HealthService
+
+
+def _counting_check(name, delay=0.0, healthy=True, required=False):
+    calls = []
+    active = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def check():
+        with lock:
+            calls.append(time.monotonic())
+            active.append(1)
+            peak[0] = max(peak[0], len(active))
+        time.sleep(delay)
+        with lock:
+            active.pop()
+        return {"name": name, "healthy": healthy, "message": "ok", "required": required}
+
+    check.calls = calls
+    check.peak = peak
+    return check
+
+
+def _wait_until_probed(prober, timeout=1.0):
+    """Wait for every probe to have completed once, without starting new runs."""
+    deadline = time.monotonic() + timeout
+    while not all("checked_at" in c for c in prober.snapshot()):
+        assert time.monotonic() < deadline, "probes did not complete"
+        time.sleep(0.01)
+
+
+class TestDependencyProber:
+    """Test cached, concurrent dependency probing."""
+
+    def test_snapshot_is_served_from_cache(self):
+        fast = _counting_check("fast")
+        slow = _counting_check("slow", delay=0.2)
+        prober = DependencyProber(Flask(__name__), {"fast": (fast, 60), "slow": (slow, 60)})
+
+        started = time.monotonic()
+        _wait_until_probed(prober)
+        cold = time.monotonic() - started
+
+        # Cold probes run concurrently, not one after another
+        assert cold < 0.35
+        first = prober.snapshot()
+        assert [c["name"] for c in first] == ["fast", "slow"]
+        assert all(c["healthy"] and not c["stale"] and "checked_at" in c for c in first)
+
+        started = time.monotonic()
+        for _ in range(100):
+            prober.snapshot()
+        assert time.monotonic() - started < 0.1
+        assert len(fast.calls) == len(slow.calls) == 1
+
+    def test_cold_snapshot_does_not_wait(self):
+        slow = _counting_check("slow", delay=0.3)
+        prober = DependencyProber(Flask(__name__), {"slow": (slow, 60)}, required=["slow"])
+
+        started = time.monotonic()
+        pending = prober.snapshot()[0]
+
+        assert time.monotonic() - started < 0.1
+        assert pending["healthy"] is False and pending["stale"] is True
+        assert pending["required"] is True
+
+        # The probe was started in the background and fills in the result
+        _wait_until_probed(prober)
+        assert len(slow.calls) == 1
+        assert prober.snapshot()[0]["healthy"] is True
+
+    def test_slow_probe_never_stacks_up(self):
+        slow = _counting_check("slow", delay=0.3)
+        prober = DependencyProber(Flask(__name__), {"slow": (slow, 60)}, timeout=0.01)
+
+        for _ in range(5):
+            prober.refresh(timeout=0.01)
+        pending = prober.snapshot()[0]
+        assert pending["healthy"] is False and pending["stale"] is True
+
+        prober.refresh(timeout=1)
+        assert len(slow.calls) == 1
+        assert slow.peak[0] == 1
+        assert prober.snapshot()[0]["healthy"] is True
+
+    def test_background_refresh_on_interval(self):
+        check = _counting_check("dep")
+        prober = DependencyProber(Flask(__name__), {"dep": (check, 0.05)}, jitter=0.2)
+
+        prober.start()
+        try:
+            time.sleep(0.4)
+        finally:
+            prober.stop()
+
+        assert len(check.calls) >= 4
+        assert prober.snapshot()[0]["age_seconds"] < 1
+
+    def test_failing_probe_is_reported_unhealthy(self):
+        def broken():
+            raise RuntimeError("upstream down")
+
+        prober = DependencyProber(Flask(__name__), {"dep": (broken, 60)})
+        prober.refresh()
+        check = prober.snapshot()[0]
+
+        assert check["healthy"] is False
+        assert "upstream down" in check["message"]
+
+
+class TestReadiness:
+    """Test readiness served from the prober snapshot."""
+
+    def test_required_dependency_gates_readiness(self):
+        app = Flask(__name__)
+        app.startup_time = datetime.now(timezone.utc)
+        with app.app_context():
+            service = HealthService()
+            for name in ("shopify_connection", "bigquery_connection", "github_connection", "ai_assistant"):
+                setattr(service, f"_check_{name}", _counting_check(name))
+            workspace = _counting_check("workspace_service", healthy=False, required=True)
+            service._check_workspace_service = workspace
+
+            try:
+                # The required probe has not completed yet
+                first = service.check_readiness()
+                _wait_until_probed(service.get_prober())
+                second = service.check_readiness()
+            finally:
+                service.get_prober().stop()
+
+        assert first["ready"] is False and first["status"] == "degraded"
+        assert [c["name"] for c in first["checks"]][0] == "core_service"
+        assert len(first["checks"]) == 6
+        assert second["ready"] is False
+        assert {c["name"]: c["healthy"] for c in second["checks"]}["workspace_service"] is False
+        assert len(workspace.calls) == 1
@@ -0,0 +1,120 @@
+"""Unit tests for leader election and leader-gated Socket.IO emitters."""
+
+import threading
+
+import pytest
+
+from app.services.leader_election import FileLeaderElector, LocalLeaderElector, RedisLeaderElector
+
+
+class FakeRedis:
+    """The subset of the redis-py client used by the Redis elector."""
+
+    def __init__(self):
+        self.data = {}
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def eval(self, script, numkeys, key, identity, *args):
+        # Both scripts act only when the caller still holds the lease
+        if self.data.get(key) != identity:
+            return 0
+        if "DEL" in script:
+            del self.data[key]
+        return 1
+
+
+class TestFileLeaderElector:
+    def test_single_leader_and_failover(self, tmp_path):
+        lock_path = str(tmp_path / "emitters.lock")
+        first = FileLeaderElector("emitters", lock_path)
+        second = FileLeaderElector("emitters", lock_path)
+
+        assert first.campaign() is True
+        assert second.campaign() is False
+        assert first.campaign() is True
+
+        first.stop()
+        assert first.is_leader is False
+        assert second.campaign() is True
+        second.stop()
+
+
+class TestRedisLeaderElector:
+    def test_single_leader_and_failover(self):
+        redis = FakeRedis()
+        first = RedisLeaderElector("emitters", redis, ttl=15)
+        second = RedisLeaderElector("emitters", redis, ttl=15)
+
+        assert first.campaign() is True
+        assert second.campaign() is False
+        assert first.campaign() is True  # Renewal
+
+        first.stop()
+        assert redis.data == {}
+        assert second.campaign() is True
+
+    def test_lost_lease_is_not_renewed(self):
+        redis = FakeRedis()
+        elector = RedisLeaderElector("emitters", redis)
+        elector.campaign()
+
+        # The lease expired and another worker took it
+        redis.data["leader:emitters"] = "other"
+
+        assert elector.campaign() is False
+        assert redis.data["leader:emitters"] == "other"
+
+    def test_unreachable_redis_drops_leadership(self):
+        class DownRedis:
+            def set(self, *args, **kwargs):
+                raise ConnectionError("redis down")
+
+        elector = RedisLeaderElector("emitters", DownRedis())
+
+        assert elector.campaign() is False
+
+
+class TestLeaderGatedEmitters:
+    def test_only_leader_emits(self, monkeypatch):
+        sockets = pytest.importorskip("app.sockets")
+        monkeypatch.setattr(sockets, "socketio", object())
+
+        calls = []
+        stop = threading.Event()
+
+        def emitter():
+            calls.append(1)
+            stop.set()
+
+        class Follower(LocalLeaderElector):
+            def _try_acquire(self):
+                return False
+
+        follower = Follower("emitters")
+        follower.campaign()
+        stopped = threading.Event()
+        stopped.set()
+        sockets.run_periodic_emitter("test", 0.01, emitter, follower, stop=stopped)
+        assert calls == []
+
+        leader = LocalLeaderElector("emitters")
+        leader.campaign()
+        sockets.run_periodic_emitter("test", 0.01, emitter, leader, stop=stop)
+        assert calls == [1]
+
+    def test_multi_worker_options(self, monkeypatch):
+        sockets = pytest.importorskip("app.sockets")
+        monkeypatch.setenv("WEB_CONCURRENCY", "4")
+        monkeypatch.setenv("SOCKETIO_MESSAGE_QUEUE", "redis://localhost:6379/2")
+        monkeypatch.delenv("SOCKETIO_TRANSPORTS", raising=False)
+
+        options = sockets.get_socketio_options()
+
+        assert options["message_queue"] == "redis://localhost:6379/2"
+        assert options["transports"] == ["websocket"]
+
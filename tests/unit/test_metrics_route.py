@@ -0,0 +1,27 @@
+"""Unit tests for the metrics endpoint."""
+
+from flask import Flask
+
+from app.routes.metrics import metrics_bp
+from app.services import webhook_processor
+from app.services.webhook_processor import WebhookProcessor
+from app.services.webhook_queue import WebhookDispatcher, WebhookQueue
+
+
+def test_metrics_report_webhook_queue(tmp_path, monkeypatch):
+    queue = WebhookQueue(str(tmp_path / "queue.sqlite3"))
+    queue.enqueue("orders/create", b"{}", "shop", "ord-1")
+    processor = WebhookProcessor()
+    processor._dispatcher = WebhookDispatcher(queue, handler=None)
+    monkeypatch.setattr(webhook_processor, "_webhook_processor", processor)
+    app = Flask(__name__)
+    app.register_blueprint(metrics_bp)
+
+    response = app.test_client().get("/metrics")
+
+    assert response.status_code == 200
+    webhooks = response.get_json()["webhooks"]
+    assert webhooks["queue"]["pending"] == 1
+    assert webhooks["dispatcher"]["failed"] == 0
+    assert webhooks["coalescing"]["batches"] == 0
+    queue.close()
@@ -0,0 +1,125 @@
+"""Unit tests for forecaster observation storage and retrain scheduling."""
+
+import json
+
+from orchestrator.services.observation_store import ObservationStore
+from orchestrator.services.predictive_forecaster import PredictiveForecaster
+
+
+class TestObservationStore:
+    """Test the append-only observation log."""
+
+    def test_appends_survive_reload(self, tmp_path):
+        store = ObservationStore(tmp_path, capacity=10)
+        for i in range(5):
+            store.append({"i": i})
+        store.close()
+
+        reloaded = ObservationStore(tmp_path, capacity=10)
+
+        assert [o["i"] for o in reloaded] == [0, 1, 2, 3, 4]
+
+    def test_compaction_keeps_only_the_ring_buffer(self, tmp_path):
+        store = ObservationStore(tmp_path, capacity=10, compaction_factor=2.0)
+        for i in range(25):
+            store.append({"i": i})
+        store.close()
+
+        lines = sum(len(p.read_text().splitlines()) for p in tmp_path.glob("segment-*.jsonl"))
+        reloaded = ObservationStore(tmp_path, capacity=10)
+
+        assert lines < 20
+        assert [o["i"] for o in reloaded] == list(range(15, 25))
+
+    def test_imports_legacy_json_and_skips_torn_lines(self, tmp_path):
+        legacy = tmp_path / "historical_data.json"
+        legacy.write_text(json.dumps([{"i": 0}, {"i": 1}]))
+
+        store = ObservationStore(tmp_path / "observations", legacy_file=legacy)
+        store.append({"i": 2})
+        store.close()
+        segment = sorted((tmp_path / "observations").glob("segment-*.jsonl"))[-1]
+        with open(segment, "a") as f:
+            f.write('{"i": 3')
+
+        reloaded = ObservationStore(tmp_path / "observations", legacy_file=legacy)
+
+        assert [o["i"] for o in reloaded] == [0, 1, 2]
+
+
+class TestRetrainScheduling:
+    """Test that retraining is batched and runs off the caller's thread."""
+
+    def test_retrains_every_n_observations(self, tmp_path, monkeypatch):
+        forecaster = PredictiveForecaster(str(tmp_path), retrain_every=50, retrain_interval=1e9)
+        retrains = []
+        monkeypatch.setattr(forecaster, "_retrain_models", lambda observations: retrains.append(len(observations)))
+
+        for i in range(250):
+            forecaster.record_observation(70.0 + i % 5, 0.1, 0.3)
+            forecaster.wait_for_retrain()
+        forecaster.close()
+
+        assert retrains == [100, 150, 200, 250]
+
+    def test_background_retrain_publishes_models(self, tmp_path):
+        forecaster = PredictiveForecaster(str(tmp_path), retrain_every=120)
+        for i in range(120):
+            forecaster.record_observation(60.0 + (i % 20), (i % 7) / 10, (i % 5) / 10)
+
+        assert forecaster.wait_for_retrain(timeout=60)
+        forecaster.close()
+
+        assert forecaster.confidence_model is not None
+        assert (tmp_path / "confidence_forecasting_model.joblib").exists()
+        assert PredictiveForecaster(str(tmp_path)).confidence_model is not None
+
+
+class TestRollingFeatureStore:
+    """Test incremental features against the equivalent pandas computation."""
+
+    def test_matches_pandas_lags_and_rolling_stats(self):
+        import numpy as np
+        import pandas as pd
+
+        from orchestrator.services.forecast_features import RollingFeatureStore
+
+        rng = np.random.default_rng(0)
+        observations = [
+            {"confidence_score": float(c), "sentiment_score": float(s), "volatility": float(v),
+             "hour_of_day": i % 24, "day_of_week": i % 7, "month": 1}
+            for i, (c, s, v) in enumerate(rng.uniform(0, 1, size=(80, 3)))
+        ]
+        store = RollingFeatureStore(capacity=60)
+        store.extend(observations[:30])
+        for observation in observations[30:]:
+            store.append(observation)
+
+        frame = store.snapshot().training_frame()
+        expected = pd.DataFrame(observations)
+        expected["confidence_lag_24"] = expected["confidence_score"].shift(24)
+        expected["sentiment_ma_6"] = expected["sentiment_score"].rolling(6).mean()
+        expected["confidence_std_12"] = expected["confidence_score"].rolling(12).std()
+        expected["confidence_future_6h"] = expected["confidence_score"].shift(-6)
+        expected = expected.iloc[24:68]
+
+        assert len(frame) == 44
+        for col in ["confidence_lag_24", "sentiment_ma_6", "confidence_std_12", "confidence_future_6h"]:
+            np.testing.assert_allclose(frame[col].to_numpy(), expected[col].to_numpy())
+
+    def test_forecast_confidence_makes_one_model_call(self, tmp_path):
+        forecaster = PredictiveForecaster(str(tmp_path), retrain_every=150)
+        for i in range(150):
+            forecaster.record_observation(60.0 + (i % 20), (i % 7) / 10, (i % 5) / 10)
+        forecaster.wait_for_retrain(timeout=60)
+        forecaster.close()
+
+        model = forecaster.confidence_model
+        calls = []
+        original_predict = model.predict
+        model.predict = lambda X: calls.append(X.shape) or original_predict(X)
+
+        forecasts = forecaster.forecast_confidence(70.0, 0.1, 0.3, [1, 3, 6, 12, 24])
+
+        assert [f.forecast_horizon for f in forecasts] == [1, 3, 6, 12, 24]
+        assert calls == [(1, 18)]
@@ -0,0 +1,155 @@
+"""Unit tests for the sliding-window rate limiter."""
+
+import fnmatch
+import threading
+
+from flask import Flask
+
+from core.security.rate_limiter import MemoryRateLimitBackend, RateLimiter, RedisRateLimitBackend
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """The subset of the redis-py client used by the rate limit backend."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttl = {}
+        self._lock = threading.Lock()
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def incr(self, key):
+        with self._lock:
+            self.data[key] = int(self.data.get(key, 0)) + 1
+            return self.data[key]
+
+    def decr(self, key):
+        with self._lock:
+            self.data[key] = int(self.data.get(key, 0)) - 1
+            return self.data[key]
+
+    def expire(self, key, seconds):
+        self.ttl[key] = seconds
+        return True
+
+    def get(self, key):
+        value = self.data.get(key)
+        return None if value is None else str(value).encode()
+
+    def mget(self, *keys):
+        return [self.get(k) for k in keys]
+
+    def scan_iter(self, match="*"):
+        return [k for k in list(self.data) if fnmatch.fnmatchcase(k, match)]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, args))
+
+    def execute(self):
+        return [getattr(self.client, name)(*args) for name, args in self.commands]
+
+
+class TestMemoryBackend:
+    """Test sliding-window accounting and bounded memory."""
+
+    def test_sliding_window_weights_previous_window(self):
+        clock = FakeClock(1000.0)  # start of a 10s window
+        backend = MemoryRateLimitBackend(clock=clock)
+
+        assert [backend.hit("k", 5, 10).allowed for _ in range(6)] == [True] * 5 + [False]
+
+        # Half-way into the next window, half of the previous count still applies
+        clock.now = 1015.0
+        results = [backend.hit("k", 5, 10) for _ in range(3)]
+        assert [r.allowed for r in results] == [True, True, False]
+        assert results[-1].retry_after > 0
+
+        clock.now = 1030.0
+        assert backend.hit("k", 5, 10).remaining == 4
+
+    def test_idle_clients_are_evicted(self):
+        clock = FakeClock(1000.0)
+        backend = MemoryRateLimitBackend(max_keys=50, clock=clock)
+
+        for i in range(200):
+            backend.hit(f"scanner-{i}", 10, 60)
+        assert len(backend) == 50
+
+        clock.now += 121
+        backend.hit("late", 10, 60)
+        assert len(backend) == 1
+        assert backend.evictions == 200
+
+    def test_concurrent_hits_admit_exactly_the_limit(self):
+        backend = MemoryRateLimitBackend(clock=FakeClock(1000.0))
+        allowed = []
+
+        def worker():
+            for _ in range(50):
+                allowed.append(backend.hit("shared", 100, 60).allowed)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sum(allowed) == 100
+
+
+class TestRedisBackend:
+    """Test that limits are shared between limiter instances."""
+
+    def test_limit_is_shared_across_workers(self):
+        redis = FakeRedis()
+        clock = FakeClock(1000.0)
+        workers = [RateLimiter({"api": (4, 10)}, backend=RedisRateLimitBackend(redis, clock=clock)) for _ in range(2)]
+
+        results = [workers[i % 2].hit("api", "1.2.3.4").allowed for i in range(6)]
+
+        assert results == [True] * 4 + [False] * 2
+        assert workers[0].check_limit("api", "1.2.3.4")["remaining"] == 0
+        assert all(ttl == 20 for ttl in redis.ttl.values())
+
+        workers[1].reset("api", "1.2.3.4")
+        assert workers[0].hit("api", "1.2.3.4").allowed
+
+
+class TestRateLimitDecorator:
+    """Test the Flask decorator."""
+
+    def test_returns_429_with_retry_after(self):
+        app = Flask(__name__)
+        limiter = RateLimiter(backend=MemoryRateLimitBackend())
+
+        @app.route("/ping")
+        @limiter.limit("ping", max_requests=2, window_seconds=60)
+        def ping():
+            return "pong"
+
+        client = app.test_client()
+        statuses = [client.get("/ping").status_code for _ in range(3)]
+        response = client.get("/ping")
+
+        assert statuses == [200, 200, 429]
+        assert int(response.headers["Retry-After"]) >= 1
+        assert response.get_json()["error"] == "Rate limit exceeded"
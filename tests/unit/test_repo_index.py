@@ -0,0 +1,100 @@
+"""Unit tests for the repository connector's trigram content index."""
+
+import os
+
+import pytest
+
+pytest.importorskip("google.cloud.bigquery")
+pytest.importorskip("mcp")
+pytest.importorskip("git")
+
+from royal_mcp.connectors.repo_index import RepoContentIndex, required_literals  # noqa: E402
+
+
+def _excluded(path):
+    return path.name in (".git", "node_modules")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "pricing.py").write_text("def reprice(product):\n    return product.price * 0.9\n")
+    (tmp_path / "app" / "inventory.py").write_text("def restock(item):\n    return item.quantity + 10\n")
+    (tmp_path / "README.md").write_text("Pricing engine docs\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "lib.js").write_text("function reprice() {}\n")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG\0\0reprice")
+    return tmp_path
+
+
+def _index(repo, **kwargs):
+    return RepoContentIndex(repo, _excluded, max_file_size=1024 * 1024, refresh_interval=0, **kwargs)
+
+
+class TestRequiredLiterals:
+    """Test literal extraction used to prefilter regex searches."""
+
+    def test_literals_exclude_optional_and_grouped_parts(self):
+        assert required_literals(r"def\s+reprice\(") == ["def", "reprice("]
+        assert required_literals(r"colou?r_map") == ["colo", "r_map"]
+        assert required_literals(r"(foo)?barbaz") == ["barbaz"]
+        assert required_literals(r"foo|bar") == []
+
+    def test_required_literals_skip_whole_escapes(self):
+        assert required_literals(r"\x41BCD") == ["BCD"]
+        assert required_literals(r"\u0041BCD") == ["BCD"]
+        assert required_literals(r"\U00000041BCD") == ["BCD"]
+        assert required_literals(r"\N{LATIN CAPITAL LETTER A}BCD") == ["BCD"]
+        assert required_literals(r"\101BCD") == ["BCD"]
+        assert required_literals(r"\012BCD") == ["BCD"]
+        assert required_literals(r"(a)\1BCD") == ["BCD"]
+
+    def test_required_literals_ignore_patterns_with_inline_flags(self):
+        assert required_literals(r"(?x)a b c") == []
+        assert required_literals(r"(?i:foo)barbaz") == []
+
+
+class TestRepoContentIndex:
+    """Test candidate filtering, matching and incremental refresh."""
+
+    def test_only_candidate_files_are_scanned(self, repo):
+        index = _index(repo)
+        result = index.search("reprice")
+
+        assert [m["path"] for m in result["matches"]] == ["app/pricing.py"]
+        assert result["files_searched"] == 1
+        assert result["indexed_files"] == 4  # node_modules pruned, binary tracked
+
+    def test_regex_case_and_patterns(self, repo):
+        index = _index(repo)
+
+        assert [m["path"] for m in index.search(r"def \w+\(", regex=True)["matches"]] == [
+            "app/inventory.py",
+            "app/pricing.py",
+        ]
+        assert [m["path"] for m in index.search("pricing", file_patterns=["*.md"])["matches"]] == ["README.md"]
+        assert index.search("Pricing", case_sensitive=True)["matches"][0]["matching_lines"] == [
+            {"line_number": 1, "content": "Pricing engine docs"}
+        ]
+        assert len(index.search("def", max_results=1)["matches"]) == 1
+
+    def test_refresh_reindexes_changed_files_only(self, repo):
+        index = _index(repo)
+        index.refresh(force=True)
+
+        pricing = repo / "app" / "pricing.py"
+        pricing.write_text("def discount(product):\n    return 0\n")
+        os.utime(pricing, ns=(1, 1))
+        (repo / "app" / "inventory.py").unlink()
+        (repo / "app" / "orders.py").write_text("def reprice_order(): pass\n")
+
+        assert index.refresh(force=True) == {"added": 1, "updated": 1, "removed": 1}
+        assert [m["path"] for m in index.search("reprice")["matches"]] == ["app/orders.py"]
+
+    def test_index_is_persisted(self, repo, tmp_path_factory):
+        index_path = tmp_path_factory.mktemp("cache") / "index.json.gz"
+        _index(repo, index_path=index_path).refresh(force=True)
+
+        reloaded = _index(repo, index_path=index_path)
+        assert reloaded.refresh(force=True) == {"added": 0, "updated": 0, "removed": 0}
+        assert [m["path"] for m in reloaded.search("restock")["matches"]] == ["app/inventory.py"]
@@ -0,0 +1,197 @@
+"""Unit tests for SQL demand aggregation and the daily sales rollup."""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from royal_platform.database.models import (
+    Customer,
+    Order,
+    OrderLineItem,
+    Product,
+    ProductVariant,
+    SalesRollupCoverage,
+    VariantSalesDaily,
+)
+from royal_platform.database.sales_rollup import (
+    query_variant_demand,
+    rebuild_variant_sales_daily,
+    record_order_sales,
+    rollup_available,
+)
+
+TODAY = date(2024, 6, 30)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    with engine.begin() as conn:
+        # Tables only: several models declare the same index twice
+        for model in (Product, ProductVariant, Customer, Order, OrderLineItem, VariantSalesDaily, SalesRollupCoverage):
+            conn.execute(CreateTable(model.__table__))
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+    engine.dispose()
+
+
+def _variant(db, sku):
+    product = Product(shopify_id=f"p-{sku}", title=sku, handle=sku)
+    variant = ProductVariant(product=product, shopify_id=f"v-{sku}", sku=sku, price=Decimal("10.00"))
+    db.add_all([product, variant])
+    db.flush()
+    return variant
+
+
+def _order(db, day, items, status="paid"):
+    order = Order(
+        shopify_id=uuid.uuid4().hex,
+        name="#1",
+        total_price=Decimal("0"),
+        subtotal_price=Decimal("0"),
+        financial_status=status,
+        created_at=datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc) + timedelta(hours=12),
+    )
+    for variant, quantity, price in items:
+        order.line_items.append(OrderLineItem(
+            shopify_line_id=uuid.uuid4().hex,
+            variant_id=variant.id,
+            sku=variant.sku,
+            quantity=quantity,
+            price=Decimal(price),
+        ))
+    db.add(order)
+    db.flush()
+    return order
+
+
+def _seed(db):
+    fast, slow = _variant(db, "FAST"), _variant(db, "SLOW")
+    orders = []
+    # 20 older sale days at 1/day, then 14 recent days at 3/day
+    for offset in range(34, 14, -1):
+        orders.append(_order(db, TODAY - timedelta(days=offset), [(fast, 1, "10.00")]))
+    for offset in range(14, 0, -1):
+        orders.append(_order(db, TODAY - timedelta(days=offset), [(fast, 3, "10.00")]))
+    # Two orders on the same day for the slow variant, plus one unpaid and one too old
+    orders.append(_order(db, TODAY - timedelta(days=3), [(slow, 2, "5.00")]))
+    orders.append(_order(db, TODAY - timedelta(days=3), [(slow, 1, "5.00"), (fast, 1, "10.00")]))
+    orders.append(_order(db, TODAY - timedelta(days=2), [(slow, 50, "5.00")], status="pending"))
+    orders.append(_order(db, TODAY - timedelta(days=200), [(slow, 50, "5.00")]))
+    return fast, slow, orders
+
+
+def _by_sku(demand):
+    return {sku: i for i, sku in enumerate(demand.skus)}
+
+
+class TestVariantDemand:
+    """Test demand statistics computed in SQL."""
+
+    @pytest.mark.parametrize("use_rollup", [False, True])
+    def test_demand_statistics(self, session, use_rollup):
+        _seed(session)
+        since = TODAY - timedelta(days=90)
+        if use_rollup:
+            rebuild_variant_sales_daily(session, since)
+
+        demand = query_variant_demand(session, since, use_rollup=use_rollup)
+        idx = _by_sku(demand)
+
+        fast, slow = idx["FAST"], idx["SLOW"]
+        assert len(demand) == 2
+        assert demand.sales_days[fast] == 34
+        assert demand.total_quantity[fast] == 20 + 14 * 3 + 1
+        assert demand.max_daily[fast] == 4
+        assert demand.total_revenue[fast] == pytest.approx(630.0)
+        # 13 recent days at 3 and one at 4, against 20 older days at 1
+        assert demand.velocity[fast] == pytest.approx((43 / 14 - 1) / 1)
+
+        assert demand.sales_days[slow] == 1
+        assert demand.total_quantity[slow] == 3
+        assert demand.order_count[slow] == 2
+        assert demand.total_revenue[slow] == pytest.approx(15.0)
+        assert demand.velocity[slow] == 0
+
+    def test_short_history_has_no_velocity(self, session):
+        variant = _variant(session, "NEW")
+        for offset in range(14, 0, -1):
+            _order(session, TODAY - timedelta(days=offset), [(variant, 2, "10.00")])
+
+        demand = query_variant_demand(session, TODAY - timedelta(days=90))
+
+        assert demand.avg_daily_demand[0] == 2
+        assert demand.velocity[0] == 0
+
+
+class TestSalesRollup:
+    """Test incremental maintenance of variant_sales_daily."""
+
+    def test_recording_orders_updates_only_their_days(self, session):
+        fast, slow, _ = _seed(session)
+        since = TODAY - timedelta(days=90)
+        rebuild_variant_sales_daily(session, since)
+        baseline = session.query(VariantSalesDaily).count()
+
+        day = TODAY - timedelta(days=3)
+        new_order = _order(session, day, [(slow, 4, "5.00")])
+        assert record_order_sales(session, [new_order]) == 2
+
+        row = session.get(VariantSalesDaily, (slow.id, day))
+        assert row.quantity == 7
+        assert row.order_count == 3
+        assert session.query(VariantSalesDaily).count() == baseline
+
+        # The incremental rollup matches a live aggregation
+        rolled = query_variant_demand(session, since, use_rollup=True)
+        live = query_variant_demand(session, since, use_rollup=False)
+        assert rolled.skus == live.skus
+        assert list(rolled.total_quantity) == list(live.total_quantity)
+        assert list(rolled.order_count) == list(live.order_count)
+
+    def test_partial_rollup_is_not_read(self, session):
+        _, _, orders = _seed(session)
+        since = TODAY - timedelta(days=90)
+
+        # Only one day was ever recorded, so the rollup does not cover the window
+        record_order_sales(session, orders[-3:-2])
+        assert session.query(VariantSalesDaily).count() > 0
+        assert not rollup_available(session, since)
+
+        demand = query_variant_demand(session, since)
+        assert len(demand) == 2
+        assert demand.sales_days[_by_sku(demand)["FAST"]] == 34
+
+        rebuild_variant_sales_daily(session, since)
+        assert rollup_available(session, since)
+        assert not rollup_available(session, since - timedelta(days=1))
+
+    def test_commit_refreshes_rollup(self, session):
+        _, slow, _ = _seed(session)
+        since = TODAY - timedelta(days=90)
+        rebuild_variant_sales_daily(session, since)
+        session.commit()
+
+        day = TODAY - timedelta(days=3)
+        order = _order(session, day, [(slow, 4, "5.00")])
+        session.commit()
+        assert session.get(VariantSalesDaily, (slow.id, day)).quantity == 7
+
+        order.line_items[0].quantity = 1
+        session.commit()
+        assert session.get(VariantSalesDaily, (slow.id, day)).quantity == 4
+
+        session.delete(order)
+        session.commit()
+        assert session.get(VariantSalesDaily, (slow.id, day)).quantity == 3
+
+        rolled = query_variant_demand(session, since)
+        live = query_variant_demand(session, since, use_rollup=False)
+        assert list(rolled.total_quantity) == list(live.total_quantity)
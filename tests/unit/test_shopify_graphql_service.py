@@ -107,3 +107,35 @@ class TestShopifyGraphQLService:
         assert len(date_part) == 10
         assert date_part[4] == '-'
         assert date_part[7] == '-'
+
+    @pytest.mark.asyncio
+    async def test_orders_summary_follows_all_pages(self):
+        """Test that the summary is not truncated at the first 250 orders."""
+        from app.services.shopify_graphql_service import ShopifyGraphQLService
+
+        service = ShopifyGraphQLService()
+        cursors = []
+
+        def page(count, cursor):
+            return {
+                'orders': {
+                    'edges': [{'node': {
+                        'currentTotalPriceSet': {'shopMoney': {'amount': '10.00'}},
+                        'displayFulfillmentStatus': 'FULFILLED',
+                    }}] * count,
+                    'pageInfo': {'hasNextPage': cursor is not None, 'endCursor': cursor}
+                }
+            }
+
+        async def mock_execute(query, variables):
+            cursors.append(variables['after'])
+            return page(250, 'c1') if variables['after'] is None else page(40, None)
+
+        service._execute_query = mock_execute
+
+        summary = await service.get_orders_summary(days=30)
+
+        assert cursors == [None, 'c1']
+        assert summary['total_orders'] == 290
+        assert summary['total_revenue'] == 2900.0
+        assert summary['fulfilled_orders'] == 290
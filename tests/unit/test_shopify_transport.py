@@ -0,0 +1,209 @@
+"""Unit tests for the async Shopify REST transport."""
+
+import time
+
+import httpx
+import pytest
+
+from app.services.async_bridge import AsyncBridgeError
+from app.services.shopify_service import (
+    LeakyBucket,
+    ShopifyAuthError,
+    ShopifyRateLimitError,
+    ShopifyService,
+    ShopifyTransport,
+    close_shopify_transports,
+)
+
+BASE_URL = "https://test-shop.myshopify.com/admin/api/2024-01"
+
+
+def _paged_handler(pages, seen):
+    """Serve ``pages`` of products, linking each page to the next by cursor."""
+
+    def handler(request):
+        seen.append(dict(request.url.params))
+        index = int(request.url.params.get("page_info", "0"))
+        links = []
+        if index + 1 < len(pages):
+            links.append(f'<{BASE_URL}/products.json?limit=2&page_info={index + 1}>; rel="next"')
+        if index > 0:
+            links.append(f'<{BASE_URL}/products.json?limit=2&page_info={index - 1}>; rel="previous"')
+        headers = {"X-Shopify-Shop-Api-Call-Limit": f"{index + 1}/40"}
+        if links:
+            headers["Link"] = ", ".join(links)
+        return httpx.Response(200, json={"products": pages[index]}, headers=headers)
+
+    return handler
+
+
+class TestLeakyBucket:
+    @pytest.mark.asyncio
+    async def test_waits_when_full(self):
+        bucket = LeakyBucket(capacity=4, leak_rate=20.0, headroom=1)
+        bucket.observe(3, 4)
+
+        started = time.monotonic()
+        await bucket.acquire()
+
+        assert bucket.waits >= 1
+        assert time.monotonic() - started >= 0.03
+
+    def test_observe_adopts_plus_capacity(self):
+        bucket = LeakyBucket()
+        bucket.observe(10, 400)
+
+        assert bucket.capacity == 400
+        assert bucket.leak_rate == pytest.approx(20.0)
+        assert bucket.level >= 9
+
+
+class TestShopifyTransport:
+    @pytest.mark.asyncio
+    async def test_follows_link_header_cursors(self):
+        seen = []
+        pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+        transport = ShopifyTransport(BASE_URL, transport=httpx.MockTransport(_paged_handler(pages, seen)))
+
+        items, pagination = await transport.fetch(
+            "/products.json", "products", {"status": "active", "fields": "id"}, limit=None
+        )
+
+        assert [p["id"] for p in items] == [1, 2, 3, 4, 5]
+        assert pagination["has_next"] is False and pagination["count"] == 5
+        # Filters go on the first page only; cursor pages carry limit, fields and page_info
+        assert seen[0] == {"status": "active", "fields": "id", "limit": "250"}
+        assert seen[1] == {"fields": "id", "limit": "250", "page_info": "1"}
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_limit_stops_early_and_returns_cursor(self):
+        seen = []
+        pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+        transport = ShopifyTransport(BASE_URL, transport=httpx.MockTransport(_paged_handler(pages, seen)))
+
+        items, pagination = await transport.fetch("/products.json", "products", limit=3)
+
+        assert [p["id"] for p in items] == [1, 2, 3]
+        assert len(seen) == 2
+        assert pagination["next_page_info"] == "2"
+        assert pagination["previous_page_info"] == "0"
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retries_after_429(self):
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"shop": {"name": "Test"}}, headers={"X-Shopify-Shop-Api-Call-Limit": "5/40"}),
+        ]
+        transport = ShopifyTransport(BASE_URL, transport=httpx.MockTransport(lambda request: responses.pop(0)))
+        transport.bucket.leak_rate = 1000.0
+
+        response = await transport.request("GET", "/shop.json")
+
+        assert response.json()["shop"]["name"] == "Test"
+        assert responses == []
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_raises_after_exhausting_retries(self):
+        transport = ShopifyTransport(
+            BASE_URL,
+            max_retries=1,
+            transport=httpx.MockTransport(lambda request: httpx.Response(429, headers={"Retry-After": "0"})),
+        )
+        transport.bucket.leak_rate = 1000.0
+
+        with pytest.raises(ShopifyRateLimitError):
+            await transport.request("GET", "/shop.json")
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_maps_auth_errors(self):
+        transport = ShopifyTransport(BASE_URL, transport=httpx.MockTransport(lambda request: httpx.Response(401)))
+
+        with pytest.raises(ShopifyAuthError):
+            await transport.request("GET", "/shop.json")
+        await transport.aclose()
+
+
+def test_service_sync_facade_reads_all_pages(monkeypatch):
+    monkeypatch.setenv("SHOPIFY_API_KEY", "key")
+    monkeypatch.setenv("SHOPIFY_API_SECRET", "secret")
+    monkeypatch.setenv("SHOP_NAME", "test-shop")
+    monkeypatch.setattr(ShopifyService, "_instance", None, raising=False)
+
+    seen = []
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+    service = ShopifyService()
+    service.transport._transport = httpx.MockTransport(_paged_handler(pages, seen))
+
+    products, pagination = service.list_products(limit=None)
+
+    assert [p["id"] for p in products] == [1, 2, 3]
+    assert pagination["has_next"] is False
+    assert service._rate_limit_used == 2 and service._rate_limit_bucket == 40
+
+
+def test_service_facade_does_not_retry_on_top_of_the_transport(monkeypatch):
+    monkeypatch.setenv("SHOPIFY_API_KEY", "key")
+    monkeypatch.setenv("SHOPIFY_API_SECRET", "secret")
+    monkeypatch.setenv("SHOP_NAME", "limited-shop")
+    monkeypatch.setattr(ShopifyService, "_instance", None, raising=False)
+
+    requests = []
+    service = ShopifyService()
+    service.transport.max_retries = 1
+    service.transport.bucket.leak_rate = 1000.0
+    service.transport._transport = httpx.MockTransport(
+        lambda request: requests.append(request) or httpx.Response(429, headers={"Retry-After": "0"})
+    )
+
+    with pytest.raises(ShopifyRateLimitError):
+        service.list_orders()
+
+    assert len(requests) == 2
+    close_shopify_transports()
+
+
+@pytest.mark.asyncio
+async def test_service_has_async_entry_points_and_refuses_blocking_in_a_loop(monkeypatch):
+    monkeypatch.setenv("SHOPIFY_API_KEY", "key")
+    monkeypatch.setenv("SHOPIFY_API_SECRET", "secret")
+    monkeypatch.setenv("SHOP_NAME", "async-shop")
+    monkeypatch.setattr(ShopifyService, "_instance", None, raising=False)
+
+    seen = []
+    service = ShopifyService()
+    service.transport._transport = httpx.MockTransport(_paged_handler([[{"id": 1}]], seen))
+
+    with pytest.raises(AsyncBridgeError, match="fetch_async"):
+        service.list_products()
+    assert seen == []
+
+    products, _ = await service.fetch_async("/products.json", "products")
+    assert products == [{"id": 1}]
+    await service.transport.aclose()
+
+
+def test_services_share_one_transport_per_shop(monkeypatch):
+    monkeypatch.setenv("SHOPIFY_API_KEY", "key")
+    monkeypatch.setenv("SHOPIFY_API_SECRET", "secret")
+    monkeypatch.setenv("SHOP_NAME", "shared-shop")
+    monkeypatch.setattr(ShopifyService, "_instance", None, raising=False)
+    first = ShopifyService()
+    monkeypatch.setattr(ShopifyService, "_instance", None, raising=False)
+    second = ShopifyService()
+
+    assert first is not second
+    assert first.transport is second.transport
+
+    first.transport._transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"shop": {}}, headers={"X-Shopify-Shop-Api-Call-Limit": "7/40"})
+    )
+    first._make_request("GET", "/shop.json")
+    client = next(iter(first.transport._clients.values()))
+
+    assert second.get_rate_limit_status()["used"] == 7
+    close_shopify_transports()
+    assert client.is_closed
@@ -0,0 +1,231 @@
+"""Unit tests for delta-encoded Socket.IO publishing."""
+
+import copy
+
+import pytest
+
+from app.services.socket_publisher import (
+    DeltaPublisher,
+    RedisPresence,
+    RedisSnapshotStore,
+    apply_merge_patch,
+    merge_patch,
+)
+
+
+class Recorder:
+    """Stands in for socketio.emit, recording what was sent."""
+
+    def __init__(self):
+        self.sent = []
+
+    def __call__(self, event, data, namespace=None, to=None):
+        self.sent.append((event, copy.deepcopy(data), namespace, to))
+
+
+class FakeRedis:
+    """The subset of the redis-py client used by the snapshot store."""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def hget(self, key, field):
+        value = self.hashes.get(key, {}).get(field)
+        return None if value is None else value.encode()
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def hgetall(self, key):
+        return {k.encode(): v.encode() for k, v in self.hashes.get(key, {}).items()}
+
+    def hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field.decode() if isinstance(field, bytes) else field, None)
+
+
+def test_merge_patch_round_trip():
+    old = {"cpu": 10, "memory": {"used": 5, "total": 16}, "alerts": ["a"], "stale": True}
+    new = {"cpu": 12, "memory": {"used": 5, "total": 16, "swap": 1}, "alerts": ["a", "b"], "nested": {}}
+
+    patch = merge_patch(old, new)
+
+    assert patch == {"cpu": 12, "memory": {"swap": 1}, "alerts": ["a", "b"], "nested": {}, "stale": None}
+    assert apply_merge_patch(copy.deepcopy(old), patch) == new
+    assert merge_patch(new, copy.deepcopy(new)) is None
+
+
+class TestDeltaPublisher:
+    def test_skips_namespaces_without_clients(self):
+        emit = Recorder()
+        publisher = DeltaPublisher(emit, has_subscribers=lambda namespace: False)
+        computed = []
+
+        outcomes = publisher.publish("/ws/system", lambda: computed.append(1) or {"metrics": {}})
+
+        assert outcomes == {}
+        assert computed == [] and emit.sent == []
+        assert publisher.stats()["skipped"] == 1
+
+    def test_sends_snapshot_then_deltas_only_on_change(self):
+        emit = Recorder()
+        publisher = DeltaPublisher(emit, has_subscribers=lambda namespace: True)
+
+        publisher.publish("/ws/system", lambda: {"metrics": {"cpu": 10, "memory": 40}})
+        publisher.publish("/ws/system", lambda: {"metrics": {"cpu": 10, "memory": 40}})
+        publisher.publish("/ws/system", lambda: {"metrics": {"cpu": 25, "memory": 40}})
+
+        assert emit.sent == [
+            ("metrics", {"cpu": 10, "memory": 40}, "/ws/system", None),
+            ("metrics", {"cpu": 25, "memory": 40}, "/ws/system", "full"),
+            ("metrics:delta", {"seq": 2, "base": 1, "patch": {"cpu": 25}}, "/ws/system", "deltas"),
+        ]
+        assert publisher.stats()["unchanged"] == 1
+
+    def test_resends_full_snapshot_after_idle_period(self):
+        emit = Recorder()
+        subscribed = {"value": True}
+        publisher = DeltaPublisher(emit, has_subscribers=lambda namespace: subscribed["value"])
+
+        publisher.publish("/ws/empire", lambda: {"empire_metrics": {"revenue": 1}})
+        subscribed["value"] = False
+        publisher.publish("/ws/empire", lambda: {"empire_metrics": {"revenue": 2}})
+        assert not publisher.has_snapshot("/ws/empire", "empire_metrics")
+
+        subscribed["value"] = True
+        outcomes = publisher.publish("/ws/empire", lambda: {"empire_metrics": {"revenue": 3}})
+
+        assert outcomes == {"empire_metrics": "snapshot"}
+        assert emit.sent[-1] == ("empire_metrics", {"revenue": 3}, "/ws/empire", None)
+
+    def test_resync_sends_latest_snapshots_to_one_client(self):
+        emit = Recorder()
+        publisher = DeltaPublisher(emit, has_subscribers=lambda namespace: True)
+        publisher.publish("/ws/system", lambda: {"heartbeat": {"seq": 1}, "metrics": {"cpu": 1}})
+        publisher.publish("/ws/system", lambda: {"heartbeat": {"seq": 2}, "metrics": {"cpu": 1}})
+        emit.sent.clear()
+
+        seqs = publisher.send_snapshots("/ws/system", to="sid-1", events=["heartbeat"])
+
+        assert seqs == {"heartbeat": 2}
+        assert emit.sent == [("heartbeat", {"seq": 2}, "/ws/system", "sid-1")]
+
+
+class TestSharedSnapshots:
+    """Leader and follower workers sharing snapshots through Redis."""
+
+    def test_follower_serves_leader_snapshots(self):
+        redis = FakeRedis()
+        leader_emit, follower_emit = Recorder(), Recorder()
+        leader = DeltaPublisher(leader_emit, lambda namespace: True, store=RedisSnapshotStore(redis))
+        follower = DeltaPublisher(follower_emit, lambda namespace: True, store=RedisSnapshotStore(redis))
+
+        leader.publish("/ws/system", lambda: {"metrics": {"cpu": 10, "disks": ("sda",)}})
+        leader.publish("/ws/system", lambda: {"metrics": {"cpu": 20, "disks": ("sda",)}})
+
+        # A client connected to the follower resyncs to the leader's latest state
+        seqs = follower.send_snapshots("/ws/system", to="sid-2")
+        assert seqs == {"metrics": 2}
+        assert follower_emit.sent == [("metrics", {"cpu": 20, "disks": ["sda"]}, "/ws/system", "sid-2")]
+
+        # ...and the leader's next delta applies on top of it
+        leader.publish("/ws/system", lambda: {"metrics": {"cpu": 30, "disks": ("sda",)}})
+        event, delta, _, _ = leader_emit.sent[-1]
+        assert event == "metrics:delta" and delta["base"] == seqs["metrics"]
+        assert apply_merge_patch(follower_emit.sent[0][1], delta["patch"]) == {"cpu": 30, "disks": ["sda"]}
+
+    def test_without_shared_store_changes_are_full_snapshots(self):
+        emit = Recorder()
+        publisher = DeltaPublisher(emit, lambda namespace: True, deltas=False)
+
+        publisher.publish("/ws/empire", lambda: {"empire_metrics": {"revenue": 1}})
+        publisher.publish("/ws/empire", lambda: {"empire_metrics": {"revenue": 1}})
+        publisher.publish("/ws/empire", lambda: {"empire_metrics": {"revenue": 2}})
+
+        assert [(event, data) for event, data, _, _ in emit.sent] == [
+            ("empire_metrics", {"revenue": 1}),
+            ("empire_metrics", {"revenue": 2}),
+        ]
+
+
+class TestDeltaOptIn:
+    """Clients connected through Socket.IO."""
+
+    def test_only_clients_that_opt_in_receive_deltas(self, monkeypatch):
+        sockets = pytest.importorskip("app.sockets")
+        from flask import Flask
+        from flask_socketio import SocketIO
+
+        monkeypatch.delenv("SOCKETIO_MESSAGE_QUEUE", raising=False)
+        app = Flask(__name__)
+        server = SocketIO(app, async_mode="threading")
+        monkeypatch.setattr(sockets, "socketio", server)
+        monkeypatch.setattr(sockets, "delta_publisher", sockets.create_delta_publisher())
+        sockets.register_aria_handlers()
+        sockets.register_resync_handlers()
+
+        existing = server.test_client(app, namespace="/ws/aria")
+        opted_in = server.test_client(app, namespace="/ws/aria")
+        sockets.delta_publisher.publish("/ws/aria", lambda: {"aria_status": {"mode": "idle", "queue": 0}})
+        assert opted_in.emit("subscribe_deltas", namespace="/ws/aria", callback=True) == {"aria_status": 1}
+        existing.get_received("/ws/aria")
+        opted_in.get_received("/ws/aria")
+
+        sockets.delta_publisher.publish("/ws/aria", lambda: {"aria_status": {"mode": "busy", "queue": 0}})
+
+        def received(client):
+            return [(m["name"], m["args"][0]) for m in client.get_received("/ws/aria")]
+
+        assert received(existing) == [("aria_status", {"mode": "busy", "queue": 0})]
+        assert received(opted_in) == [("aria_status:delta", {"seq": 2, "base": 1, "patch": {"mode": "busy"}})]
+
+
+class TestSharedPresence:
+    """Workers telling the leader whether they have clients."""
+
+    def test_presence_of_other_workers_expires(self):
+        redis = FakeRedis()
+        follower, leader = RedisPresence(redis), RedisPresence(redis)
+        follower.identity = "worker-2"
+
+        follower.update("/ws/system", True)
+        assert leader.any("/ws/system")
+        assert not leader.any("/ws/empire")
+
+        follower.update("/ws/system", False)
+        assert not leader.any("/ws/system")
+
+        # A worker that died without cleaning up stops counting after its TTL
+        RedisPresence(redis, ttl=0).update("/ws/system", True)
+        assert not leader.any("/ws/system")
+        assert redis.hashes["socketio:presence:/ws/system"] == {}
+
+    def test_leader_publishes_for_clients_of_other_workers(self, monkeypatch):
+        sockets = pytest.importorskip("app.sockets")
+        from flask import Flask
+        from flask_socketio import SocketIO
+
+        redis = FakeRedis()
+        app = Flask(__name__)
+        server = SocketIO(app, async_mode="threading")
+        monkeypatch.setenv("SOCKETIO_MESSAGE_QUEUE", "redis://localhost:6379/2")
+        monkeypatch.setattr(sockets, "socketio", server)
+        monkeypatch.setattr(sockets, "presence", RedisPresence(redis))
+        monkeypatch.setattr(sockets, "delta_publisher", sockets.create_delta_publisher(redis))
+        sockets.register_aria_handlers()
+        follower = RedisPresence(redis)
+        follower.identity = "worker-2"
+
+        assert not sockets.namespace_has_clients("/ws/aria")
+        follower.update("/ws/aria", True)
+        assert sockets.namespace_has_clients("/ws/aria")
+        follower.update("/ws/aria", False)
+
+        # Clients of this worker are recorded for the others as they come and go
+        client = server.test_client(app, namespace="/ws/aria")
+        assert sockets.presence.identity in redis.hashes["socketio:presence:/ws/aria"]
+        client.disconnect(namespace="/ws/aria")
+        assert redis.hashes["socketio:presence:/ws/aria"] == {}
@@ -0,0 +1,354 @@
+"""Unit tests for durable webhook ingestion."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from app.services.webhook_processor import WebhookProcessor, coalesce_updates
+from app.services.webhook_queue import WebhookDispatcher, WebhookQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = WebhookQueue(str(tmp_path / "queue.sqlite3"), max_attempts=3, retry_backoff=0)
+    yield q
+    q.close()
+
+
+class TestWebhookQueue:
+    """Test persistence and idempotency."""
+
+    def test_duplicate_deliveries_are_ignored(self, queue):
+        first = queue.enqueue("orders/create", b'{"id": 1}', "shop", "abc")
+        retry = queue.enqueue("orders/create", b'{"id": 1}', "shop", "abc")
+
+        assert first == ("abc", True)
+        assert retry == ("abc", False)
+        assert queue.stats()["pending"] == 1
+
+    def test_entries_survive_a_crash(self, tmp_path):
+        path = str(tmp_path / "queue.sqlite3")
+        crashed = WebhookQueue(path)
+        crashed.enqueue("orders/create", b"{}", "shop", "one")
+        crashed.enqueue("orders/create", b"{}", "shop", "two")
+        assert len(crashed.claim(1)) == 1
+        crashed.close()
+
+        restarted = WebhookQueue(path)
+        assert restarted.recover() == 1
+        assert [e.webhook_id for e in restarted.claim(10)] == ["one", "two"]
+        restarted.close()
+
+
+class TestWebhookDispatcher:
+    """Test draining with bounded concurrency and retries."""
+
+    @pytest.mark.asyncio
+    async def test_per_topic_concurrency_is_bounded(self, queue):
+        for i in range(12):
+            queue.enqueue("inventory_levels/update", b"{}", "shop", f"inv-{i}")
+        for i in range(4):
+            queue.enqueue("orders/create", b"{}", "shop", f"ord-{i}")
+
+        active = {}
+        peak = {}
+
+        async def handler(entry):
+            active[entry.topic] = active.get(entry.topic, 0) + 1
+            peak[entry.topic] = max(peak.get(entry.topic, 0), active[entry.topic])
+            await asyncio.sleep(0.01)
+            active[entry.topic] -= 1
+
+        dispatcher = WebhookDispatcher(queue, handler, workers=4, per_topic_concurrency=2)
+        await dispatcher.drain()
+
+        assert queue.stats()["done"] == 16
+        assert peak["inventory_levels/update"] == 2
+        assert dispatcher.metrics["processed"] == 16
+
+    @pytest.mark.asyncio
+    async def test_failures_are_retried_then_dead_lettered(self, queue):
+        queue.enqueue("orders/create", b"{}", "shop", "flaky")
+        queue.enqueue("orders/create", b"{}", "shop", "broken")
+        attempts = {}
+
+        async def handler(entry):
+            attempts[entry.webhook_id] = entry.attempts
+            if entry.webhook_id == "broken" or entry.attempts == 1:
+                raise RuntimeError("agent unavailable")
+
+        await WebhookDispatcher(queue, handler).drain()
+
+        assert attempts == {"flaky": 2, "broken": 3}
+        assert queue.stats() == {"pending": 0, "processing": 0, "done": 1, "failed": 1}
+
+    @pytest.mark.asyncio
+    async def test_run_processes_new_entries_until_stopped(self, queue):
+        processed = []
+
+        async def handler(entry):
+            processed.append(entry.webhook_id)
+
+        dispatcher = WebhookDispatcher(queue, handler, poll_interval=5)
+        runner = asyncio.create_task(dispatcher.run())
+        await asyncio.sleep(0.05)
+
+        queue.enqueue("orders/create", b"{}", "shop", "late")
+        dispatcher.notify()
+        for _ in range(100):
+            if processed:
+                break
+            await asyncio.sleep(0.01)
+
+        dispatcher.stop()
+        await asyncio.wait_for(runner, 1)
+        assert processed == ["late"]
+
+    @pytest.mark.asyncio
+    async def test_maintenance_recovers_only_expired_leases(self, tmp_path):
+        path = str(tmp_path / "queue.sqlite3")
+        worker_a, worker_b = WebhookQueue(path), WebhookQueue(path)
+        worker_a.enqueue("orders/create", b"{}", "shop", "in-flight")
+        worker_a.enqueue("orders/create", b"{}", "shop", "done")
+        in_flight, done = worker_a.claim(2)
+        worker_a.complete(done)
+
+        # A second worker starting up leaves the first worker's claim alone
+        dispatcher = WebhookDispatcher(worker_b, handler=None, processing_timeout=60, retention=3600)
+        assert await dispatcher.maintain() == {"recovered": 0, "purged": 0}
+        assert worker_b.stats()["processing"] == 1
+
+        # Once the lease has expired the claim is returned, and old entries are purged
+        dispatcher.processing_timeout = 0
+        dispatcher.retention = 0
+        assert await dispatcher.maintain() == {"recovered": 1, "purged": 1}
+        assert [e.webhook_id for e in worker_b.claim(10)] == ["in-flight"]
+        worker_a.close()
+        worker_b.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_handler_is_timed_out_and_retried(self, queue):
+        queue.enqueue("orders/create", b"{}", "shop", "slow")
+
+        async def handler(entry):
+            await asyncio.sleep(10)
+
+        dispatcher = WebhookDispatcher(queue, handler, processing_timeout=0.01)
+        await dispatcher.drain()
+
+        # Each timed-out attempt counts; the fixture allows three without backoff
+        assert dispatcher.metrics["failed"] == 3
+        assert queue.stats()["failed"] == 1
+
+
+class TestWebhookProcessor:
+    """Test agent fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_agents_are_notified_in_parallel(self, queue):
+        processor = WebhookProcessor()
+
+        def slow_route(name):
+            async def route(topic, data, webhook_id):
+                await asyncio.sleep(0.2)
+                return {"agent": name, "webhook_id": webhook_id, "id": data["id"]}
+            return route
+
+        processor._route_to_customer_support_agent = slow_route("customer_support")
+        processor._route_to_marketing_agent = slow_route("marketing")
+
+        queue.enqueue("customers/create", json.dumps({"id": 7}).encode(), "shop", "cust-7")
+        entry = queue.claim(1)[0]
+
+        started = time.monotonic()
+        result = await processor.process_shopify_webhook(
+            entry.topic, json.loads(entry.payload), entry.shop_domain, entry.webhook_id
+        )
+
+        assert time.monotonic() - started < 0.35
+        assert result["agents_notified"] == 2
+        assert {r["agent"] for r in result["agent_results"]} == {"customer_support", "marketing"}
+        assert all(r["webhook_id"] == "cust-7" for r in result["agent_results"])
+
+
+    @pytest.mark.asyncio
+    async def test_agent_errors_retry_the_webhook_for_that_agent(self, queue):
+        queue.enqueue("customers/create", json.dumps({"id": 7}).encode(), "shop", "cust-7")
+        processor = WebhookProcessor()
+        calls = []
+
+        async def support(topic, data, webhook_id):
+            calls.append("customer_support")
+            if calls.count("customer_support") == 1:
+                raise ConnectionError("agent unreachable")
+            return {"agent": "customer_support", "status": "queued"}
+
+        async def marketing(topic, data, webhook_id):
+            calls.append("marketing")
+            return {"agent": "marketing", "status": "queued"}
+
+        processor._route_to_customer_support_agent = support
+        processor._route_to_marketing_agent = marketing
+        dispatcher = WebhookDispatcher(queue, processor._process_queued_webhook)
+        processor._dispatcher = dispatcher
+        await dispatcher.drain()
+
+        assert sorted(calls) == ["customer_support", "customer_support", "marketing"]
+        assert dispatcher.metrics["failed"] == 1
+        assert queue.stats()["done"] == 1
+
+
+class TestWebhookCoalescing:
+    """Test collapsing bursts of catalog webhooks into batches."""
+
+    def test_delayed_entries_are_not_claimed_early(self, queue):
+        queue.enqueue("inventory_levels/update", b"{}", "shop", "held", delay=60)
+        queue.enqueue("orders/create", b"{}", "shop", "ready")
+
+        assert [e.webhook_id for e in queue.claim(10)] == ["ready"]
+
+    def test_latest_update_per_item_and_location_wins(self):
+        updates = [
+            {"inventory_item_id": 1, "location_id": 10, "available": 5, "updated_at": "2024-01-01T10:00:02Z"},
+            {"inventory_item_id": 1, "location_id": 20, "available": 7, "updated_at": "2024-01-01T10:00:00Z"},
+            {"inventory_item_id": 1, "location_id": 10, "available": 3, "updated_at": "2024-01-01T10:00:01Z"},
+            {"inventory_item_id": 1, "location_id": 10, "available": 9, "updated_at": "2024-01-01T10:00:02Z"},
+        ]
+
+        coalesced = coalesce_updates("inventory_levels/update", updates)
+
+        assert [(u["location_id"], u["available"]) for u in coalesced] == [(10, 9), (20, 7)]
+
+    @pytest.mark.asyncio
+    async def test_burst_becomes_a_single_agent_run(self, queue):
+        for i in range(500):
+            payload = {"inventory_item_id": i % 5, "location_id": 1, "available": i}
+            queue.enqueue("inventory_levels/update", json.dumps(payload).encode(), "shop", f"inv-{i}")
+        queue.enqueue("orders/create", b'{"id": 1}', "shop", "ord-1")
+
+        processor = WebhookProcessor()
+        batches = []
+        single = []
+
+        async def route_batch(topic, updates, webhook_ids, shop_domain):
+            batches.append((topic, updates, webhook_ids))
+            return {"agent": "inventory", "status": "queued"}
+
+        async def handler(entry):
+            single.append(entry.webhook_id)
+
+        processor._route_batch_to_inventory_agent = route_batch
+        dispatcher = WebhookDispatcher(
+            queue,
+            handler,
+            batch_handlers={"inventory_levels/update": processor._process_webhook_batch},
+        )
+        await dispatcher.drain()
+
+        assert single == ["ord-1"]
+        assert len(batches) == 1
+        topic, updates, webhook_ids = batches[0]
+        assert len(webhook_ids) == 500
+        assert sorted(u["available"] for u in updates) == [495, 496, 497, 498, 499]
+        assert queue.stats()["done"] == 501
+        assert processor.get_coalescing_metrics() == {
+            "received": 500, "delivered": 5, "batches": 1, "coalescing_ratio": 100.0
+        }
+
+    @pytest.mark.asyncio
+    async def test_batches_are_per_shop(self, queue):
+        for i in range(4):
+            shop = "a.myshopify.com" if i % 2 else "b.myshopify.com"
+            payload = {"inventory_item_id": 1, "location_id": 1, "available": i}
+            queue.enqueue("inventory_levels/update", json.dumps(payload).encode(), shop, f"inv-{i}")
+
+        processor = WebhookProcessor()
+        batches = []
+
+        async def route_batch(topic, updates, webhook_ids, shop_domain):
+            batches.append((shop_domain, webhook_ids, [u["available"] for u in updates]))
+            return {"agent": "inventory", "status": "queued"}
+
+        async def handler(entry):
+            raise AssertionError("batched topics must not be handled singly")
+
+        processor._route_batch_to_inventory_agent = route_batch
+        await WebhookDispatcher(
+            queue, handler, batch_handlers={"inventory_levels/update": processor._process_webhook_batch}
+        ).drain()
+
+        # Updates of one shop never coalesce with another shop's
+        assert batches == [
+            ("b.myshopify.com", ["inv-0", "inv-2"], [2]),
+            ("a.myshopify.com", ["inv-1", "inv-3"], [3]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried(self, queue):
+        for i in range(3):
+            queue.enqueue("products/update", json.dumps({"id": 1}).encode(), "shop", f"prod-{i}")
+        sizes = []
+
+        async def batch_handler(entries):
+            sizes.append(len(entries))
+            if len(sizes) == 1:
+                raise RuntimeError("agent unavailable")
+
+        async def handler(entry):
+            raise AssertionError("batched topics must not be handled singly")
+
+        await WebhookDispatcher(queue, handler, batch_handlers={"products/update": batch_handler}).drain()
+
+        assert sizes == [3, 3]
+        assert queue.stats()["done"] == 3
+
+    @pytest.mark.asyncio
+    async def test_agent_errors_retry_only_the_failed_agent(self, queue):
+        for i in range(2):
+            queue.enqueue("products/update", json.dumps({"id": i}).encode(), "shop", f"prod-{i}")
+        processor = WebhookProcessor()
+        calls = []
+        research_calls = []
+
+        async def route_batch(topic, updates, webhook_ids, shop_domain):
+            calls.append(webhook_ids)
+            if len(calls) == 1:
+                raise ConnectionError("agent unreachable")
+            return {"agent": "inventory", "status": "queued"}
+
+        async def research(topic, updates, webhook_ids, shop_domain):
+            research_calls.append(webhook_ids)
+            return {"agent": "product_research", "status": "queued"}
+
+        async def handler(entry):
+            raise AssertionError("batched topics must not be handled singly")
+
+        processor._route_batch_to_inventory_agent = route_batch
+        processor._route_batch_to_product_research_agent = research
+        dispatcher = WebhookDispatcher(
+            queue, handler, batch_handlers={"products/update": processor._process_webhook_batch}
+        )
+        processor._dispatcher = dispatcher
+        await dispatcher.drain()
+
+        # The error was raised to the dispatcher, which retried the batch for the failed agent only
+        assert calls == [["prod-0", "prod-1"], ["prod-0", "prod-1"]]
+        assert research_calls == [["prod-0", "prod-1"]]
+        metrics = processor.get_queue_metrics()
+        assert metrics["queue"]["done"] == 2
+        assert metrics["dispatcher"]["failed"] == 2  # Both entries of the first attempt
+        assert metrics["coalescing"] == {
+            "received": 2, "delivered": 2, "batches": 1, "coalescing_ratio": 1.0
+        }
+
+    def test_delivery_survives_reclaiming(self, queue):
+        queue.enqueue("products/update", b"{}", "shop", "prod-1")
+        entry = queue.claim(1)[0]
+        queue.mark_delivered("inventory", entry)
+        queue.mark_delivered("inventory", entry)
+        queue.mark_delivered("product_research", entry)
+        queue.fail(entry, "agent unreachable")
+
+        assert queue.claim(1)[0].delivered == {"inventory", "product_research"}